@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""Measure peak RSS and time of reading a large host config.
+
+Writes a synthetic ``~/.claude.json`` (see benchmark_json_backends.py) and
+runs each read in a fresh interpreter, reporting how far it raised the
+process's peak resident set size. Every operation is measured with the
+previous implementation ("before") and the current one ("after"):
+
+- parse: read text, strip, ``json.loads`` / ``parse_json_safe``
+- list servers: full parse / ``parse_json_members_safe``
+- legacy check: ``MCPInspector.check_legacy_format`` on a damaged config,
+  which used to split the whole file into stripped lines
+
+Usage:
+    python scripts/benchmark_config_reads.py [--projects N] [--backend NAME]
+"""
+
+import argparse
+import json
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(REPO_ROOT / "scripts"))
+
+from benchmark_json_backends import synthetic_claude_json  # noqa: E402
+
+_OLD_LEGACY_CHECK = """
+try:
+    parse_json_members_safe(path, SERVER_SECTION_KEYS)
+except ConfigurationError:
+    content = path.read_text(encoding="utf-8")
+    lines = [line.strip() for line in content.split("\\n") if line.strip()]
+    for line in lines:
+        try:
+            json.loads(line)
+        except json.JSONDecodeError:
+            break
+"""
+
+# (operation, config file, before, after)
+OPERATIONS = [
+    (
+        "parse",
+        "config",
+        "json.loads(path.read_text(encoding='utf-8').strip())",
+        "parse_json_safe(path)",
+    ),
+    (
+        "list servers",
+        "config",
+        "json.loads(path.read_text(encoding='utf-8').strip()).get('mcpServers')",
+        "parse_json_members_safe(path, ['mcpServers'])",
+    ),
+    (
+        "legacy check",
+        "damaged",
+        _OLD_LEGACY_CHECK,
+        "MCPInspector(PlatformInfo(Platform.CLAUDE_CODE, 1.0, path)).check_legacy_format()",
+    ),
+]
+
+_CHILD = """
+import json, resource, sys, time
+from pathlib import Path
+from py_mcp_installer.config_manager import SERVER_SECTION_KEYS
+from py_mcp_installer.exceptions import ConfigurationError
+from py_mcp_installer.json_backend import set_json_backend
+from py_mcp_installer.mcp_inspector import MCPInspector
+from py_mcp_installer.types import Platform, PlatformInfo
+from py_mcp_installer.utils import parse_json_members_safe, parse_json_safe
+
+def peak_rss():
+    # ru_maxrss survives exec on Linux (it would report the parent's peak),
+    # so prefer the high-water mark of this process image
+    try:
+        with open("/proc/self/status") as status:
+            for line in status:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+    scale = 1 if sys.platform == "darwin" else 1024
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * scale
+
+path = Path(sys.argv[1])
+set_json_backend(sys.argv[2])
+code = compile(sys.argv[3], "<benchmark>", "exec")
+before = peak_rss()
+start = time.perf_counter()
+exec(code)
+elapsed = time.perf_counter() - start
+print(peak_rss() - before, elapsed)
+"""
+
+
+def measure(path: Path, code: str, backend: str) -> tuple[float, float]:
+    """Run one read in a fresh interpreter.
+
+    Returns:
+        (peak RSS increase in MB, elapsed milliseconds)
+    """
+    output = subprocess.run(
+        [sys.executable, "-c", _CHILD, str(path), backend, code],
+        env={"PYTHONPATH": str(REPO_ROOT / "src")},
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout.split()
+    return int(output[0]) / 1e6, float(output[1]) * 1000
+
+
+def main() -> int:
+    """Run the benchmark and print a table."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--projects", type=int, default=8000, help="projects in the config")
+    parser.add_argument("--backend", default="json", help="JSON backend to parse with")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        files = {"config": Path(tmp) / ".claude.json", "damaged": Path(tmp) / "damaged.json"}
+        content = json.dumps(synthetic_claude_json(args.projects), indent=2) + "\n"
+        files["config"].write_text(content)
+        files["damaged"].write_text(content[: len(content) // 2])
+        del content
+
+        print(f"Synthetic .claude.json: {files['config'].stat().st_size / 1e6:.1f} MB")
+        print("Peak RSS increase in MB, time in ms")
+        header = ("RSS before", "RSS after", "ms before", "ms after")
+        print(f"{'operation':<14}" + "".join(f"{column:>11}" for column in header))
+        for name, file, old, new in OPERATIONS:
+            old_rss, old_ms = measure(files[file], old, args.backend)
+            new_rss, new_ms = measure(files[file], new, args.backend)
+            row = (old_rss, new_rss, old_ms, new_ms)
+            print(f"{name:<14}" + "".join(f"{value:>11.1f}" for value in row))
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
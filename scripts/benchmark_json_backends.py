@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""Benchmark config parse/serialize with each installed JSON backend.
+
+Builds a synthetic ``~/.claude.json`` (project history dominates real files)
+and times the code paths ConfigManager uses:
+
+- parse: ``parse_json_safe`` (file bytes -> dict)
+- serialize: ``JsonBackend.dumps`` (dict -> indented bytes)
+
+The baseline row is the pre-backend implementation: read text, strip,
+``json.loads``; ``json.dumps(indent=2)`` then encode.
+
+Usage:
+    python scripts/benchmark_json_backends.py [--projects N] [--repeat N]
+"""
+
+import argparse
+import gc
+import json
+import sys
+import tempfile
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+REPO_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(REPO_ROOT / "src"))
+
+from py_mcp_installer.json_backend import (  # noqa: E402
+    available_json_backends,
+    set_json_backend,
+)
+from py_mcp_installer.utils import parse_json_safe  # noqa: E402
+
+
+def synthetic_claude_json(projects: int) -> dict[str, Any]:
+    """Build a host config shaped like a long-lived ~/.claude.json."""
+    return {
+        "numStartups": 412,
+        "tipsHistory": {f"tip-{i}": i for i in range(50)},
+        "projects": {
+            f"/home/user/src/project-{i}": {
+                "allowedTools": ["Bash(git status)", "Read", "Edit"],
+                "history": [
+                    {"display": f"refactor module {j} of project {i}", "pastedContents": {}}
+                    for j in range(20)
+                ],
+                "lastCost": 0.0123 * i,
+                "lastDuration": 1000 + i,
+                "hasTrustDialogAccepted": True,
+            }
+            for i in range(projects)
+        },
+        "mcpServers": {
+            f"server-{i}": {"command": "uvx", "args": [f"server-{i}"], "env": {}} for i in range(10)
+        },
+    }
+
+
+def best_of(repeat: int, func: Callable[[], object]) -> float:
+    """Return the fastest of ``repeat`` runs in milliseconds (GC paused, as timeit does)."""
+    timings = []
+    gc.disable()
+    try:
+        for _ in range(repeat):
+            start = time.perf_counter()
+            func()
+            timings.append(time.perf_counter() - start)
+    finally:
+        gc.enable()
+    return min(timings) * 1000
+
+
+def baseline_parse(path: Path) -> Any:
+    """Parse the way parse_json_safe did before JSON backends."""
+    with path.open("r", encoding="utf-8") as f:
+        return json.loads(f.read().strip())
+
+
+def main() -> int:
+    """Run the benchmark and print a table."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--projects", type=int, default=2000, help="projects in the config")
+    parser.add_argument("--repeat", type=int, default=10, help="runs per measurement")
+    args = parser.parse_args()
+
+    config = synthetic_claude_json(args.projects)
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / ".claude.json"
+        path.write_text(json.dumps(config, indent=2) + "\n")
+        size_mb = path.stat().st_size / 1e6
+        print(f"Synthetic .claude.json: {size_mb:.1f} MB, {args.projects} projects")
+        print(f"{'backend':<12} {'parse ms':>10} {'serialize ms':>13}")
+
+        parse_ms = best_of(args.repeat, lambda: baseline_parse(path))
+        dump_ms = best_of(
+            args.repeat, lambda: (json.dumps(config, indent=2) + "\n").encode("utf-8")
+        )
+        print(f"{'baseline':<12} {parse_ms:>10.1f} {dump_ms:>13.1f}")
+
+        for name in available_json_backends():
+            backend = set_json_backend(name)
+            assert parse_json_safe(path) == config
+            parse_ms = best_of(args.repeat, lambda: parse_json_safe(path))
+            dump_ms = best_of(args.repeat, lambda: backend.dumps(config))
+            print(f"{name:<12} {parse_ms:>10.1f} {dump_ms:>13.1f}")
+        set_json_backend(None)
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -30,17 +30,25 @@ Design Principles:
 
 __version__ = "0.1.5"
 
+# Backup storage
+from .backup_store import BackupCodec, BackupSnapshot, BackupStore, RetentionPolicy
+
 # Core types
 from .command_builder import CommandBuilder
 
 # Phase 2 modules
-from .config_manager import ConfigManager
+from .config_manager import ConfigManager, ConfigTransaction, clear_config_cache
+
+# Platform detection cache
+from .detection_cache import DetectionCache
 
 # Exceptions
 from .exceptions import (
     AtomicWriteError,
     BackupError,
     CommandNotFoundError,
+    ConfigConflictError,
+    ConfigLockError,
     ConfigurationError,
     InstallationError,
     PlatformDetectionError,
@@ -48,18 +56,31 @@ from .exceptions import (
     PyMCPInstallerError,
     ValidationError,
 )
+
+# Cross-process config locking
+from .file_lock import FileLock, LockStats, lock_stats, reset_lock_stats
 from .installation_strategy import (
-    InstallationStrategy as BaseInstallationStrategy,
-)
-from .installation_strategy import (
+    ConfigFileStrategy,
     JSONManipulationStrategy,
     NativeCLIStrategy,
     TOMLManipulationStrategy,
 )
+from .installation_strategy import (
+    InstallationStrategy as BaseInstallationStrategy,
+)
 from .installer import MCPInstaller
 
 # Phase 4 modules (Doctor/Diagnostics)
-from .mcp_doctor import DiagnosticIssue, DiagnosticReport, MCPDoctor, ServerDiagnostic
+from .mcp_client import MCPStdioClient
+from .mcp_doctor import (
+    BenchmarkReport,
+    DiagnosticIssue,
+    DiagnosticReport,
+    LatencyStats,
+    MCPDoctor,
+    ServerBenchmark,
+    ServerDiagnostic,
+)
 
 # Phase 3 modules
 from .mcp_inspector import InspectionReport, MCPInspector, ValidationIssue
@@ -82,12 +103,21 @@ from .self_updater import (
     SelfUpdater,
     UpdateCheckResult,
 )
+
+# Indexed server lookups
+from .server_index import ServerIndex
+
+# Warm server pool (Doctor watch mode)
+from .server_pool import ServerHealth, ServerPool
 from .types import (
     ArgsList,
     ConfigFormat,
+    ConfigLayout,
     DiagnosticCategory,
     DiagnosticStatus,
+    Durability,
     EnvDict,
+    FrozenServerConfig,
     InstallationResult,
     InstallationStrategy,
     InstallMethod,
@@ -103,7 +133,14 @@ from .types import (
 from .utils import (
     atomic_write,
     backup_file,
+    classify_json_config,
+    clear_command_cache,
+    deferred_sync,
+    file_signature,
+    json_config_looks_valid,
+    mapped_file,
     mask_credentials,
+    parse_json_members_safe,
     parse_json_safe,
     parse_toml_safe,
     resolve_command_path,
@@ -120,8 +157,11 @@ __all__ = [
     "InstallMethod",
     "Scope",
     "ConfigFormat",
+    "ConfigLayout",
+    "Durability",
     "InstallationStrategy",
     "MCPServerConfig",
+    "FrozenServerConfig",
     "PlatformInfo",
     "InstallationResult",
     "JsonDict",
@@ -140,24 +180,46 @@ __all__ = [
     "CommandNotFoundError",
     "BackupError",
     "AtomicWriteError",
+    "ConfigLockError",
+    "ConfigConflictError",
     "PlatformNotSupportedError",
     # Platform Detection
     "PlatformDetector",
+    "DetectionCache",
     # Utilities
     "atomic_write",
+    "deferred_sync",
     "backup_file",
     "restore_backup",
+    "BackupStore",
+    "BackupSnapshot",
+    "BackupCodec",
+    "RetentionPolicy",
     "parse_json_safe",
+    "parse_json_members_safe",
+    "classify_json_config",
+    "mapped_file",
+    "json_config_looks_valid",
+    "file_signature",
     "parse_toml_safe",
     "mask_credentials",
     "resolve_command_path",
+    "clear_command_cache",
     "validate_json_structure",
     "validate_toml_structure",
     # Phase 2 modules
     "ConfigManager",
+    "ConfigTransaction",
+    "ServerIndex",
+    "clear_config_cache",
+    "FileLock",
+    "LockStats",
+    "lock_stats",
+    "reset_lock_stats",
     "CommandBuilder",
     "BaseInstallationStrategy",
     "NativeCLIStrategy",
+    "ConfigFileStrategy",
     "JSONManipulationStrategy",
     "TOMLManipulationStrategy",
     # Platform implementations
@@ -174,6 +236,12 @@ __all__ = [
     "DiagnosticIssue",
     "DiagnosticReport",
     "ServerDiagnostic",
+    "BenchmarkReport",
+    "ServerBenchmark",
+    "LatencyStats",
+    "MCPStdioClient",
+    "ServerPool",
+    "ServerHealth",
     # Self-updater
     "SelfUpdater",
     "SelfUpdateInstallMethod",
@@ -0,0 +1,798 @@
+"""Content-deduplicated configuration backups with bounded retention.
+
+Every config write takes a backup. Keeping each one as a separate full copy
+makes the backup directory grow by the size of the config per install, so
+this module stores backup content once per distinct version and prunes old
+snapshots according to a retention policy.
+
+Layout of a backup directory (``.mcp-installer-backups/`` next to the file):
+- ``objects/<sha256>``: content of one config version, stored once
+- ``<file>.<YYYYmmdd_HHMMSS_ffffff>.backup``: one snapshot, a hard link to
+  its object (a plain copy where hard links are unavailable)
+
+Snapshots are ordinary files, so they can still be inspected or restored
+by hand. Older ``<file>.<YYYYmmdd_HHMMSS>.backup`` copies are recognized,
+listed and pruned like new snapshots.
+
+With ``compression`` set, snapshots are instead stored compressed (zlib or
+lzma): every ``full_every``-th snapshot as a ``.full`` base, the others as
+``.delta`` files holding the compressed difference to the latest base. Any
+snapshot is restored from its base plus at most one delta. Both carry a
+small uncompressed header, so listings never decompress payloads.
+
+Design Philosophy:
+- Identical content is stored once, however many snapshots reference it
+- Bounded growth: count, age and total-size limits per config file
+- The newest snapshot is never pruned
+- Unique names without races: snapshots are created with exclusive links
+- Restores verify the SHA-256 of reconstructed content
+
+Example:
+    >>> store = BackupStore.for_file(config_path, RetentionPolicy(max_count=5))
+    >>> snapshot = store.save(config_path)
+    >>> for info in store.snapshots(config_path.name):
+    ...     print(info.created, info.size)
+    >>> store.restore(snapshot, config_path)
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import re
+import struct
+import tempfile
+import zlib
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from difflib import SequenceMatcher
+from enum import Enum
+from pathlib import Path
+from typing import Any
+
+try:
+    import lzma
+except ImportError:  # Python built without liblzma
+    lzma = None  # type: ignore[assignment]
+
+from .exceptions import BackupError
+
+logger = logging.getLogger(__name__)
+
+# Backup directory created next to each config file
+BACKUP_DIR_NAME = ".mcp-installer-backups"
+
+# Subdirectory holding deduplicated snapshot content
+_OBJECTS_DIR_NAME = "objects"
+
+# <file>.<date>_<time>[_<microseconds>][-<seq>].<backup|full|delta>
+_SNAPSHOT_PATTERN = r"^{name}\.(\d{{8}}_\d{{6}})(?:_(\d{{6}}))?(?:-(\d+))?\.(backup|full|delta)$"
+
+# First line of compressed snapshots; a JSON metadata line follows
+_MAGIC = b"MCP-INSTALLER-BACKUP 1\n"
+
+# Longest accepted metadata line
+_MAX_HEADER = 4096
+
+# Delta instructions: copy a byte range of the base, or insert literal bytes
+_COPY = struct.Struct(">cQQ")
+_INSERT = struct.Struct(">cQ")
+
+# Comparison block size when trimming the common prefix/suffix of a delta
+_BLOCK = 4096
+
+# Most lines diffed for a delta (SequenceMatcher is quadratic in the worst
+# case); a larger differing middle is stored as a full snapshot instead
+_MAX_DIFF_LINES = 5000
+
+# Errors raised while decoding a corrupt payload
+_DECODE_ERRORS: tuple[type[Exception], ...] = (ValueError, zlib.error, struct.error)
+if lzma is not None:
+    _DECODE_ERRORS += (lzma.LZMAError,)
+
+
+# ============================================================================
+# Enums
+# ============================================================================
+
+
+class BackupCodec(str, Enum):
+    """Compression used for compressed snapshots.
+
+    - ZLIB: Fast, moderate ratio
+    - LZMA: Slower, smallest files
+    """
+
+    ZLIB = "zlib"
+    LZMA = "lzma"
+
+
+# ============================================================================
+# Data Classes
+# ============================================================================
+
+
+@dataclass(frozen=True)
+class RetentionPolicy:
+    """Limits applied to the snapshots of one config file after each backup.
+
+    A limit of None disables it. The most recent snapshot is always kept,
+    even if it alone exceeds a limit.
+
+    Attributes:
+        max_count: Maximum number of snapshots kept
+        max_age_days: Snapshots older than this are removed
+        max_bytes: Maximum disk usage of the snapshots (content shared
+            between snapshots is counted once)
+
+    Example:
+        >>> policy = RetentionPolicy(max_count=10, max_bytes=50 * 1024 * 1024)
+    """
+
+    max_count: int | None = 20
+    max_age_days: float | None = 90.0
+    max_bytes: int | None = None
+
+    def __post_init__(self) -> None:
+        """Validate limits.
+
+        Raises:
+            ValueError: If a limit is not positive
+        """
+        for name in ("max_count", "max_age_days", "max_bytes"):
+            value = getattr(self, name)
+            if value is not None and value <= 0:
+                raise ValueError(f"{name} must be positive or None, got {value}")
+
+
+@dataclass(frozen=True)
+class BackupSnapshot:
+    """One stored backup of a config file.
+
+    Attributes:
+        path: Snapshot file (pass to :meth:`BackupStore.restore`)
+        created: When the backup was taken
+        size: Size of the backed-up content in bytes
+        stored_size: Size of the snapshot file on disk
+        kind: "copy" (plain file), "full" (compressed base) or "delta"
+        base: Base snapshot a delta is applied to (None otherwise)
+
+    Example:
+        >>> latest = store.snapshots(".claude.json")[-1]
+        >>> print(f"{latest.created:%Y-%m-%d %H:%M:%S} {latest.size} bytes")
+    """
+
+    path: Path
+    created: datetime
+    size: int
+    stored_size: int
+    kind: str
+    base: Path | None = None
+
+
+# ============================================================================
+# Backup Store
+# ============================================================================
+
+
+class BackupStore:
+    """Deduplicated, pruned backup directory.
+
+    Snapshots of any format can be listed and restored regardless of the
+    mode the store saves in.
+
+    Attributes:
+        directory: Backup directory
+        retention: Retention policy applied after every save
+        compression: Codec for compressed delta snapshots (None: plain
+            deduplicated copies)
+        full_every: Store a full base every N compressed snapshots
+
+    Example:
+        >>> store = BackupStore.for_file(Path.home() / ".claude.json")
+        >>> snapshot = store.save(Path.home() / ".claude.json")
+        >>> print(snapshot.name)
+        .claude.json.20250105_143022_481516.backup
+    """
+
+    def __init__(
+        self,
+        directory: Path,
+        retention: RetentionPolicy | None = None,
+        compression: BackupCodec | str | None = None,
+        full_every: int = 10,
+    ) -> None:
+        """Initialize store (the directory is created on first save).
+
+        Args:
+            directory: Backup directory
+            retention: Retention policy (default: RetentionPolicy())
+            compression: "zlib" or "lzma" to save compressed deltas against a
+                periodic full base (default: plain deduplicated copies)
+            full_every: Snapshots per full base in compressed mode
+
+        Raises:
+            ValueError: If the codec is unknown or full_every is not positive
+        """
+        if full_every < 1:
+            raise ValueError(f"full_every must be positive, got {full_every}")
+        self.directory = directory
+        self.retention = retention or RetentionPolicy()
+        self.compression = BackupCodec(compression) if compression is not None else None
+        self.full_every = full_every
+        self._hardlinks = True
+
+    @classmethod
+    def for_file(
+        cls,
+        path: Path,
+        retention: RetentionPolicy | None = None,
+        compression: BackupCodec | str | None = None,
+    ) -> BackupStore:
+        """Create the store used for a config file.
+
+        Args:
+            path: Config file
+            retention: Retention policy (default: RetentionPolicy())
+            compression: Codec for compressed delta snapshots (default: none)
+
+        Returns:
+            Store in the ``.mcp-installer-backups`` directory next to ``path``
+        """
+        return cls(path.parent / BACKUP_DIR_NAME, retention, compression)
+
+    def save(self, path: Path) -> Path:
+        """Back up a file, then apply the retention policy.
+
+        Args:
+            path: File to back up
+
+        Returns:
+            Path of the new snapshot
+
+        Raises:
+            BackupError: If the file cannot be read or the snapshot written
+        """
+        try:
+            data = path.read_bytes()
+        except FileNotFoundError as e:
+            raise BackupError(f"Cannot backup non-existent file: {path}") from e
+        except OSError as e:
+            raise BackupError(f"Failed to read {path} for backup: {e}") from e
+
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+        except OSError as e:
+            raise BackupError(f"Failed to create backup directory: {e}") from e
+
+        digest = hashlib.sha256(data).hexdigest()
+        stamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
+
+        extension, payload = "backup", None
+        if self.compression is not None:
+            extension, payload = self._encode(path.name, data, digest)
+
+        seq = 0
+        while True:
+            suffix = f"-{seq}" if seq else ""
+            snapshot = self.directory / f"{path.name}.{stamp}{suffix}.{extension}"
+            try:
+                if payload is None:
+                    self._store(digest, data, snapshot)
+                else:
+                    _create_exclusive(snapshot, payload)
+                break
+            except FileExistsError:
+                seq += 1  # Another backup in the same microsecond
+            except OSError as e:
+                raise BackupError(f"Failed to write backup {snapshot}: {e}") from e
+
+        self.prune(path.name)
+        return snapshot
+
+    def restore(self, snapshot: Path, target: Path) -> None:
+        """Atomically replace a file with the content of a snapshot.
+
+        Compressed snapshots are reconstructed from their base and verified
+        against the checksum recorded when they were taken.
+
+        Args:
+            snapshot: Snapshot file (or any older full-copy backup)
+            target: File to restore
+
+        Raises:
+            BackupError: If the snapshot is missing, corrupt, or the restore fails
+        """
+        data = self.read(snapshot)
+        try:
+            # Copy rather than link: later edits must never touch the backup
+            _replace_file(target, data)
+        except OSError as e:
+            raise BackupError(f"Failed to restore from backup: {e}") from e
+
+    def read(self, snapshot: Path) -> bytes:
+        """Return the content a snapshot was taken of.
+
+        Args:
+            snapshot: Snapshot file
+
+        Returns:
+            Original file content
+
+        Raises:
+            BackupError: If the snapshot (or its base) is missing or corrupt
+        """
+        return self._decode(snapshot, allow_delta=True)
+
+    def snapshot_at(self, name: str, when: datetime) -> BackupSnapshot | None:
+        """Find the snapshot describing a config file at a point in time.
+
+        Args:
+            name: Config file name
+            when: Point in time
+
+        Returns:
+            Latest snapshot taken at or before ``when``, or None
+
+        Example:
+            >>> snapshot = store.snapshot_at(".claude.json", datetime(2025, 1, 5, 14, 0))
+            >>> if snapshot:
+            ...     store.restore(snapshot.path, Path.home() / ".claude.json")
+        """
+        earlier = [s for s in self.snapshots(name) if s.created <= when]
+        return earlier[-1] if earlier else None
+
+    def snapshots(self, name: str) -> list[BackupSnapshot]:
+        """List the snapshots of a config file, oldest first.
+
+        Args:
+            name: Config file name (e.g. ".claude.json")
+
+        Only the small header of compressed snapshots is read.
+
+        Returns:
+            Snapshot metadata (empty if there are no backups)
+        """
+        pattern = re.compile(_SNAPSHOT_PATTERN.format(name=re.escape(name)))
+        found: list[tuple[datetime, int, BackupSnapshot]] = []
+        try:
+            entries = list(os.scandir(self.directory))
+        except OSError:
+            return []
+
+        for entry in entries:
+            match = pattern.match(entry.name)
+            if match is None:
+                continue
+            stamp, micros, seq, extension = match.groups()
+            try:
+                created = datetime.strptime(stamp, "%Y%m%d_%H%M%S").replace(
+                    microsecond=int(micros or 0)
+                )
+                stored_size = entry.stat().st_size
+            except (ValueError, OSError):
+                continue
+
+            path = Path(entry.path)
+            if extension == "backup":
+                snapshot = BackupSnapshot(path, created, stored_size, stored_size, "copy")
+            else:
+                header = _read_header(path)
+                if header is None:
+                    logger.debug(f"Skipping unreadable backup {path}")
+                    continue
+                base = path.parent / header["base"] if header["base"] is not None else None
+                snapshot = BackupSnapshot(
+                    path, created, header["size"], stored_size, extension, base
+                )
+            found.append((created, int(seq or 0), snapshot))
+
+        found.sort(key=lambda item: item[:2])
+        return [snapshot for _, _, snapshot in found]
+
+    def prune(self, name: str) -> list[Path]:
+        """Apply the retention policy to the snapshots of a config file.
+
+        Compressed bases are kept as long as a remaining delta refers to
+        them, even if that exceeds a limit.
+
+        Args:
+            name: Config file name
+
+        Returns:
+            Removed snapshot paths
+        """
+        snapshots = self.snapshots(name)
+        if len(snapshots) <= 1:
+            return []
+
+        policy = self.retention
+        doomed: set[Path] = set()
+
+        if policy.max_count is not None and len(snapshots) > policy.max_count:
+            doomed.update(s.path for s in snapshots[: len(snapshots) - policy.max_count])
+
+        if policy.max_age_days is not None:
+            cutoff = datetime.now() - timedelta(days=policy.max_age_days)
+            doomed.update(s.path for s in snapshots[:-1] if s.created < cutoff)
+
+        if policy.max_bytes is not None:
+            kept = [s for s in snapshots if s.path not in doomed]
+            while len(kept) > 1 and _disk_usage(kept) > policy.max_bytes:
+                doomed.add(kept.pop(0).path)
+
+        # A base stays while a remaining delta needs it
+        doomed.difference_update(
+            s.base for s in snapshots if s.path not in doomed and s.base is not None
+        )
+
+        removed: list[Path] = []
+        for snapshot in snapshots:
+            if snapshot.path in doomed:
+                try:
+                    snapshot.path.unlink()
+                    removed.append(snapshot.path)
+                except FileNotFoundError:
+                    pass  # Pruned concurrently
+                except OSError as e:
+                    logger.warning(f"Could not remove old backup {snapshot.path}: {e}")
+
+        if removed:
+            logger.debug(f"Pruned {len(removed)} backups of {name}")
+            self._collect_garbage()
+        return removed
+
+    # ========================================================================
+    # Private Helper Methods
+    # ========================================================================
+
+    def _decode(self, snapshot: Path, allow_delta: bool) -> bytes:
+        """Read a snapshot of any format.
+
+        Args:
+            snapshot: Snapshot file
+            allow_delta: Whether a delta is acceptable (bases must be full)
+
+        Returns:
+            Original file content
+
+        Raises:
+            BackupError: If the snapshot (or its base) is missing or corrupt
+        """
+        try:
+            with open(snapshot, "rb") as f:
+                if f.read(len(_MAGIC)) != _MAGIC:
+                    f.seek(0)
+                    return f.read()  # Plain copy
+                header = _parse_header(f.readline(_MAX_HEADER))
+                payload = f.read()
+        except FileNotFoundError as e:
+            raise BackupError(f"Backup file not found: {snapshot}") from e
+        except OSError as e:
+            raise BackupError(f"Failed to read backup {snapshot}: {e}") from e
+
+        if header is None:
+            raise BackupError(f"Corrupt backup header: {snapshot}")
+        try:
+            content = _decompress(header["codec"], payload)
+            if header["base"] is not None:
+                if not allow_delta:
+                    raise BackupError(f"Backup base is itself a delta: {snapshot}")
+                base = self._decode(snapshot.parent / header["base"], allow_delta=False)
+                content = _apply_delta(base, content)
+        except _DECODE_ERRORS as e:
+            raise BackupError(f"Corrupt backup {snapshot}: {e}") from e
+
+        if hashlib.sha256(content).hexdigest() != header["sha256"]:
+            raise BackupError(f"Backup checksum mismatch: {snapshot}")
+        return content
+
+    def _store(self, digest: str, data: bytes, snapshot: Path) -> None:
+        """Create a snapshot file sharing storage with identical content.
+
+        Args:
+            digest: SHA-256 of the content
+            data: Content
+            snapshot: Snapshot path (must not exist)
+
+        Raises:
+            FileExistsError: If the snapshot path is taken
+            OSError: If the snapshot cannot be written
+        """
+        if self._hardlinks:
+            obj = self.directory / _OBJECTS_DIR_NAME / digest
+            for _ in range(2):
+                try:
+                    if not obj.exists():
+                        obj.parent.mkdir(exist_ok=True)
+                        _replace_file(obj, data)
+                    os.link(obj, snapshot)
+                    return
+                except FileExistsError:
+                    raise
+                except FileNotFoundError:
+                    continue  # Object garbage-collected concurrently; store it again
+                except OSError as e:
+                    logger.debug(f"Hard links unavailable in {self.directory}: {e}")
+                    self._hardlinks = False
+                    break
+
+        with open(snapshot, "xb") as f:
+            f.write(data)
+
+    def _encode(self, name: str, data: bytes, digest: str) -> tuple[str, bytes]:
+        """Encode content as a compressed full or delta snapshot.
+
+        A delta is made against the latest full base unless the base already
+        has ``full_every - 1`` deltas, cannot be read, the changed part is
+        too large to diff, or the delta is not under half the content size.
+        Only the form that is stored gets compressed.
+
+        Args:
+            name: Config file name
+            data: Content
+            digest: SHA-256 of the content
+
+        Returns:
+            (file extension, snapshot file bytes)
+
+        Raises:
+            BackupError: If the codec is unavailable
+        """
+        assert self.compression is not None
+        codec = self.compression.value
+
+        base: BackupSnapshot | None = None
+        deltas = 0
+        for snapshot in self.snapshots(name):
+            if snapshot.kind == "full":
+                base, deltas = snapshot, 0
+            elif snapshot.kind == "delta" and base is not None and snapshot.base == base.path:
+                deltas += 1
+
+        if base is not None and deltas < self.full_every - 1:
+            try:
+                base_data = self.read(base.path)
+            except BackupError as e:
+                logger.debug(f"Starting a new backup base: {e}")
+            else:
+                delta = _make_delta(base_data, data)
+                if delta is not None and len(delta) * 2 < len(data):
+                    payload = _compress(codec, delta)
+                    return "delta", _encode_snapshot(codec, data, digest, payload, base.path.name)
+
+        return "full", _encode_snapshot(codec, data, digest, _compress(codec, data), None)
+
+    def _collect_garbage(self) -> None:
+        """Delete objects no snapshot links to any more."""
+        try:
+            entries = list(os.scandir(self.directory / _OBJECTS_DIR_NAME))
+        except OSError:
+            return
+
+        for entry in entries:
+            try:
+                if entry.stat().st_nlink <= 1:
+                    os.unlink(entry.path)
+            except OSError:
+                pass
+
+
+def _disk_usage(snapshots: list[BackupSnapshot]) -> int:
+    """Bytes used by snapshots, counting hard-linked content once.
+
+    Args:
+        snapshots: Snapshots to measure
+
+    Returns:
+        Total size of the distinct files
+    """
+    sizes: dict[tuple[int, int], int] = {}
+    for snapshot in snapshots:
+        try:
+            st = snapshot.path.stat()
+        except OSError:
+            continue
+        sizes[(st.st_dev, st.st_ino)] = st.st_size
+    return sum(sizes.values())
+
+
+def _replace_file(path: Path, data: bytes) -> None:
+    """Write a file atomically (temp file in the same directory + rename).
+
+    Args:
+        path: Target file
+        data: Content
+
+    Raises:
+        OSError: If the file cannot be written
+    """
+    fd, temp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(temp_path, path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.unlink(temp_path)
+        raise
+
+
+def _create_exclusive(path: Path, data: bytes) -> None:
+    """Create a new file with the given content.
+
+    Raises:
+        FileExistsError: If the file already exists
+        OSError: If the file cannot be written
+    """
+    with open(path, "xb") as f:
+        f.write(data)
+
+
+# ============================================================================
+# Compressed Snapshot Format
+# ============================================================================
+
+
+def _compress(codec: str, data: bytes) -> bytes:
+    """Compress bytes with a backup codec."""
+    if codec == BackupCodec.LZMA.value:
+        if lzma is None:
+            raise BackupError("lzma backups require Python built with liblzma")
+        return lzma.compress(data)
+    return zlib.compress(data, 6)
+
+
+def _decompress(codec: str, payload: bytes) -> bytes:
+    """Decompress a snapshot payload.
+
+    Raises:
+        ValueError: If the codec is unknown
+    """
+    if codec == BackupCodec.ZLIB.value:
+        return zlib.decompress(payload)
+    if codec == BackupCodec.LZMA.value and lzma is not None:
+        return lzma.decompress(payload)
+    raise ValueError(f"unsupported backup codec: {codec}")
+
+
+def _encode_snapshot(
+    codec: str, data: bytes, digest: str, payload: bytes, base: str | None
+) -> bytes:
+    """Assemble a compressed snapshot file (magic, metadata line, payload)."""
+    header = {"codec": codec, "size": len(data), "sha256": digest, "base": base}
+    return _MAGIC + json.dumps(header).encode() + b"\n" + payload
+
+
+def _read_header(path: Path) -> dict[str, Any] | None:
+    """Read the metadata of a compressed snapshot without its payload.
+
+    Returns:
+        Metadata, or None if the file is unreadable or not a snapshot
+    """
+    try:
+        with open(path, "rb") as f:
+            if f.read(len(_MAGIC)) != _MAGIC:
+                return None
+            return _parse_header(f.readline(_MAX_HEADER))
+    except OSError:
+        return None
+
+
+def _parse_header(line: bytes) -> dict[str, Any] | None:
+    """Parse and validate a snapshot metadata line.
+
+    Returns:
+        Metadata, or None if the line is malformed
+    """
+    try:
+        header = json.loads(line)
+    except ValueError:
+        return None
+    if not isinstance(header, dict):
+        return None
+    if not isinstance(header.get("codec"), str) or not isinstance(header.get("sha256"), str):
+        return None
+    if not isinstance(header.get("size"), int):
+        return None
+    base = header.get("base")
+    if base is not None and (not isinstance(base, str) or os.sep in base or "/" in base):
+        return None
+    header["base"] = base
+    return header
+
+
+def _make_delta(base: bytes, data: bytes) -> bytes | None:
+    """Encode ``data`` as copy/insert instructions against ``base``.
+
+    The common prefix and suffix are found block-wise; only the differing
+    middle is diffed line by line.
+
+    Args:
+        base: Base content
+        data: New content
+
+    Returns:
+        Delta instructions (uncompressed), or None if the differing middle
+        has more than ``_MAX_DIFF_LINES`` lines
+    """
+    limit = min(len(base), len(data))
+    prefix = 0
+    while prefix + _BLOCK <= limit and (
+        base[prefix : prefix + _BLOCK] == data[prefix : prefix + _BLOCK]
+    ):
+        prefix += _BLOCK
+    while prefix < limit and base[prefix] == data[prefix]:
+        prefix += 1
+
+    limit -= prefix
+    suffix = 0
+    while suffix + _BLOCK <= limit and (
+        base[len(base) - suffix - _BLOCK : len(base) - suffix]
+        == data[len(data) - suffix - _BLOCK : len(data) - suffix]
+    ):
+        suffix += _BLOCK
+    while suffix < limit and base[len(base) - suffix - 1] == data[len(data) - suffix - 1]:
+        suffix += 1
+
+    old_lines = base[prefix : len(base) - suffix].splitlines(keepends=True)
+    new_lines = data[prefix : len(data) - suffix].splitlines(keepends=True)
+    if len(old_lines) + len(new_lines) > _MAX_DIFF_LINES:
+        return None
+
+    out = bytearray()
+
+    def copy(start: int, length: int) -> None:
+        if length:
+            out.extend(_COPY.pack(b"C", start, length))
+
+    def insert(chunk: bytes) -> None:
+        if chunk:
+            out.extend(_INSERT.pack(b"I", len(chunk)))
+            out.extend(chunk)
+
+    copy(0, prefix)
+
+    offsets = [prefix]
+    for line in old_lines:
+        offsets.append(offsets[-1] + len(line))
+
+    matcher = SequenceMatcher(None, old_lines, new_lines)
+    for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+        if tag == "equal":
+            copy(offsets[i1], offsets[i2] - offsets[i1])
+        elif tag in ("replace", "insert"):
+            insert(b"".join(new_lines[j1:j2]))
+
+    copy(len(base) - suffix, suffix)
+    return bytes(out)
+
+
+def _apply_delta(base: bytes, delta: bytes) -> bytes:
+    """Rebuild content from a base and delta instructions.
+
+    Raises:
+        ValueError: If the delta is malformed or does not fit the base
+    """
+    out = bytearray()
+    i = 0
+    while i < len(delta):
+        op = delta[i : i + 1]
+        if op == b"C":
+            _, start, length = _COPY.unpack_from(delta, i)
+            if start + length > len(base):
+                raise ValueError("delta copies past the end of its base")
+            out.extend(base[start : start + length])
+            i += _COPY.size
+        elif op == b"I":
+            _, length = _INSERT.unpack_from(delta, i)
+            i += _INSERT.size
+            if i + length > len(delta):
+                raise ValueError("truncated delta")
+            out.extend(delta[i : i + length])
+            i += length
+        else:
+            raise ValueError(f"unknown delta instruction at offset {i}")
+    return bytes(out)
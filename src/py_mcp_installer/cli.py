@@ -5,6 +5,8 @@ including the doctor diagnostic command.
 
 Usage:
     py-mcp-installer doctor [--full] [--server NAME] [--json] [--verbose]
+                            [--parallel N] [--budget SECONDS] [--bench N]
+                            [--watch SECONDS] [--no-cache]
     py-mcp-installer --version
     py-mcp-installer --help
 
@@ -18,19 +20,39 @@ Example:
     # Test specific server
     $ py-mcp-installer doctor --server mcp-ticketer --full
 
+    # Probe up to 16 servers at once, giving up after 30 seconds overall
+    $ py-mcp-installer doctor --full --parallel 16 --budget 30
+
+    # Handshake with every server 20 times and report latency percentiles
+    $ py-mcp-installer doctor --bench 20 --parallel 1
+
+    # Keep servers running and re-check them every 30 seconds
+    $ py-mcp-installer doctor --watch 30
+
     # JSON output for programmatic use
     $ py-mcp-installer doctor --json
 """
 
 import argparse
+import asyncio
 import json
 import sys
+from datetime import datetime
 from typing import Any, NoReturn
 
 from . import __version__
+from .detection_cache import DetectionCache
 from .exceptions import PlatformDetectionError
-from .mcp_doctor import DiagnosticIssue, DiagnosticReport, MCPDoctor, ServerDiagnostic
+from .mcp_doctor import (
+    BenchmarkReport,
+    DiagnosticIssue,
+    DiagnosticReport,
+    LatencyStats,
+    MCPDoctor,
+    ServerDiagnostic,
+)
 from .platform_detector import PlatformDetector
+from .server_pool import ServerHealth
 from .types import DiagnosticStatus, ServerStatus
 
 
@@ -90,6 +112,48 @@ def main() -> NoReturn:
         help="Timeout for server tests in seconds (default: 10)",
         metavar="SECONDS",
     )
+    doctor_parser.add_argument(
+        "--parallel",
+        type=_positive_int,
+        default=MCPDoctor.DEFAULT_MAX_WORKERS,
+        help=(
+            "Maximum number of servers tested concurrently with --full "
+            f"(default: {MCPDoctor.DEFAULT_MAX_WORKERS})"
+        ),
+        metavar="N",
+    )
+    doctor_parser.add_argument(
+        "--budget",
+        type=_positive_float,
+        default=None,
+        help="Wall-clock budget for all server tests in seconds (default: none)",
+        metavar="SECONDS",
+    )
+    doctor_parser.add_argument(
+        "--bench",
+        type=_positive_int,
+        default=None,
+        help=(
+            "Benchmark mode: run the server handshake N times per server and "
+            "report latency percentiles"
+        ),
+        metavar="N",
+    )
+    doctor_parser.add_argument(
+        "--watch",
+        type=_positive_float,
+        default=None,
+        help=(
+            "Watch mode: keep servers running and re-check them every SECONDS "
+            "until interrupted"
+        ),
+        metavar="SECONDS",
+    )
+    doctor_parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Ignore and don't update the cached platform detection result",
+    )
 
     args = parser.parse_args()
 
@@ -115,7 +179,7 @@ def cmd_doctor(args: argparse.Namespace) -> int:
     """
     try:
         # Detect platform
-        detector = PlatformDetector()
+        detector = PlatformDetector(cache=None if args.no_cache else DetectionCache())
         platform_info = detector.detect()
 
         # Create doctor
@@ -123,8 +187,16 @@ def cmd_doctor(args: argparse.Namespace) -> int:
             platform_info,
             timeout=args.timeout,
             verbose=args.verbose,
+            max_workers=args.parallel,
+            total_timeout=args.budget,
         )
 
+        # Benchmark and watch modes replace the diagnostic report
+        if args.bench is not None:
+            return _run_benchmark(doctor, args)
+        if args.watch is not None:
+            return _run_watch(doctor, args)
+
         # Run diagnostics
         report = doctor.diagnose(full=args.full)
 
@@ -166,6 +238,62 @@ def cmd_doctor(args: argparse.Namespace) -> int:
         return 2
 
 
+def _run_benchmark(doctor: MCPDoctor, args: argparse.Namespace) -> int:
+    """Run benchmark mode and print the results.
+
+    Args:
+        doctor: Configured doctor
+        args: Parsed command line arguments (uses bench, server, json)
+
+    Returns:
+        Exit code (0 for success, 1 if a server never completed a handshake)
+    """
+    report = doctor.benchmark(args.bench, server_name=args.server)
+
+    if args.json:
+        print(json.dumps(report.to_dict(), indent=2))
+    else:
+        _print_benchmark(report)
+
+    if any(bench.failures == bench.runs for bench in report.servers.values()):
+        return 1
+    return 0
+
+
+def _run_watch(doctor: MCPDoctor, args: argparse.Namespace) -> int:
+    """Run watch mode until interrupted, printing health after each check.
+
+    Args:
+        doctor: Configured doctor
+        args: Parsed command line arguments (uses watch, server, json)
+
+    Returns:
+        Exit code (0 when interrupted)
+    """
+
+    async def watch() -> None:
+        async with doctor.server_pool(server_name=args.server) as pool:
+            async for health in pool.watch(args.watch):
+                if args.json:
+                    print(
+                        json.dumps(
+                            {
+                                "timestamp": datetime.now().isoformat(),
+                                "servers": {n: h.to_dict() for n, h in health.items()},
+                            }
+                        ),
+                        flush=True,
+                    )
+                else:
+                    _print_watch(health)
+
+    try:
+        asyncio.run(watch())
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
 def _filter_report_by_server(
     report: DiagnosticReport, server_name: str
 ) -> DiagnosticReport:
@@ -270,7 +398,7 @@ def _print_report(report: DiagnosticReport, verbose: bool = False) -> None:
     if report.server_reports:
         print(f"\n{_color('cyan', 'Server Status:')}")
         for name, diag in report.server_reports.items():
-            _print_server_status(diag)
+            _print_server_status(diag, verbose=verbose)
 
     # Recommendations
     if report.recommendations:
@@ -292,11 +420,12 @@ def _print_issue(issue: DiagnosticIssue) -> None:
     print(f"    Fix: {issue.fix_suggestion}")
 
 
-def _print_server_status(diag: "ServerDiagnostic") -> None:
+def _print_server_status(diag: "ServerDiagnostic", verbose: bool = False) -> None:
     """Print server diagnostic status.
 
     Args:
         diag: Server diagnostic to print
+        verbose: Also print the per-phase latency breakdown
     """
 
     status_colors = {
@@ -326,12 +455,133 @@ def _print_server_status(diag: "ServerDiagnostic") -> None:
         if diag.response_time_ms:
             details += f" - {diag.response_time_ms:.0f}ms"
         print(f"  {diag.name}: {status_str} {details}")
+        if verbose:
+            _print_server_timings(diag)
     elif diag.error:
         print(f"  {diag.name}: {status_str} - {diag.error}")
     else:
         print(f"  {diag.name}: {status_str}")
 
 
+def _print_server_timings(diag: "ServerDiagnostic") -> None:
+    """Print the per-phase latency breakdown of a server test.
+
+    Args:
+        diag: Server diagnostic to print
+    """
+    phases: list[tuple[str, float | None]] = [
+        ("first byte", diag.first_byte_ms),
+        ("initialize", diag.initialize_ms),
+        *diag.method_times_ms.items(),
+    ]
+    timings = [f"{label}: {ms:.0f}ms" for label, ms in phases if ms is not None]
+    if timings:
+        print(f"    {_color('gray', ', '.join(timings))}")
+
+
+def _print_benchmark(report: BenchmarkReport) -> None:
+    """Print benchmark results as a table.
+
+    Args:
+        report: Benchmark report to print
+    """
+    print("\n" + "=" * 50)
+    print("MCP Server Benchmark")
+    print("=" * 50)
+    print(f"\nPlatform: {report.platform.value}")
+    print(f"Iterations: {report.iterations}")
+
+    if not report.servers:
+        print("\nNo servers configured.\n")
+        return
+
+    header = (
+        f"{'Phase':<18}{'min':>9}{'p50':>9}{'p95':>9}{'max':>9}"
+        f"{'mean':>9}{'stdev':>9}{'variance':>12}"
+    )
+    for name, bench in report.servers.items():
+        print(f"\n{_color('cyan', name)} ({bench.runs - bench.failures}/{bench.runs} ok)")
+        phases: list[tuple[str, LatencyStats | None]] = [
+            ("first byte", bench.first_byte),
+            ("initialize", bench.initialize),
+            *bench.methods.items(),
+            ("total", bench.total),
+        ]
+        rows = [(label, stats) for label, stats in phases if stats is not None]
+        if rows:
+            print(f"  {header}")
+            for label, stats in rows:
+                print(
+                    f"  {label:<18}{stats.min_ms:>9.1f}{stats.p50_ms:>9.1f}"
+                    f"{stats.p95_ms:>9.1f}{stats.max_ms:>9.1f}{stats.mean_ms:>9.1f}"
+                    f"{stats.stdev_ms:>9.1f}{stats.variance_ms2:>12.1f}"
+                )
+        for error in bench.errors:
+            print(f"  {_color('red', 'failed')}: {error}")
+
+    print("\n  (all times in ms)\n")
+
+
+def _print_watch(health: dict[str, ServerHealth]) -> None:
+    """Print one round of watch-mode health checks.
+
+    Args:
+        health: Latest health per server
+    """
+    print(f"\n[{datetime.now():%H:%M:%S}] {_color('cyan', 'Server Status:')}")
+    if not health:
+        print("  No servers configured.")
+    for entry in health.values():
+        _print_server_status(entry.diagnostic)
+        details = f"checks: {entry.checks}, restarts: {entry.restarts}"
+        if entry.pid is not None:
+            details = f"pid: {entry.pid}, {details}"
+        print(f"    {_color('gray', details)}")
+    sys.stdout.flush()
+
+
+def _positive_int(value: str) -> int:
+    """Parse a strictly positive integer command line argument.
+
+    Args:
+        value: Argument text
+
+    Returns:
+        Parsed integer
+
+    Raises:
+        argparse.ArgumentTypeError: If value is not an integer above zero
+    """
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid integer: {value!r}") from None
+    if number <= 0:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
+
+
+def _positive_float(value: str) -> float:
+    """Parse a strictly positive, finite number command line argument.
+
+    Args:
+        value: Argument text
+
+    Returns:
+        Parsed number
+
+    Raises:
+        argparse.ArgumentTypeError: If value is not a number above zero
+    """
+    try:
+        number = float(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid number: {value!r}") from None
+    if not 0 < number < float("inf"):
+        raise argparse.ArgumentTypeError(f"must be greater than 0, got {value}")
+    return number
+
+
 def _color(color: str, text: str) -> str:
     """Apply ANSI color to text if terminal supports it.
 
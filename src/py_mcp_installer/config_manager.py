@@ -9,19 +9,37 @@ Design Philosophy:
 - Support both JSON (most platforms) and TOML (Codex)
 - Graceful handling of missing files
 - Legacy format migration support
+- Each file version is parsed once per process (cached by stat signature)
+- JSON writes replace only the servers section, preserving the rest of the
+  file byte for byte (see json_splice)
+- Read-modify-write cycles hold a cross-process file lock, so concurrent
+  installer processes never lose each other's updates (see file_lock), or
+  in optimistic mode use lock-free compare-and-swap writes with retries
 
 Example:
     >>> manager = ConfigManager(Path.home() / ".config/claude/mcp.json", ConfigFormat.JSON)
     >>> config = manager.read()
     >>> config["mcpServers"]["new-server"] = {"command": "test", "args": []}
     >>> manager.write(config)
+
+    >>> # Several changes, one backup and one write
+    >>> with manager.transaction() as txn:
+    ...     txn.remove_server("old-server")
+    ...     txn.add_server(new_server)
 """
 
 from __future__ import annotations
 
-import json
+import logging
+import os
+import random
+import threading
+import time
+from collections.abc import Callable, Collection, Iterator
+from contextlib import contextmanager, nullcontext
+from dataclasses import replace
 from pathlib import Path
-from typing import Any
+from typing import Any, TypeVar
 
 # tomllib is imported conditionally in parse_toml_safe utility
 
@@ -30,16 +48,101 @@ try:
 except ImportError:
     tomli_w = None  # type: ignore[assignment,unused-ignore]
 
-from .exceptions import BackupError, ConfigurationError, ValidationError
-from .types import ConfigFormat, MCPServerConfig
+from .backup_store import BackupStore
+from .exceptions import (
+    BackupError,
+    ConfigConflictError,
+    ConfigurationError,
+    ValidationError,
+)
+from .file_lock import DEFAULT_LOCK_TIMEOUT, FileLock
+from .json_backend import get_json_backend
+from .json_splice import replace_json_member
+from .server_index import ServerIndex
+from .types import ConfigFormat, Durability, FrozenServerConfig, MCPServerConfig
 from .utils import (
     atomic_write,
-    backup_file,
+    file_signature,
+    parse_json_members_safe,
     parse_json_safe,
     parse_toml_safe,
-    restore_backup,
 )
 
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Exponential backoff between optimistic update attempts (seconds)
+_CAS_BACKOFF_BASE = 0.005
+_CAS_BACKOFF_MAX = 0.25
+
+# ============================================================================
+# Parsed Config Cache
+# ============================================================================
+
+# Parsed documents by (absolute path, format), tagged with the file signature
+# they were parsed from. Cached documents are shared and never mutated.
+_parsed_configs: dict[
+    tuple[str, ConfigFormat], tuple[tuple[int, int, int], dict[str, Any]]
+] = {}
+_parsed_configs_lock = threading.Lock()
+
+# Number of config files kept in the cache
+_PARSED_CONFIG_LIMIT = 16
+
+# Selected top-level members by (absolute path, member names), tagged with
+# the file signature; see ConfigManager.snapshot_members()
+_parsed_members: dict[
+    tuple[str, tuple[str, ...]], tuple[tuple[int, int, int], dict[str, Any]]
+] = {}
+
+# Server indexes by (absolute path, servers key), with the shared servers
+# section they were built from; see ConfigManager.server_index()
+_server_indexes: dict[tuple[str, str], tuple[Any, ServerIndex]] = {}
+
+# Top-level keys that may hold the servers section, by precedence
+SERVER_SECTION_KEYS = ("mcpServers", "mcp_servers", "servers")
+
+# JSON files from this size on are read member by member when only some
+# members are needed, instead of being parsed completely
+STREAMING_READ_THRESHOLD = 1024 * 1024
+
+
+def clear_config_cache() -> None:
+    """Forget all parsed configuration files.
+
+    ConfigManager re-parses a file whenever its (inode, size, mtime_ns)
+    signature changes, so this is only needed after editing a file in a way
+    that preserves all three (e.g. in-place rewrite within one mtime tick).
+
+    Example:
+        >>> clear_config_cache()
+        >>> config = manager.read()  # parses the file again
+    """
+    with _parsed_configs_lock:
+        _parsed_configs.clear()
+        _parsed_members.clear()
+        _server_indexes.clear()
+
+
+def _copy_document(value: Any) -> Any:
+    """Copy a parsed config document.
+
+    Only dicts and lists are copied; every other value in a parsed JSON/TOML
+    document is immutable. Much faster than copy.deepcopy().
+
+    Args:
+        value: Parsed document or part of it
+
+    Returns:
+        Copy that shares no containers with ``value``
+    """
+    if isinstance(value, dict):
+        return {key: _copy_document(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_copy_document(item) for item in value]
+    return value
+
 
 class ConfigManager:
     """Manage MCP configuration files with atomic operations.
@@ -50,6 +153,13 @@ class ConfigManager:
     Attributes:
         config_path: Path to configuration file
         format: Configuration file format (JSON or TOML)
+        backup_store: Store receiving the backups taken before each write
+        lock: Cross-process lock held while changing the file (None if
+            locking is disabled or the manager is optimistic)
+        optimistic: Whether changes use compare-and-swap writes instead of
+            the lock
+        max_attempts: Attempts per :meth:`update` in optimistic mode
+        durability: fsync policy for config writes
 
     Example:
         >>> manager = ConfigManager(
@@ -64,12 +174,31 @@ class ConfigManager:
         ... ))
     """
 
-    def __init__(self, config_path: Path, format: ConfigFormat) -> None:
+    def __init__(
+        self,
+        config_path: Path,
+        format: ConfigFormat,
+        backup_store: BackupStore | None = None,
+        lock_timeout: float | None = DEFAULT_LOCK_TIMEOUT,
+        optimistic: bool = False,
+        max_attempts: int = 8,
+        durability: Durability = Durability.FILE,
+    ) -> None:
         """Initialize configuration manager.
 
         Args:
             config_path: Path to configuration file
             format: Configuration file format (JSON or TOML)
+            backup_store: Backup store to use (default: .mcp-installer-backups/
+                next to the config file with the default retention policy)
+            lock_timeout: Seconds to wait for other processes changing the
+                same file, or None to disable cross-process locking
+            optimistic: Never lock; instead verify just before replacing the
+                file that it is still the version the change was based on,
+                and retry :meth:`update` changes on conflict
+            max_attempts: Attempts per :meth:`update` in optimistic mode
+            durability: fsync policy for config writes: NONE, FILE (default)
+                or FILE_AND_DIR (see :func:`atomic_write`)
 
         Example:
             >>> manager = ConfigManager(
@@ -79,12 +208,133 @@ class ConfigManager:
         """
         self.config_path = config_path
         self.format = format
+        self.backup_store = backup_store or BackupStore.for_file(config_path)
+        self.optimistic = optimistic
+        self.max_attempts = max_attempts
+        self.durability = Durability(durability)
+        self.lock = (
+            FileLock.for_file(config_path, lock_timeout)
+            if lock_timeout is not None and not optimistic
+            else None
+        )
+        self._transaction: ConfigTransaction | None = None
+        # Whether read()/snapshot() ran, and the file signature they saw
+        self._has_read = False
+        self._read_signature: tuple[int, int, int] | None = None
+
+    @property
+    def servers_key(self) -> str:
+        """Key of the servers section ("mcpServers" or "mcp_servers" for TOML)."""
+        return "mcpServers" if self.format == ConfigFormat.JSON else "mcp_servers"
+
+    @contextmanager
+    def transaction(self) -> Iterator[ConfigTransaction]:
+        """Group several changes into one backup and one atomic write.
+
+        The file is read once, on first access. Changes made through the
+        yielded ConfigTransaction - and through this manager's own methods
+        while the transaction is open - are kept in memory and written when
+        the block exits normally. If the block raises, nothing is written.
+        A transaction opened inside another one joins the outer transaction.
+
+        The outermost transaction holds the manager's cross-process lock
+        from before the read until after the write, so updates made by
+        other processes in the meantime cannot be lost. In optimistic mode no
+        lock is taken; the commit raises ConfigConflictError instead if the
+        file changed since the transaction read it (use :meth:`update` to
+        retry automatically).
+
+        A ConfigManager must not be shared between threads while a
+        transaction is open.
+
+        Yields:
+            Transaction holding the pending configuration
+
+        Raises:
+            BackupError: If backup creation fails on commit
+            ConfigLockError: If another process holds the lock too long
+            ConfigConflictError: If optimistic and the file changed meanwhile
+            ConfigurationError: If the file is invalid or the commit fails
+
+        Example:
+            >>> manager = ConfigManager(Path(".claude.json"), ConfigFormat.JSON)
+            >>> with manager.transaction() as txn:
+            ...     txn.remove_server("old-server")
+            ...     txn.add_server(new_server)
+            ...     manager.update_server("other", other)  # joins the transaction
+        """
+        if self._transaction is not None:
+            yield self._transaction
+            return
+
+        with self.lock or nullcontext():
+            txn = ConfigTransaction(self)
+            self._transaction = txn
+            try:
+                yield txn
+            finally:
+                self._transaction = None
+
+            if txn.changed:
+                self._write_file(
+                    txn.config,
+                    expected_signature=txn.signature,
+                    require_unchanged=self.optimistic and txn.has_read,
+                    base=txn.base,
+                    others_unchanged=not txn.others_changed,
+                )
+
+    def update(self, mutate: Callable[[ConfigTransaction], T]) -> T:
+        """Apply a change function in a transaction, retrying on conflict.
+
+        ``mutate`` receives the transaction and edits it like a
+        ``with transaction()`` block would. In optimistic mode, if another
+        process replaced the file after it was read, the change is discarded
+        and ``mutate`` runs again on the new content, after a randomized
+        exponential backoff, up to ``max_attempts`` times. With locking, the
+        first attempt always succeeds. Inside an open transaction, ``mutate``
+        joins it and is not retried.
+
+        Args:
+            mutate: Change function; must only touch the transaction (it may
+                run several times)
+
+        Returns:
+            Return value of the successful ``mutate`` call
+
+        Raises:
+            ConfigConflictError: If every attempt conflicted
+            ConfigLockError: If another process holds the lock too long
+            ConfigurationError: If the file is invalid or the write fails
+
+        Example:
+            >>> manager = ConfigManager(path, ConfigFormat.JSON, optimistic=True)
+            >>> manager.update(lambda txn: txn.add_server(server))
+        """
+        attempt = 1
+        while True:
+            try:
+                with self.transaction() as txn:
+                    return mutate(txn)
+            except ConfigConflictError:
+                if attempt >= self.max_attempts or self._transaction is not None:
+                    raise
+                delay = min(_CAS_BACKOFF_MAX, _CAS_BACKOFF_BASE * 2 ** (attempt - 1))
+                logger.debug(
+                    f"{self.config_path} changed during update "
+                    f"(attempt {attempt}/{self.max_attempts}); retrying"
+                )
+                time.sleep(random.uniform(0, delay))
+                attempt += 1
 
     def read(self) -> dict[str, Any]:
         """Read and parse configuration file.
 
         Returns empty dict if file doesn't exist. Validates structure
-        and raises ConfigurationError if invalid.
+        and raises ConfigurationError if invalid. The result is a private
+        copy the caller may modify; the file itself is parsed only when it
+        changed since the last read (see :meth:`snapshot`). Inside a
+        transaction, returns the pending configuration instead.
 
         Returns:
             Configuration dictionary (empty dict if file missing)
@@ -97,27 +347,84 @@ class ConfigManager:
             >>> config = manager.read()
             >>> print(config.get("mcpServers", {}))
         """
-        if self.format == ConfigFormat.JSON:
-            return parse_json_safe(self.config_path)
-        elif self.format == ConfigFormat.TOML:
-            return parse_toml_safe(self.config_path)
+        if self._transaction is not None:
+            return self._transaction.config
+        copy: dict[str, Any] = _copy_document(self._read_recorded())
+        return copy
+
+    def snapshot(self) -> dict[str, Any]:
+        """Read configuration without copying it.
+
+        Like :meth:`read`, but returns the parsed document shared by every
+        reader in the process: the file is parsed only when its (inode, size,
+        mtime_ns) signature changed. The result must be treated as read-only;
+        use :meth:`read` or :meth:`transaction` to make changes. Inside a
+        transaction, returns the pending configuration.
+
+        Returns:
+            Configuration dictionary (empty dict if file missing)
+
+        Raises:
+            ConfigurationError: If file exists but is invalid
+
+        Example:
+            >>> manager = ConfigManager(Path(".claude.json"), ConfigFormat.JSON)
+            >>> servers = manager.snapshot().get("mcpServers", {})
+            >>> print(sorted(servers))
+        """
+        if self._transaction is not None:
+            return self._transaction.config
+        return self._read_recorded()
+
+    def snapshot_members(self, keys: Collection[str]) -> dict[str, Any]:
+        """Read only some top-level members of the configuration.
+
+        For read-only callers that need one section (e.g. the servers) of a
+        large host config. JSON files of ``STREAMING_READ_THRESHOLD`` bytes
+        or more are not parsed completely: the other members are validated
+        but not built, which keeps memory proportional to the requested
+        members. Smaller files, TOML files and files already parsed by
+        :meth:`snapshot` are served from the parsed document. Like
+        :meth:`snapshot`, the result is shared and must not be mutated.
+
+        Args:
+            keys: Top-level members to return
+
+        Returns:
+            The requested members that are present
+
+        Raises:
+            ConfigurationError: If file exists but is invalid
+
+        Example:
+            >>> manager = ConfigManager(Path.home() / ".claude.json", ConfigFormat.JSON)
+            >>> servers = manager.snapshot_members(["mcpServers"]).get("mcpServers", {})
+        """
+        if self._transaction is not None:
+            config = self._transaction.config
         else:
-            raise ConfigurationError(
-                f"Unsupported config format: {self.format}",
-                config_path=str(self.config_path),
-            )
+            config = self._read_members_cached(tuple(keys))
+        return {key: config[key] for key in keys if key in config}
 
     def write(self, config: dict[str, Any]) -> None:
         """Write configuration with atomic operation.
 
         Creates backup before writing. Uses atomic write pattern
-        (temp file + rename) to prevent partial writes.
+        (temp file + rename) to prevent partial writes. Inside a
+        transaction, replaces the pending configuration instead; the file is
+        written when the transaction commits.
+
+        In optimistic mode the write is a compare-and-swap against the
+        version seen by this manager's last :meth:`read`/:meth:`snapshot`
+        (if any): it raises ConfigConflictError instead of overwriting a
+        file that changed since. :meth:`update` retries such conflicts.
 
         Args:
             config: Configuration dictionary to write
 
         Raises:
             BackupError: If backup creation fails
+            ConfigConflictError: If optimistic and the file changed since read
             ConfigurationError: If write operation fails
 
         Example:
@@ -125,52 +432,22 @@ class ConfigManager:
             >>> config = {"mcpServers": {"test": {"command": "test"}}}
             >>> manager.write(config)
         """
-        # Create backup if file exists
-        if self.config_path.exists():
-            try:
-                backup_file(self.config_path)
-            except Exception as e:
-                raise BackupError(f"Failed to backup before write: {e}") from e
-
-        # Serialize configuration
-        try:
-            if self.format == ConfigFormat.JSON:
-                content = json.dumps(config, indent=2) + "\n"
-            elif self.format == ConfigFormat.TOML:
-                if tomli_w is None:
-                    raise ConfigurationError(
-                        "TOML write support requires tomli-w package",
-                        config_path=str(self.config_path),
-                    )
-                import io
-
-                # tomli_w.dump requires binary mode IO
-                buffer = io.BytesIO()
-                tomli_w.dump(config, buffer)
-                content = buffer.getvalue().decode("utf-8")
-            else:
-                raise ConfigurationError(
-                    f"Unsupported config format: {self.format}",
-                    config_path=str(self.config_path),
-                )
-        except Exception as e:
-            raise ConfigurationError(
-                f"Failed to serialize config: {e}", config_path=str(self.config_path)
-            ) from e
-
-        # Write atomically
-        try:
-            atomic_write(self.config_path, content)
-        except Exception as e:
-            raise ConfigurationError(
-                f"Failed to write config: {e}", config_path=str(self.config_path)
-            ) from e
+        if self._transaction is not None:
+            self._transaction.replace(config)
+            return
+        with self.lock or nullcontext():
+            self._write_file(
+                config,
+                expected_signature=self._read_signature,
+                require_unchanged=self.optimistic and self._has_read,
+                base=self._cached_document(self._read_signature),
+            )
 
     def backup(self) -> Path:
         """Create timestamped backup of current config.
 
-        Backups are stored in .mcp-installer-backups/ directory with
-        timestamp in filename.
+        Backups are stored in the manager's backup store, which keeps
+        identical snapshots once and prunes old ones (see :class:`BackupStore`).
 
         Returns:
             Path to created backup file
@@ -182,12 +459,12 @@ class ConfigManager:
             >>> manager = ConfigManager(Path(".claude.json"), ConfigFormat.JSON)
             >>> backup_path = manager.backup()
             >>> print(backup_path)
-            .mcp-installer-backups/.claude.json.20250105_143022.backup
+            .mcp-installer-backups/.claude.json.20250105_143022_481516.backup
         """
         if not self.config_path.exists():
             raise BackupError(f"Cannot backup non-existent file: {self.config_path}")
 
-        return backup_file(self.config_path)
+        return self.backup_store.save(self.config_path)
 
     def restore(self, backup_path: Path) -> None:
         """Restore configuration from backup file.
@@ -204,7 +481,8 @@ class ConfigManager:
             >>> # ... make changes ...
             >>> manager.restore(backup_path)  # Rollback changes
         """
-        restore_backup(backup_path, self.config_path)
+        with self.lock or nullcontext():
+            self.backup_store.restore(backup_path, self.config_path)
 
     def add_server(self, server: MCPServerConfig) -> None:
         """Add MCP server to configuration.
@@ -229,44 +507,7 @@ class ConfigManager:
             ... )
             >>> manager.add_server(server)
         """
-        config = self.read()
-
-        # Determine servers key based on format
-        servers_key = (
-            "mcpServers" if self.format == ConfigFormat.JSON else "mcp_servers"
-        )
-
-        # Initialize servers section if missing
-        if servers_key not in config:
-            config[servers_key] = {}
-
-        # Check if server already exists
-        if server.name in config[servers_key]:
-            raise ValidationError(
-                f"Server '{server.name}' already exists in configuration",
-                recovery_suggestion=(
-                    "Use update_server() to modify existing server, "
-                    "or remove it first"
-                ),
-            )
-
-        # Build server config dict
-        server_dict: dict[str, Any] = {
-            "command": server.command,
-            "args": list(server.args),  # Convert to list to ensure JSON serialization
-        }
-
-        # Add optional fields
-        if server.env:
-            server_dict["env"] = dict(server.env)  # Convert to dict
-        if server.description:
-            server_dict["description"] = server.description
-
-        # Add server
-        config[servers_key][server.name] = server_dict
-
-        # Write config
-        self.write(config)
+        self.update(lambda txn: txn.add_server(server))
 
     def remove_server(self, name: str) -> None:
         """Remove MCP server from configuration.
@@ -282,25 +523,7 @@ class ConfigManager:
             >>> manager = ConfigManager(Path(".claude.json"), ConfigFormat.JSON)
             >>> manager.remove_server("mcp-ticketer")
         """
-        config = self.read()
-
-        # Determine servers key
-        servers_key = (
-            "mcpServers" if self.format == ConfigFormat.JSON else "mcp_servers"
-        )
-
-        # Check if server exists
-        if servers_key not in config or name not in config[servers_key]:
-            raise ValidationError(
-                f"Server '{name}' not found in configuration",
-                recovery_suggestion="Use list_servers() to see available servers",
-            )
-
-        # Remove server
-        del config[servers_key][name]
-
-        # Write config
-        self.write(config)
+        self.update(lambda txn: txn.remove_server(name))
 
     def update_server(self, name: str, server: MCPServerConfig) -> None:
         """Update existing server configuration.
@@ -322,36 +545,95 @@ class ConfigManager:
             ... )
             >>> manager.update_server("mcp-ticketer", updated)
         """
-        config = self.read()
+        self.update(lambda txn: txn.update_server(name, server))
 
-        # Determine servers key
-        servers_key = (
-            "mcpServers" if self.format == ConfigFormat.JSON else "mcp_servers"
-        )
+    def add_servers(
+        self, servers: list[MCPServerConfig], replace: Collection[str] = ()
+    ) -> None:
+        """Add or replace several MCP servers with a single write.
 
-        # Check if server exists
-        if servers_key not in config or name not in config[servers_key]:
-            raise ValidationError(
-                f"Server '{name}' not found in configuration",
-                recovery_suggestion="Use add_server() to create new server",
-            )
+        All servers are checked before anything changes: names must be
+        unique, names in ``replace`` must already exist and all other names
+        must not. The batch is then applied in one transaction (one backup,
+        one atomic write).
 
-        # Build updated server config
-        server_dict: dict[str, Any] = {
-            "command": server.command,
-            "args": list(server.args),
-        }
+        Args:
+            servers: Server configurations to add
+            replace: Names of existing servers to overwrite
 
-        if server.env:
-            server_dict["env"] = dict(server.env)
-        if server.description:
-            server_dict["description"] = server.description
+        Raises:
+            ValidationError: If any server fails the checks (nothing is written)
+            ConfigurationError: If write fails
+
+        Example:
+            >>> manager = ConfigManager(Path(".claude.json"), ConfigFormat.JSON)
+            >>> manager.add_servers(
+            ...     [ticketer, github],
+            ...     replace={"mcp-ticketer"},  # already installed, overwrite
+            ... )
+        """
+
+        def apply(txn: ConfigTransaction) -> None:
+            existing = txn.servers
+
+            problems: list[str] = []
+            seen: set[str] = set()
+            for server in servers:
+                if server.name in seen:
+                    problems.append(f"Server '{server.name}' listed more than once")
+                elif server.name in replace and server.name not in existing:
+                    problems.append(f"Server '{server.name}' not found in configuration")
+                elif server.name not in replace and server.name in existing:
+                    problems.append(
+                        f"Server '{server.name}' already exists in configuration"
+                    )
+                seen.add(server.name)
+
+            if problems:
+                raise ValidationError(
+                    "\n".join(problems),
+                    recovery_suggestion=(
+                        "Remove duplicates and pass existing servers in 'replace' "
+                        "to overwrite them"
+                    ),
+                )
+
+            for server in servers:
+                if server.name in replace:
+                    txn.update_server(server.name, server)
+                else:
+                    txn.add_server(server)
+
+        self.update(apply)
+
+    def remove_servers(self, names: list[str]) -> None:
+        """Remove several MCP servers with a single write.
+
+        Args:
+            names: Names of servers to remove
+
+        Raises:
+            ValidationError: If any server doesn't exist (nothing is written)
+            ConfigurationError: If write fails
+
+        Example:
+            >>> manager = ConfigManager(Path(".claude.json"), ConfigFormat.JSON)
+            >>> manager.remove_servers(["old-server", "unused-server"])
+        """
+        unique = list(dict.fromkeys(names))
+
+        def apply(txn: ConfigTransaction) -> None:
+            missing = [name for name in unique if txn.get_server(name) is None]
+            if missing:
+                raise ValidationError(
+                    "Servers not found in configuration: " + ", ".join(missing),
+                    recovery_suggestion="Use list_servers() to see available servers",
+                )
 
-        # Update server
-        config[servers_key][name] = server_dict
+            for name in unique:
+                txn.remove_server(name)
 
-        # Write config
-        self.write(config)
+        self.update(apply)
 
     def list_servers(self) -> list[MCPServerConfig]:
         """List all configured MCP servers.
@@ -365,30 +647,7 @@ class ConfigManager:
             >>> for server in servers:
             ...     print(f"{server.name}: {server.command}")
         """
-        config = self.read()
-
-        # Determine servers key
-        servers_key = (
-            "mcpServers" if self.format == ConfigFormat.JSON else "mcp_servers"
-        )
-
-        servers: list[MCPServerConfig] = []
-
-        for name, server_dict in config.get(servers_key, {}).items():
-            if not isinstance(server_dict, dict):
-                continue  # Skip invalid entries
-
-            servers.append(
-                MCPServerConfig(
-                    name=name,
-                    command=server_dict.get("command", ""),
-                    args=server_dict.get("args", []),
-                    env=server_dict.get("env", {}),
-                    description=server_dict.get("description", ""),
-                )
-            )
-
-        return servers
+        return [self._copy_server(server) for server in self.server_index()]
 
     def get_server(self, name: str) -> MCPServerConfig | None:
         """Get specific server configuration.
@@ -405,24 +664,68 @@ class ConfigManager:
             >>> if server:
             ...     print(f"Command: {server.command}")
         """
-        config = self.read()
+        server = self.server_index().get(name)
+        return self._copy_server(server) if server is not None else None
 
-        # Determine servers key
-        servers_key = (
-            "mcpServers" if self.format == ConfigFormat.JSON else "mcp_servers"
-        )
+    def frozen_servers(self) -> tuple[FrozenServerConfig, ...]:
+        """List all configured MCP servers as immutable configs.
 
-        server_dict = config.get(servers_key, {}).get(name)
-        if not server_dict or not isinstance(server_dict, dict):
-            return None
+        Unlike :meth:`list_servers`, nothing is copied: the configs are
+        built once per parsed version of the file and shared between
+        callers, which suits inventories of many servers and cache keys.
 
-        return MCPServerConfig(
-            name=name,
-            command=server_dict.get("command", ""),
-            args=server_dict.get("args", []),
-            env=server_dict.get("env", {}),
-            description=server_dict.get("description", ""),
-        )
+        Returns:
+            Frozen server configurations, in config order
+
+        Raises:
+            ConfigurationError: If file exists but is invalid
+
+        Example:
+            >>> manager = ConfigManager(Path(".claude.json"), ConfigFormat.JSON)
+            >>> hashes = {server.content_hash for server in manager.frozen_servers()}
+        """
+        return self.server_index().frozen()
+
+    def server_index(self) -> ServerIndex:
+        """Index the configured servers by name, command and argv.
+
+        The index is built once per parsed version of the file and shared
+        between callers, like :meth:`snapshot`; its server configs must not
+        be mutated. Only the servers section is read, so large files aren't
+        fully parsed. Inside a transaction the pending configuration is
+        indexed instead.
+
+        Returns:
+            Index of the configured servers
+
+        Raises:
+            ConfigurationError: If file exists but is invalid
+
+        Example:
+            >>> index = manager.server_index()
+            >>> for names in index.near_duplicates():
+            ...     print("Same command:", ", ".join(names))
+        """
+        if self._transaction is not None:
+            section = self._transaction.config.get(self.servers_key, {})
+            return ServerIndex.from_section(section if isinstance(section, dict) else {})
+
+        section = self.snapshot_members([self.servers_key]).get(self.servers_key, {})
+        key = (os.path.abspath(self.config_path), self.servers_key)
+        with _parsed_configs_lock:
+            cached = _server_indexes.get(key)
+        # Parsed sections are shared and never mutated, so the same object
+        # means the same content
+        if cached is not None and cached[0] is section:
+            return cached[1]
+
+        index = ServerIndex.from_section(section if isinstance(section, dict) else {})
+        with _parsed_configs_lock:
+            _server_indexes.pop(key, None)
+            _server_indexes[key] = (section, index)
+            while len(_server_indexes) > _PARSED_CONFIG_LIMIT:
+                del _server_indexes[next(iter(_server_indexes))]
+        return index
 
     def validate(self) -> list[str]:
         """Validate configuration structure.
@@ -443,7 +746,7 @@ class ConfigManager:
         issues: list[str] = []
 
         try:
-            config = self.read()
+            config = self.snapshot()
         except ConfigurationError as e:
             return [f"Failed to read config: {e.message}"]
 
@@ -541,3 +844,442 @@ class ConfigManager:
             self.write(config)
 
         return migrated
+
+    # ========================================================================
+    # Private Helper Methods
+    # ========================================================================
+
+    def _read_recorded(self) -> dict[str, Any]:
+        """Read the shared document and remember its version for write().
+
+        Returns:
+            Cached configuration dictionary (must not be mutated)
+
+        Raises:
+            ConfigurationError: If file exists but is invalid
+        """
+        signature, document = self._read_cached()
+        self._has_read = True
+        self._read_signature = signature
+        return document
+
+    def _read_cached(self) -> tuple[tuple[int, int, int] | None, dict[str, Any]]:
+        """Return the shared parsed document, parsing only if the file changed.
+
+        The signature is taken before parsing: if the file is replaced
+        meanwhile, a compare-and-swap based on it fails rather than
+        overwriting the newer version.
+
+        Returns:
+            (file signature or None if missing, cached configuration
+            dictionary that must not be mutated)
+
+        Raises:
+            ConfigurationError: If file exists but is invalid
+        """
+        signature = file_signature(self.config_path)
+        if signature is None:
+            return None, self._read_file()
+
+        key = (os.path.abspath(self.config_path), self.format)
+        with _parsed_configs_lock:
+            cached = _parsed_configs.get(key)
+        if cached is not None and cached[0] == signature:
+            return signature, cached[1]
+
+        document = self._read_file()
+
+        # Only cache if the file didn't change while it was being parsed
+        if file_signature(self.config_path) == signature:
+            with _parsed_configs_lock:
+                _parsed_configs.pop(key, None)
+                _parsed_configs[key] = (signature, document)
+                while len(_parsed_configs) > _PARSED_CONFIG_LIMIT:
+                    del _parsed_configs[next(iter(_parsed_configs))]
+
+        return signature, document
+
+    def _cached_document(self, signature: tuple[int, int, int] | None) -> dict[str, Any] | None:
+        """Return the shared parsed document of a file version, if cached.
+
+        Args:
+            signature: File signature of the wanted version
+
+        Returns:
+            Cached configuration dictionary (must not be mutated), or None
+        """
+        if signature is None:
+            return None
+        with _parsed_configs_lock:
+            cached = _parsed_configs.get((os.path.abspath(self.config_path), self.format))
+        return cached[1] if cached is not None and cached[0] == signature else None
+
+    def _read_members_cached(self, keys: tuple[str, ...]) -> dict[str, Any]:
+        """Return a document holding at least the given top-level members.
+
+        Args:
+            keys: Top-level members needed
+
+        Returns:
+            Shared parsed document (complete, or only the members) that must
+            not be mutated
+
+        Raises:
+            ConfigurationError: If file exists but is invalid
+        """
+        signature = file_signature(self.config_path)
+        if (
+            signature is None
+            or self.format != ConfigFormat.JSON
+            or signature[1] < STREAMING_READ_THRESHOLD
+        ):
+            return self._read_cached()[1]
+
+        path = os.path.abspath(self.config_path)
+        with _parsed_configs_lock:
+            complete = _parsed_configs.get((path, self.format))
+            partial = _parsed_members.get((path, keys))
+        for cached in (complete, partial):
+            if cached is not None and cached[0] == signature:
+                return cached[1]
+
+        members = parse_json_members_safe(self.config_path, keys)
+
+        # Only cache if the file didn't change while it was being parsed
+        if file_signature(self.config_path) == signature:
+            with _parsed_configs_lock:
+                _parsed_members.pop((path, keys), None)
+                _parsed_members[(path, keys)] = (signature, members)
+                while len(_parsed_members) > _PARSED_CONFIG_LIMIT:
+                    del _parsed_members[next(iter(_parsed_members))]
+
+        return members
+
+    def _read_file(self) -> dict[str, Any]:
+        """Read and parse the configuration file from disk.
+
+        Returns:
+            Configuration dictionary (empty dict if file missing)
+
+        Raises:
+            ConfigurationError: If file exists but is invalid
+        """
+        if self.format == ConfigFormat.JSON:
+            return parse_json_safe(self.config_path)
+        elif self.format == ConfigFormat.TOML:
+            return parse_toml_safe(self.config_path)
+        else:
+            raise ConfigurationError(
+                f"Unsupported config format: {self.format}",
+                config_path=str(self.config_path),
+            )
+
+    def _write_file(
+        self,
+        config: dict[str, Any],
+        expected_signature: tuple[int, int, int] | None = None,
+        require_unchanged: bool = False,
+        base: dict[str, Any] | None = None,
+        others_unchanged: bool = False,
+    ) -> None:
+        """Back up and atomically write the configuration file.
+
+        Args:
+            config: Configuration dictionary to write
+            expected_signature: Signature of the version ``config`` is based on
+            require_unchanged: Compare-and-swap against ``expected_signature``
+            base: Parsed document of that version (enables splicing JSON)
+            others_unchanged: Whether only the servers section can differ
+                from ``base``
+
+        Raises:
+            BackupError: If backup creation fails
+            ConfigConflictError: If require_unchanged and the file changed
+            ConfigurationError: If write operation fails
+        """
+        # Create backup if file exists
+        if self.config_path.exists():
+            try:
+                self.backup_store.save(self.config_path)
+            except Exception as e:
+                raise BackupError(f"Failed to backup before write: {e}") from e
+
+        # Serialize configuration
+        try:
+            if self.format == ConfigFormat.JSON:
+                # Rewrite only the servers section when possible
+                spliced = self._splice_servers(
+                    config, base, expected_signature, others_unchanged
+                )
+                content: str | bytes = (
+                    spliced if spliced is not None else get_json_backend().dumps(config)
+                )
+            elif self.format == ConfigFormat.TOML:
+                if tomli_w is None:
+                    raise ConfigurationError(
+                        "TOML write support requires tomli-w package",
+                        config_path=str(self.config_path),
+                    )
+                import io
+
+                # tomli_w.dump requires binary mode IO
+                buffer = io.BytesIO()
+                tomli_w.dump(config, buffer)
+                content = buffer.getvalue().decode("utf-8")
+            else:
+                raise ConfigurationError(
+                    f"Unsupported config format: {self.format}",
+                    config_path=str(self.config_path),
+                )
+        except Exception as e:
+            raise ConfigurationError(
+                f"Failed to serialize config: {e}", config_path=str(self.config_path)
+            ) from e
+
+        # Write atomically
+        try:
+            atomic_write(
+                self.config_path,
+                content,
+                expected_signature=expected_signature,
+                require_unchanged=require_unchanged,
+                durability=self.durability,
+            )
+        except ConfigConflictError:
+            raise
+        except Exception as e:
+            raise ConfigurationError(
+                f"Failed to write config: {e}", config_path=str(self.config_path)
+            ) from e
+
+    def _splice_servers(
+        self,
+        config: dict[str, Any],
+        base: dict[str, Any] | None,
+        base_signature: tuple[int, int, int] | None,
+        others_unchanged: bool,
+    ) -> str | None:
+        """Build new JSON file content by replacing only the servers section.
+
+        Which members changed is decided against ``base``, the document
+        already parsed for the version being replaced; the file itself is
+        only scanned for the byte span of the servers section.
+
+        Args:
+            config: Configuration dictionary to write
+            base: Parsed document ``config`` was derived from
+            base_signature: File signature of that version
+            others_unchanged: Whether only the servers section can differ
+                from ``base`` (skips comparing the other members)
+
+        Returns:
+            Current file content with the servers section replaced, or None
+            if anything outside that section changed or the file can't be
+            patched safely (the caller then serializes the whole document)
+        """
+        key = self.servers_key
+        if base is None or base_signature is None or key not in config:
+            return None
+
+        names = list(base)
+        if list(config) != (names if key in base else [*names, key]):
+            return None  # Members added, removed or reordered
+        if not others_unchanged and any(
+            config[name] != base[name] for name in names if name != key
+        ):
+            return None
+
+        try:
+            original = self.config_path.read_text(encoding="utf-8")
+        except (OSError, UnicodeDecodeError):
+            return None
+        if file_signature(self.config_path) != base_signature:
+            return None  # Replaced since it was parsed
+        if key in base and config[key] == base[key]:
+            return original
+        return replace_json_member(original, key, config[key])
+
+    @staticmethod
+    def _copy_server(server: MCPServerConfig) -> MCPServerConfig:
+        """Copy an indexed server config for a caller that may mutate it.
+
+        Args:
+            server: Shared server configuration
+
+        Returns:
+            Server configuration owning its own args list and env dict
+        """
+        return replace(
+            server,
+            args=list(server.args),
+            env=dict(server.env) if isinstance(server.env, dict) else server.env,
+        )
+
+    @staticmethod
+    def _server_to_dict(server: MCPServerConfig) -> dict[str, Any]:
+        """Build the config file entry for a server.
+
+        Args:
+            server: Server configuration
+
+        Returns:
+            Server entry (optional fields only when set)
+        """
+        server_dict: dict[str, Any] = {
+            "command": server.command,
+            "args": list(server.args),  # Convert to list to ensure JSON serialization
+        }
+
+        # Add optional fields
+        if server.env:
+            server_dict["env"] = dict(server.env)
+        if server.description:
+            server_dict["description"] = server.description
+
+        return server_dict
+
+
+class ConfigTransaction:
+    """Pending changes to a configuration file.
+
+    Created by :meth:`ConfigManager.transaction`. The file is read on first
+    access; server mutations only change the in-memory configuration, which
+    the manager writes once when the transaction commits.
+
+    Attributes:
+        manager: Manager that owns the transaction
+        changed: Whether the pending configuration differs from the file
+        has_read: Whether the file was read into the transaction
+        signature: Signature of the file version that was read (None if the
+            file did not exist)
+        base: Shared parsed document of that version (must not be mutated)
+        others_changed: Whether members outside the servers section may
+            have been edited (set by :meth:`mark_changed` and :meth:`replace`)
+
+    Example:
+        >>> with manager.transaction() as txn:
+        ...     for name in ("old-a", "old-b"):
+        ...         txn.remove_server(name)
+        ...     txn.config["theme"] = "dark"  # direct edit
+        ...     txn.mark_changed()
+    """
+
+    def __init__(self, manager: ConfigManager) -> None:
+        """Initialize transaction (the file is read lazily).
+
+        Args:
+            manager: Manager that owns the transaction
+        """
+        self.manager = manager
+        self.changed = False
+        self.has_read = False
+        self.signature: tuple[int, int, int] | None = None
+        self.base: dict[str, Any] | None = None
+        self.others_changed = False
+        self._config: dict[str, Any] | None = None
+
+    @property
+    def config(self) -> dict[str, Any]:
+        """Pending configuration (read from the file on first access).
+
+        Call :meth:`mark_changed` after editing it directly.
+
+        Raises:
+            ConfigurationError: If the file exists but is invalid
+        """
+        if self._config is None:
+            self.signature, self.base = self.manager._read_cached()
+            self.has_read = True
+            self._config = _copy_document(self.base)
+        return self._config
+
+    @property
+    def servers(self) -> dict[str, Any]:
+        """Servers section of the pending configuration (created if missing)."""
+        servers: dict[str, Any] = self.config.setdefault(self.manager.servers_key, {})
+        return servers
+
+    def mark_changed(self) -> None:
+        """Record a direct edit of :attr:`config` so the commit writes it."""
+        self.changed = True
+        self.others_changed = True
+
+    def replace(self, config: dict[str, Any]) -> None:
+        """Replace the whole pending configuration.
+
+        Args:
+            config: New configuration
+        """
+        self._config = config
+        self.changed = True
+        self.others_changed = True
+
+    def get_server(self, name: str) -> dict[str, Any] | None:
+        """Get a server entry from the pending configuration.
+
+        Args:
+            name: Server name
+
+        Returns:
+            Server entry, or None if not configured
+        """
+        entry = self.config.get(self.manager.servers_key, {}).get(name)
+        return entry if isinstance(entry, dict) else None
+
+    def add_server(self, server: MCPServerConfig) -> None:
+        """Add a server.
+
+        Args:
+            server: Server configuration to add
+
+        Raises:
+            ValidationError: If server with same name already exists
+        """
+        if server.name in self.servers:
+            raise ValidationError(
+                f"Server '{server.name}' already exists in configuration",
+                recovery_suggestion=(
+                    "Use update_server() to modify existing server, "
+                    "or remove it first"
+                ),
+            )
+
+        self.servers[server.name] = ConfigManager._server_to_dict(server)
+        self.changed = True
+
+    def update_server(self, name: str, server: MCPServerConfig) -> None:
+        """Replace an existing server.
+
+        Args:
+            name: Name of server to update
+            server: New server configuration
+
+        Raises:
+            ValidationError: If server doesn't exist
+        """
+        if name not in self.config.get(self.manager.servers_key, {}):
+            raise ValidationError(
+                f"Server '{name}' not found in configuration",
+                recovery_suggestion="Use add_server() to create new server",
+            )
+
+        self.servers[name] = ConfigManager._server_to_dict(server)
+        self.changed = True
+
+    def remove_server(self, name: str) -> None:
+        """Remove a server.
+
+        Args:
+            name: Name of server to remove
+
+        Raises:
+            ValidationError: If server doesn't exist
+        """
+        if name not in self.config.get(self.manager.servers_key, {}):
+            raise ValidationError(
+                f"Server '{name}' not found in configuration",
+                recovery_suggestion="Use list_servers() to see available servers",
+            )
+
+        del self.servers[name]
+        self.changed = True
@@ -0,0 +1,264 @@
+"""Persistent cache of platform detection results.
+
+Platform detection stats a dozen paths, checks config files and searches
+PATH for several CLIs. The result only changes when one of those inputs
+changes, so this module stores each detection pass on disk together with a
+signature of everything the detectors looked at, and replays it when all
+signatures still match.
+
+Recorded signatures:
+- Every probed path: whether it exists, and (inode, size, mtime_ns) for
+  config files whose content was checked
+- Every environment variable a detector read
+- PATH, plus the mtime of each PATH directory (covers CLI lookups)
+- Home directory, working directory, OS and package version
+
+Design Philosophy:
+- A stale result is worse than a slow one: any change invalidates the entry
+- The cache is an optimization only; read/write failures are ignored
+- Entries are kept per working directory (detectors check project files)
+
+Example:
+    >>> from py_mcp_installer import DetectionCache, PlatformDetector
+    >>> detector = PlatformDetector(cache=DetectionCache())
+    >>> info = detector.detect()  # full detection, result stored
+    >>> info = detector.detect()  # a few stat calls
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import sys
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+from .types import Durability, Platform, PlatformInfo, Scope
+from .utils import atomic_write
+
+logger = logging.getLogger(__name__)
+
+# Probe key used by PlatformDetector: (kind, argument)
+ProbeKey = tuple[str, str]
+
+
+class DetectionCache:
+    """On-disk cache of PlatformDetector.detect_all() results.
+
+    Attributes:
+        path: Cache file location
+
+    Example:
+        >>> cache = DetectionCache()
+        >>> print(cache.path)
+        /home/user/.cache/py-mcp-installer/detection.json
+        >>> cache.clear()
+    """
+
+    # Bump when the file layout or detector logic changes
+    FORMAT_VERSION = 1
+
+    # Number of working directories kept in the cache file
+    MAX_ENTRIES = 32
+
+    def __init__(self, path: Path | None = None) -> None:
+        """Initialize cache.
+
+        Args:
+            path: Cache file location (default: see :meth:`default_path`)
+        """
+        self.path = path or self.default_path()
+
+    @staticmethod
+    def default_path() -> Path:
+        """Default cache file location.
+
+        Uses ``$XDG_CACHE_HOME/py-mcp-installer`` (``~/.cache`` if unset),
+        or ``%LOCALAPPDATA%\\py-mcp-installer`` on Windows.
+
+        Returns:
+            Path to the cache file
+        """
+        if sys.platform == "win32" and os.environ.get("LOCALAPPDATA"):
+            base = Path(os.environ["LOCALAPPDATA"])
+        else:
+            base = Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache")
+        return base / "py-mcp-installer" / "detection.json"
+
+    @staticmethod
+    def probe_signature(kind: str, key: str) -> Any:
+        """Capture the current state of a detector input.
+
+        Args:
+            kind: Probe type ("exists", "json", "toml", "command", "env")
+            key: Path, command name or environment variable name
+
+        Returns:
+            JSON-serializable signature; equal signatures mean the probe
+            would return the same result
+        """
+        if kind == "env":
+            return os.environ.get(key)
+        if kind == "exists":
+            return os.path.exists(key)
+        if kind == "command":
+            # Covered by PATH and PATH directory mtimes in the context
+            return None
+        try:
+            st = os.stat(key)
+        except OSError:
+            return None
+        return [st.st_ino, st.st_size, st.st_mtime_ns]
+
+    def load(self) -> dict[Platform, PlatformInfo] | None:
+        """Return cached results if nothing the detectors probed changed.
+
+        Returns:
+            Cached detect_all() results, or None on a miss
+        """
+        entry = self._read_entries().get(os.getcwd())
+        if entry is None:
+            return None
+
+        if entry.get("context") != self._context():
+            logger.debug("Detection cache miss: environment changed")
+            return None
+
+        for kind, key, signature in entry.get("probes", []):
+            if self.probe_signature(kind, key) != signature:
+                logger.debug(f"Detection cache miss: {kind} {key} changed")
+                return None
+
+        try:
+            return {
+                Platform(name): _info_from_dict(Platform(name), data)
+                for name, data in entry["results"].items()
+            }
+        except (KeyError, TypeError, ValueError) as e:
+            logger.debug(f"Ignoring malformed detection cache entry: {e}")
+            return None
+
+    def store(
+        self,
+        results: dict[Platform, PlatformInfo],
+        probes: dict[ProbeKey, Any],
+    ) -> None:
+        """Store detection results with the signatures of their inputs.
+
+        Args:
+            results: detect_all() results
+            probes: Signature of every probe made during detection, taken
+                before the probe ran
+        """
+        entries = self._read_entries()
+        entries.pop(os.getcwd(), None)
+        entries[os.getcwd()] = {
+            "created": datetime.now().isoformat(),
+            "context": self._context(),
+            "probes": [[kind, key, sig] for (kind, key), sig in probes.items()],
+            "results": {platform.value: _info_to_dict(info) for platform, info in results.items()},
+        }
+
+        # Keep the most recently stored working directories
+        while len(entries) > self.MAX_ENTRIES:
+            entries.pop(next(iter(entries)))
+
+        document = {"version": self.FORMAT_VERSION, "entries": entries}
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            # A lost cache write only costs one detection pass
+            atomic_write(self.path, json.dumps(document), durability=Durability.NONE)
+        except Exception as e:
+            logger.debug(f"Could not write detection cache {self.path}: {e}")
+
+    def clear(self) -> None:
+        """Delete the cache file."""
+        try:
+            self.path.unlink()
+        except FileNotFoundError:
+            pass
+
+    # ========================================================================
+    # Private Helper Methods
+    # ========================================================================
+
+    def _read_entries(self) -> dict[str, Any]:
+        """Read all cache entries, keyed by working directory.
+
+        Returns:
+            Entries (empty if the cache is missing, corrupt or outdated)
+        """
+        try:
+            document = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+
+        if not isinstance(document, dict):
+            return {}
+        if document.get("version") != self.FORMAT_VERSION:
+            return {}
+        entries = document.get("entries")
+        return entries if isinstance(entries, dict) else {}
+
+    @staticmethod
+    def _context() -> dict[str, Any]:
+        """Inputs shared by all detectors.
+
+        Returns:
+            JSON-serializable description of the detection environment
+        """
+        from . import __version__
+
+        path = os.environ.get("PATH", os.defpath)
+        path_mtimes: list[int | None] = []
+        for directory in path.split(os.pathsep):
+            try:
+                path_mtimes.append(os.stat(directory or os.curdir).st_mtime_ns)
+            except OSError:
+                path_mtimes.append(None)
+
+        return {
+            "package_version": __version__,
+            "os": sys.platform,
+            "home": str(Path.home()),
+            "path": path,
+            "path_mtimes": path_mtimes,
+        }
+
+
+def _info_to_dict(info: PlatformInfo) -> dict[str, Any]:
+    """Serialize PlatformInfo for the cache file.
+
+    Args:
+        info: Platform info
+
+    Returns:
+        JSON-serializable dict
+    """
+    return {
+        "confidence": info.confidence,
+        "config_path": str(info.config_path) if info.config_path else None,
+        "cli_available": info.cli_available,
+        "scope_support": info.scope_support.value,
+    }
+
+
+def _info_from_dict(platform: Platform, data: dict[str, Any]) -> PlatformInfo:
+    """Deserialize PlatformInfo from the cache file.
+
+    Args:
+        platform: Platform the entry belongs to
+        data: Dict produced by _info_to_dict
+
+    Returns:
+        Platform info
+    """
+    return PlatformInfo(
+        platform=platform,
+        confidence=float(data["confidence"]),
+        config_path=Path(data["config_path"]) if data["config_path"] else None,
+        cli_available=bool(data["cli_available"]),
+        scope_support=Scope(data["scope_support"]),
+    )
@@ -214,6 +214,50 @@ class AtomicWriteError(PyMCPInstallerError):
         super().__init__(message, recovery_suggestion=recovery)
 
 
+class ConfigLockError(PyMCPInstallerError):
+    """Timed out waiting for another process to release a config file lock.
+
+    Raised when another installer process keeps the lock on the same
+    configuration file for longer than the lock timeout.
+
+    Example:
+        >>> raise ConfigLockError(
+        ...     "Timed out after 10.0s waiting for lock on ~/.claude.json",
+        ...     "/home/user/.claude.json.mcp-installer.lock"
+        ... )
+    """
+
+    def __init__(self, message: str, lock_path: str = "") -> None:
+        """Initialize with lock file path."""
+        recovery = "Wait for other py-mcp-installer processes to finish and try again"
+        if lock_path:
+            recovery += f"\nLock file: {lock_path} (delete it if no installer is running)"
+        super().__init__(message, recovery_suggestion=recovery)
+
+
+class ConfigConflictError(PyMCPInstallerError):
+    """Config file was changed by someone else between read and write.
+
+    Raised by compare-and-swap writes (optimistic concurrency) when the file
+    no longer matches the version the change was based on. ConfigManager
+    retries the change on a fresh read before giving up with this error.
+
+    Example:
+        >>> raise ConfigConflictError(
+        ...     "Config changed while it was being updated",
+        ...     "/home/user/.claude.json"
+        ... )
+    """
+
+    def __init__(self, message: str, config_path: str = "") -> None:
+        """Initialize with config file path."""
+        recovery = "Another process is updating the same file; retry the operation"
+        if config_path:
+            recovery += f"\nConfig file: {config_path}"
+        super().__init__(message, recovery_suggestion=recovery)
+        self.config_path = config_path
+
+
 class PlatformNotSupportedError(PyMCPInstallerError):
     """Requested platform is not supported by this library.
 
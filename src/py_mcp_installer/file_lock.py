@@ -0,0 +1,375 @@
+"""Cross-process advisory locks for configuration files.
+
+Config updates are read-modify-write cycles. Two installer processes that
+update the same file concurrently would both read the old content, and the
+last writer would silently drop the other's change. ConfigManager therefore
+holds a FileLock for the whole cycle.
+
+The lock is taken on a sidecar file (``<config>.mcp-installer.lock``), not
+on the config itself: atomic writes replace the config inode, which would
+detach a lock held on it.
+
+Lock mechanisms:
+- POSIX: ``fcntl.flock`` on the sidecar file. Released by the kernel if the
+  holder dies, so it can never go stale.
+- Fallback (no fcntl, or flock unsupported by the filesystem): exclusive
+  creation of ``<config>.mcp-installer.lck``. A lockfile older than
+  ``stale_after`` seconds is treated as abandoned and broken: it is renamed
+  to a unique name first, so only one waiter can break it.
+
+Design Philosophy:
+- Bounded waiting: acquisition times out with ConfigLockError
+- Observable: process-wide contention metrics via :func:`lock_stats`
+- Advisory only: cooperating py-mcp-installer processes, not other tools
+
+Example:
+    >>> with FileLock.for_file(Path.home() / ".claude.json", timeout=5.0):
+    ...     ...  # read, modify and write the config
+    >>> stats = lock_stats()
+    >>> print(f"{stats.contended}/{stats.acquisitions} acquisitions waited")
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import secrets
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from types import TracebackType
+
+from .exceptions import ConfigLockError
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None  # type: ignore[assignment]
+
+logger = logging.getLogger(__name__)
+
+# Default time to wait for a lock held by another process
+DEFAULT_LOCK_TIMEOUT = 10.0
+
+# Age after which a fallback lockfile is considered abandoned
+DEFAULT_STALE_AFTER = 60.0
+
+# Polling backoff while waiting for a lock
+_MIN_POLL = 0.001
+_MAX_POLL = 0.05
+
+
+# ============================================================================
+# Contention Metrics
+# ============================================================================
+
+
+@dataclass(frozen=True)
+class LockStats:
+    """Process-wide file lock metrics.
+
+    Attributes:
+        acquisitions: Locks acquired
+        contended: Acquisitions that had to wait for another holder
+        timeouts: Acquisitions that gave up after the timeout
+        stale_breaks: Abandoned fallback lockfiles removed
+        total_wait: Seconds spent waiting, over all acquisitions
+        max_wait: Longest single wait in seconds
+
+    Example:
+        >>> stats = lock_stats()
+        >>> if stats.contended:
+        ...     print(f"mean wait {stats.total_wait / stats.contended:.3f}s")
+    """
+
+    acquisitions: int = 0
+    contended: int = 0
+    timeouts: int = 0
+    stale_breaks: int = 0
+    total_wait: float = 0.0
+    max_wait: float = 0.0
+
+
+_stats = LockStats()
+_stats_lock = threading.Lock()
+
+
+def lock_stats() -> LockStats:
+    """Return file lock metrics collected in this process.
+
+    Returns:
+        Snapshot of the counters
+    """
+    with _stats_lock:
+        return _stats
+
+
+def reset_lock_stats() -> None:
+    """Reset file lock metrics to zero."""
+    global _stats
+    with _stats_lock:
+        _stats = LockStats()
+
+
+def _record(wait: float, contended: bool, timed_out: bool, stale_breaks: int) -> None:
+    """Add one acquisition attempt to the process-wide metrics."""
+    global _stats
+    with _stats_lock:
+        _stats = LockStats(
+            acquisitions=_stats.acquisitions + (not timed_out),
+            contended=_stats.contended + contended,
+            timeouts=_stats.timeouts + timed_out,
+            stale_breaks=_stats.stale_breaks + stale_breaks,
+            total_wait=_stats.total_wait + wait,
+            max_wait=max(_stats.max_wait, wait),
+        )
+
+
+# ============================================================================
+# File Lock
+# ============================================================================
+
+
+class FileLock:
+    """Exclusive advisory lock shared by all processes on a machine.
+
+    The lock is reentrant for the object holding it; other FileLock objects
+    (in this or another process) block until it is released. Use one
+    FileLock object per thread.
+
+    Attributes:
+        path: Lock file (``.lck`` variant used by the fallback mechanism)
+        timeout: Seconds to wait before raising ConfigLockError
+        stale_after: Age in seconds after which a fallback lockfile is broken
+
+    Example:
+        >>> lock = FileLock(Path("/tmp/config.json.mcp-installer.lock"))
+        >>> with lock:
+        ...     update_config()
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        timeout: float = DEFAULT_LOCK_TIMEOUT,
+        stale_after: float = DEFAULT_STALE_AFTER,
+    ) -> None:
+        """Initialize lock (nothing is acquired yet).
+
+        Args:
+            path: Lock file path
+            timeout: Seconds to wait for the lock
+            stale_after: Age after which a fallback lockfile is abandoned
+        """
+        self.path = path
+        self.timeout = timeout
+        self.stale_after = stale_after
+        self._fd: int | None = None
+        self._fallback_path: Path | None = None
+        self._depth = 0
+
+    @classmethod
+    def for_file(cls, config_path: Path, timeout: float = DEFAULT_LOCK_TIMEOUT) -> FileLock:
+        """Create the lock guarding a config file.
+
+        Args:
+            config_path: Config file
+            timeout: Seconds to wait for the lock
+
+        Returns:
+            Lock on ``<config>.mcp-installer.lock`` next to the config
+        """
+        return cls(config_path.parent / f"{config_path.name}.mcp-installer.lock", timeout)
+
+    @property
+    def locked(self) -> bool:
+        """Whether this object currently holds the lock."""
+        return self._depth > 0
+
+    def acquire(self) -> None:
+        """Acquire the lock, waiting up to ``timeout`` seconds.
+
+        Raises:
+            ConfigLockError: If the lock is still held by someone else after
+                the timeout, or the lock file cannot be created
+        """
+        if self._depth:
+            self._depth += 1
+            return
+
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+        except OSError as e:
+            raise ConfigLockError(
+                f"Cannot create lock directory {self.path.parent}: {e}", str(self.path)
+            ) from e
+
+        start = time.monotonic()
+        deadline = start + self.timeout
+        poll = _MIN_POLL
+        contended = False
+        stale_breaks = 0
+
+        while True:
+            try:
+                acquired, broke_stale = self._try_acquire()
+            except OSError as e:
+                raise ConfigLockError(
+                    f"Cannot create lock file {self.path}: {e}", str(self.path)
+                ) from e
+            stale_breaks += broke_stale
+            if acquired:
+                break
+
+            contended = True
+            now = time.monotonic()
+            if now >= deadline:
+                _record(now - start, contended, True, stale_breaks)
+                raise ConfigLockError(
+                    f"Timed out after {self.timeout}s waiting for lock {self.path}",
+                    str(self._fallback_path or self.path),
+                )
+            time.sleep(min(poll, deadline - now))
+            poll = min(poll * 2, _MAX_POLL)
+
+        wait = time.monotonic() - start
+        if contended:
+            logger.debug(f"Acquired {self.path} after waiting {wait:.3f}s")
+        _record(wait, contended, False, stale_breaks)
+        self._depth = 1
+
+    def release(self) -> None:
+        """Release the lock (once per acquire)."""
+        if self._depth == 0:
+            return
+        self._depth -= 1
+        if self._depth:
+            return
+
+        if self._fd is not None:
+            # Closing the descriptor drops the flock
+            os.close(self._fd)
+            self._fd = None
+        if self._fallback_path is not None:
+            try:
+                self._fallback_path.unlink()
+            except FileNotFoundError:
+                pass
+            self._fallback_path = None
+
+    def __enter__(self) -> FileLock:
+        """Acquire the lock."""
+        self.acquire()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        """Release the lock."""
+        self.release()
+
+    # ========================================================================
+    # Private Helper Methods
+    # ========================================================================
+
+    def _try_acquire(self) -> tuple[bool, bool]:
+        """Make one non-blocking acquisition attempt.
+
+        Returns:
+            (acquired, whether an abandoned fallback lockfile was removed)
+
+        Raises:
+            OSError: If the lock file cannot be created
+        """
+        if fcntl is not None:
+            fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+            try:
+                fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except BlockingIOError:
+                os.close(fd)
+                return False, False
+            except OSError as e:
+                # Filesystem without flock support (e.g. some network mounts)
+                os.close(fd)
+                logger.debug(f"flock unavailable for {self.path}, using lockfile: {e}")
+            else:
+                self._fd = fd
+                return True, False
+
+        return self._try_lockfile()
+
+    def _try_lockfile(self) -> tuple[bool, bool]:
+        """Attempt the exclusive-create fallback lock.
+
+        Returns:
+            (acquired, whether an abandoned lockfile was removed)
+
+        Raises:
+            OSError: If the lockfile cannot be created
+        """
+        path = self.path.with_suffix(".lck")
+        broke_stale = False
+        try:
+            fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o644)
+        except FileExistsError:
+            if not self._break_stale(path):
+                return False, False
+            broke_stale = True
+            try:
+                fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o644)
+            except FileExistsError:
+                return False, True  # A fresh holder got in first
+
+        with os.fdopen(fd, "w") as f:
+            f.write(f"{os.getpid()}\n")
+        self._fallback_path = path
+        return True, broke_stale
+
+    def _break_stale(self, path: Path) -> bool:
+        """Remove a fallback lockfile if it is abandoned.
+
+        The lockfile is renamed to a unique name before it is deleted. Of
+        several waiters that find it stale, only one rename succeeds, and a
+        fresh lockfile that replaced it meanwhile is put back, not deleted.
+
+        Args:
+            path: Fallback lockfile
+
+        Returns:
+            Whether this call removed an abandoned lockfile
+
+        Raises:
+            OSError: If the lockfile cannot be renamed or removed
+        """
+        try:
+            st = path.stat()
+        except FileNotFoundError:
+            return False  # Released meanwhile; retry on next poll
+        age = time.time() - st.st_mtime
+        if age < self.stale_after:
+            return False
+
+        claimed = path.with_name(f"{path.name}.{secrets.token_hex(8)}.stale")
+        try:
+            os.rename(path, claimed)
+        except FileNotFoundError:
+            return False  # Broken by another waiter first
+
+        claimed_st = claimed.stat()
+        # The inode alone is not enough: a new file may reuse a freed one
+        if not os.path.samestat(st, claimed_st) or claimed_st.st_mtime_ns != st.st_mtime_ns:
+            # Took a fresh lockfile created since the stat: hand it back
+            try:
+                os.link(claimed, path)
+            except OSError as e:
+                logger.warning(f"Could not restore lock file {path}: {e}")
+            os.unlink(claimed)
+            return False
+
+        logger.warning(f"Removing abandoned lock file {path} ({age:.0f}s old)")
+        os.unlink(claimed)
+        return True
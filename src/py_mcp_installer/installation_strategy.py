@@ -13,12 +13,14 @@ Strategies:
 - NativeCLIStrategy: Use platform CLI (claude mcp add)
 - JSONManipulationStrategy: Direct JSON config modification
 - TOMLManipulationStrategy: Direct TOML config modification
+- ConfigFileStrategy: Shared base of the two config file strategies
 """
 
 from __future__ import annotations
 
 import subprocess
 from abc import ABC, abstractmethod
+from collections.abc import Collection
 from pathlib import Path
 
 from .config_manager import ConfigManager
@@ -31,7 +33,7 @@ from .types import (
     Platform,
     Scope,
 )
-from .utils import mask_credentials, resolve_command_path
+from .utils import deferred_sync, mask_credentials, resolve_command_path
 
 
 class InstallationStrategy(ABC):
@@ -105,6 +107,80 @@ class InstallationStrategy(ABC):
         """
         pass
 
+    def get_server(self, name: str, scope: Scope) -> MCPServerConfig | None:
+        """Look up one installed server.
+
+        The default implementation searches list_servers(). Config file
+        strategies override it with an indexed lookup.
+
+        Args:
+            name: Server name
+            scope: Installation scope
+
+        Returns:
+            Server configuration, or None if not installed
+
+        Raises:
+            NotImplementedError: If the strategy cannot list servers
+        """
+        for server in self.list_servers(scope):
+            if server.name == name:
+                return server
+        return None
+
+    def install_many(
+        self,
+        servers: list[MCPServerConfig],
+        scope: Scope,
+        replace: Collection[str] = (),
+    ) -> list[InstallationResult]:
+        """Install several servers.
+
+        The default implementation calls install() (or update() for names in
+        ``replace``) once per server and stops at the first failure, syncing
+        written files to disk once at the end (see deferred_sync). Config
+        file strategies override it to apply the whole batch in one write.
+
+        Args:
+            servers: Server configurations to install
+            scope: Installation scope
+            replace: Names of existing servers to overwrite
+
+        Returns:
+            One InstallationResult per server, in input order
+
+        Raises:
+            InstallationError: If installing any server fails
+        """
+        with deferred_sync():
+            return [
+                self.update(server, scope)
+                if server.name in replace
+                else self.install(server, scope)
+                for server in servers
+            ]
+
+    def uninstall_many(self, names: list[str], scope: Scope) -> list[InstallationResult]:
+        """Uninstall several servers.
+
+        The default implementation calls uninstall() once per server and stops
+        at the first failure, syncing written files to disk once at the end.
+        Config file strategies override it to apply the whole batch in one
+        write.
+
+        Args:
+            names: Server names to uninstall
+            scope: Installation scope
+
+        Returns:
+            One InstallationResult per server, in input order
+
+        Raises:
+            InstallationError: If uninstalling any server fails
+        """
+        with deferred_sync():
+            return [self.uninstall(name, scope) for name in names]
+
     @abstractmethod
     def validate(self) -> bool:
         """Validate this strategy can be used.
@@ -387,7 +463,134 @@ class NativeCLIStrategy(InstallationStrategy):
         return masked
 
 
-class JSONManipulationStrategy(InstallationStrategy):
+class ConfigFileStrategy(InstallationStrategy):
+    """Base class for strategies that edit a config file with ConfigManager.
+
+    Batch operations apply the whole batch in one transaction, so the file
+    is backed up and written once, and get_server() is an indexed lookup
+    rather than a scan of list_servers(). Subclasses set up ``config_manager`` for
+    their format and name the file in recovery hints with ``file_kind``.
+
+    Attributes:
+        platform: Target platform
+        config_path: Path to the config file
+        config_manager: Manager of the config file
+        file_kind: How recovery suggestions refer to the file
+    """
+
+    platform: Platform
+    config_path: Path
+    config_manager: ConfigManager
+    file_kind = "config file"
+
+    def get_server(self, name: str, scope: Scope) -> MCPServerConfig | None:
+        """Look up one server in the config file's server index.
+
+        Args:
+            name: Server name
+            scope: Installation scope (unused)
+
+        Returns:
+            Server configuration, or None if not installed
+        """
+        try:
+            return self.config_manager.get_server(name)
+        except Exception as e:
+            raise InstallationError(
+                f"Failed to read server {name}: {e}",
+                recovery_suggestion=f"Check {self.file_kind} exists and is readable",
+            ) from e
+
+    def install_many(
+        self,
+        servers: list[MCPServerConfig],
+        scope: Scope,
+        replace: Collection[str] = (),
+    ) -> list[InstallationResult]:
+        """Install several servers with one config write.
+
+        Args:
+            servers: Server configurations to install
+            scope: Installation scope (unused, config_path determines scope)
+            replace: Names of existing servers to overwrite
+
+        Returns:
+            One InstallationResult per server, in input order
+
+        Raises:
+            InstallationError: If any server conflicts or the write fails
+                (the config file is left unchanged)
+        """
+        try:
+            self.config_manager.add_servers(servers, replace=replace)
+        except ValidationError as e:
+            raise InstallationError(
+                f"Cannot install servers: {e.message}",
+                recovery_suggestion=e.recovery_suggestion,
+            ) from e
+        except Exception as e:
+            raise InstallationError(
+                f"Failed to install servers: {e}",
+                recovery_suggestion=f"Check {self.file_kind} permissions and syntax",
+            ) from e
+
+        return [
+            InstallationResult(
+                success=True,
+                platform=self.platform,
+                server_name=server.name,
+                method=InstallMethod.DIRECT,
+                message=(
+                    f"Successfully updated '{server.name}' in {self.config_path}"
+                    if server.name in replace
+                    else f"Successfully installed '{server.name}' to {self.config_path}"
+                ),
+                config_path=self.config_path,
+            )
+            for server in servers
+        ]
+
+    def uninstall_many(self, names: list[str], scope: Scope) -> list[InstallationResult]:
+        """Uninstall several servers with one config write.
+
+        Args:
+            names: Server names to uninstall
+            scope: Installation scope (unused)
+
+        Returns:
+            One InstallationResult per server, in input order
+
+        Raises:
+            InstallationError: If any server is missing or the write fails
+                (the config file is left unchanged)
+        """
+        try:
+            self.config_manager.remove_servers(names)
+        except ValidationError as e:
+            raise InstallationError(
+                e.message,
+                recovery_suggestion=e.recovery_suggestion,
+            ) from e
+        except Exception as e:
+            raise InstallationError(
+                f"Failed to uninstall servers: {e}",
+                recovery_suggestion=f"Check {self.file_kind} permissions",
+            ) from e
+
+        return [
+            InstallationResult(
+                success=True,
+                platform=self.platform,
+                server_name=name,
+                method=InstallMethod.DIRECT,
+                message=f"Successfully uninstalled '{name}' from {self.config_path}",
+                config_path=self.config_path,
+            )
+            for name in names
+        ]
+
+
+class JSONManipulationStrategy(ConfigFileStrategy):
     """Installation via direct JSON config file manipulation.
 
     Safely modifies JSON configuration files using ConfigManager.
@@ -440,7 +643,6 @@ class JSONManipulationStrategy(InstallationStrategy):
             InstallationError: If installation fails
         """
         try:
-            # Add server using config manager
             self.config_manager.add_server(server)
 
             return InstallationResult(
@@ -511,10 +713,7 @@ class JSONManipulationStrategy(InstallationStrategy):
             InstallationError: If update fails
         """
         try:
-            # Create backup before update
-            self.config_manager.backup()
-
-            # Update server using config manager
+            # Backed up by the manager before it writes
             self.config_manager.update_server(server.name, server)
 
             return InstallationResult(
@@ -571,7 +770,7 @@ class JSONManipulationStrategy(InstallationStrategy):
             return True
 
 
-class TOMLManipulationStrategy(InstallationStrategy):
+class TOMLManipulationStrategy(ConfigFileStrategy):
     """Installation via direct TOML config file manipulation.
 
     Used by Codex platform which uses TOML instead of JSON.
@@ -584,6 +783,8 @@ class TOMLManipulationStrategy(InstallationStrategy):
         >>> result = strategy.install(server, Scope.GLOBAL)
     """
 
+    file_kind = "TOML file"
+
     def __init__(self, platform: Platform, config_path: Path) -> None:
         """Initialize with platform and config path.
 
@@ -681,10 +882,7 @@ class TOMLManipulationStrategy(InstallationStrategy):
             InstallationError: If update fails
         """
         try:
-            # Create backup before update
-            self.config_manager.backup()
-
-            # Update server using config manager
+            # Backed up by the manager before it writes
             self.config_manager.update_server(server.name, server)
 
             return InstallationResult(
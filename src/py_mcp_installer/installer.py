@@ -25,12 +25,13 @@ Example:
 
 from __future__ import annotations
 
-import json
 import logging
 from pathlib import Path
 from typing import Any
 
 from .command_builder import CommandBuilder
+from .config_manager import ConfigManager
+from .detection_cache import DetectionCache
 from .exceptions import (
     ConfigurationError,
     InstallationError,
@@ -49,6 +50,8 @@ from .mcp_inspector import InspectionReport, MCPInspector, ValidationIssue
 from .platform_detector import PlatformDetector
 from .platforms import ClaudeCodeStrategy, CodexStrategy, CursorStrategy
 from .types import (
+    ConfigFormat,
+    Durability,
     InstallationResult,
     InstallMethod,
     MCPServerConfig,
@@ -105,6 +108,8 @@ class MCPInstaller:
         platform: Platform | None = None,
         dry_run: bool = False,
         verbose: bool = False,
+        use_cache: bool = False,
+        durability: Durability = Durability.FILE,
     ) -> None:
         """Initialize installer.
 
@@ -112,6 +117,11 @@ class MCPInstaller:
             platform: Force specific platform (None = auto-detect)
             dry_run: Preview changes without applying
             verbose: Enable verbose logging
+            use_cache: Reuse the on-disk platform detection result when
+                nothing it depends on has changed (see DetectionCache). Off
+                by default: it reads and writes a file under ~/.cache
+            durability: fsync policy for config file writes: NONE (fastest,
+                for throwaway environments), FILE (default) or FILE_AND_DIR
 
         Raises:
             PlatformDetectionError: If platform cannot be detected
@@ -126,9 +136,17 @@ class MCPInstaller:
 
             >>> # Dry-run mode (safe testing)
             >>> installer = MCPInstaller(dry_run=True, verbose=True)
+
+            >>> # Long-lived tool: skip re-probing unchanged platforms
+            >>> installer = MCPInstaller(use_cache=True)
+
+            >>> # Skip fsync in a disposable CI container
+            >>> installer = MCPInstaller(durability=Durability.NONE)
         """
         self.dry_run = dry_run
         self.verbose = verbose
+        self.use_cache = use_cache
+        self.durability = Durability(durability)
 
         # Configure logging
         if verbose:
@@ -140,7 +158,7 @@ class MCPInstaller:
         # Detect or use provided platform
         if platform:
             # For forced platform, detect info specifically for that platform
-            detector = PlatformDetector()
+            detector = self._create_detector()
             try:
                 self._platform_info = detector.detect_for_platform(platform)
             except PlatformDetectionError as e:
@@ -162,6 +180,7 @@ class MCPInstaller:
 
         # Select installation strategy and platform strategy
         self._strategy, self._platform_strategy = self._select_strategy()
+        self._apply_durability()
 
     @classmethod
     def auto_detect(cls, **kwargs: Any) -> MCPInstaller:
@@ -286,20 +305,14 @@ class MCPInstaller:
         )
 
         # Validate server config
-        issues = self._inspector.validate_server(server)
-        errors = [i for i in issues if i.severity == "error"]
+        errors = self._validate_server(server)
         if errors:
-            error_msg = "\n".join(f"- {e.message}" for e in errors)
+            error_msg = "\n".join(f"- {e}" for e in errors)
             raise ValidationError(
                 f"Server configuration invalid:\n{error_msg}",
                 "Fix validation errors before installing",
             )
 
-        # Log warnings
-        warnings = [i for i in issues if i.severity == "warning"]
-        for warning in warnings:
-            logger.warning(f"{warning.message} - {warning.fix_suggestion}")
-
         # Install using strategy
         if self.dry_run:
             logger.info(
@@ -392,6 +405,150 @@ class MCPInstaller:
                 "Check logs for details and verify permissions",
             ) from e
 
+    def install_servers(
+        self,
+        servers: list[MCPServerConfig],
+        scope: Scope = Scope.PROJECT,
+        force: bool = False,
+    ) -> list[InstallationResult]:
+        """Install several MCP servers at once.
+
+        Every server is validated before anything is changed. With a config
+        file strategy (JSON/TOML) the whole batch is applied in memory and
+        written once, with a single backup; either all servers are installed
+        or the config file is left untouched. Native CLI strategies install
+        the servers one after another.
+
+        Args:
+            servers: Server configurations to install
+            scope: Installation scope (PROJECT or GLOBAL)
+            force: If True, update existing servers instead of raising error
+
+        Returns:
+            One InstallationResult per server, in input order
+
+        Raises:
+            ValidationError: If any server configuration is invalid
+            InstallationError: If a server already exists (without force)
+                or installation fails
+
+        Example:
+            >>> results = installer.install_servers([
+            ...     MCPServerConfig(name="mcp-ticketer", command="uv",
+            ...                     args=["run", "mcp-ticketer", "mcp"]),
+            ...     MCPServerConfig(name="github-mcp", command="npx",
+            ...                     args=["-y", "@modelcontextprotocol/server-github"]),
+            ... ])
+            >>> for result in results:
+            ...     print(result.message)
+        """
+        logger.info(f"Installing {len(servers)} servers")
+
+        # Validate every server before touching the config
+        errors: list[str] = []
+        seen: set[str] = set()
+        for server in servers:
+            if server.name in seen:
+                errors.append(f"Server '{server.name}' listed more than once")
+            seen.add(server.name)
+            errors.extend(self._validate_server(server))
+        if errors:
+            error_msg = "\n".join(f"- {e}" for e in errors)
+            raise ValidationError(
+                f"Server configuration invalid:\n{error_msg}",
+                "Fix validation errors before installing",
+            )
+
+        if self.dry_run:
+            logger.info(
+                f"[DRY RUN] Would install {len(servers)} servers "
+                f"to {self._platform_info.config_path}"
+            )
+            return [
+                InstallationResult(
+                    success=True,
+                    platform=self._platform_info.platform,
+                    server_name=server.name,
+                    method=InstallMethod.DIRECT,
+                    message=f"[DRY RUN] Would install {server.name}",
+                    config_path=self._platform_info.config_path,
+                )
+                for server in servers
+            ]
+
+        try:
+            installed = {server.name for server in self.list_servers(scope)}
+            existing = [server.name for server in servers if server.name in installed]
+
+            if existing and not force:
+                raise InstallationError(
+                    f"Servers already exist: {', '.join(existing)}",
+                    "Use force=True to update existing servers or uninstall first",
+                )
+
+            results = self._strategy.install_many(servers, scope, replace=set(existing))
+            logger.info(f"Successfully installed {len(results)} servers")
+            return results
+        except InstallationError:
+            raise
+        except Exception as e:
+            logger.error(f"Installation failed: {e}", exc_info=True)
+            raise InstallationError(
+                f"Failed to install servers: {e}",
+                "Check logs for details and verify permissions",
+            ) from e
+
+    def uninstall_servers(
+        self, names: list[str], scope: Scope = Scope.PROJECT
+    ) -> list[InstallationResult]:
+        """Remove several MCP servers from configuration at once.
+
+        With a config file strategy (JSON/TOML) all servers are removed with a
+        single backup and write; if any server is missing nothing is removed.
+
+        Args:
+            names: Server names to uninstall
+            scope: Installation scope (PROJECT or GLOBAL)
+
+        Returns:
+            One InstallationResult per server, in input order
+
+        Raises:
+            InstallationError: If uninstallation fails
+
+        Example:
+            >>> results = installer.uninstall_servers(["old-server", "unused-server"])
+            >>> print(f"Removed {len(results)} servers")
+        """
+        logger.info(f"Uninstalling {len(names)} servers")
+
+        if self.dry_run:
+            logger.info(f"[DRY RUN] Would uninstall {', '.join(names)}")
+            return [
+                InstallationResult(
+                    success=True,
+                    platform=self._platform_info.platform,
+                    server_name=name,
+                    method=InstallMethod.DIRECT,  # Not relevant for uninstall
+                    message=f"[DRY RUN] Would uninstall {name}",
+                    config_path=self._platform_info.config_path,
+                )
+                for name in names
+            ]
+
+        try:
+            results = self._strategy.uninstall_many(names, scope)
+            logger.info(f"Successfully uninstalled {len(results)} servers")
+            return results
+        except InstallationError:
+            raise
+        except Exception as e:
+            logger.error(f"Uninstallation failed: {e}", exc_info=True)
+            raise InstallationError(
+                f"Failed to uninstall servers: {e}",
+                "Check logs for details and verify permissions",
+            ) from e
+
     def list_servers(self, scope: Scope = Scope.PROJECT) -> list[MCPServerConfig]:
         """List all installed MCP servers.
 
@@ -416,42 +573,8 @@ class MCPInstaller:
             logger.debug(f"Strategy does not support list_servers, falling back to JSON: {e}")
 
             try:
-                # Get config path from platform strategy
-                if self._platform_strategy is None:
-                    logger.warning("No platform strategy available for fallback")
-                    return []
-
-                config_path = self._platform_strategy.get_config_path(scope)
-
-                if not config_path.exists():
-                    logger.debug(f"Config file does not exist: {config_path}")
-                    return []
-
-                # Read and parse JSON file
-                with open(config_path) as f:
-                    config = json.load(f)
-
-                # Extract mcpServers section
-                mcp_servers = config.get("mcpServers", {})
-
-                # Convert to MCPServerConfig objects
-                servers: list[MCPServerConfig] = []
-                for name, server_dict in mcp_servers.items():
-                    if not isinstance(server_dict, dict):
-                        continue  # Skip invalid entries
-
-                    servers.append(
-                        MCPServerConfig(
-                            name=name,
-                            command=server_dict.get("command", ""),
-                            args=server_dict.get("args", []),
-                            env=server_dict.get("env", {}),
-                            description=server_dict.get("description", ""),
-                        )
-                    )
-
-                return servers
-
+                manager = self._fallback_config_manager(scope)
+                return manager.list_servers() if manager is not None else []
             except Exception as json_error:
                 logger.warning(f"Failed to read JSON config: {json_error}")
                 return []
@@ -477,11 +600,17 @@ class MCPInstaller:
             ...     print(f"Command: {server.command}")
             ...     print(f"Args: {server.args}")
         """
-        servers = self.list_servers(scope)
-        for server in servers:
-            if server.name == name:
-                return server
-        return None
+        try:
+            return self._strategy.get_server(name, scope)
+        except NotImplementedError as e:
+            logger.debug(f"Strategy does not support get_server, falling back to JSON: {e}")
+
+            try:
+                manager = self._fallback_config_manager(scope)
+                return manager.get_server(name) if manager is not None else None
+            except Exception as json_error:
+                logger.warning(f"Failed to read JSON config: {json_error}")
+                return None
 
     def inspect_installation(self) -> InspectionReport:
         """Run comprehensive inspection.
@@ -628,19 +757,20 @@ class MCPInstaller:
 
         logger.info(f"Found {len(auto_fixable)} auto-fixable issues")
 
-        for issue in auto_fixable:
-            if self.dry_run or not auto_fix:
+        if self.dry_run or not auto_fix:
+            for issue in auto_fixable:
                 fixes.append(f"[DRY RUN] Would fix: {issue.message}")
                 logger.info(f"[DRY RUN] Would fix: {issue.message}")
+            return fixes
+
+        # All fixes share one config write
+        fixed = self._inspector.auto_fix_all(auto_fixable)
+        for issue in auto_fixable:
+            if any(issue is f for f in fixed):
+                fixes.append(issue.message)
+                logger.info(f"Fixed: {issue.message}")
             else:
-                try:
-                    if self._inspector.auto_fix(issue):
-                        fixes.append(issue.message)
-                        logger.info(f"Fixed: {issue.message}")
-                    else:
-                        logger.warning(f"Could not auto-fix: {issue.message}")
-                except Exception as e:
-                    logger.error(f"Fix failed for '{issue.message}': {e}")
+                logger.warning(f"Could not auto-fix: {issue.message}")
 
         return fixes
 
@@ -722,6 +852,60 @@ class MCPInstaller:
     # Private Helper Methods
     # ========================================================================
 
+    def _create_detector(self) -> PlatformDetector:
+        """Create platform detector, with the detection cache if enabled.
+
+        Returns:
+            Platform detector
+        """
+        return PlatformDetector(cache=DetectionCache() if self.use_cache else None)
+
+    def _apply_durability(self) -> None:
+        """Pass the durability setting to every config manager in use."""
+        managers = [self._inspector.config_manager]
+        strategy_manager = getattr(self._strategy, "config_manager", None)
+        if isinstance(strategy_manager, ConfigManager):
+            managers.append(strategy_manager)
+        for manager in managers:
+            manager.durability = self.durability
+
+    def _fallback_config_manager(self, scope: Scope) -> ConfigManager | None:
+        """Open the platform's JSON config for strategies that cannot read it.
+
+        Args:
+            scope: Installation scope
+
+        Returns:
+            Config manager, or None if there is no config file to read
+        """
+        if self._platform_strategy is None:
+            logger.warning("No platform strategy available for fallback")
+            return None
+
+        config_path = self._platform_strategy.get_config_path(scope)
+        if not config_path.exists():
+            logger.debug(f"Config file does not exist: {config_path}")
+            return None
+
+        return ConfigManager(config_path, ConfigFormat.JSON)
+
+    def _validate_server(self, server: MCPServerConfig) -> list[str]:
+        """Validate server config, logging warnings.
+
+        Args:
+            server: Server configuration to validate
+
+        Returns:
+            Error messages (empty if the server can be installed)
+        """
+        issues = self._inspector.validate_server(server)
+
+        # Log warnings
+        for warning in (i for i in issues if i.severity == "warning"):
+            logger.warning(f"{warning.message} - {warning.fix_suggestion}")
+
+        return [i.message for i in issues if i.severity == "error"]
+
     def _detect_platform(self) -> PlatformInfo:
         """Detect platform automatically.
 
@@ -731,7 +915,7 @@ class MCPInstaller:
         Raises:
             PlatformDetectionError: If no platform detected
         """
-        detector = PlatformDetector()
+        detector = self._create_detector()
         info = detector.detect()
 
         if info.platform == Platform.UNKNOWN or info.confidence == 0.0:
@@ -0,0 +1,207 @@
+"""Pluggable JSON backends for reading and writing config files.
+
+Host configs such as ``~/.claude.json`` can grow to several megabytes.
+Decoding them to ``str``, stripping and parsing with the stdlib costs three
+passes and two full copies; orjson and msgspec parse the raw bytes directly
+and serialize straight to bytes, several times faster. They are optional:
+the fastest importable backend is used, with the stdlib ``json`` module as
+the always-available fallback.
+
+Design Philosophy:
+- Same results on every backend: documents a fast backend rejects (NaN,
+  integers beyond 64 bits, ...) are retried with the stdlib, so installing
+  orjson never changes what parses or what can be written
+- Bytes in, bytes out: no intermediate ``str`` copies of the document
+  (input may be a memoryview, e.g. of a memory-mapped file)
+- Explicit override for tests and benchmarks via :func:`set_json_backend`
+
+Every backend writes the same bytes: two-space indentation, a trailing
+newline and escaped non-ASCII characters (documents containing non-ASCII
+text are serialized by the stdlib, which the fast backends cannot match).
+Only floats in exponent notation are spelled differently (``1e16`` rather
+than ``1e+16``).
+
+Example:
+    >>> backend = get_json_backend()
+    >>> config = backend.loads(path.read_bytes())
+    >>> atomic_write(path, backend.dumps(config))
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import threading
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment,unused-ignore]
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None  # type: ignore[assignment,unused-ignore]
+
+logger = logging.getLogger(__name__)
+
+# Backends in order of preference
+JSON_BACKEND_NAMES = ("orjson", "msgspec", "json")
+
+
+@dataclass(frozen=True)
+class JsonBackend:
+    """A JSON implementation used for config files.
+
+    Attributes:
+        name: Backend name ("orjson", "msgspec" or "json")
+        loads: Parse a document (text, bytes or a bytes view)
+        dumps: Serialize a document, indented by two spaces, with a
+            trailing newline
+        parses_bytes: Whether ``loads`` parses bytes directly; if not, it
+            decodes them to text first, and callers reading a mapped file
+            should decode it with :func:`decode_json_bytes` and release the
+            mapping before parsing
+
+    Example:
+        >>> get_json_backend().dumps({"mcpServers": {}})
+        b'{\\n  "mcpServers": {}\\n}\\n'
+    """
+
+    name: str
+    loads: Callable[[str | bytes | memoryview], Any]
+    dumps: Callable[[Any], bytes]
+    parses_bytes: bool = True
+
+
+# ============================================================================
+# Backend Implementations
+# ============================================================================
+
+
+def decode_json_bytes(data: bytes | memoryview) -> str:
+    """Decode an encoded JSON document to text, like ``json.loads(bytes)``.
+
+    Args:
+        data: UTF-8/16/32 encoded document (a leading BOM is removed)
+
+    Returns:
+        Document text
+    """
+    encoding = json.detect_encoding(bytes(data[:4]))
+    return str(data, encoding, "surrogatepass")
+
+
+def _stdlib_loads(data: str | bytes | memoryview) -> Any:
+    """Parse with the stdlib."""
+    return json.loads(data if isinstance(data, str) else decode_json_bytes(data))
+
+
+def _stdlib_dumps(obj: Any) -> bytes:
+    """Serialize with the stdlib, matching the historical config format."""
+    return (json.dumps(obj, indent=2) + "\n").encode("utf-8")
+
+
+def _orjson_loads(data: str | bytes | memoryview) -> Any:
+    """Parse with orjson, deferring to the stdlib for what it rejects."""
+    try:
+        return orjson.loads(data)
+    except orjson.JSONDecodeError:
+        return _stdlib_loads(data)
+
+
+def _orjson_dumps(obj: Any) -> bytes:
+    """Serialize with orjson, deferring to the stdlib for what it rejects."""
+    try:
+        data = orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE)
+    except orjson.JSONEncodeError:
+        return _stdlib_dumps(obj)
+    return data if data.isascii() else _stdlib_dumps(obj)
+
+
+def _msgspec_loads(data: str | bytes | memoryview) -> Any:
+    """Parse with msgspec, deferring to the stdlib for what it rejects."""
+    try:
+        return msgspec.json.decode(data)
+    except msgspec.DecodeError:
+        return _stdlib_loads(data)
+
+
+def _msgspec_dumps(obj: Any) -> bytes:
+    """Serialize with msgspec, deferring to the stdlib for what it rejects."""
+    try:
+        data: bytes = msgspec.json.format(msgspec.json.encode(obj), indent=2) + b"\n"
+    except (msgspec.EncodeError, TypeError, OverflowError):
+        return _stdlib_dumps(obj)
+    return data if data.isascii() else _stdlib_dumps(obj)
+
+
+_BACKENDS: dict[str, JsonBackend] = {
+    "json": JsonBackend("json", _stdlib_loads, _stdlib_dumps, parses_bytes=False)
+}
+if orjson is not None:
+    _BACKENDS["orjson"] = JsonBackend("orjson", _orjson_loads, _orjson_dumps)
+if msgspec is not None:
+    _BACKENDS["msgspec"] = JsonBackend("msgspec", _msgspec_loads, _msgspec_dumps)
+
+
+# ============================================================================
+# Backend Selection
+# ============================================================================
+
+_selected: JsonBackend | None = None
+_selected_lock = threading.Lock()
+
+
+def available_json_backends() -> list[str]:
+    """List the JSON backends importable in this environment.
+
+    Returns:
+        Backend names, fastest first (always ends with "json")
+    """
+    return [name for name in JSON_BACKEND_NAMES if name in _BACKENDS]
+
+
+def get_json_backend() -> JsonBackend:
+    """Return the backend used for config files.
+
+    Returns:
+        The backend chosen with :func:`set_json_backend`, or else the
+        fastest available one
+    """
+    global _selected
+    with _selected_lock:
+        if _selected is None:
+            _selected = _BACKENDS[available_json_backends()[0]]
+            logger.debug(f"Using JSON backend: {_selected.name}")
+        return _selected
+
+
+def set_json_backend(name: str | None) -> JsonBackend:
+    """Choose the backend used for config files.
+
+    Args:
+        name: "orjson", "msgspec" or "json"; None restores automatic
+            selection
+
+    Returns:
+        The backend now in use
+
+    Raises:
+        ValueError: If the backend is unknown or not installed
+
+    Example:
+        >>> set_json_backend("json")  # e.g. for reproducible output
+    """
+    global _selected
+    if name is not None and name not in _BACKENDS:
+        raise ValueError(
+            f"JSON backend {name!r} is not available "
+            f"(available: {', '.join(available_json_backends())})"
+        )
+    with _selected_lock:
+        _selected = _BACKENDS[name] if name is not None else None
+    return get_json_backend()
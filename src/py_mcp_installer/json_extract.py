@@ -0,0 +1,165 @@
+"""Extraction of selected top-level members from large JSON documents.
+
+Listing the servers of a host config only needs its ``mcpServers`` member,
+but ``json.loads`` builds every other member too: for a ``~/.claude.json``
+with years of project history that is tens of megabytes of dicts, lists
+and strings, built only to be thrown away. This module walks the
+top-level members instead (see json_scan.py) and decodes only the
+requested ones. Every other value is still fully validated but never kept.
+
+Design Philosophy:
+- Same result as ``json.loads`` for the requested members, and the same
+  errors for malformed documents (duplicate keys: the last one wins)
+- Memory proportional to the extracted members, not to the document
+- Tokenizing stays in C; Python code runs once per top-level member
+
+The same walk tells a modern config (one object) from a legacy
+line-delimited one, see :func:`classify_json_document`.
+
+Example:
+    >>> text = Path("~/.claude.json").expanduser().read_text()
+    >>> extract_json_members(text, ["mcpServers"])
+    {'mcpServers': {'mcp-ticketer': {...}}}
+"""
+
+from __future__ import annotations
+
+import json
+from collections.abc import Collection
+from dataclasses import dataclass, field
+from typing import Any
+
+from .json_scan import scan_json_object, skip_whitespace
+from .types import ConfigLayout
+
+_DECODER = json.JSONDecoder()
+
+
+def extract_json_members(text: str, keys: Collection[str]) -> dict[str, Any]:
+    """Decode only some top-level members of a JSON object.
+
+    Args:
+        text: JSON document (a blank document counts as an empty object)
+        keys: Top-level members to decode
+
+    Returns:
+        The requested members that are present, in document order
+
+    Raises:
+        json.JSONDecodeError: If the document is malformed or not an object
+
+    Example:
+        >>> extract_json_members('{"a": [1, 2], "b": {"c": 3}}', ["b", "x"])
+        {'b': {'c': 3}}
+    """
+    i = skip_whitespace(text, 0)
+    if i == len(text):
+        return {}
+    members, end = _scan_object(text, i, keys)
+    end = skip_whitespace(text, end)
+    if end != len(text):
+        raise json.JSONDecodeError("Extra data", text, end)
+    return members
+
+
+# ============================================================================
+# Document Classification
+# ============================================================================
+
+
+@dataclass(frozen=True)
+class JsonDocumentScan:
+    """Result of classifying a config document with :func:`classify_json_document`.
+
+    Attributes:
+        layout: Whether the document is modern, legacy or corrupt
+        members: Requested top-level members (MODERN only)
+        entries: One decoded value per line (LEGACY only)
+        error: Why the document is not valid JSON (CORRUPT only)
+    """
+
+    layout: ConfigLayout
+    members: dict[str, Any] = field(default_factory=dict)
+    entries: list[Any] = field(default_factory=list)
+    error: str | None = None
+
+
+def classify_json_document(text: str, keys: Collection[str]) -> JsonDocumentScan:
+    """Tell a modern config from a legacy line-delimited one in one scan.
+
+    A modern config is a single JSON object; a legacy (pre-FastMCP SDK) one
+    has one JSON value per line. The first value is walked as in
+    :func:`extract_json_members`; only if more values follow it is the rest
+    of the document decoded value by value. Anything else is corrupt,
+    including a document whose only value is not an object.
+
+    Args:
+        text: JSON document (a blank document counts as an empty object)
+        keys: Top-level members to decode from a modern document
+
+    Returns:
+        The layout, with the requested members, the legacy entries or the
+        parse error
+
+    Example:
+        >>> classify_json_document('{"name": "a"}\\n{"name": "b"}', []).layout
+        <ConfigLayout.LEGACY: 'legacy'>
+    """
+    start = skip_whitespace(text, 0)
+    if start == len(text):
+        return JsonDocumentScan(ConfigLayout.MODERN)
+
+    try:
+        if text[start] == "{":
+            members, end = _scan_object(text, start, keys)
+        else:
+            members, end = {}, _DECODER.raw_decode(text, start)[1]
+    except json.JSONDecodeError as e:
+        return JsonDocumentScan(ConfigLayout.CORRUPT, error=str(e))
+
+    i = skip_whitespace(text, end)
+    if i == len(text):
+        if text[start] == "{":
+            return JsonDocumentScan(ConfigLayout.MODERN, members=members)
+        error = json.JSONDecodeError("Expecting a JSON object", text, start)
+        return JsonDocumentScan(ConfigLayout.CORRUPT, error=str(error))
+
+    # More values follow: legacy if each one is valid and on a line of its
+    # own, else report what json.loads would have
+    corrupt = JsonDocumentScan(
+        ConfigLayout.CORRUPT, error=str(json.JSONDecodeError("Extra data", text, i))
+    )
+    if text.find("\n", start, end) != -1:
+        return corrupt  # Pretty-printed, so not line-delimited
+    entries = [_DECODER.raw_decode(text, start)[0]]  # Legacy lines are short
+    while i < len(text):
+        if text.find("\n", end, i) == -1:
+            return corrupt  # Two values on one line
+        try:
+            value, end = _DECODER.raw_decode(text, i)
+        except json.JSONDecodeError:
+            return corrupt
+        if text.find("\n", i, end) != -1:
+            return corrupt
+        entries.append(value)
+        i = skip_whitespace(text, end)
+    return JsonDocumentScan(ConfigLayout.LEGACY, entries=entries)
+
+
+# ============================================================================
+# Private Helper Functions
+# ============================================================================
+
+
+def _scan_object(text: str, i: int, keys: Collection[str]) -> tuple[dict[str, Any], int]:
+    """Walk the JSON object starting at offset i, decoding only some members.
+
+    Returns:
+        (requested members, offset just past the closing brace)
+
+    Raises:
+        json.JSONDecodeError: If the value at i is malformed or not an object
+    """
+    members, end = scan_json_object(text, i, keys.__contains__)
+    # Duplicate keys: the last value wins, at the first position, as in json.loads
+    return {m.name: m.value for m in members if m.name in keys}, end
@@ -0,0 +1,115 @@
+"""Walking the top-level members of a JSON object.
+
+Both partial decoding (json_extract.py) and layout-preserving updates
+(json_splice.py) need the same walk over a document's top-level object:
+the name of every member and the span of its value, with only some values
+actually built. This module holds that single walker.
+
+Values that are not built are still run through the C decoder, with a hook
+that drops each object as soon as it is complete: they are fully validated,
+but only the containers still open are alive at any time.
+
+Design Philosophy:
+- One walker, so that every caller accepts and rejects the same documents
+- Same errors as ``json.loads`` for malformed objects (json.JSONDecodeError)
+- Tokenizing stays in C; Python code runs once per top-level member
+
+Example:
+    >>> members, end = scan_json_object('{"a": [1], "b": 2}', 0, {"b"}.__contains__)
+    >>> [(m.name, m.value) for m in members]
+    [('a', None), ('b', 2)]
+"""
+
+from __future__ import annotations
+
+import json
+import re
+from collections.abc import Callable
+from dataclasses import dataclass
+from json.decoder import scanstring  # type: ignore[attr-defined]
+from typing import Any
+
+_DECODER = json.JSONDecoder()
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+
+
+def _discard(pairs: list[tuple[str, Any]]) -> None:
+    """Object hook that drops every decoded object."""
+    return None
+
+
+# Validates a value without keeping it: each object is replaced by None once
+# decoded, so only the containers still open are alive at any time
+_SKIPPER = json.JSONDecoder(object_pairs_hook=_discard)
+
+
+@dataclass(frozen=True)
+class JsonMember:
+    """A top-level member of a JSON object.
+
+    Attributes:
+        name: Member key
+        value: Decoded value (meaningless for members that were only
+            validated: their objects are dropped)
+        value_start: Offset of the first character of the value
+        value_end: Offset just past the value
+    """
+
+    name: str
+    value: Any
+    value_start: int
+    value_end: int
+
+
+def skip_whitespace(text: str, i: int) -> int:
+    """Return the offset of the first non-whitespace character at or after i."""
+    match = _WHITESPACE.match(text, i)
+    assert match is not None  # Matches the empty string
+    return match.end()
+
+
+def scan_json_object(
+    text: str, i: int, decode: Callable[[str], bool]
+) -> tuple[list[JsonMember], int]:
+    """Walk the JSON object starting at offset i.
+
+    Args:
+        text: JSON document
+        i: Offset of the opening brace
+        decode: Whether to build the value of a member, by name
+
+    Returns:
+        (members in document order, duplicates included; offset just past
+        the closing brace)
+
+    Raises:
+        json.JSONDecodeError: If the value at i is malformed or not an object
+    """
+    members: list[JsonMember] = []
+    if text[i : i + 1] != "{":
+        raise json.JSONDecodeError("Expecting a JSON object", text, i)
+
+    i = skip_whitespace(text, i + 1)
+    if text[i : i + 1] == "}":
+        return members, i + 1
+
+    while True:
+        if text[i : i + 1] != '"':
+            raise json.JSONDecodeError("Expecting property name enclosed in double quotes", text, i)
+        name, i = scanstring(text, i + 1)
+        i = skip_whitespace(text, i)
+        if text[i : i + 1] != ":":
+            raise json.JSONDecodeError("Expecting ':' delimiter", text, i)
+        value_start = skip_whitespace(text, i + 1)
+
+        decoder = _DECODER if decode(name) else _SKIPPER
+        value, i = decoder.raw_decode(text, value_start)
+        members.append(JsonMember(name, value, value_start, i))
+
+        i = skip_whitespace(text, i)
+        separator = text[i : i + 1]
+        if separator == "}":
+            return members, i + 1
+        if separator != ",":
+            raise json.JSONDecodeError("Expecting ',' delimiter", text, i)
+        i = skip_whitespace(text, i + 1)
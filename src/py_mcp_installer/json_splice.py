@@ -0,0 +1,210 @@
+"""Layout-preserving updates of one top-level member in a JSON document.
+
+Host configs such as ``~/.claude.json`` hold megabytes of unrelated state
+next to the ``mcpServers`` section. Re-serializing the whole document for a
+one-server change rewrites (and reformats) all of it. This module instead
+locates the top-level member in the original text and replaces only its
+value, keeping every other byte of the file as it was.
+
+Design Philosophy:
+- Byte-for-byte preservation outside the replaced member
+- Correctness first: splice only when the rest of the document is provably
+  unchanged, otherwise return None so the caller serializes the whole file
+- Top-level members are found with the shared walker of json_scan.py
+- Callers that already hold the parsed document use :func:`replace_json_member`,
+  which only locates byte spans and builds no values
+
+Example:
+    >>> text = Path("~/.claude.json").expanduser().read_text()
+    >>> config = json.loads(text)
+    >>> config["mcpServers"]["new-server"] = {"command": "uvx", "args": []}
+    >>> new_text = splice_json_member(text, config, "mcpServers")
+    >>> if new_text is None:
+    ...     new_text = json.dumps(config, indent=2) + "\\n"
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+
+from .json_scan import JsonMember, scan_json_object, skip_whitespace
+
+
+def splice_json_member(text: str, config: dict[str, Any], key: str) -> str | None:
+    """Replace one top-level member of a JSON document, keeping its layout.
+
+    ``config`` is the complete new document. The splice is done only if it
+    differs from ``text`` in the value of ``key`` alone (same other members,
+    same order); ``key`` may also be new, in which case it is appended as the
+    last member. The new value is serialized in the file's style: indented
+    with the file's indentation unit, or compact if the file is on one line.
+
+    Args:
+        text: Current file content
+        config: New document
+        key: Top-level member to replace (e.g. "mcpServers")
+
+    Returns:
+        New file content, or None if the change cannot be spliced safely
+        (malformed or non-object document, duplicate keys, other members
+        changed, member removed, ...)
+
+    Example:
+        >>> splice_json_member('{\\n  "a": 1,\\n  "s": {}\\n}\\n', {"a": 1, "s": {"x": 1}}, "s")
+        '{\\n  "a": 1,\\n  "s": {\\n    "x": 1\\n  }\\n}\\n'
+    """
+    if key not in config:
+        return None
+
+    try:
+        parsed = _scan_members(text, decode_values=True)
+    except (ValueError, IndexError):
+        return None
+    if parsed is None:
+        return None
+    members, indent, last_value_end = parsed
+
+    names = [m.name for m in members]
+    if len(set(names)) != len(names):
+        return None  # Duplicate keys: the parser keeps the last one
+
+    new_names = list(config)
+    if key in names:
+        if new_names != names:
+            return None
+    elif new_names != [*names, key] or not members:
+        return None
+
+    for member in members:
+        if member.name != key and config[member.name] != member.value:
+            return None
+
+    if key in names and members[names.index(key)].value == config[key]:
+        return text
+    return _replace_value(text, members, indent, last_value_end, key, config[key])
+
+
+def replace_json_member(text: str, key: str, value: Any) -> str | None:
+    """Replace the value of one top-level member, keeping the file's layout.
+
+    Unlike :func:`splice_json_member`, the other members are not parsed or
+    compared: the caller must already know that only ``key`` changed, e.g.
+    from a parsed copy of the same file version. The document is only
+    scanned for the byte span of the member; if ``key`` is missing it is
+    appended as the last member.
+
+    Args:
+        text: Current file content
+        key: Top-level member to replace (e.g. "mcpServers")
+        value: New member value
+
+    Returns:
+        New file content, or None if the document cannot be patched safely
+        (malformed, not an object, empty object or duplicate keys)
+
+    Example:
+        >>> replace_json_member('{"a": 1, "s": {}}', "s", {"x": 1})
+        '{"a": 1, "s":{"x":1}}'
+    """
+    try:
+        parsed = _scan_members(text, decode_values=False)
+    except (ValueError, IndexError):
+        return None
+    if parsed is None:
+        return None
+    members, indent, last_value_end = parsed
+
+    names = [m.name for m in members]
+    if len(set(names)) != len(names):
+        return None
+    return _replace_value(text, members, indent, last_value_end, key, value)
+
+
+# ============================================================================
+# Private Helper Functions
+# ============================================================================
+
+
+def _replace_value(
+    text: str,
+    members: list[JsonMember],
+    indent: str | None,
+    last_value_end: int,
+    key: str,
+    value: Any,
+) -> str | None:
+    """Replace or append a member in scanned text.
+
+    Args:
+        text: JSON document
+        members: Members found by :func:`_scan_members`
+        indent: Indentation unit of the file (None for compact files)
+        last_value_end: Offset just past the last member value
+        key: Member to replace
+        value: New member value
+
+    Returns:
+        New document, or None if ``key`` is missing and the object is empty
+        (there is no layout to follow)
+    """
+    value_text = _dump_value(value, indent)
+    for member in members:
+        if member.name == key:
+            return text[: member.value_start] + value_text + text[member.value_end :]
+    if not members:
+        return None
+
+    separator = ": " if indent is not None else ":"
+    new_member = json.dumps(key) + separator + value_text
+    if indent is not None:
+        new_member = "\n" + indent + new_member
+    return text[:last_value_end] + "," + new_member + text[last_value_end:]
+
+
+def _scan_members(
+    text: str, decode_values: bool
+) -> tuple[list[JsonMember], str | None, int] | None:
+    """Locate the members of a top-level JSON object.
+
+    Args:
+        text: JSON document
+        decode_values: Build the member values (False to only find spans)
+
+    Returns:
+        (members, indentation unit or None if compact, offset just past the
+        last member value), or None if the document is not a JSON object
+
+    Raises:
+        ValueError: If the document is malformed
+    """
+    start = skip_whitespace(text, 0)
+    if text[start : start + 1] != "{":
+        return None
+    members, end = scan_json_object(text, start, lambda name: decode_values)
+
+    # Nothing but whitespace may follow the object
+    if skip_whitespace(text, end) != len(text):
+        return None
+
+    # Indentation of the first member line, None for single-line documents
+    leading = text[start + 1 : skip_whitespace(text, start + 1)]
+    indent = leading[leading.rfind("\n") + 1 :] if "\n" in leading else None
+
+    last_value_end = members[-1].value_end if members else end - 1
+    return members, indent, last_value_end
+
+
+def _dump_value(value: Any, indent: str | None) -> str:
+    """Serialize a member value for insertion at nesting depth 1.
+
+    Args:
+        value: Value to serialize
+        indent: Indentation unit of the file (None for compact files)
+
+    Returns:
+        JSON text whose continuation lines are indented one level
+    """
+    if indent is None:
+        return json.dumps(value, separators=(",", ":"))
+    return json.dumps(value, indent=indent).replace("\n", "\n" + indent)
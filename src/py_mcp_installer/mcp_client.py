@@ -0,0 +1,462 @@
+"""Asyncio JSON-RPC client for MCP servers using the stdio transport.
+
+This module provides a minimal MCP client used by MCPDoctor to talk to server
+processes. Messages are newline-delimited JSON-RPC 2.0 objects on the server's
+stdin/stdout, as required by the MCP stdio transport.
+
+Design Philosophy:
+- Never block on a pipe: stdout and stderr are drained by background tasks
+- Responses are matched to requests by id, so requests can be pipelined
+- Every request has its own deadline
+- Partial lines and non-JSON output never wedge the client
+- Cross-platform (asyncio subprocesses work on POSIX and Windows)
+
+Example:
+    >>> import asyncio
+    >>> async def probe() -> None:
+    ...     async with MCPStdioClient("uv", ["run", "mcp-ticketer", "mcp"]) as client:
+    ...         init = await client.request("initialize", {...}, timeout=10.0)
+    ...         await client.notify("notifications/initialized")
+    ...         tools = await client.request("tools/list", timeout=5.0)
+    >>> asyncio.run(probe())
+"""
+
+from __future__ import annotations
+
+import asyncio
+import itertools
+import json
+import logging
+import time
+from collections import deque
+from types import TracebackType
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+
+class MCPStdioClient:
+    """JSON-RPC client for a single MCP server subprocess.
+
+    The server is spawned by :meth:`start` (or ``async with``). A reader task
+    parses stdout line by line and resolves the pending request with the
+    matching id; a second task drains stderr into a bounded buffer so a chatty
+    server can never fill the pipe and deadlock.
+
+    Attributes:
+        command: Executable to run
+        args: Command arguments
+        env: Complete environment for the subprocess (None = inherit)
+        request_timeout: Default per-request deadline in seconds
+
+    Example:
+        >>> client = MCPStdioClient("npx", ["-y", "@modelcontextprotocol/server-github"])
+        >>> await client.start()
+        >>> response = await client.request("tools/list", timeout=5.0)
+        >>> await client.close()
+    """
+
+    # Maximum size of a single JSON-RPC message line
+    STREAM_LIMIT = 16 * 1024 * 1024
+
+    # Number of stderr lines kept for error reporting
+    STDERR_TAIL_LINES = 50
+
+    def __init__(
+        self,
+        command: str,
+        args: list[str] | None = None,
+        env: dict[str, str] | None = None,
+        request_timeout: float = 10.0,
+    ) -> None:
+        """Initialize client (does not start the server).
+
+        Args:
+            command: Executable to run
+            args: Command arguments
+            env: Complete environment for the subprocess (None = inherit)
+            request_timeout: Default per-request deadline in seconds
+        """
+        self.command = command
+        self.args = list(args or [])
+        self.env = env
+        self.request_timeout = request_timeout
+
+        self._process: asyncio.subprocess.Process | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._ids = itertools.count(1)
+        self._pending: dict[int, asyncio.Future[dict[str, Any]]] = {}
+        self._tasks: list[asyncio.Task[None]] = []
+        self._stderr_tail: deque[str] = deque(maxlen=self.STDERR_TAIL_LINES)
+        self._closed_error: ConnectionError | None = None
+        self._started_at: float | None = None
+        self._first_byte_at: float | None = None
+        self._request_times_ms: dict[str, float] = {}
+
+    async def __aenter__(self) -> MCPStdioClient:
+        """Start the server process."""
+        await self.start()
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        """Stop the server process."""
+        await self.close()
+
+    # ========================================================================
+    # Lifecycle
+    # ========================================================================
+
+    async def start(self) -> None:
+        """Spawn the server process and start the stream reader tasks.
+
+        Raises:
+            FileNotFoundError: If the command does not exist
+            PermissionError: If the command is not executable
+        """
+        self._loop = asyncio.get_running_loop()
+        self._started_at = time.perf_counter()
+        self._process = await asyncio.create_subprocess_exec(
+            self.command,
+            *self.args,
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            env=self.env,
+            limit=self.STREAM_LIMIT,
+        )
+        logger.debug(f"Started {self.command} (pid {self._process.pid})")
+
+        self._tasks = [
+            asyncio.create_task(self._read_stdout()),
+            asyncio.create_task(self._read_stderr()),
+        ]
+
+    async def close(self, grace: float = 2.0) -> None:
+        """Stop the server process.
+
+        Closes stdin (the MCP stdio shutdown signal), waits up to ``grace``
+        seconds for the process to exit, then terminates and finally kills it.
+
+        Args:
+            grace: Seconds to wait for a voluntary exit before terminating
+        """
+        proc = self._process
+        if proc is None:
+            return
+
+        if proc.stdin is not None and not proc.stdin.is_closing():
+            proc.stdin.close()
+
+        if proc.returncode is None:
+            try:
+                await asyncio.wait_for(proc.wait(), timeout=grace)
+            except asyncio.TimeoutError:
+                try:
+                    proc.terminate()
+                    await asyncio.wait_for(proc.wait(), timeout=grace)
+                except ProcessLookupError:
+                    pass
+                except asyncio.TimeoutError:
+                    proc.kill()
+                    await proc.wait()
+
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._fail_pending(ConnectionError("Client closed"))
+
+    def kill(self) -> None:
+        """Kill the server process immediately.
+
+        Safe to call from any thread; pending requests fail with
+        ConnectionError once the process exits.
+        """
+        proc, loop = self._process, self._loop
+        if proc is None or loop is None or proc.returncode is not None:
+            return
+
+        def _kill() -> None:
+            try:
+                proc.kill()
+            except ProcessLookupError:
+                pass
+
+        try:
+            loop.call_soon_threadsafe(_kill)
+        except RuntimeError:
+            pass  # Event loop already closed
+
+    @property
+    def pid(self) -> int | None:
+        """Process id of the server (None if not started)."""
+        return self._process.pid if self._process else None
+
+    @property
+    def returncode(self) -> int | None:
+        """Exit code of the server (None while running)."""
+        return self._process.returncode if self._process else None
+
+    @property
+    def first_byte_ms(self) -> float | None:
+        """Milliseconds from spawn until the server's first stdout output.
+
+        None until the server has written anything to stdout.
+        """
+        if self._started_at is None or self._first_byte_at is None:
+            return None
+        return (self._first_byte_at - self._started_at) * 1000
+
+    @property
+    def request_times_ms(self) -> dict[str, float]:
+        """Round-trip time of the last answered request, by method name."""
+        return dict(self._request_times_ms)
+
+    @property
+    def stderr_tail(self) -> str:
+        """Last lines the server wrote to stderr."""
+        return "\n".join(self._stderr_tail)
+
+    # ========================================================================
+    # JSON-RPC
+    # ========================================================================
+
+    async def request(
+        self,
+        method: str,
+        params: dict[str, Any] | None = None,
+        timeout: float | None = None,
+    ) -> dict[str, Any]:
+        """Send a JSON-RPC request and wait for the matching response.
+
+        Responses are matched by id, so several requests may be awaited
+        concurrently (e.g. with ``asyncio.gather``) on one client.
+
+        Args:
+            method: JSON-RPC method name
+            params: Method parameters
+            timeout: Deadline in seconds (defaults to request_timeout)
+
+        Returns:
+            Complete JSON-RPC response (contains "result" or "error")
+
+        Raises:
+            TimeoutError: If no response arrives before the deadline
+            ConnectionError: If the server exits or closes stdout
+        """
+        if self._closed_error is not None:
+            raise self._closed_error
+
+        assert self._loop is not None
+        request_id = next(self._ids)
+        future: asyncio.Future[dict[str, Any]] = self._loop.create_future()
+        self._pending[request_id] = future
+
+        deadline = self.request_timeout if timeout is None else timeout
+        sent_at = time.perf_counter()
+        try:
+            self._write(
+                {
+                    "jsonrpc": "2.0",
+                    "id": request_id,
+                    "method": method,
+                    "params": params or {},
+                }
+            )
+            await self._flush()
+            response = await asyncio.wait_for(future, timeout=deadline)
+            self._request_times_ms[method] = (time.perf_counter() - sent_at) * 1000
+            return response
+        except asyncio.TimeoutError:
+            raise TimeoutError(f"No response to {method} within {deadline}s") from None
+        finally:
+            self._pending.pop(request_id, None)
+
+    async def notify(self, method: str, params: dict[str, Any] | None = None) -> None:
+        """Send a JSON-RPC notification (no response expected).
+
+        Args:
+            method: JSON-RPC method name
+            params: Method parameters
+
+        Raises:
+            ConnectionError: If the server is not running
+        """
+        if self._closed_error is not None:
+            raise self._closed_error
+
+        message: dict[str, Any] = {"jsonrpc": "2.0", "method": method}
+        if params is not None:
+            message["params"] = params
+        self._write(message)
+        await self._flush()
+
+    # ========================================================================
+    # Private Helper Methods
+    # ========================================================================
+
+    def _write(self, message: dict[str, Any]) -> None:
+        """Frame and buffer a message for the server's stdin.
+
+        Args:
+            message: JSON-RPC message
+        """
+        assert self._process is not None and self._process.stdin is not None
+        data = json.dumps(message, separators=(",", ":")) + "\n"
+        logger.debug(f"Sending: {data.strip()}")
+        self._process.stdin.write(data.encode("utf-8"))
+
+    async def _flush(self) -> None:
+        """Flush buffered stdin data to the server.
+
+        Raises:
+            ConnectionError: If the pipe is closed
+        """
+        assert self._process is not None and self._process.stdin is not None
+        try:
+            await self._process.stdin.drain()
+        except (BrokenPipeError, ConnectionResetError) as e:
+            raise ConnectionError(f"Server closed stdin: {e}") from e
+
+    async def _read_stdout(self) -> None:
+        """Dispatch messages from the server's stdout until EOF."""
+        assert self._process is not None and self._process.stdout is not None
+        stdout = self._process.stdout
+
+        try:
+            # Cold start is timed on the first byte, not on the first full line
+            head = await stdout.read(1)
+            if not head:
+                return
+            self._first_byte_at = time.perf_counter()
+
+            while True:
+                try:
+                    line = head if head == b"\n" else head + await stdout.readline()
+                except ValueError as e:
+                    # Line exceeded STREAM_LIMIT; the stream cannot be resynced
+                    self._fail_pending(ConnectionError(f"Oversized message: {e}"))
+                    return
+                head = b""
+
+                if not line:
+                    break
+
+                self._dispatch(line)
+        finally:
+            if self._process.returncode is None:
+                try:
+                    await asyncio.wait_for(self._process.wait(), timeout=0.5)
+                except asyncio.TimeoutError:
+                    pass
+            self._fail_pending(self._connection_closed_error())
+
+    async def _read_stderr(self) -> None:
+        """Drain the server's stderr into a bounded buffer until EOF."""
+        assert self._process is not None and self._process.stderr is not None
+        stderr = self._process.stderr
+
+        while True:
+            try:
+                line = await stderr.readline()
+            except ValueError:
+                # Very long stderr line: drop the buffered chunk and carry on
+                await stderr.read(self.STREAM_LIMIT)
+                continue
+
+            if not line:
+                return
+
+            text = line.decode("utf-8", errors="replace").rstrip()
+            self._stderr_tail.append(text)
+            logger.debug(f"[{self.command} stderr] {text}")
+
+    def _dispatch(self, line: bytes) -> None:
+        """Handle one line of server output.
+
+        Args:
+            line: Raw line from stdout
+        """
+        text = line.decode("utf-8", errors="replace").strip()
+        if not text:
+            return
+
+        try:
+            message = json.loads(text)
+        except json.JSONDecodeError:
+            # Servers sometimes log to stdout; ignore anything that isn't JSON
+            logger.debug(f"Ignoring non-JSON output: {text[:200]}")
+            return
+
+        if not isinstance(message, dict):
+            logger.debug(f"Ignoring non-object message: {text[:200]}")
+            return
+
+        logger.debug(f"Received: {text[:500]}")
+
+        if "method" in message:
+            self._handle_server_message(message)
+            return
+
+        request_id = message.get("id")
+        future = self._pending.get(request_id) if isinstance(request_id, int) else None
+        if future is not None and not future.done():
+            future.set_result(message)
+        else:
+            logger.debug(f"Ignoring response with unknown id: {request_id!r}")
+
+    def _handle_server_message(self, message: dict[str, Any]) -> None:
+        """Handle a request or notification sent by the server.
+
+        Server notifications are ignored. Server requests are answered so the
+        server never blocks waiting on us: ``ping`` succeeds, anything else
+        gets a method-not-found error.
+
+        Args:
+            message: JSON-RPC message with a "method" key
+        """
+        if "id" not in message or self._closed_error is not None:
+            return
+
+        assert self._process is not None and self._process.stdin is not None
+        if self._process.stdin.is_closing():
+            return
+
+        reply: dict[str, Any] = {"jsonrpc": "2.0", "id": message["id"]}
+        if message["method"] == "ping":
+            reply["result"] = {}
+        else:
+            reply["error"] = {"code": -32601, "message": "Method not found"}
+        self._write(reply)
+
+    def _connection_closed_error(self) -> ConnectionError:
+        """Build the error reported when the server stops responding.
+
+        Returns:
+            ConnectionError describing the exit code and stderr tail
+        """
+        returncode = self.returncode
+        message = "Server closed connection"
+        if returncode is not None:
+            message += f" (exit code {returncode})"
+        tail = list(self._stderr_tail)[-5:]
+        if tail:
+            message += ": " + " | ".join(tail)
+        return ConnectionError(message)
+
+    def _fail_pending(self, error: ConnectionError) -> None:
+        """Fail all pending requests and reject new ones.
+
+        Args:
+            error: Error to raise in waiting callers
+        """
+        if self._closed_error is None:
+            self._closed_error = error
+        for future in self._pending.values():
+            if not future.done():
+                future.set_exception(self._closed_error)
+        self._pending.clear()
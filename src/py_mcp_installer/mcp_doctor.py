@@ -23,18 +23,23 @@ Example:
     ...         print(f"{issue.severity}: {issue.message}")
 """
 
-import json
+import asyncio
 import logging
-import select
-import subprocess
+import math
+import os
+import statistics
+import threading
 import time
+from concurrent.futures import Future, ThreadPoolExecutor, wait
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Literal
 
-from .config_manager import ConfigManager
+from .config_manager import SERVER_SECTION_KEYS, ConfigManager
 from .exceptions import ConfigurationError
+from .mcp_client import MCPStdioClient
+from .server_pool import ServerPool
 from .types import (
     ConfigFormat,
     DiagnosticCategory,
@@ -103,6 +108,10 @@ class ServerDiagnostic:
         resource_count: Number of resources exposed
         prompt_count: Number of prompts exposed
         error: Error message if status is error/unreachable
+        first_byte_ms: Time from process spawn to the server's first output
+            (covers interpreter/``npx``/``uv run`` startup)
+        initialize_ms: Round-trip time of the initialize request
+        method_times_ms: Round-trip time of each list request, by method
 
     Example:
         >>> diagnostic = ServerDiagnostic(
@@ -126,6 +135,9 @@ class ServerDiagnostic:
     resource_count: int = 0
     prompt_count: int = 0
     error: str | None = None
+    first_byte_ms: float | None = None
+    initialize_ms: float | None = None
+    method_times_ms: dict[str, float] = field(default_factory=dict)
 
 
 @dataclass(frozen=True)
@@ -244,6 +256,9 @@ class DiagnosticReport:
                     "resource_count": diag.resource_count,
                     "prompt_count": diag.prompt_count,
                     "error": diag.error,
+                    "first_byte_ms": diag.first_byte_ms,
+                    "initialize_ms": diag.initialize_ms,
+                    "method_times_ms": diag.method_times_ms,
                 }
                 for name, diag in self.server_reports.items()
             },
@@ -251,6 +266,233 @@ class DiagnosticReport:
         }
 
 
+@dataclass(frozen=True)
+class LatencyStats:
+    """Summary statistics for a series of latency samples.
+
+    Attributes:
+        samples: Number of samples
+        min_ms: Fastest sample
+        p50_ms: Median
+        p95_ms: 95th percentile (linear interpolation)
+        max_ms: Slowest sample
+        mean_ms: Arithmetic mean
+        variance_ms2: Sample variance in ms² (0.0 for a single sample)
+
+    Example:
+        >>> stats = LatencyStats.from_samples([120.0, 95.5, 101.2])
+        >>> print(f"p50={stats.p50_ms:.0f}ms p95={stats.p95_ms:.0f}ms")
+    """
+
+    samples: int
+    min_ms: float
+    p50_ms: float
+    p95_ms: float
+    max_ms: float
+    mean_ms: float
+    variance_ms2: float
+
+    @classmethod
+    def from_samples(cls, samples: list[float]) -> "LatencyStats":
+        """Compute statistics from latency samples.
+
+        Args:
+            samples: Latency samples in milliseconds (at least one)
+
+        Returns:
+            Statistics for the samples
+
+        Raises:
+            ValueError: If samples is empty
+        """
+        if not samples:
+            raise ValueError("At least one sample is required")
+
+        ordered = sorted(samples)
+        return cls(
+            samples=len(ordered),
+            min_ms=ordered[0],
+            p50_ms=_percentile(ordered, 50),
+            p95_ms=_percentile(ordered, 95),
+            max_ms=ordered[-1],
+            mean_ms=statistics.fmean(ordered),
+            variance_ms2=statistics.variance(ordered) if len(ordered) > 1 else 0.0,
+        )
+
+    @property
+    def stdev_ms(self) -> float:
+        """Sample standard deviation in milliseconds."""
+        return math.sqrt(self.variance_ms2)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert statistics to dictionary for JSON serialization.
+
+        Returns:
+            Dictionary representation of the statistics
+        """
+        return {
+            "samples": self.samples,
+            "min_ms": self.min_ms,
+            "p50_ms": self.p50_ms,
+            "p95_ms": self.p95_ms,
+            "max_ms": self.max_ms,
+            "mean_ms": self.mean_ms,
+            "variance_ms2": self.variance_ms2,
+        }
+
+
+@dataclass(frozen=True)
+class ServerBenchmark:
+    """Benchmark results for repeated handshakes with one MCP server.
+
+    Statistics only cover successful runs; failed runs are counted in
+    ``failures`` and their distinct error messages kept in ``errors``.
+
+    Attributes:
+        name: Server name
+        runs: Number of handshakes attempted
+        failures: Number of handshakes that did not complete
+        total: Complete handshake time (spawn to last list response)
+        first_byte: Cold start (spawn to first output)
+        initialize: Initialize round-trip time
+        methods: Round-trip time of each list method, by method name
+        errors: Distinct error messages from failed runs
+
+    Example:
+        >>> bench = doctor.benchmark(iterations=10).servers["mcp-ticketer"]
+        >>> if bench.total and bench.total.p95_ms > 2000:
+        ...     print("too slow")
+    """
+
+    name: str
+    runs: int
+    failures: int = 0
+    total: LatencyStats | None = None
+    first_byte: LatencyStats | None = None
+    initialize: LatencyStats | None = None
+    methods: dict[str, LatencyStats] = field(default_factory=dict)
+    errors: list[str] = field(default_factory=list)
+
+    @classmethod
+    def from_diagnostics(
+        cls, name: str, diagnostics: list[ServerDiagnostic]
+    ) -> "ServerBenchmark":
+        """Aggregate the results of repeated server tests.
+
+        Args:
+            name: Server name
+            diagnostics: Results of each test_server() run
+
+        Returns:
+            Aggregated benchmark results
+        """
+        healthy = [d for d in diagnostics if d.status == ServerStatus.HEALTHY]
+        errors = list(
+            dict.fromkeys(
+                d.error or d.status.value
+                for d in diagnostics
+                if d.status != ServerStatus.HEALTHY
+            )
+        )
+
+        method_samples: dict[str, list[float]] = {}
+        for diag in healthy:
+            for method, ms in diag.method_times_ms.items():
+                method_samples.setdefault(method, []).append(ms)
+
+        return cls(
+            name=name,
+            runs=len(diagnostics),
+            failures=len(diagnostics) - len(healthy),
+            total=_stats([d.response_time_ms for d in healthy]),
+            first_byte=_stats([d.first_byte_ms for d in healthy]),
+            initialize=_stats([d.initialize_ms for d in healthy]),
+            methods={
+                method: LatencyStats.from_samples(samples)
+                for method, samples in method_samples.items()
+            },
+            errors=errors,
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert benchmark to dictionary for JSON serialization.
+
+        Returns:
+            Dictionary representation of the benchmark
+        """
+        return {
+            "name": self.name,
+            "runs": self.runs,
+            "failures": self.failures,
+            "total": self.total.to_dict() if self.total else None,
+            "first_byte": self.first_byte.to_dict() if self.first_byte else None,
+            "initialize": self.initialize.to_dict() if self.initialize else None,
+            "methods": {
+                method: stats.to_dict() for method, stats in self.methods.items()
+            },
+            "errors": self.errors,
+        }
+
+
+@dataclass(frozen=True)
+class BenchmarkReport:
+    """Results of benchmarking all configured MCP servers.
+
+    Attributes:
+        platform: Detected platform
+        timestamp: When the benchmark started
+        iterations: Handshakes per server
+        servers: Per-server benchmark results, in config order
+    """
+
+    platform: Platform
+    timestamp: datetime
+    iterations: int
+    servers: dict[str, ServerBenchmark] = field(default_factory=dict)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert report to dictionary for JSON serialization.
+
+        Returns:
+            Dictionary representation of the report
+        """
+        return {
+            "platform": self.platform.value,
+            "timestamp": self.timestamp.isoformat(),
+            "iterations": self.iterations,
+            "servers": {name: bench.to_dict() for name, bench in self.servers.items()},
+        }
+
+
+def _percentile(ordered: list[float], percent: float) -> float:
+    """Percentile of sorted samples using linear interpolation.
+
+    Args:
+        ordered: Samples sorted in ascending order (at least one)
+        percent: Percentile between 0 and 100
+
+    Returns:
+        Interpolated percentile value
+    """
+    rank = (len(ordered) - 1) * percent / 100
+    lower = math.floor(rank)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (rank - lower)
+
+
+def _stats(samples: list[float | None]) -> LatencyStats | None:
+    """Statistics for the recorded samples, ignoring missing values.
+
+    Args:
+        samples: Latency samples (None where not recorded)
+
+    Returns:
+        Statistics, or None if no sample was recorded
+    """
+    recorded = [ms for ms in samples if ms is not None]
+    return LatencyStats.from_samples(recorded) if recorded else None
+
+
 # ============================================================================
 # MCP Doctor
 # ============================================================================
@@ -267,6 +509,8 @@ class MCPDoctor:
         platform_info: Detected platform information
         timeout: Timeout for server tests in seconds
         verbose: Enable verbose logging
+        max_workers: Maximum number of servers probed concurrently in full mode
+        total_timeout: Wall-clock budget for all server tests (None = unbounded)
 
     Example:
         >>> from py_mcp_installer import PlatformDetector
@@ -282,11 +526,16 @@ class MCPDoctor:
     CLIENT_NAME = "mcp-doctor"
     CLIENT_VERSION = "1.0.0"
 
+    # Default number of servers probed concurrently in full mode
+    DEFAULT_MAX_WORKERS = 8
+
     def __init__(
         self,
         platform_info: PlatformInfo,
         timeout: float = 10.0,
         verbose: bool = False,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        total_timeout: float | None = None,
     ) -> None:
         """Initialize doctor with platform info.
 
@@ -294,16 +543,24 @@ class MCPDoctor:
             platform_info: Platform information from PlatformDetector
             timeout: Timeout for server tests in seconds
             verbose: Enable verbose logging
+            max_workers: Maximum number of servers probed concurrently
+                (1 = probe servers one after another)
+            total_timeout: Wall-clock budget in seconds for probing all servers.
+                Servers still running when the budget expires are reported
+                as unreachable. None means no global budget.
 
         Example:
             >>> from py_mcp_installer import PlatformDetector
             >>> detector = PlatformDetector()
             >>> info = detector.detect()
             >>> doctor = MCPDoctor(info, timeout=15.0, verbose=True)
+            >>> doctor = MCPDoctor(info, max_workers=16, total_timeout=30.0)
         """
         self.platform_info = platform_info
         self.timeout = timeout
         self.verbose = verbose
+        self.max_workers = max(1, max_workers)
+        self.total_timeout = total_timeout
         self.config_path = platform_info.config_path or Path()
 
         # Determine config format based on platform
@@ -314,6 +571,12 @@ class MCPDoctor:
 
         self.config_manager = ConfigManager(self.config_path, self.config_format)
 
+        # Server clients currently being probed (killed when budget expires)
+        self._active_clients: set[MCPStdioClient] = set()
+        self._clients_lock = threading.Lock()
+        # Budget of the test_servers() run a worker thread is probing for
+        self._worker_state = threading.local()
+
         if verbose:
             logging.basicConfig(level=logging.DEBUG)
             logger.setLevel(logging.DEBUG)
@@ -380,8 +643,9 @@ class MCPDoctor:
 
         # Run server protocol tests (full mode only)
         if full:
+            server_diags = self.test_servers(servers)
             for server in servers:
-                server_diag = self.test_server(server)
+                server_diag = server_diags[server.name]
                 server_reports[server.name] = server_diag
                 checks_total += 1
 
@@ -443,6 +707,75 @@ class MCPDoctor:
             recommendations=recommendations,
         )
 
+    def benchmark(
+        self, iterations: int, server_name: str | None = None
+    ) -> BenchmarkReport:
+        """Run the server handshake repeatedly and summarize its latency.
+
+        Each iteration tests every configured server once with
+        :meth:`test_servers` (honouring ``max_workers`` and
+        ``total_timeout``), so every sample is a cold start. Use
+        ``max_workers=1`` for samples that do not compete for CPU.
+
+        Args:
+            iterations: Number of handshakes per server
+            server_name: Only benchmark this server (None = all servers)
+
+        Returns:
+            Benchmark report with per-server, per-phase statistics
+
+        Raises:
+            ValueError: If iterations is less than 1
+
+        Example:
+            >>> report = doctor.benchmark(iterations=20)
+            >>> for name, bench in report.servers.items():
+            ...     if bench.total:
+            ...         print(f"{name}: p95 {bench.total.p95_ms:.0f}ms")
+        """
+        if iterations < 1:
+            raise ValueError("iterations must be at least 1")
+
+        servers = self._get_servers()
+        if server_name is not None:
+            servers = [s for s in servers if s.name == server_name]
+
+        timestamp = datetime.now()
+        runs: dict[str, list[ServerDiagnostic]] = {s.name: [] for s in servers}
+        for iteration in range(iterations):
+            logger.info(f"Benchmark iteration {iteration + 1}/{iterations}")
+            for name, diag in self.test_servers(servers).items():
+                runs[name].append(diag)
+
+        return BenchmarkReport(
+            platform=self.platform_info.platform,
+            timestamp=timestamp,
+            iterations=iterations,
+            servers={
+                name: ServerBenchmark.from_diagnostics(name, diags)
+                for name, diags in runs.items()
+            },
+        )
+
+    def server_pool(self, server_name: str | None = None) -> ServerPool:
+        """Create a warm pool of the configured servers for repeated checks.
+
+        Args:
+            server_name: Only pool this server (None = all servers)
+
+        Returns:
+            ServerPool using this doctor's handshake, timeout and max_workers
+
+        Example:
+            >>> async with doctor.server_pool() as pool:
+            ...     async for health in pool.watch(interval=30.0):
+            ...         print({n: h.diagnostic.status.value for n, h in health.items()})
+        """
+        servers = self._get_servers()
+        if server_name is not None:
+            servers = [s for s in servers if s.name == server_name]
+        return ServerPool(self, servers)
+
     def check_platform(self) -> list[DiagnosticIssue]:
         """Check platform detection and configuration.
 
@@ -527,11 +860,10 @@ class MCPDoctor:
 
         # Try to read and validate config
         try:
-            config = self.config_manager.read()
+            config = self.config_manager.snapshot_members(SERVER_SECTION_KEYS)
 
             # Check for mcpServers key
-            server_keys = ["mcpServers", "mcp_servers", "servers"]
-            has_servers = any(key in config for key in server_keys)
+            has_servers = bool(config)
 
             if not has_servers:
                 issues.append(
@@ -650,115 +982,112 @@ class MCPDoctor:
         )
         return issues
 
-    def test_server(self, server: MCPServerConfig) -> ServerDiagnostic:
-        """Test single MCP server with full protocol validation.
+    def test_servers(
+        self, servers: list[MCPServerConfig]
+    ) -> dict[str, ServerDiagnostic]:
+        """Test multiple MCP servers concurrently.
 
-        Starts the server process and tests JSON-RPC protocol compliance
-        by performing the initialization handshake and querying capabilities.
+        Up to ``max_workers`` servers are probed at the same time, so total
+        time is bounded by the slowest server rather than the sum of all of
+        them. If ``total_timeout`` is set, servers that have not finished
+        when the budget expires are killed and reported as unreachable.
 
         Args:
-            server: Server configuration to test
+            servers: Server configurations to test
 
         Returns:
-            Complete server diagnostic results
-        """
-        logger.info(f"Testing server: {server.name}")
+            Server diagnostics keyed by server name, in the same order as
+            ``servers`` regardless of completion order
 
-        # Check command exists first
-        if not resolve_command_path(server.command):
-            return ServerDiagnostic(
-                name=server.name,
-                status=ServerStatus.UNREACHABLE,
-                error=f"Command not found: {server.command}",
-            )
-
-        # Build command line
-        cmd = [server.command] + server.args
+        Example:
+            >>> diags = doctor.test_servers(doctor._get_servers())
+            >>> for name, diag in diags.items():
+            ...     print(f"{name}: {diag.status.value}")
+        """
+        if not servers:
+            return {}
 
-        # Prepare environment
-        import os
+        workers = min(self.max_workers, len(servers))
+        if workers == 1 and self.total_timeout is None:
+            return {server.name: self.test_server(server) for server in servers}
 
-        env = os.environ.copy()
-        env.update(server.env)
+        logger.info(
+            f"Testing {len(servers)} servers with {workers} workers "
+            f"(budget: {self.total_timeout or 'none'})"
+        )
 
+        executor = ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="mcp-doctor"
+        )
+        expired = threading.Event()
+        futures: list[Future[ServerDiagnostic]] = [
+            executor.submit(self._test_server_in_run, server, expired)
+            for server in servers
+        ]
         try:
-            # Start server process
-            start_time = time.time()
-            proc = subprocess.Popen(
-                cmd,
-                stdin=subprocess.PIPE,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                env=env,
-                text=True,
-            )
+            _, not_done = wait(futures, timeout=self.total_timeout)
+            if not_done:
+                logger.warning(
+                    f"{len(not_done)} server test(s) exceeded the "
+                    f"{self.total_timeout}s diagnostic budget"
+                )
+                for future in not_done:
+                    future.cancel()
+                self._kill_active_processes(expired)
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+        results: dict[str, ServerDiagnostic] = {}
+        for server, future in zip(servers, futures):
+            if future in not_done:
+                results[server.name] = ServerDiagnostic(
+                    name=server.name,
+                    status=ServerStatus.UNREACHABLE,
+                    error=(
+                        f"Server test did not complete within the "
+                        f"{self.total_timeout}s diagnostic budget"
+                    ),
+                )
+                continue
 
-            # Test initialization
-            init_success, init_result = self._test_jsonrpc_initialize(proc)
-            if not init_success:
-                proc.terminate()
-                return ServerDiagnostic(
+            error = future.exception()
+            if error is not None:
+                results[server.name] = ServerDiagnostic(
                     name=server.name,
                     status=ServerStatus.ERROR,
-                    error=init_result.get("error", "Initialization failed"),
+                    error=str(error),
                 )
+            else:
+                results[server.name] = future.result()
 
-            # Send initialized notification
-            self._send_jsonrpc_notification(proc, "initialized", {})
-
-            # Get protocol version and capabilities from init response
-            protocol_version = init_result.get("protocolVersion")
-            capabilities = init_result.get("capabilities", {})
-
-            # Test tools/list
-            tools_success, tools = self._test_jsonrpc_tools_list(proc)
-            tool_count = len(tools) if tools_success else 0
-
-            # Test resources/list
-            resources_success, resources = self._test_jsonrpc_resources_list(proc)
-            resource_count = len(resources) if resources_success else 0
+        return results
 
-            # Test prompts/list
-            prompts_success, prompts = self._test_jsonrpc_prompts_list(proc)
-            prompt_count = len(prompts) if prompts_success else 0
+    def test_server(self, server: MCPServerConfig) -> ServerDiagnostic:
+        """Test single MCP server with full protocol validation.
 
-            # Calculate response time
-            response_time_ms = (time.time() - start_time) * 1000
+        Starts the server process and tests JSON-RPC protocol compliance
+        by performing the initialization handshake and querying capabilities.
+        The server is driven by an asyncio stdio client, so stdout and stderr
+        are drained concurrently and every request has its own deadline.
 
-            # Clean up
-            proc.terminate()
-            try:
-                proc.wait(timeout=2)
-            except subprocess.TimeoutExpired:
-                proc.kill()
+        Args:
+            server: Server configuration to test
 
-            return ServerDiagnostic(
-                name=server.name,
-                status=ServerStatus.HEALTHY,
-                response_time_ms=response_time_ms,
-                protocol_version=protocol_version,
-                capabilities={
-                    "tools": "tools" in capabilities,
-                    "resources": "resources" in capabilities,
-                    "prompts": "prompts" in capabilities,
-                },
-                tool_count=tool_count,
-                resource_count=resource_count,
-                prompt_count=prompt_count,
-            )
+        Returns:
+            Complete server diagnostic results
+        """
+        logger.info(f"Testing server: {server.name}")
 
-        except FileNotFoundError:
+        # Check command exists first
+        if not resolve_command_path(server.command):
             return ServerDiagnostic(
                 name=server.name,
                 status=ServerStatus.UNREACHABLE,
                 error=f"Command not found: {server.command}",
             )
-        except subprocess.TimeoutExpired:
-            return ServerDiagnostic(
-                name=server.name,
-                status=ServerStatus.UNREACHABLE,
-                error=f"Server did not respond within {self.timeout}s",
-            )
+
+        try:
+            return asyncio.run(self._test_server_async(server))
         except Exception as e:
             logger.error(f"Server test failed: {e}", exc_info=True)
             return ServerDiagnostic(
@@ -767,118 +1096,182 @@ class MCPDoctor:
                 error=str(e),
             )
 
-    # ========================================================================
-    # JSON-RPC Protocol Methods
-    # ========================================================================
-
-    def _send_jsonrpc(
-        self, proc: subprocess.Popen[str], method: str, params: dict[str, Any], id: int
-    ) -> dict[str, Any]:
-        """Send JSON-RPC request and receive response.
+    async def _test_server_async(self, server: MCPServerConfig) -> ServerDiagnostic:
+        """Run the protocol test for one server on the current event loop.
 
         Args:
-            proc: Server subprocess with stdin/stdout
-            method: JSON-RPC method name
-            params: Method parameters
-            id: Request ID
+            server: Server configuration to test
 
         Returns:
-            JSON-RPC response as dictionary
-
-        Raises:
-            TimeoutError: If response not received within timeout
-            ValueError: If response is invalid JSON-RPC
+            Complete server diagnostic results
         """
-        request = {
-            "jsonrpc": "2.0",
-            "method": method,
-            "params": params,
-            "id": id,
-        }
-
-        request_str = json.dumps(request) + "\n"
-        logger.debug(f"Sending: {request_str.strip()}")
+        client, diag = await self.open_session(server)
+        if client is not None:
+            await client.close()
+        return diag
 
-        assert proc.stdin is not None
-        proc.stdin.write(request_str)
-        proc.stdin.flush()
+    async def open_session(
+        self, server: MCPServerConfig
+    ) -> tuple[MCPStdioClient | None, ServerDiagnostic]:
+        """Spawn a server and run the protocol handshake, keeping it running.
 
-        # Read response with timeout
-        response = self._read_jsonrpc_response(proc)
-        logger.debug(f"Received: {response}")
+        Must be awaited on a running event loop. If the handshake succeeds
+        the initialized client is returned and the caller is responsible for
+        closing it; otherwise the process is stopped and no client is
+        returned.
 
-        return response
+        Args:
+            server: Server configuration to start
 
-    def _send_jsonrpc_notification(
-        self, proc: subprocess.Popen[str], method: str, params: dict[str, Any]
-    ) -> None:
-        """Send JSON-RPC notification (no response expected).
+        Returns:
+            Tuple of (client_or_None, diagnostic). The client is only
+            returned for healthy servers.
 
-        Args:
-            proc: Server subprocess with stdin
-            method: JSON-RPC method name
-            params: Method parameters
+        Example:
+            >>> client, diag = await doctor.open_session(server)
+            >>> if client is not None:
+            ...     await client.request("ping")
+            ...     await client.close()
         """
-        notification = {
-            "jsonrpc": "2.0",
-            "method": method,
-            "params": params,
-        }
+        # Prepare environment
+        env = os.environ.copy()
+        env.update(server.env)
 
-        notification_str = json.dumps(notification) + "\n"
-        logger.debug(f"Sending notification: {notification_str.strip()}")
+        client = MCPStdioClient(
+            server.command, server.args, env=env, request_timeout=self.timeout
+        )
 
-        assert proc.stdin is not None
-        proc.stdin.write(notification_str)
-        proc.stdin.flush()
+        start_time = time.time()
+        try:
+            await client.start()
+        except (FileNotFoundError, PermissionError):
+            return None, ServerDiagnostic(
+                name=server.name,
+                status=ServerStatus.UNREACHABLE,
+                error=f"Command not found: {server.command}",
+            )
 
-    def _read_jsonrpc_response(self, proc: subprocess.Popen[str]) -> dict[str, Any]:
-        """Read JSON-RPC response with timeout.
+        self._track_client(client)
+        keep = False
+        try:
+            try:
+                diag = await self._handshake(server, client, start_time)
+            except ConnectionError as e:
+                # E.g. the server exited right after answering initialize
+                diag = ServerDiagnostic(
+                    name=server.name, status=ServerStatus.ERROR, error=str(e)
+                )
+            except TimeoutError as e:
+                diag = ServerDiagnostic(
+                    name=server.name, status=ServerStatus.UNREACHABLE, error=str(e)
+                )
+            keep = diag.status == ServerStatus.HEALTHY
+            return (client if keep else None), diag
+        finally:
+            self._untrack_client(client)
+            if not keep:
+                await client.close()
+
+    async def _handshake(
+        self, server: MCPServerConfig, client: MCPStdioClient, start_time: float
+    ) -> ServerDiagnostic:
+        """Initialize a started server and list its capabilities.
 
         Args:
-            proc: Server subprocess with stdout
+            server: Server configuration being tested
+            client: Started stdio client for the server
+            start_time: time.time() at which the process was spawned
 
         Returns:
-            Parsed JSON-RPC response
-
-        Raises:
-            TimeoutError: If response not received within timeout
-            ValueError: If response is invalid JSON
+            Complete server diagnostic results
         """
-        assert proc.stdout is not None
+        # Test initialization
+        init_success, init_result = await self._test_jsonrpc_initialize(client)
+        if not init_success:
+            if init_result.get("timeout"):
+                return ServerDiagnostic(
+                    name=server.name,
+                    status=ServerStatus.UNREACHABLE,
+                    error=f"Server did not respond within {self.timeout}s",
+                )
+            return ServerDiagnostic(
+                name=server.name,
+                status=ServerStatus.ERROR,
+                error=init_result.get("error", "Initialization failed"),
+            )
 
-        # Use select for timeout on Unix systems
-        import sys
+        # Send initialized notification
+        await client.notify("notifications/initialized")
 
-        if sys.platform != "win32":
-            readable, _, _ = select.select([proc.stdout], [], [], self.timeout)
-            if not readable:
-                raise TimeoutError(f"No response within {self.timeout}s")
+        # Get protocol version and capabilities from init response
+        protocol_version = init_result.get("protocolVersion")
+        capabilities = init_result.get("capabilities") or {}
+        if not isinstance(capabilities, dict):
+            return ServerDiagnostic(
+                name=server.name,
+                status=ServerStatus.ERROR,
+                protocol_version=protocol_version,
+                error=f"Invalid capabilities in initialize result: {capabilities!r}",
+            )
 
-        # Read line
-        line = proc.stdout.readline()
-        if not line:
-            raise ValueError("Empty response from server")
+        # Pipeline the list requests for advertised capabilities: they are
+        # independent once initialize has completed, so send them all and
+        # let the client match responses by id
+        list_probes = {
+            "tools": self._test_jsonrpc_tools_list,
+            "resources": self._test_jsonrpc_resources_list,
+            "prompts": self._test_jsonrpc_prompts_list,
+        }
+        advertised = {name: name in capabilities for name in list_probes}
+        probed = [name for name in list_probes if advertised[name]]
+        results = await asyncio.gather(
+            *(list_probes[name](client) for name in probed)
+        )
+        counts = {
+            name: len(items) if success else 0
+            for name, (success, items) in zip(probed, results)
+        }
 
-        try:
-            return json.loads(line)  # type: ignore[no-any-return]
-        except json.JSONDecodeError as e:
-            raise ValueError(f"Invalid JSON response: {e}") from e
+        # Calculate response time and per-phase breakdown
+        response_time_ms = (time.time() - start_time) * 1000
+        request_times = client.request_times_ms
+
+        return ServerDiagnostic(
+            name=server.name,
+            status=ServerStatus.HEALTHY,
+            response_time_ms=response_time_ms,
+            protocol_version=protocol_version,
+            capabilities=advertised,
+            tool_count=counts.get("tools", 0),
+            resource_count=counts.get("resources", 0),
+            prompt_count=counts.get("prompts", 0),
+            first_byte_ms=client.first_byte_ms,
+            initialize_ms=request_times.get("initialize"),
+            method_times_ms={
+                method: request_times[method]
+                for method in (f"{name}/list" for name in probed)
+                if method in request_times
+            },
+        )
 
-    def _test_jsonrpc_initialize(
-        self, proc: subprocess.Popen[str]
+    # ========================================================================
+    # JSON-RPC Protocol Methods
+    # ========================================================================
+
+    async def _test_jsonrpc_initialize(
+        self, client: MCPStdioClient
     ) -> tuple[bool, dict[str, Any]]:
         """Test JSON-RPC initialize handshake.
 
         Args:
-            proc: Server subprocess
+            client: Started stdio client for the server
 
         Returns:
-            Tuple of (success, result_or_error_dict)
+            Tuple of (success, result_or_error_dict). On failure the dict has
+            an "error" message and "timeout" set if the server never answered.
         """
         try:
-            response = self._send_jsonrpc(
-                proc,
+            response = await client.request(
                 "initialize",
                 {
                     "protocolVersion": self.PROTOCOL_VERSION,
@@ -888,91 +1281,157 @@ class MCPDoctor:
                         "version": self.CLIENT_VERSION,
                     },
                 },
-                id=1,
             )
 
             if "error" in response:
-                return False, {
-                    "error": response["error"].get("message", "Unknown error")
-                }
+                error = response["error"]
+                message = (
+                    error.get("message", "Unknown error")
+                    if isinstance(error, dict)
+                    else str(error)
+                )
+                return False, {"error": message}
 
-            return True, response.get("result", {})
+            result = response.get("result")
+            if not isinstance(result, dict):
+                return False, {"error": f"Invalid initialize result: {result!r}"}
+            return True, result
 
-        except (TimeoutError, ValueError) as e:
+        except TimeoutError as e:
+            return False, {"error": str(e), "timeout": True}
+        except ConnectionError as e:
             return False, {"error": str(e)}
 
-    def _test_jsonrpc_tools_list(
-        self, proc: subprocess.Popen[str]
+    async def _test_jsonrpc_list(
+        self, client: MCPStdioClient, method: str, result_key: str
     ) -> tuple[bool, list[dict[str, Any]]]:
-        """Test tools/list method.
+        """Test a capability list method (tools/list, resources/list, ...).
 
         Args:
-            proc: Server subprocess
+            client: Started stdio client for the server
+            method: JSON-RPC method name
+            result_key: Key of the list in the result object
 
         Returns:
-            Tuple of (success, list_of_tools)
+            Tuple of (success, list_of_items)
         """
         try:
-            response = self._send_jsonrpc(proc, "tools/list", {}, id=2)
+            response = await client.request(method)
 
             if "error" in response:
                 return False, []
 
-            result = response.get("result", {})
-            return True, result.get("tools", [])
+            result = response.get("result")
+            items = result.get(result_key) if isinstance(result, dict) else None
+            if not isinstance(items, list):
+                return False, []
+            return True, items
 
-        except (TimeoutError, ValueError):
+        except (TimeoutError, ConnectionError):
             return False, []
 
-    def _test_jsonrpc_resources_list(
-        self, proc: subprocess.Popen[str]
+    async def _test_jsonrpc_tools_list(
+        self, client: MCPStdioClient
     ) -> tuple[bool, list[dict[str, Any]]]:
-        """Test resources/list method.
+        """Test tools/list method.
 
         Args:
-            proc: Server subprocess
+            client: Started stdio client for the server
 
         Returns:
-            Tuple of (success, list_of_resources)
+            Tuple of (success, list_of_tools)
         """
-        try:
-            response = self._send_jsonrpc(proc, "resources/list", {}, id=3)
+        return await self._test_jsonrpc_list(client, "tools/list", "tools")
 
-            if "error" in response:
-                return False, []
+    async def _test_jsonrpc_resources_list(
+        self, client: MCPStdioClient
+    ) -> tuple[bool, list[dict[str, Any]]]:
+        """Test resources/list method.
 
-            result = response.get("result", {})
-            return True, result.get("resources", [])
+        Args:
+            client: Started stdio client for the server
 
-        except (TimeoutError, ValueError):
-            return False, []
+        Returns:
+            Tuple of (success, list_of_resources)
+        """
+        return await self._test_jsonrpc_list(client, "resources/list", "resources")
 
-    def _test_jsonrpc_prompts_list(
-        self, proc: subprocess.Popen[str]
+    async def _test_jsonrpc_prompts_list(
+        self, client: MCPStdioClient
     ) -> tuple[bool, list[dict[str, Any]]]:
         """Test prompts/list method.
 
         Args:
-            proc: Server subprocess
+            client: Started stdio client for the server
 
         Returns:
             Tuple of (success, list_of_prompts)
         """
+        return await self._test_jsonrpc_list(client, "prompts/list", "prompts")
+
+    # ========================================================================
+    # Private Helper Methods
+    # ========================================================================
+
+    def _test_server_in_run(
+        self, server: MCPServerConfig, expired: threading.Event
+    ) -> ServerDiagnostic:
+        """Test a server in a worker thread of a test_servers() run.
+
+        Args:
+            server: Server configuration to test
+            expired: Set when the run's budget runs out
+
+        Returns:
+            Complete server diagnostic results
+        """
+        self._worker_state.expired = expired
         try:
-            response = self._send_jsonrpc(proc, "prompts/list", {}, id=4)
+            return self.test_server(server)
+        finally:
+            self._worker_state.expired = None
 
-            if "error" in response:
-                return False, []
+    def _track_client(self, client: MCPStdioClient) -> None:
+        """Register a server client being probed.
 
-            result = response.get("result", {})
-            return True, result.get("prompts", [])
+        A client started by a worker whose budget already ran out is killed
+        right away, so that no server outlives test_servers().
 
-        except (TimeoutError, ValueError):
-            return False, []
+        Args:
+            client: Started stdio client
+        """
+        expired = getattr(self._worker_state, "expired", None)
+        with self._clients_lock:
+            self._active_clients.add(client)
+            kill = expired is not None and expired.is_set()
+        if kill:
+            client.kill()
 
-    # ========================================================================
-    # Private Helper Methods
-    # ========================================================================
+    def _untrack_client(self, client: MCPStdioClient) -> None:
+        """Unregister a probed server client.
+
+        Args:
+            client: Started stdio client
+        """
+        with self._clients_lock:
+            self._active_clients.discard(client)
+
+    def _kill_active_processes(self, expired: threading.Event) -> None:
+        """Kill all server processes still being probed.
+
+        Used when the diagnostic budget expires so that pending requests in
+        worker threads fail immediately instead of waiting for the
+        per-request timeout.
+
+        Args:
+            expired: Budget event of the run, set so that servers its
+                workers start from now on are killed too
+        """
+        with self._clients_lock:
+            expired.set()
+            clients = list(self._active_clients)
+        for client in clients:
+            client.kill()
 
     def _get_servers(self) -> list[MCPServerConfig]:
         """Get servers from configuration.
@@ -981,14 +1440,13 @@ class MCPDoctor:
             List of server configurations (empty if config invalid)
         """
         try:
-            config = self.config_manager.read()
+            config = self.config_manager.snapshot_members(SERVER_SECTION_KEYS)
         except ConfigurationError:
             return []
 
         servers: list[MCPServerConfig] = []
-        server_keys = ["mcpServers", "mcp_servers", "servers"]
 
-        for key in server_keys:
+        for key in SERVER_SECTION_KEYS:
             if key in config and isinstance(config[key], dict):
                 for name, server_data in config[key].items():
                     if isinstance(server_data, dict):
@@ -24,19 +24,21 @@ Example:
 
 from __future__ import annotations
 
-import json
 import logging
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any, Literal
 
-from .config_manager import ConfigManager
+from .config_manager import SERVER_SECTION_KEYS, ConfigManager
 from .exceptions import ConfigurationError
-from .types import ConfigFormat, MCPServerConfig, Platform, PlatformInfo
-from .utils import resolve_command_path
+from .json_extract import JsonDocumentScan
+from .server_index import ServerIndex, server_from_entry
+from .types import ConfigFormat, ConfigLayout, MCPServerConfig, Platform, PlatformInfo
+from .utils import classify_json_config, file_signature, resolve_command_path
 
 logger = logging.getLogger(__name__)
 
+
 # ============================================================================
 # Data Classes
 # ============================================================================
@@ -184,6 +186,12 @@ class MCPInspector:
 
         self.config_manager = ConfigManager(self.config_path, self.config_format)
 
+        # Layout of the JSON config, keyed by the file signature it was read at
+        self._scan: tuple[tuple[int, int, int] | None, JsonDocumentScan] | None = None
+
+        # Server index, with the servers section it was built from
+        self._index: tuple[dict[str, Any], ServerIndex] | None = None
+
     def inspect(self) -> InspectionReport:
         """Run complete inspection and return report.
 
@@ -243,9 +251,10 @@ class MCPInspector:
             )
             recommendations.extend(self.suggest_migration())
 
-        # Read and validate config
+        # Read and validate config (only the servers section is built; a JSON
+        # file was already read by the legacy check)
         try:
-            config = self.config_manager.read()
+            config = self._read_server_sections()
         except ConfigurationError as e:
             issues.append(
                 ValidationIssue(
@@ -265,8 +274,9 @@ class MCPInspector:
                 recommendations=recommendations,
             )
 
-        # Get servers from config
-        servers = self._extract_servers(config)
+        # Get servers from config, indexed once for all checks below
+        index = self._server_index(config)
+        servers = list(index)
         total_servers = len(servers)
         valid_servers = 0
 
@@ -278,14 +288,19 @@ class MCPInspector:
             issues.extend(server_issues)
 
         # Check for duplicates
-        duplicates = self.find_duplicates(config)
-        for name1, name2 in duplicates:
+        for name1, name2 in self._find_duplicates(index):
+            if name1 == name2:
+                message = f"Duplicate server names detected: {name1}, {name2}"
+                suggestion = "Rename one of the servers to avoid conflicts"
+            else:
+                message = f"Servers run the same command: {name1}, {name2}"
+                suggestion = f"Remove {name2} if it is a second install of {name1}"
             issues.append(
                 ValidationIssue(
                     severity="warning",
-                    message=f"Duplicate server names detected: {name1}, {name2}",
+                    message=message,
                     server_name=None,
-                    fix_suggestion="Rename one of the servers to avoid conflicts",
+                    fix_suggestion=suggestion,
                     auto_fixable=False,
                 )
             )
@@ -452,27 +467,34 @@ class MCPInspector:
             return False  # Only JSON configs can be legacy format
 
         try:
-            content = self.config_path.read_text(encoding="utf-8")
+            return self.classify_config().layout == ConfigLayout.LEGACY
+        except ConfigurationError as e:
+            logger.warning(f"Error checking legacy format: {e}")
+            return False
 
-            # Legacy format has multiple JSON objects separated by newlines
-            # Modern format has single JSON object
-            lines = [line.strip() for line in content.split("\n") if line.strip()]
+    def classify_config(self) -> JsonDocumentScan:
+        """Classify the JSON config file as modern, legacy or corrupt.
 
-            if len(lines) <= 1:
-                return False  # Single object, not legacy
+        The file is scanned once per version: the result carries the servers
+        sections of a modern file and the entries of a legacy one, so
+        inspection and migration do not read it again.
 
-            # Try to parse as line-delimited JSON
-            for line in lines:
-                try:
-                    json.loads(line)
-                except json.JSONDecodeError:
-                    return False  # Not valid line-delimited JSON
+        Returns:
+            Classification of the config file
 
-            return True  # All lines are valid JSON = legacy format
+        Raises:
+            ConfigurationError: If the file cannot be read
 
-        except Exception as e:
-            logger.warning(f"Error checking legacy format: {e}")
-            return False
+        Example:
+            >>> scan = inspector.classify_config()
+            >>> print(scan.layout.value)
+        """
+        signature = file_signature(self.config_path)
+        if signature is not None and self._scan is not None and self._scan[0] == signature:
+            return self._scan[1]
+        scan = classify_json_config(self.config_path, SERVER_SECTION_KEYS)
+        self._scan = (signature, scan)
+        return scan
 
     def suggest_migration(self) -> list[str]:
         """Suggest migration steps for legacy format.
@@ -495,35 +517,22 @@ class MCPInspector:
     def find_duplicates(self, config: dict[str, Any]) -> list[tuple[str, str]]:
         """Find duplicate server names or commands.
 
+        Servers that run the same command line under different names are
+        near-duplicates (see :meth:`ServerIndex.near_duplicates`).
+
         Args:
             config: Configuration dictionary
 
         Returns:
-            List of (name1, name2) tuples for duplicates
+            List of (name1, name2) tuples for duplicates: (name, name) for a
+            repeated name, (first, other) for each near-duplicate
 
         Example:
             >>> duplicates = inspector.find_duplicates(config)
             >>> if duplicates:
             ...     print(f"Found {len(duplicates)} duplicate pairs")
         """
-        duplicates: list[tuple[str, str]] = []
-        servers = self._extract_servers(config)
-
-        # Check for duplicate names
-        names = [s.name for s in servers]
-        seen_names: set[str] = set()
-        for name in names:
-            if name in seen_names:
-                # Find other server with same name
-                for other in servers:
-                    if other.name == name and other.name not in [
-                        d[0] for d in duplicates
-                    ]:
-                        duplicates.append((name, name))
-                        break
-            seen_names.add(name)
-
-        return duplicates
+        return self._find_duplicates(ServerIndex.from_section(self._servers_section(config)))
 
     def auto_fix(self, issue: ValidationIssue) -> bool:
         """Attempt to automatically fix issue.
@@ -569,40 +578,111 @@ class MCPInspector:
             logger.error(f"Auto-fix failed: {e}")
             return False
 
+    def auto_fix_all(self, issues: list[ValidationIssue]) -> list[ValidationIssue]:
+        """Attempt to fix several issues with a single config write.
+
+        Runs :meth:`auto_fix` for each issue inside one ConfigManager
+        transaction, so the config file is backed up and written once no
+        matter how many fixes apply. If the final write fails, no fix is
+        applied.
+
+        Args:
+            issues: Issues to fix (non auto-fixable issues are skipped)
+
+        Returns:
+            Issues that were fixed
+
+        Example:
+            >>> report = inspector.inspect()
+            >>> fixed = inspector.auto_fix_all(report.issues)
+            >>> print(f"Fixed {len(fixed)} of {len(report.issues)} issues")
+        """
+        fixed: list[ValidationIssue] = []
+        try:
+            with self.config_manager.transaction():
+                fixed = [issue for issue in issues if self.auto_fix(issue)]
+        except Exception as e:
+            logger.error(f"Failed to write fixes: {e}")
+            return []
+
+        return fixed
+
     # ========================================================================
     # Private Helper Methods
     # ========================================================================
 
-    def _extract_servers(self, config: dict[str, Any]) -> list[MCPServerConfig]:
-        """Extract server configurations from config dict.
+    def _read_server_sections(self) -> dict[str, Any]:
+        """Read the servers sections of the config file.
+
+        Returns:
+            Top-level servers sections that are present
+
+        Raises:
+            ConfigurationError: If the file cannot be read or parsed
+        """
+        if self.config_format != ConfigFormat.JSON:
+            return self.config_manager.snapshot_members(SERVER_SECTION_KEYS)
+
+        scan = self.classify_config()
+        if scan.layout == ConfigLayout.LEGACY:
+            raise ConfigurationError(
+                f"Legacy line-delimited JSON in {self.config_path}",
+                config_path=str(self.config_path),
+            )
+        if scan.layout == ConfigLayout.CORRUPT:
+            raise ConfigurationError(
+                f"Invalid JSON in {self.config_path}: {scan.error}",
+                config_path=str(self.config_path),
+            )
+        return scan.members
+
+    def _servers_section(self, config: dict[str, Any]) -> dict[str, Any]:
+        """Return the servers section of a config dict.
 
         Args:
             config: Configuration dictionary
 
         Returns:
-            List of MCPServerConfig objects
+            Section under the first servers key present (different platforms
+            use different keys), or an empty dict
         """
-        servers: list[MCPServerConfig] = []
+        for key in SERVER_SECTION_KEYS:
+            if key in config and isinstance(config[key], dict):
+                section: dict[str, Any] = config[key]
+                return section
+        return {}
 
-        # Different platforms use different keys
-        server_keys = ["mcpServers", "mcp_servers", "servers"]
+    def _server_index(self, config: dict[str, Any]) -> ServerIndex:
+        """Index the servers of a config read by :meth:`inspect`.
 
-        for key in server_keys:
-            if key in config and isinstance(config[key], dict):
-                for name, server_data in config[key].items():
-                    if isinstance(server_data, dict):
-                        servers.append(
-                            MCPServerConfig(
-                                name=name,
-                                command=server_data.get("command", ""),
-                                args=server_data.get("args", []),
-                                env=server_data.get("env", {}),
-                                description=server_data.get("description", ""),
-                            )
-                        )
-                break
+        Configs read for inspection are shared and never mutated, so an
+        index built for the same servers section object is still current.
+
+        Args:
+            config: Configuration dictionary
+
+        Returns:
+            Index of the config's servers
+        """
+        section = self._servers_section(config)
+        if self._index is None or self._index[0] is not section:
+            self._index = (section, ServerIndex.from_section(section))
+        return self._index[1]
 
-        return servers
+    def _find_duplicates(self, index: ServerIndex) -> list[tuple[str, str]]:
+        """Find duplicate names and near-duplicate servers in an index.
+
+        Args:
+            index: Server index
+
+        Returns:
+            (name, name) per repeated name, then (first, other) per
+            near-duplicate
+        """
+        duplicates = [(name, name) for name in index.duplicate_names]
+        for names in index.near_duplicates():
+            duplicates.extend((names[0], other) for other in names[1:])
+        return duplicates
 
     def _generate_recommendations(self, servers: list[MCPServerConfig]) -> list[str]:
         """Generate general recommendations for improvement.
@@ -679,13 +759,14 @@ class MCPInspector:
             True if migration succeeded
         """
         try:
-            content = self.config_path.read_text(encoding="utf-8")
-            lines = [line.strip() for line in content.split("\n") if line.strip()]
+            scan = self.classify_config()
+            if scan.layout != ConfigLayout.LEGACY:
+                logger.error(f"Migration failed: {self.config_path} is not in legacy format")
+                return False
 
-            # Parse each line as JSON object
+            # Each line of a legacy config is one server
             servers: dict[str, Any] = {}
-            for line in lines:
-                server_data = json.loads(line)
+            for server_data in scan.entries:
                 name = server_data.get("name", f"server-{len(servers)}")
                 servers[name] = {
                     "command": server_data.get("command", ""),
@@ -712,11 +793,12 @@ class MCPInspector:
             True if update succeeded
         """
         try:
-            config = self.config_manager.read()
-            servers = self._extract_servers(config)
+            with self.config_manager.transaction() as txn:
+                config = txn.config
+                entry = self._servers_section(config).get(server_name)
 
-            for server in servers:
-                if server.name == server_name:
+                if isinstance(entry, dict):
+                    server = server_from_entry(server_name, entry)
                     # Remove deprecated args
                     clean_args = [
                         arg
@@ -728,7 +810,7 @@ class MCPInspector:
                     server_key = self._get_server_key(config)
                     if server_key and server.name in config[server_key]:
                         config[server_key][server.name]["args"] = clean_args
-                        self.config_manager.write(config)
+                        txn.mark_changed()
                         return True
 
             return False
@@ -746,7 +828,7 @@ class MCPInspector:
         Returns:
             Server key name or None
         """
-        for key in ["mcpServers", "mcp_servers", "servers"]:
+        for key in SERVER_SECTION_KEYS:
             if key in config:
                 return key
         return None
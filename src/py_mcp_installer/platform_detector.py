@@ -5,10 +5,14 @@ and multi-layered validation.
 
 Detection Strategy:
 1. Check for config file existence (+0.4 confidence)
-2. Validate config format (JSON/TOML parsing) (+0.3 confidence)
+2. Validate config format (JSON/TOML check) (+0.3 confidence)
 3. Check CLI availability (+0.2 confidence)
 4. Check environment variables (+0.1 confidence)
 
+Detectors run concurrently in a single detection pass and share filesystem
+and PATH probes, so a path or command checked by several detectors is only
+probed once per pass.
+
 Supported Platforms:
 - Claude Code (claude_code)
 - Claude Desktop (claude_desktop)
@@ -24,11 +28,64 @@ from __future__ import annotations
 
 import os
 import sys
+import threading
+from collections.abc import Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from pathlib import Path
+from typing import Any, TypeVar
 
+from .detection_cache import DetectionCache, ProbeKey
 from .exceptions import PlatformDetectionError
 from .types import Platform, PlatformInfo, Scope
-from .utils import parse_json_safe, parse_toml_safe, resolve_command_path
+from .utils import json_config_looks_valid, parse_toml_safe, resolve_command_path
+
+T = TypeVar("T")
+
+
+class _ProbeCache:
+    """Results of filesystem, PATH and environment probes made during one
+    detection pass.
+
+    Shared by all detectors of a pass (which may run in different threads)
+    so that e.g. ``~/.claude.json`` is stat'ed and ``claude`` looked up in
+    PATH only once. When persistent caching is enabled, the signature of
+    each probe's input is captured before the probe runs.
+    """
+
+    def __init__(self, record_signatures: bool = False) -> None:
+        self._lock = threading.Lock()
+        self._results: dict[ProbeKey, Any] = {}
+        self._record_signatures = record_signatures
+        self.signatures: dict[ProbeKey, Any] = {}
+
+    def get(self, kind: str, key: str, probe: Callable[[], T]) -> T:
+        """Return a cached probe result, running the probe on first use.
+
+        Args:
+            kind: Probe type ("exists", "json", "toml", "command", "env")
+            key: Probe argument (path, command or variable name)
+            probe: Function computing the result
+
+        Returns:
+            Probe result
+        """
+        with self._lock:
+            if (kind, key) in self._results:
+                result: T = self._results[(kind, key)]
+                return result
+
+        # Probe outside the lock so detectors don't serialize on I/O; two
+        # threads racing on the same probe compute the same value
+        signature = (
+            DetectionCache.probe_signature(kind, key) if self._record_signatures else None
+        )
+        result = probe()
+        with self._lock:
+            if self._record_signatures:
+                self.signatures.setdefault((kind, key), signature)
+            cached: T = self._results.setdefault((kind, key), result)
+            return cached
 
 
 class PlatformDetector:
@@ -45,15 +102,28 @@ class PlatformDetector:
         Platform.CLAUDE_CODE: 1.0
     """
 
-    def __init__(self) -> None:
-        """Initialize platform detector."""
-        pass
+    def __init__(self, cache: DetectionCache | None = None) -> None:
+        """Initialize platform detector.
+
+        Args:
+            cache: Persistent cache for detect_all() results (None = always
+                run the detectors)
+
+        Example:
+            >>> detector = PlatformDetector(cache=DetectionCache())
+        """
+        self.cache = cache
+
+        # Probe cache of the detection pass in progress (None outside a pass)
+        self._probes: _ProbeCache | None = None
+        self._pass_lock = threading.RLock()
 
     def detect(self) -> PlatformInfo:
         """Auto-detect current platform with highest confidence.
 
         Runs all platform-specific detectors and returns the one with
-        highest confidence score.
+        highest confidence score. Ties go to the platform listed first in
+        :meth:`detect_all`.
 
         Returns:
             PlatformInfo for detected platform
@@ -67,72 +137,59 @@ class PlatformDetector:
             >>> if info.confidence > 0.8:
             ...     print(f"Detected {info.platform} with high confidence")
         """
-        # Run all detectors
-        detectors = [
-            self.detect_claude_code,
-            self.detect_claude_desktop,
-            self.detect_cursor,
-            self.detect_auggie,
-            self.detect_codex,
-            self.detect_gemini_cli,
-            self.detect_windsurf,
-            self.detect_antigravity,
-        ]
-
-        results: list[tuple[float, Path | None]] = []
-        for detector_func in detectors:
-            confidence, config_path = detector_func()
-            results.append((confidence, config_path))
-
-        # Find platform with highest confidence
-        max_confidence = max(r[0] for r in results)
-
-        if max_confidence == 0.0:
+        results = self.detect_all()
+
+        best: PlatformInfo | None = None
+        for info in results.values():
+            if best is None or info.confidence > best.confidence:
+                best = info
+
+        if best is None or best.confidence == 0.0:
             raise PlatformDetectionError("No supported platforms detected")
 
-        # Map results back to platforms
-        platform_results = list(
-            zip(
-                [
-                    Platform.CLAUDE_CODE,
-                    Platform.CLAUDE_DESKTOP,
-                    Platform.CURSOR,
-                    Platform.AUGGIE,
-                    Platform.CODEX,
-                    Platform.GEMINI_CLI,
-                    Platform.WINDSURF,
-                    Platform.ANTIGRAVITY,
-                ],
-                results,
-            )
-        )
+        return best
 
-        # Get platform with max confidence
-        for platform, (confidence, config_path) in platform_results:
-            if confidence == max_confidence:
-                # Determine CLI availability
-                cli_available = False
-                if platform in (Platform.CLAUDE_CODE, Platform.CLAUDE_DESKTOP):
-                    cli_available = resolve_command_path("claude") is not None
-                elif platform == Platform.CURSOR:
-                    cli_available = resolve_command_path("cursor") is not None
-
-                return PlatformInfo(
-                    platform=platform,
-                    confidence=confidence,
-                    config_path=config_path,
-                    cli_available=cli_available,
-                    scope_support=Scope.BOTH,
-                )
-
-        # Should never reach here, but fallback to unknown
-        return PlatformInfo(
-            platform=Platform.UNKNOWN,
-            confidence=0.0,
-            config_path=None,
-            cli_available=False,
-            scope_support=Scope.BOTH,
-        )
+    def detect_all(self) -> dict[Platform, PlatformInfo]:
+        """Detect every supported platform in a single pass.
+
+        All detectors run concurrently and share filesystem and PATH probes.
+        Platforms that are not installed are included with confidence 0.0.
+        With a :class:`DetectionCache`, the previous result is reused when
+        none of the probed files, PATH directories or environment
+        variables changed.
+
+        Returns:
+            PlatformInfo for each supported platform, in detection priority
+            order
+
+        Example:
+            >>> detector = PlatformDetector()
+            >>> for platform, info in detector.detect_all().items():
+            ...     if info.confidence > 0:
+            ...         print(f"{platform.value}: {info.confidence:.1f}")
+        """
+        if self.cache is not None:
+            cached = self.cache.load()
+            if cached is not None:
+                return cached
+
+        detectors = self._detectors()
+
+        with self._detection_pass() as probes, ThreadPoolExecutor(
+            max_workers=len(detectors), thread_name_prefix="platform-detect"
+        ) as executor:
+            futures = {
+                platform: executor.submit(detector_func)
+                for platform, detector_func in detectors.items()
+            }
+            results = {
+                platform: self._platform_info(platform, *future.result())
+                for platform, future in futures.items()
+            }
+
+        if self.cache is not None:
+            self.cache.store(results, probes.signatures)
+        return results
 
     def detect_for_platform(self, platform: Platform) -> PlatformInfo:
         """Detect info for a specific platform.
@@ -154,43 +211,23 @@ class PlatformDetector:
             >>> info = detector.detect_for_platform(Platform.CLAUDE_CODE)
             >>> print(f"Claude Code available: {info.confidence > 0}")
         """
-        # Map platform to detector method
-        detector_map = {
-            Platform.CLAUDE_CODE: self.detect_claude_code,
-            Platform.CLAUDE_DESKTOP: self.detect_claude_desktop,
-            Platform.CURSOR: self.detect_cursor,
-            Platform.AUGGIE: self.detect_auggie,
-            Platform.CODEX: self.detect_codex,
-            Platform.GEMINI_CLI: self.detect_gemini_cli,
-            Platform.WINDSURF: self.detect_windsurf,
-            Platform.ANTIGRAVITY: self.detect_antigravity,
-        }
-
-        detector_func = detector_map.get(platform)
+        detector_func = self._detectors().get(platform)
         if not detector_func:
             raise PlatformDetectionError(f"Unknown platform: {platform}")
 
-        confidence, config_path = detector_func()
+        if self.cache is not None:
+            # One cached pass is cheaper than one uncached detector
+            info = self.detect_all()[platform]
+        else:
+            with self._detection_pass():
+                info = self._platform_info(platform, *detector_func())
 
-        if confidence == 0.0:
+        if info.confidence == 0.0:
             raise PlatformDetectionError(
                 f"Platform {platform.value} is not available on this system"
             )
 
-        # Determine CLI availability
-        cli_available = False
-        if platform in (Platform.CLAUDE_CODE, Platform.CLAUDE_DESKTOP):
-            cli_available = resolve_command_path("claude") is not None
-        elif platform == Platform.CURSOR:
-            cli_available = resolve_command_path("cursor") is not None
-
-        return PlatformInfo(
-            platform=platform,
-            confidence=confidence,
-            config_path=config_path,
-            cli_available=cli_available,
-            scope_support=Scope.BOTH,
-        )
+        return info
 
     # ========================================================================
     # Platform-Specific Detectors
@@ -220,45 +257,36 @@ class PlatformDetector:
 
         # Priority 1: New location (~/.config/claude/mcp.json)
         new_config = Path.home() / ".config" / "claude" / "mcp.json"
-        if new_config.exists():
+        if self._exists(new_config):
             config_path = new_config
             confidence += 0.4
 
             # Validate JSON
-            try:
-                parse_json_safe(new_config)
+            if self._is_valid_json(new_config):
                 confidence += 0.3
-            except Exception:
-                pass  # Invalid JSON reduces confidence
 
         # Priority 2: Legacy project location (.claude.json)
-        elif Path(".claude.json").exists():
+        elif self._exists(Path(".claude.json")):
             config_path = Path(".claude.json")
             confidence += 0.4
 
-            try:
-                parse_json_safe(config_path)
+            if self._is_valid_json(config_path):
                 confidence += 0.3
-            except Exception:
-                pass
 
         # Priority 3: Legacy global location (~/.claude.json)
-        elif (Path.home() / ".claude.json").exists():
+        elif self._exists(Path.home() / ".claude.json"):
             config_path = Path.home() / ".claude.json"
             confidence += 0.4
 
-            try:
-                parse_json_safe(config_path)
+            if self._is_valid_json(config_path):
                 confidence += 0.3
-            except Exception:
-                pass
 
         # Check CLI availability
-        if resolve_command_path("claude") is not None:
+        if self._has_command("claude"):
             confidence += 0.2
 
         # Check environment variables
-        if os.getenv("CLAUDE_CODE_ENV"):
+        if self._env("CLAUDE_CODE_ENV"):
             confidence += 0.1
 
         return (min(confidence, 1.0), config_path)
@@ -289,7 +317,7 @@ class PlatformDetector:
             )
         elif sys.platform == "win32":
             # Windows
-            appdata = os.environ.get("APPDATA", "")
+            appdata = self._env("APPDATA") or ""
             if appdata:
                 config_path = Path(appdata) / "Claude" / "claude_desktop_config.json"
         else:
@@ -299,25 +327,22 @@ class PlatformDetector:
             )
 
         # Check if config exists
-        if config_path and config_path.exists():
+        if config_path and self._exists(config_path):
             confidence += 0.4
 
             # Validate JSON
-            try:
-                parse_json_safe(config_path)
+            if self._is_valid_json(config_path):
                 confidence += 0.3
-            except Exception:
-                pass
 
         # Check CLI availability (Claude Desktop uses same CLI as Claude Code)
-        if resolve_command_path("claude") is not None:
+        if self._has_command("claude"):
             confidence += 0.2
 
         # Check for Claude Desktop process
         if sys.platform == "darwin":
             # Check if Claude.app exists
             claude_app = Path("/Applications/Claude.app")
-            if claude_app.exists():
+            if self._exists(claude_app):
                 confidence += 0.1
 
         return (min(confidence, 1.0), config_path)
@@ -334,25 +359,25 @@ class PlatformDetector:
         config_path = Path.home() / ".cursor" / "mcp.json"
 
         # Check if config exists
-        if config_path.exists():
+        if self._exists(config_path):
             confidence += 0.4
 
             # Validate JSON
-            try:
-                parse_json_safe(config_path)
+            if self._is_valid_json(config_path):
                 confidence += 0.3
-            except Exception:
-                pass
 
         # Check CLI availability
-        if resolve_command_path("cursor") is not None:
+        if self._has_command("cursor"):
             confidence += 0.2
 
         # Check for Cursor directory
-        if (Path.home() / ".cursor").exists():
+        if self._exists(Path.home() / ".cursor"):
             confidence += 0.1
 
-        return (min(confidence, 1.0), config_path if config_path.exists() else None)
+        return (
+            min(confidence, 1.0),
+            config_path if self._exists(config_path) else None,
+        )
 
     def detect_auggie(self) -> tuple[float, Path | None]:
         """Detect Auggie installation.
@@ -366,25 +391,25 @@ class PlatformDetector:
         config_path = Path.home() / ".augment" / "settings.json"
 
         # Check if config exists
-        if config_path.exists():
+        if self._exists(config_path):
             confidence += 0.4
 
             # Validate JSON
-            try:
-                parse_json_safe(config_path)
+            if self._is_valid_json(config_path):
                 confidence += 0.3
-            except Exception:
-                pass
 
         # Check for Auggie directory
-        if (Path.home() / ".augment").exists():
+        if self._exists(Path.home() / ".augment"):
             confidence += 0.2
 
         # Check environment
-        if os.getenv("AUGGIE_HOME"):
+        if self._env("AUGGIE_HOME"):
             confidence += 0.1
 
-        return (min(confidence, 1.0), config_path if config_path.exists() else None)
+        return (
+            min(confidence, 1.0),
+            config_path if self._exists(config_path) else None,
+        )
 
     def detect_codex(self) -> tuple[float, Path | None]:
         """Detect Codex installation.
@@ -398,25 +423,25 @@ class PlatformDetector:
         config_path = Path.home() / ".codex" / "config.toml"
 
         # Check if config exists
-        if config_path.exists():
+        if self._exists(config_path):
             confidence += 0.4
 
             # Validate TOML
-            try:
-                parse_toml_safe(config_path)
+            if self._is_valid_toml(config_path):
                 confidence += 0.3
-            except Exception:
-                pass
 
         # Check for Codex directory
-        if (Path.home() / ".codex").exists():
+        if self._exists(Path.home() / ".codex"):
             confidence += 0.2
 
         # Check CLI
-        if resolve_command_path("codex") is not None:
+        if self._has_command("codex"):
             confidence += 0.1
 
-        return (min(confidence, 1.0), config_path if config_path.exists() else None)
+        return (
+            min(confidence, 1.0),
+            config_path if self._exists(config_path) else None,
+        )
 
     def detect_gemini_cli(self) -> tuple[float, Path | None]:
         """Detect Gemini CLI installation.
@@ -433,33 +458,27 @@ class PlatformDetector:
 
         # Priority 1: Project-level config
         project_config = Path(".gemini") / "settings.json"
-        if project_config.exists():
+        if self._exists(project_config):
             config_path = project_config
             confidence += 0.4
 
-            try:
-                parse_json_safe(config_path)
+            if self._is_valid_json(config_path):
                 confidence += 0.3
-            except Exception:
-                pass
 
         # Priority 2: User-level config
-        elif (Path.home() / ".gemini" / "settings.json").exists():
+        elif self._exists(Path.home() / ".gemini" / "settings.json"):
             config_path = Path.home() / ".gemini" / "settings.json"
             confidence += 0.4
 
-            try:
-                parse_json_safe(config_path)
+            if self._is_valid_json(config_path):
                 confidence += 0.3
-            except Exception:
-                pass
 
         # Check for Gemini directory
-        if (Path.home() / ".gemini").exists() or Path(".gemini").exists():
+        if self._exists(Path.home() / ".gemini") or self._exists(Path(".gemini")):
             confidence += 0.2
 
         # Check CLI
-        if resolve_command_path("gemini") is not None:
+        if self._has_command("gemini"):
             confidence += 0.1
 
         return (min(confidence, 1.0), config_path)
@@ -476,27 +495,27 @@ class PlatformDetector:
         config_path = Path.home() / ".codeium" / "windsurf" / "mcp_config.json"
 
         # Check if config exists
-        if config_path.exists():
+        if self._exists(config_path):
             confidence += 0.4
 
             # Validate JSON
-            try:
-                parse_json_safe(config_path)
+            if self._is_valid_json(config_path):
                 confidence += 0.3
-            except Exception:
-                pass
 
         # Check for Windsurf directory
-        if (Path.home() / ".codeium" / "windsurf").exists():
+        if self._exists(Path.home() / ".codeium" / "windsurf"):
             confidence += 0.2
 
         # Check for Windsurf app (macOS)
         if sys.platform == "darwin":
             windsurf_app = Path("/Applications/Windsurf.app")
-            if windsurf_app.exists():
+            if self._exists(windsurf_app):
                 confidence += 0.1
 
-        return (min(confidence, 1.0), config_path if config_path.exists() else None)
+        return (
+            min(confidence, 1.0),
+            config_path if self._exists(config_path) else None,
+        )
 
     def detect_antigravity(self) -> tuple[float, Path | None]:
         """Detect Antigravity installation.
@@ -509,3 +528,156 @@ class PlatformDetector:
         """
         # TODO: Update when Antigravity config location is documented
         return (0.0, None)
+
+    # ========================================================================
+    # Private Helper Methods
+    # ========================================================================
+
+    @contextmanager
+    def _detection_pass(self) -> Iterator[_ProbeCache]:
+        """Share probe results between all detector calls in the block.
+
+        Passes on the same detector are serialized; a nested pass reuses the
+        enclosing pass's probes.
+
+        Yields:
+            Probe cache of the pass
+        """
+        with self._pass_lock:
+            if self._probes is not None:
+                yield self._probes
+                return
+
+            self._probes = _ProbeCache(record_signatures=self.cache is not None)
+            try:
+                yield self._probes
+            finally:
+                self._probes = None
+
+    def _detectors(self) -> dict[Platform, Callable[[], tuple[float, Path | None]]]:
+        """Map each supported platform to its detector, in priority order.
+
+        Returns:
+            Detector method per platform
+        """
+        return {
+            Platform.CLAUDE_CODE: self.detect_claude_code,
+            Platform.CLAUDE_DESKTOP: self.detect_claude_desktop,
+            Platform.CURSOR: self.detect_cursor,
+            Platform.AUGGIE: self.detect_auggie,
+            Platform.CODEX: self.detect_codex,
+            Platform.GEMINI_CLI: self.detect_gemini_cli,
+            Platform.WINDSURF: self.detect_windsurf,
+            Platform.ANTIGRAVITY: self.detect_antigravity,
+        }
+
+    def _platform_info(
+        self, platform: Platform, confidence: float, config_path: Path | None
+    ) -> PlatformInfo:
+        """Build PlatformInfo from a detector result.
+
+        Args:
+            platform: Detected platform
+            confidence: Detector confidence
+            config_path: Detector config path
+
+        Returns:
+            PlatformInfo including CLI availability
+        """
+        cli_available = False
+        if platform in (Platform.CLAUDE_CODE, Platform.CLAUDE_DESKTOP):
+            cli_available = self._has_command("claude")
+        elif platform == Platform.CURSOR:
+            cli_available = self._has_command("cursor")
+
+        return PlatformInfo(
+            platform=platform,
+            confidence=confidence,
+            config_path=config_path,
+            cli_available=cli_available,
+            scope_support=Scope.BOTH,
+        )
+
+    def _probe(self, kind: str, key: str, probe: Callable[[], T]) -> T:
+        """Run a probe through the current pass's cache, if any.
+
+        Args:
+            kind: Probe type
+            key: Probe argument
+            probe: Function computing the result
+
+        Returns:
+            Probe result
+        """
+        probes = self._probes
+        if probes is None:
+            return probe()
+        return probes.get(kind, key, probe)
+
+    def _exists(self, path: Path) -> bool:
+        """Check whether a path exists.
+
+        Args:
+            path: Path to check
+
+        Returns:
+            True if the path exists
+        """
+        return self._probe("exists", str(path), path.exists)
+
+    def _is_valid_json(self, path: Path) -> bool:
+        """Check whether a file contains valid JSON.
+
+        Uses the cheap, stat-keyed check from utils so that large configs
+        (e.g. ``~/.claude.json``) are not fully parsed during detection.
+
+        Args:
+            path: File to check
+
+        Returns:
+            True if the file is (or looks like) valid JSON
+        """
+        return self._probe("json", str(path), lambda: json_config_looks_valid(path))
+
+    def _is_valid_toml(self, path: Path) -> bool:
+        """Check whether a file contains valid TOML.
+
+        Args:
+            path: File to check
+
+        Returns:
+            True if the file parses as TOML
+        """
+
+        def probe() -> bool:
+            try:
+                parse_toml_safe(path)
+                return True
+            except Exception:
+                return False
+
+        return self._probe("toml", str(path), probe)
+
+    def _env(self, name: str) -> str | None:
+        """Read an environment variable.
+
+        Args:
+            name: Variable name
+
+        Returns:
+            Variable value, or None if unset
+        """
+        return self._probe("env", name, lambda: os.environ.get(name))
+
+    def _has_command(self, command: str) -> bool:
+        """Check whether a command is available in PATH.
+
+        Args:
+            command: Command name
+
+        Returns:
+            True if the command resolves
+        """
+        return self._probe(
+            "command", command, lambda: resolve_command_path(command) is not None
+        )
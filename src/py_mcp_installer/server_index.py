@@ -0,0 +1,231 @@
+"""Indexed view of the servers section of a configuration.
+
+Looking a server up by name, finding the servers that run a given command
+and spotting duplicates all used to scan the list of servers, and the
+duplicate check compared every server with every other. A ServerIndex is
+built once per parsed servers section and answers each of these from a
+dict.
+
+Near-duplicates are servers that run the same program with the same
+arguments under different names, usually left behind by installing one
+server twice. Commands are compared by executable name, so ``uvx``,
+``/usr/local/bin/uvx`` and ``uvx.exe`` match.
+
+Design Philosophy:
+- Built once per parsed config, in one pass over its servers
+- Read-only: server configs are shared between callers
+- Every lookup, including duplicate detection, is linear or better
+
+Example:
+    >>> index = ServerIndex.from_section(config["mcpServers"])
+    >>> server = index.get("mcp-ticketer")
+    >>> for names in index.near_duplicates():
+    ...     print("Same command:", ", ".join(names))
+"""
+
+from __future__ import annotations
+
+import ntpath
+from collections.abc import Iterable, Iterator, Mapping
+from typing import Any
+
+from .types import FrozenServerConfig, MCPServerConfig, coerce_server_args
+
+# Launcher suffixes ignored when comparing commands across platforms
+_EXECUTABLE_SUFFIXES = (".exe", ".cmd", ".bat")
+
+
+def server_from_entry(name: str, entry: Mapping[str, Any]) -> MCPServerConfig:
+    """Build a server config from a (possibly shared) config file entry.
+
+    Args:
+        name: Server name
+        entry: Server entry from the parsed config
+
+    Returns:
+        Server configuration owning its own env dict, with args as a list
+        of strings (see :func:`coerce_server_args`)
+
+    Example:
+        >>> server_from_entry("a", {"command": "uvx", "args": ["a"]})
+        MCPServerConfig(name='a', command='uvx', args=['a'], env={}, description='')
+    """
+    env = entry.get("env", {})
+    return MCPServerConfig(
+        name=name,
+        command=entry.get("command", ""),
+        args=coerce_server_args(entry.get("args")),
+        env=dict(env) if isinstance(env, dict) else env,
+        description=entry.get("description", ""),
+    )
+
+
+def normalize_argv(command: str, args: Any) -> tuple[str, ...]:
+    """Normalize a server's command line for comparison.
+
+    The command is reduced to its executable name without launcher suffix;
+    args are read with :func:`coerce_server_args` and surrounding whitespace
+    is dropped from every part.
+
+    Args:
+        command: Executable command
+        args: Command arguments (malformed values are coerced)
+
+    Returns:
+        Normalized command followed by the arguments
+
+    Example:
+        >>> normalize_argv("/usr/local/bin/uvx", ["mcp-ticketer "])
+        ('uvx', 'mcp-ticketer')
+    """
+    return (_normalize_command(command), *(arg.strip() for arg in coerce_server_args(args)))
+
+
+class ServerIndex:
+    """Servers of one configuration, indexed by name, command and argv.
+
+    Attributes:
+        duplicate_names: Names given to more than one server; the last
+            server with a name is the one indexed, as in a JSON object
+
+    Example:
+        >>> index = ServerIndex(manager.list_servers())
+        >>> "mcp-ticketer" in index
+        True
+        >>> index.with_command("uvx")
+        ('mcp-ticketer', 'kuzu-memory')
+    """
+
+    __slots__ = ("_by_argv", "_by_command", "_by_name", "_frozen", "duplicate_names")
+
+    def __init__(self, servers: Iterable[MCPServerConfig]) -> None:
+        """Index servers in one pass.
+
+        Args:
+            servers: Server configurations, in config order
+        """
+        self._by_name: dict[str, MCPServerConfig] = {}
+        duplicates: dict[str, None] = {}
+        for server in servers:
+            if server.name in self._by_name:
+                duplicates[server.name] = None
+                del self._by_name[server.name]  # Keep the position of the last one
+            self._by_name[server.name] = server
+        self.duplicate_names: tuple[str, ...] = tuple(duplicates)
+
+        self._frozen: tuple[FrozenServerConfig, ...] | None = None
+
+        self._by_command: dict[str, list[str]] = {}
+        self._by_argv: dict[tuple[str, ...], list[str]] = {}
+        for server in self._by_name.values():
+            argv = normalize_argv(server.command, server.args)
+            self._by_command.setdefault(argv[0], []).append(server.name)
+            self._by_argv.setdefault(argv, []).append(server.name)
+
+    @classmethod
+    def from_section(cls, section: Mapping[str, Any]) -> ServerIndex:
+        """Index the servers section of a parsed config.
+
+        Entries that are not objects are skipped.
+
+        Args:
+            section: Servers section (e.g. the ``mcpServers`` value)
+
+        Returns:
+            Index of the section's servers
+
+        Example:
+            >>> index = ServerIndex.from_section({"a": {"command": "uvx"}})
+            >>> index.get("a").command
+            'uvx'
+        """
+        return cls(
+            server_from_entry(name, entry)
+            for name, entry in section.items()
+            if isinstance(entry, dict)
+        )
+
+    def __len__(self) -> int:
+        return len(self._by_name)
+
+    def __iter__(self) -> Iterator[MCPServerConfig]:
+        return iter(self._by_name.values())
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._by_name
+
+    @property
+    def names(self) -> tuple[str, ...]:
+        """Server names, in config order."""
+        return tuple(self._by_name)
+
+    def get(self, name: str) -> MCPServerConfig | None:
+        """Look a server up by name.
+
+        Args:
+            name: Server name
+
+        Returns:
+            Shared server configuration (do not mutate), None if not found
+        """
+        return self._by_name.get(name)
+
+    def frozen(self) -> tuple[FrozenServerConfig, ...]:
+        """Return the servers as immutable configs, built on first use.
+
+        Returns:
+            Frozen server configurations, in config order
+        """
+        if self._frozen is None:
+            self._frozen = tuple(FrozenServerConfig.from_config(server) for server in self)
+        return self._frozen
+
+    def with_command(self, command: str) -> tuple[str, ...]:
+        """Find the servers that run a command, whatever their arguments.
+
+        Args:
+            command: Executable command (compared by executable name)
+
+        Returns:
+            Names of the servers, in config order
+        """
+        return tuple(self._by_command.get(_normalize_command(command), ()))
+
+    def with_argv(self, command: str, args: Iterable[str]) -> tuple[str, ...]:
+        """Find the servers that run a command line.
+
+        Args:
+            command: Executable command
+            args: Command arguments
+
+        Returns:
+            Names of the servers, in config order
+        """
+        return tuple(self._by_argv.get(normalize_argv(command, args), ()))
+
+    def near_duplicates(self) -> list[tuple[str, ...]]:
+        """Find servers that run the same command line under different names.
+
+        Returns:
+            One tuple of names (config order) per command line shared by
+            more than one server
+
+        Example:
+            >>> for names in index.near_duplicates():
+            ...     print(f"{names[0]} is also installed as {', '.join(names[1:])}")
+        """
+        return [tuple(names) for names in self._by_argv.values() if len(names) > 1]
+
+
+# ============================================================================
+# Private Helper Functions
+# ============================================================================
+
+
+def _normalize_command(command: object) -> str:
+    """Reduce a command to its executable name, without launcher suffix."""
+    text = "" if command is None else str(command)
+    name = ntpath.basename(text.strip())  # Splits on "/" and "\\"
+    if name.lower().endswith(_EXECUTABLE_SUFFIXES):
+        name = name[: name.rfind(".")]
+    return name
@@ -0,0 +1,321 @@
+"""Warm pool of MCP server processes for continuous health monitoring.
+
+This module keeps probed MCP servers running between health checks. Each
+server is spawned and initialized once with MCPDoctor's handshake; later
+checks only send a cheap ``ping`` over the open connection, so a check costs
+one round trip instead of a full ``npx``/``uv run`` cold start. Servers that
+exit or stop answering are restarted on the next check.
+
+Design Philosophy:
+- Pay the cold-start cost once per process, not once per check
+- Restart dead or hung servers automatically
+- One event loop drives every server; checks run concurrently
+- Results reuse ServerDiagnostic so reports look like ``doctor --full``
+
+Example:
+    >>> import asyncio
+    >>> from py_mcp_installer import MCPDoctor, PlatformDetector
+    >>> doctor = MCPDoctor(PlatformDetector().detect())
+    >>> async def monitor() -> None:
+    ...     async with doctor.server_pool() as pool:
+    ...         async for health in pool.watch(interval=30.0):
+    ...             for name, status in health.items():
+    ...                 print(name, status.diagnostic.status.value)
+    >>> asyncio.run(monitor())
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections.abc import AsyncIterator
+from dataclasses import dataclass, replace
+from datetime import datetime
+from types import TracebackType
+from typing import TYPE_CHECKING, Any
+
+from .mcp_client import MCPStdioClient
+from .types import MCPServerConfig, ServerStatus
+
+if TYPE_CHECKING:
+    from .mcp_doctor import MCPDoctor, ServerDiagnostic
+
+logger = logging.getLogger(__name__)
+
+# JSON-RPC error code of a request for a method the server does not implement
+_METHOD_NOT_FOUND = -32601
+
+
+# ============================================================================
+# Data Classes
+# ============================================================================
+
+
+@dataclass(frozen=True)
+class ServerHealth:
+    """Latest health of one pooled server.
+
+    Attributes:
+        name: Server name
+        diagnostic: Result of the latest check. For a warm check
+            ``response_time_ms`` is the ping round-trip time; after a
+            (re)start it is the full handshake time.
+        checks: Number of checks performed
+        restarts: Number of restart attempts after the first start
+        pid: Process id of the running server (None if not running)
+        checked_at: When the latest check finished
+
+    Example:
+        >>> health = pool.health["mcp-ticketer"]
+        >>> print(f"{health.diagnostic.status.value} ({health.restarts} restarts)")
+    """
+
+    name: str
+    diagnostic: ServerDiagnostic
+    checks: int
+    restarts: int
+    pid: int | None
+    checked_at: datetime
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert health to dictionary for JSON serialization.
+
+        Returns:
+            Dictionary representation of the health record
+        """
+        diag = self.diagnostic
+        return {
+            "name": self.name,
+            "status": diag.status.value,
+            "response_time_ms": diag.response_time_ms,
+            "tool_count": diag.tool_count,
+            "resource_count": diag.resource_count,
+            "prompt_count": diag.prompt_count,
+            "error": diag.error,
+            "checks": self.checks,
+            "restarts": self.restarts,
+            "pid": self.pid,
+            "checked_at": self.checked_at.isoformat(),
+        }
+
+
+@dataclass
+class _PoolEntry:
+    """Mutable per-server state of the pool."""
+
+    server: MCPServerConfig
+    client: MCPStdioClient | None = None
+    ping_supported: bool = True
+    started: bool = False
+    health: ServerHealth | None = None
+
+
+# ============================================================================
+# Server Pool
+# ============================================================================
+
+
+class ServerPool:
+    """Keep MCP server processes alive and check them on demand.
+
+    The pool must be used from a single event loop. :meth:`check` brings every
+    server to a known state: servers without a live process are (re)started
+    with the full handshake, running servers get a ``ping`` (or
+    ``tools/list`` for servers that reject ``ping``). Servers whose process
+    exited, or that miss the request deadline, are stopped and restarted on
+    the same check.
+
+    Attributes:
+        doctor: Doctor providing the handshake, timeout and concurrency limit
+        servers: Pooled server configurations
+
+    Example:
+        >>> async with ServerPool(doctor, servers) as pool:
+        ...     health = await pool.check()
+        ...     await asyncio.sleep(30)
+        ...     health = await pool.check()  # warm: one round trip per server
+    """
+
+    def __init__(self, doctor: MCPDoctor, servers: list[MCPServerConfig]) -> None:
+        """Initialize pool (does not start any server).
+
+        Args:
+            doctor: Doctor providing the handshake, timeout and concurrency limit
+            servers: Server configurations to keep running
+        """
+        self.doctor = doctor
+        self.servers = list(servers)
+        self._entries = {server.name: _PoolEntry(server) for server in self.servers}
+        self._semaphore: asyncio.Semaphore | None = None
+
+    async def __aenter__(self) -> ServerPool:
+        """Return the pool (servers start on the first check)."""
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        """Stop all pooled servers."""
+        await self.close()
+
+    @property
+    def health(self) -> dict[str, ServerHealth]:
+        """Latest health per server, in config order (checked servers only)."""
+        return {
+            name: entry.health for name, entry in self._entries.items() if entry.health is not None
+        }
+
+    async def check(self) -> dict[str, ServerHealth]:
+        """Check every pooled server once, concurrently.
+
+        Returns:
+            Health per server, in config order
+        """
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.doctor.max_workers)
+
+        await asyncio.gather(*(self._check_entry(e) for e in self._entries.values()))
+        return self.health
+
+    async def watch(
+        self, interval: float, iterations: int | None = None
+    ) -> AsyncIterator[dict[str, ServerHealth]]:
+        """Check all servers every ``interval`` seconds.
+
+        Args:
+            interval: Seconds between the start of consecutive checks
+            iterations: Stop after this many checks (None = run until cancelled)
+
+        Yields:
+            Health per server after each check
+        """
+        count = 0
+        while iterations is None or count < iterations:
+            started = time.monotonic()
+            yield await self.check()
+            count += 1
+            if iterations is not None and count >= iterations:
+                break
+            await asyncio.sleep(max(0.0, interval - (time.monotonic() - started)))
+
+    async def close(self) -> None:
+        """Stop all pooled server processes."""
+        clients = [e.client for e in self._entries.values() if e.client is not None]
+        for entry in self._entries.values():
+            entry.client = None
+        await asyncio.gather(*(c.close() for c in clients), return_exceptions=True)
+
+    # ========================================================================
+    # Private Helper Methods
+    # ========================================================================
+
+    async def _check_entry(self, entry: _PoolEntry) -> None:
+        """Check one server, restarting it if needed, and record its health.
+
+        Args:
+            entry: Pool entry to check
+        """
+        assert self._semaphore is not None
+        async with self._semaphore:
+            diag: ServerDiagnostic | None = None
+            try:
+                if entry.client is not None:
+                    diag = await self._ping(entry)
+                if diag is None:
+                    diag = await self._start(entry)
+            except Exception as e:
+                # E.g. an unexecutable command; start over on the next check
+                from .mcp_doctor import ServerDiagnostic  # Circular at module level
+
+                logger.error(f"Server '{entry.server.name}' check failed: {e}", exc_info=True)
+                await self._discard_client(entry)
+                diag = ServerDiagnostic(
+                    name=entry.server.name, status=ServerStatus.ERROR, error=str(e)
+                )
+
+        previous = entry.health
+        entry.health = ServerHealth(
+            name=entry.server.name,
+            diagnostic=diag,
+            checks=(previous.checks if previous else 0) + 1,
+            restarts=previous.restarts if previous else 0,
+            pid=entry.client.pid if entry.client else None,
+            checked_at=datetime.now(),
+        )
+
+    async def _ping(self, entry: _PoolEntry) -> ServerDiagnostic | None:
+        """Check a running server with one cheap request.
+
+        Args:
+            entry: Pool entry with a running client
+
+        Returns:
+            Updated diagnostic, or None if the server must be restarted
+        """
+        client = entry.client
+        assert client is not None and entry.health is not None
+        method = "ping" if entry.ping_supported else "tools/list"
+
+        start_time = time.perf_counter()
+        try:
+            response = await client.request(method)
+        except (TimeoutError, ConnectionError) as e:
+            logger.warning(f"Server '{entry.server.name}' failed {method}: {e}")
+            await self._discard_client(entry)
+            return None
+
+        status, error = ServerStatus.HEALTHY, None
+        if "error" in response:
+            rpc_error = response["error"]
+            if not isinstance(rpc_error, dict):
+                rpc_error = {"message": str(rpc_error)}
+            if method == "ping" and rpc_error.get("code") == _METHOD_NOT_FOUND:
+                # Server does not implement ping; it is alive, use tools/list next time
+                entry.ping_supported = False
+            else:
+                status = ServerStatus.ERROR
+                error = f"{method} failed: {rpc_error.get('message', 'Unknown error')}"
+
+        last = entry.health.diagnostic
+        return replace(
+            last,
+            status=status,
+            error=error,
+            response_time_ms=(time.perf_counter() - start_time) * 1000,
+            first_byte_ms=None,
+            initialize_ms=None,
+            method_times_ms={method: client.request_times_ms.get(method, 0.0)},
+        )
+
+    async def _start(self, entry: _PoolEntry) -> ServerDiagnostic:
+        """Start (or restart) a server with the full handshake.
+
+        Args:
+            entry: Pool entry without a running client
+
+        Returns:
+            Handshake diagnostic
+        """
+        if entry.started and entry.health is not None:
+            entry.health = replace(entry.health, restarts=entry.health.restarts + 1)
+            logger.info(f"Restarting server '{entry.server.name}'")
+        entry.started = True
+        entry.ping_supported = True
+
+        client, diag = await self.doctor.open_session(entry.server)
+        entry.client = client
+        return diag
+
+    async def _discard_client(self, entry: _PoolEntry) -> None:
+        """Stop a server that died or stopped responding.
+
+        Args:
+            entry: Pool entry whose client should be stopped
+        """
+        client, entry.client = entry.client, None
+        if client is not None:
+            await client.close(grace=0.5)
@@ -13,11 +13,18 @@ Design Philosophy:
 
 from __future__ import annotations
 
+import hashlib
+import json
+import sys
+from collections.abc import Mapping
 from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path
+from types import MappingProxyType
 from typing import Any
 
+from .exceptions import ValidationError
+
 # ============================================================================
 # Core Enums
 # ============================================================================
@@ -80,6 +87,32 @@ class ConfigFormat(str, Enum):
     TOML = "toml"
 
 
+class ConfigLayout(str, Enum):
+    """How the content of a JSON config file is laid out.
+
+    - MODERN: A single JSON object (FastMCP SDK format)
+    - LEGACY: One JSON object per line (pre-FastMCP SDK format)
+    - CORRUPT: Neither; the file cannot be parsed
+    """
+
+    MODERN = "modern"
+    LEGACY = "legacy"
+    CORRUPT = "corrupt"
+
+
+class Durability(str, Enum):
+    """How hard config writes try to survive a crash or power loss.
+
+    - NONE: No fsync; fastest, for throwaway environments (CI, containers)
+    - FILE: fsync the new file contents before renaming it into place
+    - FILE_AND_DIR: Also fsync the directory, making the rename itself durable
+    """
+
+    NONE = "none"
+    FILE = "file"
+    FILE_AND_DIR = "file+dir"
+
+
 class InstallationStrategy(str, Enum):
     """Installation strategies for different platforms.
 
@@ -140,6 +173,53 @@ class ServerStatus(str, Enum):
     UNKNOWN = "unknown"
 
 
+# ============================================================================
+# Helper Functions
+# ============================================================================
+
+
+def coerce_server_args(args: Any) -> list[str]:
+    """Turn the ``args`` of a config file entry into a list of strings.
+
+    Hand-edited configs contain ``null``, a single string or numbers where
+    a list of strings is expected; these are read the way a launcher would
+    pass them to the server.
+
+    Args:
+        args: ``args`` value of a server entry
+
+    Returns:
+        Arguments as strings (None -> [], scalar or string -> [str(args)])
+
+    Example:
+        >>> coerce_server_args(["--port", 8080])
+        ['--port', '8080']
+        >>> coerce_server_args("serve")
+        ['serve']
+    """
+    if args is None:
+        return []
+    if isinstance(args, (list, tuple)):
+        return [arg if isinstance(arg, str) else str(arg) for arg in args]
+    return [str(args)]
+
+
+def _as_text(value: Any) -> str:
+    """Read a string field of a config entry (None -> "")."""
+    if value is None:
+        return ""
+    return value if isinstance(value, str) else str(value)
+
+
+def _hashable(value: Any) -> Any:
+    """Convert a parsed config value to an equal-hashing immutable form."""
+    if isinstance(value, dict):
+        return frozenset((key, _hashable(item)) for key, item in value.items())
+    if isinstance(value, list):
+        return tuple(_hashable(item) for item in value)
+    return value
+
+
 # ============================================================================
 # Dataclasses
 # ============================================================================
@@ -175,6 +255,165 @@ class MCPServerConfig:
     description: str = ""
 
 
+# Shared by every FrozenServerConfig without environment variables
+_EMPTY_ENV: Mapping[str, str] = MappingProxyType({})
+
+
+def _empty_env() -> Mapping[str, str]:
+    """Default env of a FrozenServerConfig."""
+    return _EMPTY_ENV
+
+
+@dataclass(frozen=True, slots=True)
+class FrozenServerConfig:
+    """Immutable, hashable MCP server configuration.
+
+    Compact counterpart of MCPServerConfig for large server inventories and
+    for use as a dict or cache key: args is a tuple and env a read-only
+    mapping. The name, command, arguments and environment variable names
+    are interned, so servers that share them share one string; environment
+    values (often secrets) are not. Malformed args are read with
+    :func:`coerce_server_args`, like the other server listings do.
+
+    Attributes:
+        name: Unique server identifier (e.g., "mcp-ticketer")
+        command: Executable command (e.g., "uv", "/usr/bin/mcp-ticketer")
+        args: Command arguments (e.g., ("run", "mcp-ticketer", "mcp"))
+        env: Environment variables, read-only
+        description: Human-readable server description
+
+    Example:
+        >>> server = FrozenServerConfig.from_entry(
+        ...     "mcp-ticketer", {"command": "uv", "args": ["run", "mcp-ticketer", "mcp"]}
+        ... )
+        >>> inventory = {server.content_hash: server}
+        >>> server.to_entry()
+        {'command': 'uv', 'args': ['run', 'mcp-ticketer', 'mcp']}
+    """
+
+    name: str
+    command: str
+    args: tuple[str, ...] = ()
+    env: Mapping[str, str] = field(default_factory=_empty_env)
+    description: str = ""
+    _hash: int = field(default=0, init=False, repr=False, compare=False)
+    _digest: str | None = field(default=None, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        if self.env is not None and not isinstance(self.env, Mapping):
+            raise ValidationError(
+                f"Server '{self.name}': env must be a mapping, not {type(self.env).__name__}",
+                "Write env as an object of NAME: value pairs",
+            )
+        intern = sys.intern
+        name = intern(_as_text(self.name))
+        command = intern(_as_text(self.command))
+        args = tuple(intern(arg) for arg in coerce_server_args(self.args))
+        env = (
+            MappingProxyType({intern(str(key)): value for key, value in self.env.items()})
+            if self.env
+            else _EMPTY_ENV
+        )
+        description = _as_text(self.description)
+        object.__setattr__(self, "name", name)
+        object.__setattr__(self, "command", command)
+        object.__setattr__(self, "args", args)
+        object.__setattr__(self, "env", env)
+        object.__setattr__(self, "description", description)
+        # Env values from hand-edited files may be lists or objects
+        frozen_env = frozenset((key, _hashable(value)) for key, value in env.items())
+        object.__setattr__(self, "_hash", hash((name, command, args, frozen_env, description)))
+
+    def __hash__(self) -> int:
+        return self._hash
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        # The env mapping proxy cannot be pickled or copied itself
+        return (
+            type(self),
+            (self.name, self.command, self.args, dict(self.env), self.description),
+        )
+
+    @property
+    def content_hash(self) -> str:
+        """SHA-256 of the configuration, stable across processes and machines.
+
+        Equal configs have equal hashes, whatever the order of their env.
+        """
+        digest = self._digest
+        if digest is None:
+            content = [self.name, self.command, list(self.args), dict(self.env), self.description]
+            data = json.dumps(content, sort_keys=True, ensure_ascii=False, default=str)
+            digest = hashlib.sha256(data.encode("utf-8")).hexdigest()
+            object.__setattr__(self, "_digest", digest)
+        return digest
+
+    @classmethod
+    def from_entry(cls, name: str, entry: Mapping[str, Any]) -> FrozenServerConfig:
+        """Build a server config from a config file entry.
+
+        Args:
+            name: Server name
+            entry: Server entry (e.g. a value of the ``mcpServers`` section)
+
+        Returns:
+            Frozen server configuration
+        """
+        return cls(
+            name=name,
+            command=entry.get("command", ""),
+            args=tuple(coerce_server_args(entry.get("args"))),
+            env=entry.get("env") or {},
+            description=entry.get("description", ""),
+        )
+
+    def to_entry(self) -> dict[str, Any]:
+        """Build the config file entry for this server.
+
+        Returns:
+            Server entry as written by ConfigManager (optional fields only
+            when set)
+        """
+        entry: dict[str, Any] = {"command": self.command, "args": list(self.args)}
+        if self.env:
+            entry["env"] = dict(self.env)
+        if self.description:
+            entry["description"] = self.description
+        return entry
+
+    @classmethod
+    def from_config(cls, server: MCPServerConfig) -> FrozenServerConfig:
+        """Freeze an MCPServerConfig.
+
+        Args:
+            server: Server configuration
+
+        Returns:
+            Frozen server configuration
+        """
+        return cls(
+            name=server.name,
+            command=server.command,
+            args=tuple(coerce_server_args(server.args)),
+            env=server.env,
+            description=server.description,
+        )
+
+    def to_config(self) -> MCPServerConfig:
+        """Build an MCPServerConfig owning its own args list and env dict.
+
+        Returns:
+            Server configuration
+        """
+        return MCPServerConfig(
+            name=self.name,
+            command=self.command,
+            args=list(self.args),
+            env=dict(self.env),
+            description=self.description,
+        )
+
+
 @dataclass(frozen=True)
 class PlatformInfo:
     """Information about a detected platform.
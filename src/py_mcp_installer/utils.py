@@ -13,21 +13,87 @@ Design Philosophy:
 from __future__ import annotations
 
 import json
+import mmap
 import os
+import re
 import shutil
+import sys
 import tempfile
-from datetime import datetime
+import threading
+import time
+from collections.abc import Collection, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
-from .exceptions import AtomicWriteError, BackupError, ConfigurationError
+from .backup_store import BackupCodec, BackupStore
+from .exceptions import AtomicWriteError, ConfigConflictError, ConfigurationError
+from .json_backend import decode_json_bytes, get_json_backend
+from .json_extract import JsonDocumentScan, classify_json_document, extract_json_members
+from .types import ConfigLayout, Durability
 
 # ============================================================================
 # File Operations (Atomic & Safe)
 # ============================================================================
 
 
-def atomic_write(path: Path, content: str) -> None:
+@dataclass
+class _SyncBatch:
+    """Files and directories whose fsync was deferred by :func:`deferred_sync`."""
+
+    files: dict[Path, None] = field(default_factory=dict)
+    directories: dict[Path, None] = field(default_factory=dict)
+
+
+_sync_batch: ContextVar[_SyncBatch | None] = ContextVar("_sync_batch", default=None)
+
+
+@contextmanager
+def deferred_sync() -> Iterator[None]:
+    """Batch the fsync calls of several atomic writes.
+
+    Inside the block, :func:`atomic_write` skips its fsync calls and records
+    what it would have synced. When the block exits, every written file and
+    directory is synced once, so N writes cost one fsync per file and per
+    directory instead of N flushes interleaved with the writes. Durability
+    is unchanged once the block has exited; a crash inside the block may
+    lose its writes. Nested blocks join the outermost one.
+
+    Raises:
+        AtomicWriteError: If a deferred fsync fails
+
+    Example:
+        >>> with deferred_sync():
+        ...     for manager in managers:
+        ...         manager.add_server(server)
+        >>> # all configs are on disk here
+    """
+    if _sync_batch.get() is not None:
+        yield
+        return
+
+    batch = _SyncBatch()
+    token = _sync_batch.set(batch)
+    try:
+        yield
+    finally:
+        _sync_batch.reset(token)
+        for path in batch.files:
+            _fsync_path(path)
+        for directory in batch.directories:
+            _fsync_directory(directory)
+
+
+def atomic_write(
+    path: Path,
+    content: str | bytes,
+    *,
+    expected_signature: tuple[int, int, int] | None = None,
+    require_unchanged: bool = False,
+    durability: Durability = Durability.FILE,
+) -> None:
     """Write file atomically using temp file + rename pattern.
 
     This ensures the file is never in a partially-written state, which is
@@ -35,18 +101,39 @@ def atomic_write(path: Path, content: str) -> None:
 
     Strategy:
     1. Write to temporary file in same directory
-    2. Sync to disk (fsync)
-    3. Atomic rename to target path
+    2. Sync to disk (fsync), unless durability is NONE
+    3. Optionally verify the target still has the expected signature
+       (compare-and-swap)
+    4. Atomic rename to target path
+    5. Sync the directory, if durability is FILE_AND_DIR
+
+    Inside :func:`deferred_sync` the fsync calls are postponed to the end of
+    the block.
+
+    The compare-and-swap check runs immediately before the rename, so
+    only a write landing in that instant can slip past it. Cooperating
+    processes that need strict mutual exclusion should use a FileLock.
 
     Args:
         path: Target file path
-        content: Content to write
+        content: Content to write (str is encoded as UTF-8)
+        expected_signature: :func:`file_signature` of the target when the
+            content was derived from it (None: the file did not exist)
+        require_unchanged: Only replace the file if its signature still
+            equals ``expected_signature``
+        durability: fsync policy (default: file contents only)
 
     Raises:
         AtomicWriteError: If write operation fails
+        ConfigConflictError: If require_unchanged is set and the file changed
 
     Example:
         >>> atomic_write(Path("/tmp/config.json"), '{"key": "value"}')
+
+        >>> signature = file_signature(path)
+        >>> new_content = transform(path.read_text())
+        >>> atomic_write(path, new_content, expected_signature=signature,
+        ...              require_unchanged=True)
     """
     # Ensure parent directory exists
     path.parent.mkdir(parents=True, exist_ok=True)
@@ -56,35 +143,103 @@ def atomic_write(path: Path, content: str) -> None:
         fd, temp_path = tempfile.mkstemp(
             dir=path.parent, prefix=f".{path.name}.", suffix=".tmp"
         )
+    except Exception as e:
+        raise AtomicWriteError(f"Failed to create temp file: {e}", str(path)) from e
 
-        try:
-            # Write content
-            with os.fdopen(fd, "w", encoding="utf-8") as f:
-                f.write(content)
-                f.flush()
+    durability = Durability(durability)
+    batch = _sync_batch.get()
+
+    try:
+        # Write content
+        with os.fdopen(fd, "wb") as f:
+            f.write(content.encode("utf-8") if isinstance(content, str) else content)
+            f.flush()
+            if durability != Durability.NONE and batch is None:
                 os.fsync(f.fileno())  # Force write to disk
 
-            # Atomic rename (overwrites existing file atomically)
-            os.replace(temp_path, path)
+        if require_unchanged and file_signature(path) != expected_signature:
+            raise ConfigConflictError(
+                f"{path} changed since it was read; not overwriting", str(path)
+            )
 
-        except Exception as e:
-            # Clean up temp file on error
-            if os.path.exists(temp_path):
-                os.unlink(temp_path)
-            raise AtomicWriteError(f"Failed to write {path}: {e}", str(path)) from e
+        # Atomic rename (overwrites existing file atomically)
+        os.replace(temp_path, path)
 
     except Exception as e:
-        raise AtomicWriteError(f"Failed to create temp file: {e}", str(path)) from e
+        # Clean up temp file on error
+        if os.path.exists(temp_path):
+            os.unlink(temp_path)
+        if isinstance(e, ConfigConflictError):
+            raise
+        raise AtomicWriteError(f"Failed to write {path}: {e}", str(path)) from e
+
+    if batch is not None:
+        if durability != Durability.NONE:
+            batch.files[path] = None
+        if durability == Durability.FILE_AND_DIR:
+            batch.directories[path.parent] = None
+    elif durability == Durability.FILE_AND_DIR:
+        _fsync_directory(path.parent)
 
 
-def backup_file(path: Path) -> Path:
+def _fsync_path(path: Path) -> None:
+    """Flush a file's contents to disk.
+
+    Args:
+        path: File to sync
+
+    Raises:
+        AtomicWriteError: If the file cannot be synced
+    """
+    try:
+        fd = os.open(path, os.O_RDONLY)
+        try:
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+    except FileNotFoundError:
+        pass  # Replaced or removed since; nothing of ours left to sync
+    except OSError as e:
+        raise AtomicWriteError(f"Failed to sync {path}: {e}", str(path)) from e
+
+
+def _fsync_directory(directory: Path) -> None:
+    """Flush a directory entry update (e.g. a rename) to disk.
+
+    No-op on Windows, where directories cannot be opened for fsync.
+
+    Args:
+        directory: Directory to sync
+
+    Raises:
+        AtomicWriteError: If the directory cannot be synced
+    """
+    if sys.platform == "win32":
+        return
+    try:
+        fd = os.open(directory, os.O_RDONLY)
+        try:
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+    except OSError as e:
+        raise AtomicWriteError(
+            f"Failed to sync directory {directory}: {e}", str(directory)
+        ) from e
+
+
+def backup_file(path: Path, compression: BackupCodec | str | None = None) -> Path:
     """Create timestamped backup of file.
 
     Backups are stored in .mcp-installer-backups/ directory next to the
-    original file, with timestamp in filename.
+    original file, with a microsecond timestamp in the filename. Identical
+    content is stored once and old backups are pruned according to the
+    default :class:`RetentionPolicy` (see :class:`BackupStore`).
 
     Args:
         path: File to backup
+        compression: "zlib" or "lzma" to store the backup as a compressed
+            delta against a periodic full base (default: plain copy)
 
     Returns:
         Path to created backup file
@@ -95,35 +250,17 @@ def backup_file(path: Path) -> Path:
     Example:
         >>> backup_path = backup_file(Path("/tmp/config.json"))
         >>> print(backup_path)
-        /tmp/.mcp-installer-backups/config.json.20250105_143022.backup
+        /tmp/.mcp-installer-backups/config.json.20250105_143022_481516.backup
     """
-    if not path.exists():
-        raise BackupError(f"Cannot backup non-existent file: {path}")
-
-    # Create backup directory
-    backup_dir = path.parent / ".mcp-installer-backups"
-    try:
-        backup_dir.mkdir(exist_ok=True)
-    except Exception as e:
-        raise BackupError(f"Failed to create backup directory: {e}") from e
-
-    # Generate timestamped backup filename
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    backup_name = f"{path.name}.{timestamp}.backup"
-    backup_path = backup_dir / backup_name
-
-    # Copy file to backup
-    try:
-        shutil.copy2(path, backup_path)
-    except Exception as e:
-        raise BackupError(f"Failed to copy file to backup: {e}") from e
-
-    return backup_path
+    return BackupStore.for_file(path, compression=compression).save(path)
 
 
 def restore_backup(backup_path: Path, original_path: Path) -> None:
     """Restore file from backup.
 
+    The file is replaced atomically with the backup content; compressed
+    backups are reconstructed from their base first.
+
     Args:
         backup_path: Path to backup file
         original_path: Path to restore to
@@ -137,13 +274,65 @@ def restore_backup(backup_path: Path, original_path: Path) -> None:
         ...     Path("/tmp/config.json")
         ... )
     """
-    if not backup_path.exists():
-        raise BackupError(f"Backup file not found: {backup_path}")
+    BackupStore(backup_path.parent).restore(backup_path, original_path)
+
+
+# ============================================================================
+# Config File Reading
+# ============================================================================
+
+# Files from this size on are memory-mapped by mapped_file(); smaller files
+# are cheaper to read with one read() call
+MMAP_MIN_BYTES = 64 * 1024
+
+_NON_WHITESPACE = re.compile(rb"[^ \t\n\r]")
+
+
+@contextmanager
+def mapped_file(path: Path) -> Iterator[memoryview]:
+    """Expose a file's content as a read-only bytes view.
+
+    Files of ``MMAP_MIN_BYTES`` or more are memory-mapped, so parsers and
+    scanners read the page cache directly instead of a private copy of the
+    file; smaller files (and files that cannot be mapped) are read into
+    memory. The view is only valid inside the block and must not be kept.
+
+    Args:
+        path: File to read
+
+    Yields:
+        Read-only view of the file content
+
+    Raises:
+        OSError: If the file cannot be opened or read
+
+    Example:
+        >>> with mapped_file(Path.home() / ".claude.json") as data:
+        ...     config = get_json_backend().loads(data)
+    """
+    with path.open("rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        mapped: mmap.mmap | None = None
+        if size >= MMAP_MIN_BYTES:
+            try:
+                mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except (OSError, ValueError):
+                mapped = None  # e.g. special files or filesystems without mmap
+        if mapped is None:
+            with memoryview(f.read()) as view:
+                yield view
+            return
 
     try:
-        shutil.copy2(backup_path, original_path)
-    except Exception as e:
-        raise BackupError(f"Failed to restore from backup: {e}") from e
+        with memoryview(mapped) as view:
+            yield view
+    finally:
+        mapped.close()
+
+
+def _is_blank(data: memoryview) -> bool:
+    """Whether a file content holds only whitespace (without copying it)."""
+    return _NON_WHITESPACE.search(data) is None
 
 
 # ============================================================================
@@ -154,8 +343,11 @@ def restore_backup(backup_path: Path, original_path: Path) -> None:
 def parse_json_safe(path: Path) -> dict[str, Any]:
     """Parse JSON file with graceful error handling.
 
-    Returns empty dict if file doesn't exist or is empty.
-    Raises ConfigurationError if file is invalid JSON.
+    Returns empty dict if file doesn't exist or is empty. The file is read
+    through :func:`mapped_file` and its bytes are parsed by the configured
+    JSON backend (see :mod:`.json_backend`), without intermediate copies.
+    Raises ConfigurationError if file is invalid JSON. The outcome is
+    remembered for :func:`json_config_looks_valid`.
 
     Args:
         path: Path to JSON file
@@ -173,18 +365,74 @@ def parse_json_safe(path: Path) -> dict[str, Any]:
     if not path.exists():
         return {}
 
+    signature = file_signature(path)
+    backend = get_json_backend()
     try:
-        with path.open("r", encoding="utf-8") as f:
-            content = f.read().strip()
-
+        with mapped_file(path) as data:
             # Empty file is valid (return empty dict)
-            if not content:
+            if _is_blank(data):
+                _remember_json_validity(path, signature, True)
                 return {}
 
-            result: dict[str, Any] = json.loads(content)
-            return result
+            text: str | None = None
+            if backend.parses_bytes:
+                result: dict[str, Any] = backend.loads(data)
+            else:
+                # Decode and unmap before parsing, so that the file's pages
+                # and the parsed document are never resident together
+                text = decode_json_bytes(data)
+
+        if text is not None:
+            result = backend.loads(text)
+        _remember_json_validity(path, signature, True)
+        return result
+
+    except json.JSONDecodeError as e:
+        _remember_json_validity(path, signature, False)
+        raise ConfigurationError(
+            f"Invalid JSON in {path}: {e}", config_path=str(path)
+        ) from e
+    except Exception as e:
+        raise ConfigurationError(
+            f"Failed to read {path}: {e}", config_path=str(path)
+        ) from e
+
+
+def parse_json_members_safe(path: Path, keys: Collection[str]) -> dict[str, Any]:
+    """Parse only some top-level members of a JSON file.
+
+    Like :func:`parse_json_safe`, but the other members are validated
+    without being built (see :func:`extract_json_members`), so memory and
+    time do not grow with unrelated content of large host configs.
+
+    Args:
+        path: Path to JSON file
+        keys: Top-level members to return
+
+    Returns:
+        The requested members that are present (empty dict if the file
+        doesn't exist or is empty)
+
+    Raises:
+        ConfigurationError: If file exists but is invalid JSON
+
+    Example:
+        >>> members = parse_json_members_safe(Path.home() / ".claude.json", ["mcpServers"])
+        >>> print(sorted(members.get("mcpServers", {})))
+    """
+    if not path.exists():
+        return {}
+
+    signature = file_signature(path)
+    try:
+        with mapped_file(path) as data:
+            text = decode_json_bytes(data)
+        members = extract_json_members(text, keys)
+        _remember_json_validity(path, signature, True)
+        return members
 
     except json.JSONDecodeError as e:
+        _remember_json_validity(path, signature, False)
         raise ConfigurationError(
             f"Invalid JSON in {path}: {e}", config_path=str(path)
         ) from e
@@ -194,6 +442,161 @@ def parse_json_safe(path: Path) -> dict[str, Any]:
         ) from e
 
 
+def classify_json_config(path: Path, keys: Collection[str]) -> JsonDocumentScan:
+    """Classify a JSON config file as modern, legacy or corrupt in one read.
+
+    See :func:`classify_json_document`. A modern file returns the same
+    members as :func:`parse_json_members_safe`; a corrupt one is reported
+    in the result instead of raised.
+
+    Args:
+        path: Path to JSON file
+        keys: Top-level members to return from a modern file
+
+    Returns:
+        Classification of the file (MODERN with no members if the file
+        doesn't exist or is empty)
+
+    Raises:
+        ConfigurationError: If file exists but cannot be read
+
+    Example:
+        >>> scan = classify_json_config(config_path, ["mcpServers"])
+        >>> if scan.layout == ConfigLayout.LEGACY:
+        ...     print(f"{len(scan.entries)} servers to migrate")
+    """
+    if not path.exists():
+        return JsonDocumentScan(ConfigLayout.MODERN)
+
+    signature = file_signature(path)
+    try:
+        with mapped_file(path) as data:
+            text = decode_json_bytes(data)
+    except Exception as e:
+        raise ConfigurationError(
+            f"Failed to read {path}: {e}", config_path=str(path)
+        ) from e
+
+    scan = classify_json_document(text, keys)
+    _remember_json_validity(path, signature, scan.layout == ConfigLayout.MODERN)
+    return scan
+
+
+# Files up to this size are fully parsed by json_config_looks_valid
+JSON_PROBE_PARSE_LIMIT = 1024 * 1024
+
+# Bytes read from each end of a large file for the structural check
+_JSON_PROBE_EDGE_BYTES = 4096
+
+# Last known validity per file: path -> (stat signature, valid)
+_json_validity: dict[str, tuple[tuple[int, int, int], bool]] = {}
+_json_validity_lock = threading.Lock()
+
+
+def json_config_looks_valid(path: Path) -> bool:
+    """Cheaply check whether a file holds a JSON config, without parsing it all.
+
+    Intended for heuristics such as platform detection. Results are cached
+    per file and keyed by (inode, size, mtime_ns), so an unchanged file is
+    checked once per process; a successful or failed :func:`parse_json_safe`
+    also fills the cache. Files up to ``JSON_PROBE_PARSE_LIMIT`` bytes are
+    parsed; larger ones (e.g. a ``~/.claude.json`` with project history)
+    only have their first and last non-blank bytes checked for a JSON
+    object frame.
+
+    Args:
+        path: Path to the config file
+
+    Returns:
+        True if the file is (or looks like) valid JSON, False if it is
+        missing, unreadable or malformed
+
+    Example:
+        >>> if json_config_looks_valid(Path.home() / ".claude.json"):
+        ...     confidence += 0.3
+    """
+    signature = file_signature(path)
+    if signature is None:
+        return False
+
+    with _json_validity_lock:
+        cached = _json_validity.get(os.path.abspath(path))
+    if cached is not None and cached[0] == signature:
+        return cached[1]
+
+    if signature[1] <= JSON_PROBE_PARSE_LIMIT:
+        try:
+            parse_json_safe(path)
+            return True
+        except ConfigurationError:
+            return False
+
+    valid = _json_frame_looks_valid(path, signature[1])
+    _remember_json_validity(path, signature, valid)
+    return valid
+
+
+def _json_frame_looks_valid(path: Path, size: int) -> bool:
+    """Check that a file starts with ``{`` and ends with ``}``.
+
+    Args:
+        path: File to check
+        size: File size in bytes
+
+    Returns:
+        True if the file is framed as a JSON object
+    """
+    try:
+        with path.open("rb") as f:
+            head = f.read(_JSON_PROBE_EDGE_BYTES)
+            f.seek(max(0, size - _JSON_PROBE_EDGE_BYTES))
+            tail = f.read()
+    except OSError:
+        return False
+
+    return head.lstrip().startswith(b"{") and tail.rstrip().endswith(b"}")
+
+
+def file_signature(path: Path) -> tuple[int, int, int] | None:
+    """Identify a file version by inode, size and modification time.
+
+    Atomic writes replace the inode, so any rewrite through
+    :func:`atomic_write` changes the signature even within one mtime tick.
+
+    Args:
+        path: File to stat
+
+    Returns:
+        (st_ino, st_size, st_mtime_ns), or None if the file can't be stat'ed
+
+    Example:
+        >>> before = file_signature(config_path)
+        >>> if file_signature(config_path) != before:
+        ...     print("config changed")
+    """
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return (st.st_ino, st.st_size, st.st_mtime_ns)
+
+
+def _remember_json_validity(
+    path: Path, signature: tuple[int, int, int] | None, valid: bool
+) -> None:
+    """Record whether a file version is valid JSON.
+
+    Args:
+        path: File that was checked
+        signature: Stat signature taken before reading the file
+        valid: Whether the content was valid
+    """
+    if signature is None:
+        return
+    with _json_validity_lock:
+        _json_validity[os.path.abspath(path)] = (signature, valid)
+
+
 def parse_toml_safe(path: Path) -> dict[str, Any]:
     """Parse TOML file with graceful error handling.
 
@@ -223,15 +626,15 @@ def parse_toml_safe(path: Path) -> dict[str, Any]:
         except ImportError:
             import tomli as tomllib
 
-        with path.open("rb") as f:
-            content = f.read()
+        with mapped_file(path) as data:
+            text = str(data, "utf-8")
 
-            # Empty file is valid (return empty dict)
-            if not content:
-                return {}
+        # Empty file is valid (return empty dict)
+        if not text:
+            return {}
 
-            result: dict[str, Any] = tomllib.loads(content.decode("utf-8"))
-            return result
+        result: dict[str, Any] = tomllib.loads(text)
+        return result
 
     except Exception as e:
         raise ConfigurationError(
@@ -297,9 +700,154 @@ def mask_credentials(data: dict[str, Any]) -> dict[str, Any]:
 # ============================================================================
 
 
+class _PathIndex:
+    """Index of executable names found in PATH directories.
+
+    Built by listing each PATH directory once, so resolving a command is a
+    dict lookup plus one ``os.access`` call instead of a stat per directory.
+    The index is rebuilt when the PATH string changes, and when a directory's
+    mtime changes (something was installed or removed). Directory mtimes are
+    re-checked at most once every ``REVALIDATE_SECONDS``.
+    """
+
+    # Minimum interval between directory mtime checks
+    REVALIDATE_SECONDS = 1.0
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._path: str | None = None
+        self._dir_mtimes: list[tuple[str, int | None]] = []
+        self._names: dict[str, list[str]] = {}
+        self._validated_at = 0.0
+
+    def lookup(self, command: str) -> Path | None:
+        """Resolve a bare command name using the index.
+
+        Args:
+            command: Command name without directory components
+
+        Returns:
+            Absolute path to the first executable match in PATH order
+        """
+        names = self._current()
+        for candidate in _executable_candidates(command):
+            key = candidate.lower() if sys.platform == "win32" else candidate
+            for directory in names.get(key, ()):
+                full_path = os.path.join(directory, candidate)
+                if os.access(full_path, os.F_OK | os.X_OK) and not os.path.isdir(
+                    full_path
+                ):
+                    return Path(full_path)
+        return None
+
+    def clear(self) -> None:
+        """Drop the index so the next lookup rebuilds it."""
+        with self._lock:
+            self._path = None
+            self._dir_mtimes = []
+            self._names = {}
+            self._validated_at = 0.0
+
+    def _current(self) -> dict[str, list[str]]:
+        """Return an up-to-date index, rebuilding it if PATH changed.
+
+        Returns:
+            Mapping of executable name to the directories containing it
+        """
+        path = os.environ.get("PATH", os.defpath)
+        now = time.monotonic()
+        with self._lock:
+            if path != self._path:
+                self._rebuild(path)
+            elif now - self._validated_at >= self.REVALIDATE_SECONDS:
+                if any(_dir_mtime(d) != mtime for d, mtime in self._dir_mtimes):
+                    self._rebuild(path)
+            else:
+                return self._names
+            self._validated_at = now
+            return self._names
+
+    def _rebuild(self, path: str) -> None:
+        """Scan every PATH directory and rebuild the index.
+
+        Args:
+            path: PATH environment value to index
+        """
+        names: dict[str, list[str]] = {}
+        dir_mtimes: list[tuple[str, int | None]] = []
+        seen: set[str] = set()
+
+        for directory in path.split(os.pathsep):
+            directory = directory or os.curdir
+            normalized = os.path.normcase(os.path.abspath(directory))
+            if normalized in seen:
+                continue
+            seen.add(normalized)
+
+            # Record the mtime before listing so concurrent changes trigger
+            # another rebuild on the next validation
+            dir_mtimes.append((directory, _dir_mtime(directory)))
+            try:
+                with os.scandir(directory) as entries:
+                    for entry in entries:
+                        key = entry.name.lower() if sys.platform == "win32" else entry.name
+                        names.setdefault(key, []).append(directory)
+            except OSError:
+                continue
+
+        self._path = path
+        self._dir_mtimes = dir_mtimes
+        self._names = names
+
+
+def _dir_mtime(directory: str) -> int | None:
+    """Modification time of a directory (None if it does not exist).
+
+    Args:
+        directory: Directory path
+
+    Returns:
+        mtime in nanoseconds, or None
+    """
+    try:
+        return os.stat(directory).st_mtime_ns
+    except OSError:
+        return None
+
+
+def _executable_candidates(command: str) -> list[str]:
+    """File names that may provide a command on this platform.
+
+    On Windows, extensions from PATHEXT are tried unless the command already
+    has one of them, matching ``shutil.which``.
+
+    Args:
+        command: Command name
+
+    Returns:
+        Candidate file names in lookup order
+    """
+    if sys.platform != "win32":
+        return [command]
+
+    pathext_env = os.environ.get("PATHEXT", ".COM;.EXE;.BAT;.CMD")
+    pathext = [ext for ext in pathext_env.split(os.pathsep) if ext]
+    if any(command.lower().endswith(ext.lower()) for ext in pathext):
+        return [command]
+    return [command + ext for ext in pathext]
+
+
+_path_index = _PathIndex()
+
+
 def resolve_command_path(command: str) -> Path | None:
     """Find command in PATH and return absolute path.
 
+    Bare command names are resolved through a process-wide index of PATH
+    directories, so repeated lookups do not re-walk PATH. The index is
+    rebuilt when PATH changes or when a PATH directory is modified. Commands
+    containing a directory component are checked directly.
+
     Args:
         command: Command name to find (e.g., "uv", "mcp-ticketer")
 
@@ -311,8 +859,29 @@ def resolve_command_path(command: str) -> Path | None:
         >>> print(path)
         /usr/bin/python
     """
-    found = shutil.which(command)
-    return Path(found) if found else None
+    if not command:
+        return None
+
+    if os.path.dirname(command):
+        found = shutil.which(command)
+        return Path(found) if found else None
+
+    return _path_index.lookup(command)
+
+
+def clear_command_cache() -> None:
+    """Forget cached PATH contents used by resolve_command_path.
+
+    Only needed when a command is installed into an existing PATH directory
+    and must be found immediately; otherwise changes are picked up within
+    about a second.
+
+    Example:
+        >>> subprocess.run(["pipx", "install", "mcp-ticketer"], check=True)
+        >>> clear_command_cache()
+        >>> resolve_command_path("mcp-ticketer")
+    """
+    _path_index.clear()
 
 
 def detect_install_method(package: str) -> str:
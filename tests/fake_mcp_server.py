@@ -0,0 +1,126 @@
+"""Minimal stdio MCP server used by the doctor and client tests.
+
+Usage:
+    python fake_mcp_server.py MODE [--delay SECONDS] [--capabilities a,b,c] [--no-ping]
+        [--fail-after N] [--init-result JSON]
+
+Modes:
+    healthy     Answer initialize and the list methods
+    init-error  Answer initialize with a JSON-RPC error
+    hang        Read requests but never answer
+    partial     Write half a JSON line without a newline, then hang
+    noisy       Flood stderr and print non-JSON to stdout before answering
+    exit        Print to stderr and exit with code 3
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import time
+from typing import Any
+
+LISTS = {
+    "tools/list": ("tools", [{"name": "tool1"}, {"name": "tool2"}]),
+    "resources/list": ("resources", [{"uri": "file:///a"}]),
+    "prompts/list": ("prompts", []),
+}
+
+
+def send(message: dict[str, Any]) -> None:
+    sys.stdout.write(json.dumps(message) + "\n")
+    sys.stdout.flush()
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("mode")
+    parser.add_argument("--delay", type=float, default=0.0)
+    parser.add_argument("--capabilities", default="tools,resources,prompts")
+    parser.add_argument("--no-ping", action="store_true")
+    parser.add_argument("--fail-after", type=int, help="answer errors after N requests")
+    parser.add_argument("--init-result", help="answer initialize with this JSON result")
+    args = parser.parse_args()
+    capabilities = [c for c in args.capabilities.split(",") if c]
+
+    if args.mode == "exit":
+        sys.stderr.write("fatal: missing API key\n")
+        return 3
+
+    if args.mode == "noisy":
+        for i in range(20000):
+            sys.stderr.write(f"debug line {i:05d} " + "x" * 40 + "\n")
+        sys.stderr.flush()
+        sys.stdout.write("Starting server...\n")
+        sys.stdout.flush()
+
+    if args.mode == "partial":
+        sys.stdout.write('{"jsonrpc": "2.0", "id": 1, "res')
+        sys.stdout.flush()
+
+    answered = 0
+    for line in sys.stdin:
+        if not line.strip():
+            continue
+        request = json.loads(line)
+        if "id" not in request:
+            continue  # notification
+
+        if args.mode in ("hang", "partial"):
+            continue
+
+        if args.delay:
+            time.sleep(args.delay)
+
+        answered += 1
+        if args.fail_after is not None and answered > args.fail_after:
+            send(
+                {
+                    "jsonrpc": "2.0",
+                    "id": request["id"],
+                    "error": {"code": -32603, "message": "Server overloaded"},
+                }
+            )
+            continue
+
+        method = request["method"]
+        if method == "initialize":
+            if args.mode == "init-error":
+                send(
+                    {
+                        "jsonrpc": "2.0",
+                        "id": request["id"],
+                        "error": {"code": -32600, "message": "Invalid request"},
+                    }
+                )
+                continue
+            result: Any = {
+                "protocolVersion": "2024-11-05",
+                "capabilities": {name: {} for name in capabilities},
+                "serverInfo": {"name": "fake", "version": "1.0"},
+            }
+            if args.init_result is not None:
+                result = json.loads(args.init_result)
+        elif method == "ping" and not args.no_ping:
+            result = {}
+        elif method in LISTS:
+            key, items = LISTS[method]
+            result = {key: items}
+        else:
+            send(
+                {
+                    "jsonrpc": "2.0",
+                    "id": request["id"],
+                    "error": {"code": -32601, "message": "Method not found"},
+                }
+            )
+            continue
+
+        send({"jsonrpc": "2.0", "id": request["id"], "result": result})
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,344 @@
+"""Tests for BackupStore."""
+
+import json
+import os
+import zlib
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import pytest
+
+from py_mcp_installer import backup_store
+from py_mcp_installer.backup_store import BackupStore, RetentionPolicy
+from py_mcp_installer.config_manager import ConfigManager
+from py_mcp_installer.exceptions import BackupError
+from py_mcp_installer.types import ConfigFormat, MCPServerConfig
+from py_mcp_installer.utils import backup_file, restore_backup
+
+
+@pytest.fixture
+def config_path(tmp_path: Path) -> Path:
+    path = tmp_path / "mcp.json"
+    path.write_text('{"mcpServers": {}}')
+    return path
+
+
+def _store(path: Path, **limits: object) -> BackupStore:
+    defaults: dict[str, object] = {"max_count": None, "max_age_days": None, "max_bytes": None}
+    return BackupStore.for_file(path, RetentionPolicy(**{**defaults, **limits}))  # type: ignore[arg-type]
+
+
+def _objects(store: BackupStore) -> list[str]:
+    return sorted(os.listdir(store.directory / "objects"))
+
+
+def test_identical_snapshots_share_storage(config_path: Path) -> None:
+    store = _store(config_path)
+    first = store.save(config_path)
+    second = store.save(config_path)
+
+    assert first != second
+    assert os.path.samefile(first, second)
+    assert len(_objects(store)) == 1
+
+    config_path.write_text('{"mcpServers": {"a": {}}}')
+    third = store.save(config_path)
+    assert not os.path.samefile(second, third)
+    assert len(_objects(store)) == 2
+
+
+def test_rapid_saves_get_unique_names(config_path: Path) -> None:
+    store = _store(config_path)
+    paths = [store.save(config_path) for _ in range(50)]
+
+    assert len(set(paths)) == 50
+    assert [s.path for s in store.snapshots(config_path.name)] == paths
+
+
+def test_same_microsecond_gets_sequence_suffix(
+    config_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    frozen = datetime(2025, 1, 5, 14, 30, 22, 481516)
+
+    class FrozenDatetime(datetime):
+        @classmethod
+        def now(cls, tz: object = None) -> "FrozenDatetime":
+            return cls.fromtimestamp(frozen.timestamp())
+
+    monkeypatch.setattr("py_mcp_installer.backup_store.datetime", FrozenDatetime)
+    store = _store(config_path)
+
+    first = store.save(config_path)
+    second = store.save(config_path)
+
+    assert first.name == "mcp.json.20250105_143022_481516.backup"
+    assert second.name == "mcp.json.20250105_143022_481516-1.backup"
+    assert [s.path for s in store.snapshots("mcp.json")] == [first, second]
+
+
+def test_count_retention_keeps_newest(config_path: Path) -> None:
+    store = _store(config_path, max_count=3)
+    paths = []
+    for i in range(6):
+        config_path.write_text(f'{{"version": {i}}}')
+        paths.append(store.save(config_path))
+
+    assert [s.path for s in store.snapshots(config_path.name)] == paths[-3:]
+    assert len(_objects(store)) == 3  # Objects of pruned snapshots are collected
+
+
+def test_age_retention(config_path: Path) -> None:
+    store = _store(config_path, max_age_days=30)
+    backup_dir = store.directory
+    backup_dir.mkdir()
+    old = datetime.now() - timedelta(days=45)
+    legacy = backup_dir / f"mcp.json.{old:%Y%m%d_%H%M%S}.backup"
+    legacy.write_text("{}")
+
+    newest = store.save(config_path)
+
+    assert not legacy.exists()
+    assert [s.path for s in store.snapshots("mcp.json")] == [newest]
+
+
+def test_bytes_retention_counts_shared_content_once(config_path: Path) -> None:
+    config_path.write_text("x" * 100)
+    store = _store(config_path, max_bytes=250)
+    for _ in range(5):
+        store.save(config_path)
+    assert len(store.snapshots("mcp.json")) == 5  # One 100-byte object
+
+    config_path.write_text("y" * 100)
+    store.save(config_path)
+    config_path.write_text("z" * 100)
+    store.save(config_path)
+
+    contents = [s.path.read_text()[0] for s in store.snapshots("mcp.json")]
+    assert contents == ["y", "z"]
+
+
+def test_newest_snapshot_is_never_pruned(config_path: Path) -> None:
+    config_path.write_text("x" * 1000)
+    store = _store(config_path, max_bytes=10)
+
+    snapshot = store.save(config_path)
+
+    assert snapshot.exists()
+    assert store.snapshots("mcp.json")[0].size == 1000
+
+
+def test_snapshots_include_legacy_backups_and_ignore_other_files(config_path: Path) -> None:
+    store = _store(config_path)
+    store.directory.mkdir()
+    legacy = store.directory / "mcp.json.20240101_120000.backup"
+    legacy.write_text("{}")
+    (store.directory / "other.json.20240101_120000.backup").write_text("{}")
+    (store.directory / "mcp.json.notes").write_text("")
+
+    new = store.save(config_path)
+
+    listed = store.snapshots("mcp.json")
+    assert [s.path for s in listed] == [legacy, new]
+    assert listed[0].created == datetime(2024, 1, 1, 12, 0, 0)
+
+
+def test_restore_copies_content(config_path: Path) -> None:
+    store = _store(config_path)
+    snapshot = store.save(config_path)
+    config_path.write_text('{"changed": true}')
+
+    store.restore(snapshot, config_path)
+    assert config_path.read_text() == '{"mcpServers": {}}'
+
+    # The restored file must not share storage with the backup
+    config_path.write_text("edited")
+    assert snapshot.read_text() == '{"mcpServers": {}}'
+
+
+def test_save_and_restore_errors(tmp_path: Path) -> None:
+    store = BackupStore(tmp_path / "backups")
+    with pytest.raises(BackupError):
+        store.save(tmp_path / "missing.json")
+    with pytest.raises(BackupError):
+        store.restore(tmp_path / "missing.backup", tmp_path / "target.json")
+
+
+def test_falls_back_to_copies_without_hard_links(
+    config_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    def no_link(src: object, dst: object) -> None:
+        raise PermissionError("hard links not permitted")
+
+    monkeypatch.setattr(os, "link", no_link)
+    store = _store(config_path, max_count=2)
+    paths = [store.save(config_path) for _ in range(3)]
+
+    assert [s.path for s in store.snapshots("mcp.json")] == paths[1:]
+    assert paths[2].read_text() == '{"mcpServers": {}}'
+
+
+def test_invalid_retention_policy() -> None:
+    with pytest.raises(ValueError):
+        RetentionPolicy(max_count=0)
+
+
+def test_utils_and_config_manager_use_store(config_path: Path) -> None:
+    backup = backup_file(config_path)
+    assert backup.parent == config_path.parent / ".mcp-installer-backups"
+    config_path.write_text("{}")
+    restore_backup(backup, config_path)
+    assert config_path.read_text() == '{"mcpServers": {}}'
+
+    manager = ConfigManager(
+        config_path, ConfigFormat.JSON, backup_store=_store(config_path, max_count=2)
+    )
+    for name in ("a", "b", "c"):
+        manager.add_server(MCPServerConfig(name=name, command="uvx"))
+    assert len(manager.backup_store.snapshots("mcp.json")) == 2
+
+    manager.restore(manager.backup_store.snapshots("mcp.json")[0].path)
+    assert [s.name for s in manager.list_servers()] == ["a"]
+
+
+def _large_config(servers: int) -> str:
+    return json.dumps(
+        {
+            "projects": {f"/repo/{i}": {"history": ["x" * 40] * 5} for i in range(300)},
+            "mcpServers": {f"s{i}": {"command": "uvx", "args": [f"s{i}"]} for i in range(servers)},
+        },
+        indent=2,
+    )
+
+
+@pytest.mark.parametrize("codec", ["zlib", "lzma"])
+def test_compressed_deltas_restore_every_point(config_path: Path, codec: str) -> None:
+    store = BackupStore.for_file(
+        config_path, RetentionPolicy(max_count=None, max_age_days=None), compression=codec
+    )
+    versions = [_large_config(i) for i in range(6)]
+    for version in versions:
+        config_path.write_text(version)
+        store.save(config_path)
+
+    listed = store.snapshots("mcp.json")
+    assert [s.kind for s in listed] == ["full"] + ["delta"] * 5
+    assert all(s.base == listed[0].path for s in listed[1:])
+    assert [s.size for s in listed] == [len(v) for v in versions]
+    assert all(s.stored_size < s.size / 10 for s in listed[1:])
+
+    for snapshot, version in zip(listed, versions, strict=True):
+        store.restore(snapshot.path, config_path)
+        assert config_path.read_text() == version
+
+
+def test_new_base_every_full_every_snapshots(config_path: Path) -> None:
+    store = BackupStore(
+        config_path.parent / "backups",
+        RetentionPolicy(max_count=None, max_age_days=None),
+        compression="zlib",
+        full_every=3,
+    )
+    for i in range(7):
+        config_path.write_text(_large_config(i))
+        store.save(config_path)
+
+    kinds = [s.kind for s in store.snapshots("mcp.json")]
+    assert kinds == ["full", "delta", "delta", "full", "delta", "delta", "full"]
+
+
+def test_listing_does_not_decompress(config_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    store = BackupStore.for_file(config_path, compression="zlib")
+    for i in range(3):
+        config_path.write_text(_large_config(i))
+        store.save(config_path)
+
+    def fail(*args: object) -> bytes:
+        raise AssertionError("payload decompressed")
+
+    monkeypatch.setattr(zlib, "decompress", fail)
+    assert [s.size for s in store.snapshots("mcp.json")] == [
+        len(_large_config(i)) for i in range(3)
+    ]
+
+
+def test_prune_keeps_base_of_remaining_deltas(config_path: Path) -> None:
+    store = BackupStore.for_file(
+        config_path, RetentionPolicy(max_count=2, max_age_days=None), compression="zlib"
+    )
+    for i in range(4):
+        config_path.write_text(_large_config(i))
+        store.save(config_path)
+
+    listed = store.snapshots("mcp.json")
+    assert [s.kind for s in listed] == ["full", "delta", "delta"]
+    store.restore(listed[-1].path, config_path)
+    assert config_path.read_text() == _large_config(3)
+
+
+def test_snapshot_at_and_mixed_formats(config_path: Path) -> None:
+    plain = backup_file(config_path)
+    config_path.write_text(_large_config(1))
+    compressed = backup_file(config_path, compression="zlib")
+
+    store = BackupStore.for_file(config_path)
+    listed = store.snapshots("mcp.json")
+    assert [(s.path, s.kind) for s in listed] == [(plain, "copy"), (compressed, "full")]
+    assert store.snapshot_at("mcp.json", listed[0].created) == listed[0]
+    assert store.snapshot_at("mcp.json", datetime.now()) == listed[1]
+    assert store.snapshot_at("mcp.json", listed[0].created - timedelta(seconds=1)) is None
+
+    restore_backup(compressed, config_path)
+    assert config_path.read_text() == _large_config(1)
+
+
+def test_corrupt_delta_is_detected(config_path: Path) -> None:
+    store = BackupStore.for_file(config_path, compression="zlib")
+    for i in range(2):
+        config_path.write_text(_large_config(i))
+        store.save(config_path)
+    base, delta = store.snapshots("mcp.json")
+
+    base.path.write_bytes(base.path.read_bytes()[:-10])
+    with pytest.raises(BackupError):
+        store.restore(delta.path, config_path)
+
+
+def test_only_the_stored_form_is_compressed(
+    config_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    store = BackupStore.for_file(config_path, compression="zlib")
+    compressed: list[int] = []
+    real_compress = zlib.compress
+
+    def compress(data: bytes, level: int = -1) -> bytes:
+        compressed.append(len(data))
+        return real_compress(data, level)
+
+    monkeypatch.setattr(zlib, "compress", compress)
+    for i in range(2):
+        config_path.write_text(_large_config(i))
+        store.save(config_path)
+
+    assert [s.kind for s in store.snapshots("mcp.json")] == ["full", "delta"]
+    assert len(compressed) == 2
+    assert compressed[1] < len(_large_config(1)) / 10
+
+
+def test_large_rewrite_is_stored_full_without_diffing(
+    config_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    store = BackupStore.for_file(config_path, compression="zlib")
+    lines = [f'  "key{i}": {i},\n' for i in range(6000)]
+    config_path.write_text("{\n" + "".join(lines) + '  "end": 0\n}\n')
+    store.save(config_path)
+
+    def fail(*args: object) -> None:
+        raise AssertionError("rewrite diffed line by line")
+
+    monkeypatch.setattr(backup_store, "SequenceMatcher", fail)
+    rewritten = "{\n" + "".join(line.upper() for line in lines) + '  "end": 0\n}\n'
+    config_path.write_text(rewritten)
+    snapshot = store.save(config_path)
+
+    assert [s.kind for s in store.snapshots("mcp.json")] == ["full", "full"]
+    assert store.read(snapshot) == rewritten.encode()
@@ -0,0 +1,393 @@
+"""Tests for ConfigManager."""
+
+import json
+import os
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from py_mcp_installer import config_manager
+from py_mcp_installer.config_manager import ConfigManager, ConfigTransaction, clear_config_cache
+from py_mcp_installer.exceptions import ConfigConflictError, ValidationError
+from py_mcp_installer.file_lock import FileLock
+from py_mcp_installer.types import ConfigFormat, MCPServerConfig
+from py_mcp_installer.utils import atomic_write, file_signature
+
+
+@pytest.fixture
+def config_path(tmp_path: Path) -> Path:
+    """JSON config with one server and an unrelated top-level key."""
+    path = tmp_path / "mcp.json"
+    path.write_text(
+        json.dumps(
+            {
+                "theme": "dark",
+                "mcpServers": {"existing": {"command": "uv", "args": ["run", "existing"]}},
+            }
+        )
+    )
+    return path
+
+
+@pytest.fixture
+def writes(monkeypatch: pytest.MonkeyPatch) -> list[Path]:
+    """Record every atomic config write."""
+    written: list[Path] = []
+    real_atomic_write = config_manager.atomic_write
+
+    def record(path: Path, content: str, **kwargs: Any) -> None:
+        written.append(path)
+        real_atomic_write(path, content, **kwargs)
+
+    monkeypatch.setattr(config_manager, "atomic_write", record)
+    return written
+
+
+def server(name: str) -> MCPServerConfig:
+    """Server config for tests."""
+    return MCPServerConfig(name=name, command="uvx", args=[name], env={"KEY": name})
+
+
+class TestBatchOperations:
+    """Tests for add_servers() and remove_servers()."""
+
+    def test_add_servers_single_write(self, config_path: Path, writes: list[Path]) -> None:
+        """All servers are added with one write, keeping other keys."""
+        manager = ConfigManager(config_path, ConfigFormat.JSON)
+
+        manager.add_servers([server(f"server-{i}") for i in range(25)])
+
+        assert writes == [config_path]
+        config = json.loads(config_path.read_text())
+        assert config["theme"] == "dark"
+        assert len(config["mcpServers"]) == 26
+        assert config["mcpServers"]["server-7"] == {
+            "command": "uvx",
+            "args": ["server-7"],
+            "env": {"KEY": "server-7"},
+        }
+
+    def test_add_servers_single_backup(self, config_path: Path) -> None:
+        """Only one backup is taken for a batch."""
+        manager = ConfigManager(config_path, ConfigFormat.JSON)
+
+        manager.add_servers([server("a"), server("b"), server("c")])
+
+        assert len(manager.backup_store.snapshots(config_path.name)) == 1
+
+    def test_add_servers_conflict_writes_nothing(
+        self, config_path: Path, writes: list[Path]
+    ) -> None:
+        """A conflict anywhere in the batch leaves the file untouched."""
+        manager = ConfigManager(config_path, ConfigFormat.JSON)
+        before = config_path.read_text()
+
+        with pytest.raises(ValidationError, match="'existing' already exists"):
+            manager.add_servers([server("new"), server("existing")])
+
+        assert writes == []
+        assert config_path.read_text() == before
+
+    def test_add_servers_rejects_duplicates_and_missing_replacements(
+        self, config_path: Path
+    ) -> None:
+        """Duplicate names and unknown replacements are reported together."""
+        manager = ConfigManager(config_path, ConfigFormat.JSON)
+
+        with pytest.raises(ValidationError) as exc_info:
+            manager.add_servers([server("a"), server("a"), server("b")], replace={"b"})
+
+        assert "'a' listed more than once" in exc_info.value.message
+        assert "'b' not found" in exc_info.value.message
+
+    def test_add_servers_replace(self, config_path: Path) -> None:
+        """Servers named in replace overwrite existing entries."""
+        manager = ConfigManager(config_path, ConfigFormat.JSON)
+
+        manager.add_servers([server("existing"), server("new")], replace={"existing"})
+
+        servers = {s.name: s for s in manager.list_servers()}
+        assert servers["existing"].command == "uvx"
+        assert "new" in servers
+
+    def test_add_servers_creates_file(self, tmp_path: Path) -> None:
+        """A missing config file is created with the servers section."""
+        path = tmp_path / "new.json"
+        manager = ConfigManager(path, ConfigFormat.JSON)
+
+        manager.add_servers([server("a")])
+
+        assert list(json.loads(path.read_text())["mcpServers"]) == ["a"]
+
+    def test_remove_servers_single_write(self, config_path: Path, writes: list[Path]) -> None:
+        """All servers are removed with one write."""
+        manager = ConfigManager(config_path, ConfigFormat.JSON)
+        manager.add_servers([server("a"), server("b")])
+        writes.clear()
+
+        manager.remove_servers(["a", "existing"])
+
+        assert writes == [config_path]
+        assert [s.name for s in manager.list_servers()] == ["b"]
+
+    def test_remove_servers_missing_writes_nothing(
+        self, config_path: Path, writes: list[Path]
+    ) -> None:
+        """A missing server leaves the file untouched."""
+        manager = ConfigManager(config_path, ConfigFormat.JSON)
+
+        with pytest.raises(ValidationError, match="not found in configuration: ghost"):
+            manager.remove_servers(["existing", "ghost"])
+
+        assert writes == []
+        assert manager.get_server("existing") is not None
+
+
+class TestTransaction:
+    """Tests for ConfigManager.transaction()."""
+
+    def test_commits_once(self, config_path: Path, writes: list[Path]) -> None:
+        """Several mutations produce one backup and one write on exit."""
+        manager = ConfigManager(config_path, ConfigFormat.JSON)
+
+        with manager.transaction() as txn:
+            txn.add_server(server("a"))
+            txn.add_server(server("b"))
+            txn.update_server("a", server("b"))
+            txn.remove_server("existing")
+            assert writes == []
+
+        assert writes == [config_path]
+        assert len(manager.backup_store.snapshots(config_path.name)) == 1
+        assert [s.name for s in manager.list_servers()] == ["a", "b"]
+        assert manager.get_server("a").args == ["b"]
+
+    def test_rolls_back_on_exception(self, config_path: Path, writes: list[Path]) -> None:
+        """An exception inside the block discards all changes."""
+        manager = ConfigManager(config_path, ConfigFormat.JSON)
+        before = config_path.read_text()
+
+        with pytest.raises(ValidationError), manager.transaction() as txn:
+            txn.add_server(server("a"))
+            txn.remove_server("missing")
+
+        assert writes == []
+        assert config_path.read_text() == before
+
+    def test_manager_methods_join_transaction(self, config_path: Path, writes: list[Path]) -> None:
+        """Manager methods called inside a transaction defer their writes."""
+        manager = ConfigManager(config_path, ConfigFormat.JSON)
+
+        with manager.transaction():
+            manager.add_server(server("a"))
+            manager.remove_servers(["existing"])
+            assert [s.name for s in manager.list_servers()] == ["a"]
+            assert writes == []
+
+        assert writes == [config_path]
+        assert json.loads(config_path.read_text())["mcpServers"].keys() == {"a"}
+
+    def test_no_changes_no_write(self, config_path: Path, writes: list[Path]) -> None:
+        """A transaction without changes does not touch the file."""
+        manager = ConfigManager(config_path, ConfigFormat.JSON)
+
+        with manager.transaction() as txn:
+            assert txn.get_server("existing") == {"command": "uv", "args": ["run", "existing"]}
+
+        assert writes == []
+
+    def test_direct_edit_with_mark_changed(self, config_path: Path) -> None:
+        """Direct edits of the pending config are written after mark_changed()."""
+        manager = ConfigManager(config_path, ConfigFormat.JSON)
+
+        with manager.transaction() as txn:
+            txn.config["theme"] = "light"
+            txn.mark_changed()
+
+        assert json.loads(config_path.read_text())["theme"] == "light"
+
+
+class TestParsedConfigCache:
+    """Tests for the process-wide parsed config cache."""
+
+    @pytest.fixture
+    def parses(self, monkeypatch: pytest.MonkeyPatch) -> list[Path]:
+        """Record every JSON parse made by ConfigManager."""
+        clear_config_cache()
+        parsed: list[Path] = []
+        real_parse = config_manager.parse_json_safe
+
+        def record(path: Path) -> dict:
+            parsed.append(path)
+            return real_parse(path)
+
+        monkeypatch.setattr(config_manager, "parse_json_safe", record)
+        return parsed
+
+    def test_parsed_once_across_managers(self, config_path: Path, parses: list[Path]) -> None:
+        """Reads from any manager reuse the parse of an unchanged file."""
+        ConfigManager(config_path, ConfigFormat.JSON).read()
+        ConfigManager(config_path, ConfigFormat.JSON).list_servers()
+        ConfigManager(config_path, ConfigFormat.JSON).snapshot()
+
+        assert parses == [config_path]
+
+    def test_read_returns_private_copy(self, config_path: Path, parses: list[Path]) -> None:
+        """Mutating a read() result does not affect other readers."""
+        manager = ConfigManager(config_path, ConfigFormat.JSON)
+
+        config = manager.read()
+        config["mcpServers"]["existing"]["args"].append("--mutated")
+        config["mcpServers"].clear()
+
+        assert manager.snapshot()["mcpServers"]["existing"]["args"] == ["run", "existing"]
+        assert manager.read() is not manager.read()
+        assert manager.snapshot() is manager.snapshot()
+
+    def test_listed_servers_do_not_share_state(self, config_path: Path, parses: list[Path]) -> None:
+        """Server configs own their args and env."""
+        manager = ConfigManager(config_path, ConfigFormat.JSON)
+
+        manager.list_servers()[0].args.append("--mutated")
+
+        assert manager.get_server("existing").args == ["run", "existing"]
+
+    def test_external_change_reparsed(self, config_path: Path, parses: list[Path]) -> None:
+        """A file changed on disk is parsed again."""
+        manager = ConfigManager(config_path, ConfigFormat.JSON)
+        manager.read()
+
+        config_path.write_text(json.dumps({"mcpServers": {}}))
+
+        assert manager.read() == {"mcpServers": {}}
+        assert len(parses) == 2
+
+    def test_own_write_visible(self, config_path: Path, parses: list[Path]) -> None:
+        """Changes written through any manager are seen by the others."""
+        reader = ConfigManager(config_path, ConfigFormat.JSON)
+        assert [s.name for s in reader.list_servers()] == ["existing"]
+
+        ConfigManager(config_path, ConfigFormat.JSON).add_server(server("a"))
+
+        assert [s.name for s in reader.list_servers()] == ["existing", "a"]
+
+    def test_transaction_rollback_keeps_cache_intact(
+        self, config_path: Path, parses: list[Path]
+    ) -> None:
+        """Changes discarded by a failed transaction never reach the cache."""
+        manager = ConfigManager(config_path, ConfigFormat.JSON)
+
+        with pytest.raises(ValidationError), manager.transaction() as txn:
+            txn.remove_server("existing")
+            txn.remove_server("existing")
+
+        assert manager.get_server("existing") is not None
+        assert parses == [config_path]
+
+
+def _external_edit(path: Path, name: str) -> None:
+    """Add a server the way another process would (new inode)."""
+    document = json.loads(path.read_text())
+    document["mcpServers"][name] = {"command": "uvx", "args": [name]}
+    tmp = path.with_name(path.name + ".other")
+    tmp.write_text(json.dumps(document))
+    os.replace(tmp, path)
+
+
+class TestOptimisticConcurrency:
+    """Tests for compare-and-swap writes (optimistic=True)."""
+
+    def test_atomic_write_compare_and_swap(self, config_path: Path) -> None:
+        """atomic_write refuses to replace a file that changed."""
+        signature = file_signature(config_path)
+        _external_edit(config_path, "other")
+        before = config_path.read_text()
+
+        with pytest.raises(ConfigConflictError):
+            atomic_write(config_path, "{}", expected_signature=signature, require_unchanged=True)
+        assert config_path.read_text() == before
+        assert sorted(p.name for p in config_path.parent.iterdir()) == ["mcp.json"]
+
+        atomic_write(
+            config_path,
+            "{}",
+            expected_signature=file_signature(config_path),
+            require_unchanged=True,
+        )
+        assert config_path.read_text() == "{}"
+
+    def test_atomic_write_expects_missing_file(self, tmp_path: Path) -> None:
+        """A None signature means the file must still not exist."""
+        path = tmp_path / "new.json"
+        atomic_write(path, "{}", expected_signature=None, require_unchanged=True)
+        with pytest.raises(ConfigConflictError):
+            atomic_write(path, "[]", expected_signature=None, require_unchanged=True)
+
+    def test_write_after_read_detects_conflict(self, config_path: Path) -> None:
+        """write() compares against the version seen by the last read()."""
+        manager = ConfigManager(config_path, ConfigFormat.JSON, optimistic=True)
+        config = manager.read()
+        config["mcpServers"]["mine"] = {"command": "uvx"}
+        _external_edit(config_path, "theirs")
+
+        with pytest.raises(ConfigConflictError):
+            manager.write(config)
+        assert "theirs" in json.loads(config_path.read_text())["mcpServers"]
+
+        config = manager.read()
+        config["mcpServers"]["mine"] = {"command": "uvx"}
+        manager.write(config)
+        assert sorted(json.loads(config_path.read_text())["mcpServers"]) == [
+            "existing",
+            "mine",
+            "theirs",
+        ]
+
+    def test_update_retries_on_conflict(self, config_path: Path) -> None:
+        """The mutation runs again on the new content after a conflict."""
+        manager = ConfigManager(config_path, ConfigFormat.JSON, optimistic=True)
+        calls: list[int] = []
+
+        def mutate(txn: ConfigTransaction) -> str:
+            txn.add_server(server("mine"))
+            if not calls:
+                _external_edit(config_path, "theirs")  # lands before our commit
+            calls.append(1)
+            return "done"
+
+        assert manager.update(mutate) == "done"
+        assert len(calls) == 2
+        assert [s.name for s in manager.list_servers()] == ["existing", "theirs", "mine"]
+
+    def test_update_gives_up_after_max_attempts(self, config_path: Path) -> None:
+        """Persistent conflicts raise ConfigConflictError."""
+        manager = ConfigManager(config_path, ConfigFormat.JSON, optimistic=True, max_attempts=3)
+        calls: list[int] = []
+
+        def mutate(txn: ConfigTransaction) -> None:
+            txn.add_server(server(f"mine-{len(calls)}"))
+            calls.append(1)
+            _external_edit(config_path, f"theirs-{len(calls)}")
+
+        with pytest.raises(ConfigConflictError):
+            manager.update(mutate)
+        assert len(calls) == 3
+        assert not any(s.name.startswith("mine") for s in manager.list_servers())
+
+    def test_optimistic_manager_takes_no_lock(self, config_path: Path) -> None:
+        """Optimistic updates proceed while another process holds the lock."""
+        manager = ConfigManager(config_path, ConfigFormat.JSON, optimistic=True)
+        assert manager.lock is None
+
+        with FileLock.for_file(config_path, timeout=0.05):
+            manager.add_server(server("a"))
+        assert manager.get_server("a") is not None
+
+    def test_blind_write_is_not_checked(self, config_path: Path) -> None:
+        """write() without a prior read overwrites unconditionally."""
+        manager = ConfigManager(config_path, ConfigFormat.JSON, optimistic=True)
+        _external_edit(config_path, "theirs")
+
+        manager.write({"mcpServers": {}})
+        assert json.loads(config_path.read_text()) == {"mcpServers": {}}
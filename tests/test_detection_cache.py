@@ -0,0 +1,151 @@
+"""Tests for the persistent platform detection cache."""
+
+import json
+import os
+import sys
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+
+from py_mcp_installer.detection_cache import DetectionCache
+from py_mcp_installer.platform_detector import PlatformDetector
+from py_mcp_installer.types import Platform
+from py_mcp_installer.utils import clear_command_cache
+
+
+@pytest.fixture
+def home(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Iterator[Path]:
+    """Run detection against an isolated home directory, cwd and PATH."""
+    home = tmp_path / "home"
+    work = tmp_path / "work"
+    bin_dir = tmp_path / "bin"
+    for directory in (home, work, bin_dir):
+        directory.mkdir()
+    monkeypatch.setenv("HOME", str(home))
+    monkeypatch.setenv("USERPROFILE", str(home))
+    monkeypatch.setenv("PATH", str(bin_dir))
+    monkeypatch.delenv("CLAUDE_CODE_ENV", raising=False)
+    monkeypatch.delenv("AUGGIE_HOME", raising=False)
+    monkeypatch.chdir(work)
+    clear_command_cache()
+
+    cursor_dir = home / ".cursor"
+    cursor_dir.mkdir()
+    (cursor_dir / "mcp.json").write_text('{"mcpServers": {}}')
+    yield home
+    clear_command_cache()
+
+
+@pytest.fixture
+def cache(tmp_path: Path) -> DetectionCache:
+    """Detection cache stored in a temporary directory."""
+    return DetectionCache(tmp_path / "cache" / "detection.json")
+
+
+def detect_without_detectors(
+    cache: DetectionCache, monkeypatch: pytest.MonkeyPatch
+) -> dict[Platform, object]:
+    """Run detect_all, failing if any detector has to run."""
+    detector = PlatformDetector(cache=cache)
+
+    def fail() -> None:
+        raise AssertionError("detector ran despite a valid cache")
+
+    monkeypatch.setattr(detector, "_detectors", fail)
+    return dict(detector.detect_all())
+
+
+def test_cache_hit_skips_detectors(
+    home: Path, cache: DetectionCache, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """An unchanged environment is answered from the cache."""
+    first = PlatformDetector(cache=cache).detect_all()
+
+    second = detect_without_detectors(cache, monkeypatch)
+
+    assert second == first
+    assert second[Platform.CURSOR].config_path == home / ".cursor" / "mcp.json"
+
+
+def test_cache_invalidated_by_config_change(home: Path, cache: DetectionCache) -> None:
+    """Modifying a probed config file triggers a new detection."""
+    config = home / ".cursor" / "mcp.json"
+    assert PlatformDetector(cache=cache).detect().confidence == pytest.approx(0.8)
+
+    config.write_text("{broken")
+    os.utime(config, ns=(0, 0))
+
+    assert PlatformDetector(cache=cache).detect().confidence == pytest.approx(0.5)
+
+
+def test_cache_invalidated_by_new_file(home: Path, cache: DetectionCache) -> None:
+    """A config file appearing where a detector looked triggers a new detection."""
+    PlatformDetector(cache=cache).detect_all()
+
+    (home / ".codex").mkdir()
+
+    results = PlatformDetector(cache=cache).detect_all()
+    assert results[Platform.CODEX].confidence == pytest.approx(0.2)
+
+
+def test_cache_invalidated_by_environment(
+    home: Path, cache: DetectionCache, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Environment variables read by detectors are part of the signature."""
+    PlatformDetector(cache=cache).detect_all()
+
+    monkeypatch.setenv("AUGGIE_HOME", "/opt/auggie")
+
+    results = PlatformDetector(cache=cache).detect_all()
+    assert results[Platform.AUGGIE].confidence == pytest.approx(0.1)
+
+
+def test_cache_invalidated_by_new_command(
+    home: Path, cache: DetectionCache, tmp_path: Path
+) -> None:
+    """A CLI installed into a PATH directory triggers a new detection."""
+    assert not PlatformDetector(cache=cache).detect_all()[Platform.CURSOR].cli_available
+
+    cursor = tmp_path / "bin" / "cursor"
+    cursor.write_text("#!/bin/sh\n")
+    cursor.chmod(0o755)
+    os.utime(tmp_path / "bin", ns=(0, 0))
+    clear_command_cache()
+
+    assert PlatformDetector(cache=cache).detect_all()[Platform.CURSOR].cli_available
+
+
+def test_cache_entries_per_working_directory(
+    home: Path, cache: DetectionCache, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Project-level config files are re-checked in another directory."""
+    PlatformDetector(cache=cache).detect_all()
+
+    project = tmp_path / "project"
+    (project / ".gemini").mkdir(parents=True)
+    (project / ".gemini" / "settings.json").write_text("{}")
+    monkeypatch.chdir(project)
+
+    results = PlatformDetector(cache=cache).detect_all()
+    assert results[Platform.GEMINI_CLI].confidence == pytest.approx(0.9)
+
+
+@pytest.mark.parametrize("content", ["not json", '{"version": 0, "entries": {}}', "[]"])
+def test_unusable_cache_file_ignored(home: Path, cache: DetectionCache, content: str) -> None:
+    """Corrupt or outdated cache files fall back to detection and are replaced."""
+    cache.path.parent.mkdir(parents=True)
+    cache.path.write_text(content)
+
+    info = PlatformDetector(cache=cache).detect()
+
+    assert info.platform == Platform.CURSOR
+    assert json.loads(cache.path.read_text())["version"] == DetectionCache.FORMAT_VERSION
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="Windows uses LOCALAPPDATA")
+def test_default_path_uses_xdg_cache_home(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """The cache lives under $XDG_CACHE_HOME when set."""
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+
+    assert DetectionCache.default_path() == tmp_path / "py-mcp-installer" / "detection.json"
@@ -0,0 +1,159 @@
+"""Tests for FileLock and locked ConfigManager updates."""
+
+import json
+import os
+import subprocess
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from py_mcp_installer import file_lock
+from py_mcp_installer.config_manager import ConfigManager
+from py_mcp_installer.exceptions import ConfigLockError
+from py_mcp_installer.file_lock import FileLock, lock_stats, reset_lock_stats
+from py_mcp_installer.types import ConfigFormat, MCPServerConfig
+
+
+@pytest.fixture(autouse=True)
+def _fresh_stats() -> None:
+    reset_lock_stats()
+
+
+@pytest.fixture(params=["flock", "lockfile"])
+def mechanism(request: pytest.FixtureRequest, monkeypatch: pytest.MonkeyPatch) -> str:
+    """Run a test with fcntl.flock and with the exclusive-create fallback."""
+    if request.param == "flock" and file_lock.fcntl is None:
+        pytest.skip("fcntl not available")
+    if request.param == "lockfile":
+        monkeypatch.setattr(file_lock, "fcntl", None)
+    return str(request.param)
+
+
+def test_lock_excludes_other_holders(tmp_path: Path, mechanism: str) -> None:
+    path = tmp_path / "mcp.json.mcp-installer.lock"
+    with FileLock(path):
+        with pytest.raises(ConfigLockError):
+            FileLock(path, timeout=0.05).acquire()
+    FileLock(path, timeout=0.05).acquire()  # Released on exit
+
+    stats = lock_stats()
+    assert stats.timeouts == 1
+    assert stats.acquisitions == 2
+
+
+def test_lock_is_reentrant_for_its_holder(tmp_path: Path, mechanism: str) -> None:
+    lock = FileLock(tmp_path / "x.lock", timeout=0.05)
+    with lock:
+        with lock:
+            assert lock.locked
+        assert lock.locked
+        with pytest.raises(ConfigLockError):
+            FileLock(lock.path, timeout=0.05).acquire()
+    assert not lock.locked
+
+
+def test_contention_metrics(tmp_path: Path, mechanism: str) -> None:
+    path = tmp_path / "x.lock"
+    holder = FileLock(path)
+    holder.acquire()
+    releaser = threading.Timer(0.1, holder.release)
+    releaser.start()
+
+    with FileLock(path, timeout=5.0):
+        pass
+    releaser.join()
+
+    stats = lock_stats()
+    assert stats.acquisitions == 2
+    assert stats.contended == 1
+    assert stats.timeouts == 0
+    assert 0.05 < stats.max_wait <= stats.total_wait
+
+
+def test_abandoned_lockfile_is_broken(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(file_lock, "fcntl", None)
+    lock = FileLock(tmp_path / "x.lock", timeout=1.0, stale_after=30.0)
+    stale = tmp_path / "x.lck"
+    stale.write_text("12345\n")
+    old = time.time() - 120
+    os.utime(stale, (old, old))
+
+    with lock:
+        assert stale.read_text() == f"{os.getpid()}\n"
+    assert not stale.exists()
+    assert lock_stats().stale_breaks == 1
+
+
+def test_stale_lockfile_is_broken_by_one_waiter(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(file_lock, "fcntl", None)
+    lock = FileLock(tmp_path / "x.lock", stale_after=30.0)
+    other = FileLock(tmp_path / "x.lock", stale_after=30.0)
+    stale = tmp_path / "x.lck"
+    stale.write_text("12345\n")
+    old = time.time() - 120
+    os.utime(stale, (old, old))
+
+    real_time = time.time
+    interleaved: list[tuple[bool, bool]] = []
+
+    def other_breaks_first() -> float:
+        # The other waiter breaks the stale lock and takes it while this one
+        # is deciding whether the lockfile it saw is abandoned
+        monkeypatch.setattr(file_lock.time, "time", real_time)
+        interleaved.append(other._try_lockfile())
+        interleaved.append(other._try_lockfile())
+        return real_time()
+
+    monkeypatch.setattr(file_lock.time, "time", other_breaks_first)
+    first = lock._try_lockfile()
+
+    assert interleaved == [(True, True), (False, False)]
+    assert first == (False, False)
+    assert lock._try_lockfile() == (False, False)
+    assert other._fallback_path == stale and stale.exists()
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["x.lck"]
+
+
+def test_config_manager_times_out_while_locked(tmp_path: Path) -> None:
+    config_path = tmp_path / "mcp.json"
+    manager = ConfigManager(config_path, ConfigFormat.JSON, lock_timeout=0.05)
+
+    with FileLock.for_file(config_path):
+        with pytest.raises(ConfigLockError):
+            manager.add_server(MCPServerConfig(name="a", command="uvx"))
+    assert not config_path.exists()
+
+    manager.add_server(MCPServerConfig(name="a", command="uvx"))
+    assert [s.name for s in manager.list_servers()] == ["a"]
+
+
+_WORKER = """
+import sys
+from pathlib import Path
+from py_mcp_installer.config_manager import ConfigManager
+from py_mcp_installer.types import ConfigFormat, MCPServerConfig
+
+manager = ConfigManager(Path(sys.argv[1]), ConfigFormat.JSON, lock_timeout=60)
+for i in range(int(sys.argv[3])):
+    manager.add_server(MCPServerConfig(name=f"{sys.argv[2]}-{i}", command="uvx"))
+"""
+
+
+def test_parallel_processes_lose_no_updates(tmp_path: Path) -> None:
+    config_path = tmp_path / "mcp.json"
+    config_path.write_text(json.dumps({"mcpServers": {}}))
+    env = {**os.environ, "PYTHONPATH": str(Path(__file__).parents[1] / "src")}
+
+    workers = [
+        subprocess.Popen([sys.executable, "-c", _WORKER, str(config_path), f"w{n}", "10"], env=env)
+        for n in range(4)
+    ]
+    assert [w.wait(timeout=120) for w in workers] == [0] * 4
+
+    servers = json.loads(config_path.read_text())["mcpServers"]
+    assert sorted(servers) == sorted(f"w{n}-{i}" for n in range(4) for i in range(10))
@@ -0,0 +1,286 @@
+"""Tests for the MCPInstaller facade."""
+
+import json
+import sys
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from py_mcp_installer import config_manager, installation_strategy
+from py_mcp_installer.config_manager import clear_config_cache
+from py_mcp_installer.exceptions import InstallationError, ValidationError
+from py_mcp_installer.installer import MCPInstaller
+from py_mcp_installer.types import ConfigFormat, Durability, MCPServerConfig, Platform, Scope
+
+
+@pytest.fixture
+def config_path(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Windsurf config in an isolated home directory."""
+    monkeypatch.setenv("HOME", str(tmp_path))
+    monkeypatch.setenv("USERPROFILE", str(tmp_path))
+    path = tmp_path / ".codeium" / "windsurf" / "mcp_config.json"
+    path.parent.mkdir(parents=True)
+    path.write_text(json.dumps({"mcpServers": {"existing": {"command": sys.executable}}}))
+    return path
+
+
+@pytest.fixture
+def installer(config_path: Path) -> MCPInstaller:
+    """Installer using the JSON strategy on the isolated Windsurf config."""
+    return MCPInstaller(platform=Platform.WINDSURF, use_cache=False)
+
+
+def server(name: str) -> MCPServerConfig:
+    """Server config whose command exists on this machine."""
+    return MCPServerConfig(name=name, command=sys.executable, args=["-m", name])
+
+
+def servers_in(config_path: Path) -> list[str]:
+    """Server names in the config file."""
+    return list(json.loads(config_path.read_text())["mcpServers"])
+
+
+class TestBatchInstall:
+    """Tests for install_servers() and uninstall_servers()."""
+
+    def test_install_servers(self, installer: MCPInstaller, config_path: Path) -> None:
+        """Servers are installed and reported in input order."""
+        results = installer.install_servers([server("b"), server("a")])
+
+        assert [r.server_name for r in results] == ["b", "a"]
+        assert all(r.success for r in results)
+        assert servers_in(config_path) == ["existing", "b", "a"]
+
+    def test_install_servers_single_write(
+        self, installer: MCPInstaller, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """The batch is applied with one config write, not one per server."""
+        strategy = installer._strategy
+        assert isinstance(strategy, installation_strategy.JSONManipulationStrategy)
+        writes: list[Path] = []
+        real_atomic_write = config_manager.atomic_write
+
+        def record(path: Path, content: str, **kwargs: Any) -> None:
+            writes.append(path)
+            real_atomic_write(path, content, **kwargs)
+
+        monkeypatch.setattr(config_manager, "atomic_write", record)
+
+        installer.install_servers([server(f"s{i}") for i in range(10)])
+
+        assert writes == [strategy.config_path]
+
+    def test_existing_server_requires_force(
+        self, installer: MCPInstaller, config_path: Path
+    ) -> None:
+        """Existing servers abort the batch unless force=True."""
+        with pytest.raises(InstallationError, match="already exist: existing"):
+            installer.install_servers([server("new"), server("existing")])
+        assert servers_in(config_path) == ["existing"]
+
+        results = installer.install_servers([server("new"), server("existing")], force=True)
+
+        assert "updated" in results[1].message
+        assert json.loads(config_path.read_text())["mcpServers"]["existing"]["args"] == [
+            "-m",
+            "existing",
+        ]
+
+    def test_validation_happens_before_writing(
+        self, installer: MCPInstaller, config_path: Path
+    ) -> None:
+        """Invalid servers are reported together and nothing is written."""
+        before = config_path.read_text()
+        bad = MCPServerConfig(name="bad", command="definitely-not-a-command-xyz")
+
+        with pytest.raises(ValidationError) as exc_info:
+            installer.install_servers([server("a"), bad, server("a")])
+
+        assert "Command not found" in exc_info.value.message
+        assert "'a' listed more than once" in exc_info.value.message
+        assert config_path.read_text() == before
+
+    def test_dry_run(self, config_path: Path) -> None:
+        """Dry run validates and reports without writing."""
+        installer = MCPInstaller(platform=Platform.WINDSURF, dry_run=True, use_cache=False)
+        before = config_path.read_text()
+
+        results = installer.install_servers([server("a")])
+
+        assert results[0].message == "[DRY RUN] Would install a"
+        assert config_path.read_text() == before
+
+    def test_uninstall_servers(self, installer: MCPInstaller, config_path: Path) -> None:
+        """Servers are removed in one operation; missing names remove nothing."""
+        installer.install_servers([server("a"), server("b")])
+
+        with pytest.raises(InstallationError, match="ghost"):
+            installer.uninstall_servers(["a", "ghost"])
+        assert servers_in(config_path) == ["existing", "a", "b"]
+
+        results = installer.uninstall_servers(["a", "existing"])
+
+        assert [r.server_name for r in results] == ["a", "existing"]
+        assert servers_in(config_path) == ["b"]
+
+    def test_toml_batch_single_write(self, tmp_path: Path) -> None:
+        """The TOML strategy shares the one-write batch implementation."""
+        path = tmp_path / "config.toml"
+        strategy = installation_strategy.TOMLManipulationStrategy(Platform.CODEX, path)
+        assert isinstance(strategy, installation_strategy.ConfigFileStrategy)
+
+        results = strategy.install_many([server("a"), server("b")], Scope.GLOBAL)
+        assert [r.server_name for r in results] == ["a", "b"]
+        assert [s.name for s in strategy.list_servers(Scope.GLOBAL)] == ["a", "b"]
+
+        with pytest.raises(InstallationError, match="ghost"):
+            strategy.uninstall_many(["a", "ghost"], Scope.GLOBAL)
+        strategy.uninstall_many(["a"], Scope.GLOBAL)
+        assert [s.name for s in strategy.list_servers(Scope.GLOBAL)] == ["b"]
+
+
+class TestFixIssues:
+    """Tests for fix_issues()."""
+
+    def test_fixes_share_one_write(
+        self,
+        installer: MCPInstaller,
+        config_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Several auto-fixes are applied with a single config write."""
+        config_path.write_text(
+            json.dumps(
+                {
+                    "mcpServers": {
+                        name: {"command": sys.executable, "args": ["serve", "--legacy-mode"]}
+                        for name in ("a", "b", "c")
+                    }
+                }
+            )
+        )
+        writes: list[Path] = []
+        real_atomic_write = config_manager.atomic_write
+        monkeypatch.setattr(
+            config_manager,
+            "atomic_write",
+            lambda path, content, **kwargs: (
+                writes.append(path),
+                real_atomic_write(path, content, **kwargs),
+            ),
+        )
+
+        fixes = installer.fix_issues()
+
+        assert len(fixes) == 3
+        assert writes == [config_path]
+        servers = json.loads(config_path.read_text())["mcpServers"]
+        assert all(entry["args"] == ["serve"] for entry in servers.values())
+
+
+def test_install_server_parses_config_once(
+    installer: MCPInstaller, config_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """The existence check and the install share one parse of the config."""
+    clear_config_cache()
+    parses: list[Path] = []
+    real_parse = config_manager.parse_json_safe
+    monkeypatch.setattr(
+        config_manager,
+        "parse_json_safe",
+        lambda path: (parses.append(path), real_parse(path))[1],
+    )
+
+    installer.install_server(name="a", command=sys.executable, args=["-m", "a"])
+
+    assert parses == [config_path]
+    assert servers_in(config_path) == ["existing", "a"]
+
+
+def test_get_server_without_listing(
+    installer: MCPInstaller, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """get_server() is an indexed lookup, not a scan of list_servers()."""
+    monkeypatch.setattr(installer, "list_servers", None)  # Must not be called
+
+    existing = installer.get_server("existing")
+
+    assert existing is not None and existing.command == sys.executable
+    assert installer.get_server("absent") is None
+
+
+def test_toml_get_server(tmp_path: Path) -> None:
+    """The TOML strategy looks servers up through the shared index."""
+    strategy = installation_strategy.TOMLManipulationStrategy(
+        Platform.CODEX, tmp_path / "config.toml"
+    )
+    strategy.install(server("a"), Scope.GLOBAL)
+
+    found = strategy.get_server("a", Scope.GLOBAL)
+
+    assert found is not None and found.args == ["-m", "a"]
+    assert strategy.get_server("absent", Scope.GLOBAL) is None
+
+
+def test_durability_reaches_config_writes(
+    config_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """MCPInstaller(durability=...) applies to every config file write."""
+    durabilities: list[Durability] = []
+    real_atomic_write = config_manager.atomic_write
+
+    def record(path: Path, content: str, **kwargs: Any) -> None:
+        durabilities.append(kwargs["durability"])
+        real_atomic_write(path, content, **kwargs)
+
+    monkeypatch.setattr(config_manager, "atomic_write", record)
+    installer = MCPInstaller(
+        platform=Platform.WINDSURF, use_cache=False, durability=Durability.NONE
+    )
+
+    installer.install_server(name="a", command=sys.executable, args=["-m", "a"])
+    installer.uninstall_server("a")
+
+    assert durabilities == [Durability.NONE, Durability.NONE]
+
+
+def test_strategy_install_retries_conflicts(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Single installs go through ConfigManager.update() and retry conflicts."""
+    path = tmp_path / "mcp.json"
+    path.write_text(json.dumps({"mcpServers": {}}))
+    strategy = installation_strategy.JSONManipulationStrategy(Platform.CURSOR, path)
+    strategy.config_manager = config_manager.ConfigManager(path, ConfigFormat.JSON, optimistic=True)
+    real_add_server = config_manager.ConfigTransaction.add_server
+    attempts: list[str] = []
+
+    def add_server(txn: config_manager.ConfigTransaction, new: MCPServerConfig) -> None:
+        real_add_server(txn, new)
+        if not attempts:  # Another process writes before this commit
+            path.write_text(json.dumps({"mcpServers": {"theirs": {"command": "uvx"}}}))
+        attempts.append(new.name)
+
+    monkeypatch.setattr(config_manager.ConfigTransaction, "add_server", add_server)
+
+    strategy.install(server("mine"), Scope.GLOBAL)
+
+    assert attempts == ["mine", "mine"]
+    assert servers_in(path) == ["theirs", "mine"]
+
+
+@pytest.mark.parametrize("use_cache", [False, True])
+def test_detection_cache_opt_in(
+    config_path: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch, use_cache: bool
+) -> None:
+    """Library callers only touch the detection cache when they ask for it."""
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+    monkeypatch.setenv("LOCALAPPDATA", str(tmp_path / "cache"))
+
+    if use_cache:
+        MCPInstaller(platform=Platform.WINDSURF, use_cache=True)
+    else:
+        MCPInstaller(platform=Platform.WINDSURF)
+
+    assert (tmp_path / "cache" / "py-mcp-installer" / "detection.json").exists() is use_cache
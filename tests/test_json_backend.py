@@ -0,0 +1,79 @@
+"""Tests for the pluggable JSON backends."""
+
+import json
+import math
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+
+from py_mcp_installer.config_manager import ConfigManager
+from py_mcp_installer.json_backend import (
+    JsonBackend,
+    available_json_backends,
+    get_json_backend,
+    set_json_backend,
+)
+from py_mcp_installer.types import ConfigFormat, MCPServerConfig
+from py_mcp_installer.utils import parse_json_safe
+
+CONFIG = {
+    "numStartups": 12,
+    "projects": {f"/repo/{i}": {"history": ["x"] * 3, "cost": 0.25, "ok": True} for i in range(3)},
+    "mcpServers": {"a": {"command": "uvx", "args": ["a"], "env": {}}},
+    "empty": [],
+    "none": None,
+}
+
+
+@pytest.fixture(params=available_json_backends())
+def backend(request: pytest.FixtureRequest) -> Iterator[JsonBackend]:
+    """Run a test once per installed backend."""
+    yield set_json_backend(request.param)
+    set_json_backend(None)
+
+
+def test_stdlib_is_always_available() -> None:
+    assert available_json_backends()[-1] == "json"
+    assert get_json_backend().name == available_json_backends()[0]
+
+
+def test_unknown_backend_rejected() -> None:
+    with pytest.raises(ValueError):
+        set_json_backend("simdjson")
+
+
+@pytest.mark.parametrize("document", [CONFIG, {"note": "café ✓", "mcpServers": {}}])
+def test_output_matches_stdlib(backend: JsonBackend, document: dict) -> None:
+    data = backend.dumps(document)
+
+    assert data == (json.dumps(document, indent=2) + "\n").encode()
+    assert backend.loads(data) == document
+    assert backend.loads(memoryview(data)) == document
+    assert backend.loads(data.decode()) == document
+
+
+def test_documents_outside_fast_path(backend: JsonBackend) -> None:
+    """What a fast backend rejects is handled by the stdlib."""
+    parsed = backend.loads(b'{"limit": NaN, "big": 123456789012345678901234567890}')
+    assert math.isnan(parsed["limit"])
+    assert parsed["big"] == 123456789012345678901234567890
+
+    assert backend.loads(backend.dumps({"big": 2**70})) == {"big": 2**70}
+    with pytest.raises(json.JSONDecodeError):
+        backend.loads(b'{"mcpServers": ')
+
+
+def test_config_manager_round_trip(backend: JsonBackend, tmp_path: Path) -> None:
+    path = tmp_path / "config.json"
+    path.write_text("  \n")
+    assert parse_json_safe(path) == {}
+
+    manager = ConfigManager(path, ConfigFormat.JSON)
+    manager.write(CONFIG)
+    manager.add_server(MCPServerConfig(name="b", command="uvx", args=["b"]))
+
+    servers = {**CONFIG["mcpServers"], "b": {"command": "uvx", "args": ["b"]}}
+    expected = {**CONFIG, "mcpServers": servers}
+    assert parse_json_safe(path) == expected
+    assert path.read_text() == json.dumps(expected, indent=2) + "\n"
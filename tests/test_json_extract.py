@@ -0,0 +1,173 @@
+"""Tests for extracting top-level members of JSON documents."""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from py_mcp_installer import config_manager, utils
+from py_mcp_installer.config_manager import ConfigManager, clear_config_cache
+from py_mcp_installer.exceptions import ConfigurationError
+from py_mcp_installer.json_extract import classify_json_document, extract_json_members
+from py_mcp_installer.types import ConfigFormat, ConfigLayout, MCPServerConfig
+
+HOST_CONFIG = """{
+    "numStartups": 12,
+    "projects": {"/app": {"mcpServers": {"nested": {}}, "history": [{"a": [1, {}]}, "]}"]}},
+    "mcpServers": {"existing": {"command": "uv", "args": ["run", "caf\\u00e9"]}},
+    "tipsHistory": [1, 2,   3]
+}
+"""
+
+
+class TestExtractJsonMembers:
+    """Tests for extract_json_members()."""
+
+    def test_matches_full_parse(self) -> None:
+        expected = json.loads(HOST_CONFIG)
+
+        members = extract_json_members(HOST_CONFIG, ["mcpServers", "tipsHistory", "absent"])
+
+        assert members == {
+            "mcpServers": expected["mcpServers"],
+            "tipsHistory": expected["tipsHistory"],
+        }
+
+    def test_only_top_level_members(self) -> None:
+        text = '{"projects": {"mcpServers": {"nested": {}}}}'
+        assert extract_json_members(text, ["mcpServers"]) == {}
+
+    def test_duplicate_key_last_value_wins(self) -> None:
+        text = '{"a": 1, "b": 2, "a": 3}'
+        assert extract_json_members(text, ["a", "b"]) == json.loads(text)
+
+    @pytest.mark.parametrize("text", ["", "  \n", "{}", "{ }\n"])
+    def test_empty_documents(self, text: str) -> None:
+        assert extract_json_members(text, ["mcpServers"]) == {}
+
+    @pytest.mark.parametrize(
+        "text",
+        [
+            "[]",
+            '{"a": 1',
+            '{"a": 1,}',
+            '{"a" 1}',
+            '{"a": 1} x',
+            '{"skipped": {"x": [1, 2}, "mcpServers": {}}',
+            '{"skipped": "unterminated, "mcpServers": {}}',
+        ],
+    )
+    def test_malformed_documents_rejected(self, text: str) -> None:
+        with pytest.raises(json.JSONDecodeError):
+            extract_json_members(text, ["mcpServers"])
+
+
+def _large_host_config(path: Path) -> None:
+    path.write_text(
+        json.dumps(
+            {
+                "projects": {f"/repo/{i}": {"history": ["x" * 40] * 10} for i in range(100)},
+                "mcpServers": {"a": {"command": "uvx", "args": ["a"]}},
+            },
+            indent=2,
+        )
+    )
+
+
+class TestConfigManagerReads:
+    """Server listing of large JSON configs builds only the servers section."""
+
+    @pytest.fixture(autouse=True)
+    def small_threshold(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(config_manager, "STREAMING_READ_THRESHOLD", 1024)
+        clear_config_cache()
+
+    def test_list_servers_without_full_parse(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        path = tmp_path / ".claude.json"
+        _large_host_config(path)
+        manager = ConfigManager(path, ConfigFormat.JSON)
+        extractions = []
+        real_parse = config_manager.parse_json_members_safe
+
+        def counting_parse(*args: object) -> dict:
+            extractions.append(args)
+            return real_parse(*args)  # type: ignore[arg-type]
+
+        monkeypatch.setattr(config_manager, "parse_json_members_safe", counting_parse)
+        monkeypatch.setattr(config_manager, "parse_json_safe", None)  # Must not be called
+
+        assert [s.name for s in manager.list_servers()] == ["a"]
+        assert manager.get_server("a") is not None
+        assert len(extractions) == 1  # Cached by file signature
+
+        monkeypatch.setattr(config_manager, "parse_json_safe", utils.parse_json_safe)
+        manager.snapshot()
+        assert manager.get_server("b") is None
+        assert len(extractions) == 1  # Served from the full parse
+
+    def test_invalid_large_file_raises(self, tmp_path: Path) -> None:
+        path = tmp_path / ".claude.json"
+        _large_host_config(path)
+        path.write_text(path.read_text()[:-5])
+
+        with pytest.raises(ConfigurationError):
+            ConfigManager(path, ConfigFormat.JSON).list_servers()
+        assert not utils.json_config_looks_valid(path)
+
+    def test_sees_file_changes(self, tmp_path: Path) -> None:
+        path = tmp_path / ".claude.json"
+        _large_host_config(path)
+        manager = ConfigManager(path, ConfigFormat.JSON)
+        assert len(manager.list_servers()) == 1
+
+        with manager.transaction() as txn:
+            txn.add_server(MCPServerConfig(name="b", command="uvx"))
+            assert len(manager.list_servers()) == 2  # Pending configuration
+
+        assert [s.name for s in manager.list_servers()] == ["a", "b"]
+
+
+class TestClassifyJsonDocument:
+    """Tests for classify_json_document()."""
+
+    def test_modern_document(self) -> None:
+        scan = classify_json_document(HOST_CONFIG, ["mcpServers"])
+
+        assert scan.layout == ConfigLayout.MODERN
+        assert scan.members == {"mcpServers": json.loads(HOST_CONFIG)["mcpServers"]}
+
+    @pytest.mark.parametrize("text", ["", " \n"])
+    def test_blank_document_is_modern(self, text: str) -> None:
+        assert classify_json_document(text, ["mcpServers"]).layout == ConfigLayout.MODERN
+
+    def test_legacy_document(self) -> None:
+        text = '{"name": "a", "command": "uvx"}\n\n  {"name": "b"}\r\n[1]\n'
+
+        scan = classify_json_document(text, ["mcpServers"])
+
+        assert scan.layout == ConfigLayout.LEGACY
+        assert scan.entries == [{"name": "a", "command": "uvx"}, {"name": "b"}, [1]]
+
+    @pytest.mark.parametrize(
+        "text",
+        [
+            "[]",
+            '{"a": 1',
+            '{"a": 1} {"b": 2}',
+            '{"a": 1}\n{"b": ',
+            '{"a": 1}\n{"b": 2} x',
+            '{\n  "a": 1\n}\n{"b": 2}',
+            '{"a": 1}\n{\n  "b": 2\n}',
+        ],
+    )
+    def test_corrupt_documents(self, text: str) -> None:
+        scan = classify_json_document(text, ["mcpServers"])
+
+        assert scan.layout == ConfigLayout.CORRUPT
+        assert scan.error
+        if text != "[]":
+            with pytest.raises(json.JSONDecodeError) as excinfo:
+                json.loads(text)
+            assert scan.error == str(excinfo.value)
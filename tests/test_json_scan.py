@@ -0,0 +1,30 @@
+"""Tests for the shared top-level JSON member walker."""
+
+import json
+
+import pytest
+
+from py_mcp_installer.json_scan import scan_json_object
+
+TEXT = '  {"a": {"x": [1]}, "b" : "two", "a": 3}  '
+
+
+def test_spans_and_selected_values() -> None:
+    """Every member is located; only selected values are built."""
+    members, end = scan_json_object(TEXT, 2, {"b"}.__contains__)
+
+    assert [m.name for m in members] == ["a", "b", "a"]
+    assert members[0].value is None  # Validated, not kept
+    assert members[1].value == "two"
+    assert [TEXT[m.value_start : m.value_end] for m in members] == ['{"x": [1]}', '"two"', "3"]
+    assert TEXT[end:] == "  "
+
+
+@pytest.mark.parametrize(
+    "text",
+    ["[1]", "{", '{"a" 1}', '{"a": 1 "b": 2}', '{"a": [1,}', "{'a': 1}", '{"a": 1,}'],
+)
+def test_rejects_what_json_loads_rejects(text: str) -> None:
+    """Malformed objects raise json.JSONDecodeError."""
+    with pytest.raises(json.JSONDecodeError):
+        scan_json_object(text, 0, lambda name: True)
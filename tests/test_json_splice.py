@@ -0,0 +1,184 @@
+"""Tests for layout-preserving JSON member splicing."""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from py_mcp_installer import json_scan
+from py_mcp_installer.config_manager import ConfigManager
+from py_mcp_installer.json_splice import replace_json_member, splice_json_member
+from py_mcp_installer.types import ConfigFormat, MCPServerConfig
+
+# Unusual but valid layout: 4-space indent, inline arrays, unicode, escapes
+HOST_CONFIG = """{
+    "numStartups": 12,
+    "projects": {"/home/user/app": {"history": ["a", "b"], "note": "caf\\u00e9 \\"q\\""}},
+    "mcpServers": {"existing": {"command": "uv", "args": ["run", "existing"]}},
+    "tipsHistory": [1, 2,   3]
+}
+"""
+
+
+def updated(text: str, **servers: dict) -> dict:
+    """Parse text and replace its mcpServers section."""
+    config = json.loads(text)
+    config["mcpServers"] = servers
+    return config
+
+
+class TestSpliceJsonMember:
+    """Tests for splice_json_member()."""
+
+    def test_only_member_value_changes(self) -> None:
+        """Bytes before and after the member value are preserved."""
+        config = updated(HOST_CONFIG, new={"command": "uvx", "args": []})
+
+        result = splice_json_member(HOST_CONFIG, config, "mcpServers")
+
+        assert result is not None
+        assert json.loads(result) == config
+        prefix = HOST_CONFIG[: HOST_CONFIG.index('"mcpServers": ') + 14]
+        suffix = HOST_CONFIG[HOST_CONFIG.index(',\n    "tipsHistory"') :]
+        assert result.startswith(prefix)
+        assert result.endswith(suffix)
+
+    def test_value_uses_file_indentation(self) -> None:
+        """The new value is indented one level with the file's unit."""
+        config = updated(HOST_CONFIG, new={"command": "uvx"})
+
+        result = splice_json_member(HOST_CONFIG, config, "mcpServers")
+
+        assert result is not None
+        assert '    "mcpServers": {\n        "new": {\n            "command": "uvx"\n' in result
+
+    def test_missing_member_is_appended(self) -> None:
+        """A new member is added after the last one."""
+        text = '{\n\t"a": 1\n}\n'
+
+        result = splice_json_member(text, {"a": 1, "mcpServers": {}}, "mcpServers")
+
+        assert result == '{\n\t"a": 1,\n\t"mcpServers": {}\n}\n'
+
+    def test_compact_document(self) -> None:
+        """Single-line documents stay compact."""
+        text = '{"a":1,"mcpServers":{}}'
+
+        result = splice_json_member(text, {"a": 1, "mcpServers": {"s": [1]}}, "mcpServers")
+
+        assert result == '{"a":1,"mcpServers":{"s":[1]}}'
+
+    def test_unchanged_returns_text(self) -> None:
+        """An unchanged document is returned as is."""
+        assert splice_json_member(HOST_CONFIG, json.loads(HOST_CONFIG), "mcpServers") == (
+            HOST_CONFIG
+        )
+
+    @pytest.mark.parametrize(
+        ("text", "config"),
+        [
+            # Another member changed
+            ('{"a": 1, "mcpServers": {}}', {"a": 2, "mcpServers": {"s": {}}}),
+            # Member order changed
+            ('{"a": 1, "mcpServers": {}}', {"mcpServers": {"s": {}}, "a": 1}),
+            # Member removed
+            ('{"a": 1, "mcpServers": {}}', {"a": 1}),
+            # Duplicate keys
+            ('{"mcpServers": {}, "mcpServers": {}}', {"mcpServers": {"s": {}}}),
+            # Empty object (no layout to follow)
+            ("{}", {"mcpServers": {}}),
+            # Not an object / malformed / trailing data
+            ("[1, 2]", {"mcpServers": {}}),
+            ('{"a": 1, "mcpServers": {', {"a": 1, "mcpServers": {}}),
+            ('{"mcpServers": {}} {}', {"mcpServers": {"s": {}}}),
+        ],
+    )
+    def test_falls_back(self, text: str, config: dict) -> None:
+        """Changes that cannot be spliced safely return None."""
+        assert splice_json_member(text, config, "mcpServers") is None
+
+
+class TestReplaceJsonMember:
+    """Tests for replace_json_member()."""
+
+    def test_replaces_and_appends(self) -> None:
+        """The member value is replaced in place, or appended if missing."""
+        assert replace_json_member(HOST_CONFIG, "mcpServers", {}) == HOST_CONFIG.replace(
+            '{"existing": {"command": "uv", "args": ["run", "existing"]}}', "{}"
+        )
+        assert replace_json_member('{"a": 1}', "s", {"x": 1}) == '{"a": 1,"s":{"x":1}}'
+
+    @pytest.mark.parametrize(
+        "text",
+        ['{"s": {}, "s": {}}', "{}", "[1, 2]", '{"a": 1, "s": {', '{"s": {}} {}'],
+    )
+    def test_falls_back(self, text: str) -> None:
+        """Documents that cannot be patched safely return None."""
+        assert replace_json_member(text, "s", {"x": 1}) is None
+
+
+class TestConfigManagerWrites:
+    """ConfigManager uses splicing for JSON configs."""
+
+    def test_add_server_preserves_layout(self, tmp_path: Path) -> None:
+        """Adding a server leaves the rest of a host config untouched."""
+        path = tmp_path / ".claude.json"
+        path.write_text(HOST_CONFIG)
+        manager = ConfigManager(path, ConfigFormat.JSON)
+
+        manager.add_server(MCPServerConfig(name="new", command="uvx", args=["new"]))
+
+        content = path.read_text()
+        assert '"projects": {"/home/user/app": {"history": ["a", "b"]' in content
+        assert '"tipsHistory": [1, 2,   3]' in content
+        assert [s.name for s in manager.list_servers()] == ["existing", "new"]
+
+    def test_other_changes_rewrite_document(self, tmp_path: Path) -> None:
+        """Changes outside the servers section fall back to full serialization."""
+        path = tmp_path / ".claude.json"
+        path.write_text(HOST_CONFIG)
+        manager = ConfigManager(path, ConfigFormat.JSON)
+
+        config = manager.read()
+        config["numStartups"] = 13
+        manager.write(config)
+
+        assert json.loads(path.read_text()) == config
+        assert path.read_text() == json.dumps(config, indent=2) + "\n"
+
+    def test_transaction_write_does_not_parse_file(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Server changes are spliced using the already parsed document."""
+        path = tmp_path / ".claude.json"
+        path.write_text(HOST_CONFIG)
+        manager = ConfigManager(path, ConfigFormat.JSON)
+        manager.list_servers()  # Parse and cache the document
+
+        def fail(*args: object) -> None:
+            raise AssertionError("member values decoded")
+
+        monkeypatch.setattr(json_scan._DECODER, "raw_decode", fail)
+        with manager.transaction() as txn:
+            txn.add_server(MCPServerConfig(name="new", command="uvx", args=["new"]))
+            txn.remove_server("existing")
+
+        content = path.read_text()
+        assert '"projects": {"/home/user/app": {"history": ["a", "b"]' in content
+        assert json.loads(content)["mcpServers"] == {"new": {"command": "uvx", "args": ["new"]}}
+
+    def test_marked_changes_are_compared(self, tmp_path: Path) -> None:
+        """Direct edits splice only if no other member changed."""
+        path = tmp_path / ".claude.json"
+        path.write_text(HOST_CONFIG)
+        manager = ConfigManager(path, ConfigFormat.JSON)
+
+        with manager.transaction() as txn:
+            txn.servers["direct"] = {"command": "uvx", "args": []}
+            txn.mark_changed()
+        assert '"tipsHistory": [1, 2,   3]' in path.read_text()
+
+        with manager.transaction() as txn:
+            txn.config["numStartups"] = 13
+            txn.mark_changed()
+        assert path.read_text() == json.dumps(txn.config, indent=2) + "\n"
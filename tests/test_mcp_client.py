@@ -0,0 +1,126 @@
+"""Unit tests for the asyncio MCP stdio client."""
+
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+from py_mcp_installer.mcp_client import MCPStdioClient
+
+FAKE_SERVER = str(Path(__file__).parent / "fake_mcp_server.py")
+
+
+def make_client(mode: str, *extra_args: str, timeout: float = 5.0) -> MCPStdioClient:
+    """Create a client for the fake stdio MCP server."""
+    return MCPStdioClient(sys.executable, [FAKE_SERVER, mode, *extra_args], request_timeout=timeout)
+
+
+class TestMCPStdioClient:
+    """Tests for MCPStdioClient."""
+
+    def test_request_matches_response(self) -> None:
+        """Responses are returned for the request with the same id."""
+
+        async def run() -> dict:
+            async with make_client("healthy") as client:
+                await client.request("initialize", {})
+                return await client.request("tools/list")
+
+        response = asyncio.run(run())
+        assert response["result"]["tools"][0]["name"] == "tool1"
+
+    def test_concurrent_requests(self) -> None:
+        """Several requests can be in flight on one client."""
+
+        async def run() -> list[dict]:
+            async with make_client("healthy") as client:
+                await client.request("initialize", {})
+                return await asyncio.gather(
+                    client.request("tools/list"),
+                    client.request("resources/list"),
+                    client.request("prompts/list"),
+                )
+
+        tools, resources, prompts = asyncio.run(run())
+        assert "tools" in tools["result"]
+        assert "resources" in resources["result"]
+        assert "prompts" in prompts["result"]
+
+    def test_error_response(self) -> None:
+        """JSON-RPC errors are returned, not raised."""
+
+        async def run() -> dict:
+            async with make_client("healthy") as client:
+                return await client.request("unknown/method")
+
+        response = asyncio.run(run())
+        assert response["error"]["code"] == -32601
+
+    def test_deadline(self) -> None:
+        """A request with no response raises TimeoutError at its deadline."""
+
+        async def run() -> None:
+            async with make_client("hang") as client:
+                await client.request("initialize", {}, timeout=0.2)
+
+        with pytest.raises(TimeoutError):
+            asyncio.run(run())
+
+    def test_server_exit_fails_pending(self) -> None:
+        """Pending requests fail with the exit code and stderr tail."""
+
+        async def run() -> None:
+            async with make_client("exit") as client:
+                await client.request("initialize", {})
+
+        with pytest.raises(ConnectionError, match="missing API key"):
+            asyncio.run(run())
+
+    def test_stderr_is_drained(self) -> None:
+        """A flood of stderr output is drained and the tail kept."""
+
+        async def run() -> str:
+            async with make_client("noisy") as client:
+                await client.request("initialize", {})
+                return client.stderr_tail
+
+        tail = asyncio.run(run())
+        assert "debug line 19999" in tail
+        assert len(tail.splitlines()) == MCPStdioClient.STDERR_TAIL_LINES
+
+    def test_close_stops_process(self) -> None:
+        """Closing the client stops the server process."""
+
+        async def run() -> int | None:
+            client = make_client("hang")
+            await client.start()
+            await client.close(grace=0.5)
+            return client.returncode
+
+        assert asyncio.run(run()) is not None
+
+    def test_first_byte_before_full_line(self) -> None:
+        """first_byte_ms is taken on the first output, not the first full line."""
+        script = (
+            "import json, sys, time\n"
+            "request = json.loads(sys.stdin.readline())\n"
+            "response = json.dumps({'jsonrpc': '2.0', 'id': request['id'], 'result': {}})\n"
+            "sys.stdout.write(response[:1])\n"
+            "sys.stdout.flush()\n"
+            "time.sleep(0.5)\n"
+            "print(response[1:], flush=True)\n"
+        )
+
+        async def run() -> tuple[float | None, float]:
+            client = MCPStdioClient(sys.executable, ["-c", script], request_timeout=5.0)
+            started = time.perf_counter()
+            async with client:
+                response = await client.request("initialize", {})
+                assert response["result"] == {}
+                return client.first_byte_ms, (time.perf_counter() - started) * 1000
+
+        first_byte_ms, total_ms = asyncio.run(run())
+        assert first_byte_ms is not None
+        assert first_byte_ms <= total_ms - 400
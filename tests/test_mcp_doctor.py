@@ -1,7 +1,9 @@
 """Unit tests for MCPDoctor diagnostic module."""
 
-import json
-import subprocess
+import sys
+import threading
+import time
+from dataclasses import replace
 from datetime import datetime
 from pathlib import Path
 from typing import Any
@@ -12,7 +14,9 @@ import pytest
 from py_mcp_installer.mcp_doctor import (
     DiagnosticIssue,
     DiagnosticReport,
+    LatencyStats,
     MCPDoctor,
+    ServerBenchmark,
     ServerDiagnostic,
 )
 from py_mcp_installer.types import (
@@ -29,6 +33,17 @@ from py_mcp_installer.types import (
 # Fixtures
 # ============================================================================
 
+FAKE_SERVER = str(Path(__file__).parent / "fake_mcp_server.py")
+
+
+def fake_server(mode: str, *extra_args: str) -> MCPServerConfig:
+    """Build a server config that runs the fake stdio MCP server."""
+    return MCPServerConfig(
+        name=f"fake-{mode}",
+        command=sys.executable,
+        args=[FAKE_SERVER, mode, *extra_args],
+    )
+
 
 @pytest.fixture
 def mock_platform_info() -> PlatformInfo:
@@ -331,6 +346,9 @@ class TestDiagnosticReport:
             status=ServerStatus.HEALTHY,
             response_time_ms=50.0,
             tool_count=3,
+            first_byte_ms=30.0,
+            initialize_ms=28.0,
+            method_times_ms={"tools/list": 4.0},
         )
 
         report = DiagnosticReport(
@@ -355,6 +373,11 @@ class TestDiagnosticReport:
         assert d["issues"][0]["severity"] == "critical"
         assert "test-server" in d["server_reports"]
         assert d["server_reports"]["test-server"]["status"] == "healthy"
+        assert d["server_reports"]["test-server"]["first_byte_ms"] == 30.0
+        assert d["server_reports"]["test-server"]["initialize_ms"] == 28.0
+        assert d["server_reports"]["test-server"]["method_times_ms"] == {
+            "tools/list": 4.0
+        }
 
 
 # ============================================================================
@@ -464,7 +487,7 @@ class TestMCPDoctor:
     ) -> None:
         """Test config check with valid config containing servers."""
         mock_manager = MagicMock()
-        mock_manager.read.return_value = mock_config_content
+        mock_manager.snapshot_members.return_value = mock_config_content
         mock_config_manager.return_value = mock_manager
 
         with patch.object(Path, "exists", return_value=True):
@@ -481,7 +504,7 @@ class TestMCPDoctor:
     ) -> None:
         """Test config check with valid config but no servers."""
         mock_manager = MagicMock()
-        mock_manager.read.return_value = {"other_key": "value"}
+        mock_manager.snapshot_members.return_value = {}  # Config without servers
         mock_config_manager.return_value = mock_manager
 
         with patch.object(Path, "exists", return_value=True):
@@ -605,7 +628,7 @@ class TestMCPDoctor:
     ) -> None:
         """Test quick diagnose (no server tests)."""
         mock_manager = MagicMock()
-        mock_manager.read.return_value = mock_config_content
+        mock_manager.snapshot_members.return_value = mock_config_content
         doctor.config_manager = mock_manager
 
         with patch(
@@ -646,104 +669,18 @@ class TestMCPDoctor:
 class TestServerProtocolTests:
     """Tests for MCP server JSON-RPC protocol testing."""
 
-    @patch("select.select")
-    @patch("subprocess.Popen")
-    @patch("py_mcp_installer.mcp_doctor.resolve_command_path")
-    def test_test_server_healthy(
-        self,
-        mock_resolve: MagicMock,
-        mock_popen: MagicMock,
-        mock_select: MagicMock,
-        doctor: MCPDoctor,
-    ) -> None:
+    def test_test_server_healthy(self, doctor: MCPDoctor) -> None:
         """Test server testing with healthy response."""
-        mock_resolve.return_value = "/usr/bin/test"
-
-        # Mock subprocess
-        mock_process = MagicMock()
-        mock_process.poll.return_value = None
-        mock_process.returncode = None
-
-        # Mock JSON-RPC responses
-        init_response = (
-            json.dumps(
-                {
-                    "jsonrpc": "2.0",
-                    "id": 1,
-                    "result": {
-                        "protocolVersion": "2024-11-05",
-                        "capabilities": {
-                            "tools": {},
-                            "resources": {},
-                            "prompts": {},
-                        },
-                        "serverInfo": {"name": "test", "version": "1.0"},
-                    },
-                }
-            )
-            + "\n"
-        )
-
-        tools_response = (
-            json.dumps(
-                {
-                    "jsonrpc": "2.0",
-                    "id": 2,
-                    "result": {"tools": [{"name": "tool1"}, {"name": "tool2"}]},
-                }
-            )
-            + "\n"
-        )
-
-        resources_response = (
-            json.dumps(
-                {
-                    "jsonrpc": "2.0",
-                    "id": 3,
-                    "result": {"resources": []},
-                }
-            )
-            + "\n"
-        )
-
-        prompts_response = (
-            json.dumps(
-                {
-                    "jsonrpc": "2.0",
-                    "id": 4,
-                    "result": {"prompts": []},
-                }
-            )
-            + "\n"
-        )
-
-        # Set up mock readline to return responses in sequence
-        mock_process.stdout.readline.side_effect = [
-            init_response,
-            tools_response,
-            resources_response,
-            prompts_response,
-        ]
-        mock_process.stdin = MagicMock()
-
-        # Mock select to always return ready
-        mock_select.return_value = ([mock_process.stdout], [], [])
+        diag = doctor.test_server(fake_server("healthy"))
 
-        mock_popen.return_value = mock_process
-
-        server = MCPServerConfig(
-            name="test-server",
-            command="test",
-            args=["mcp"],
-        )
-
-        diag = doctor.test_server(server)
-
-        assert diag.name == "test-server"
+        assert diag.name == "fake-healthy"
         assert diag.status == ServerStatus.HEALTHY
         assert diag.tool_count == 2
+        assert diag.resource_count == 1
+        assert diag.prompt_count == 0
         assert diag.response_time_ms is not None
         assert diag.protocol_version == "2024-11-05"
+        assert diag.capabilities == {"tools": True, "resources": True, "prompts": True}
 
     @patch("py_mcp_installer.mcp_doctor.resolve_command_path")
     def test_test_server_command_not_found(
@@ -763,65 +700,341 @@ class TestServerProtocolTests:
         assert diag.status == ServerStatus.UNREACHABLE
         assert "not found" in (diag.error or "").lower()
 
-    @patch("subprocess.Popen")
-    @patch("py_mcp_installer.mcp_doctor.resolve_command_path")
-    def test_test_server_timeout(
-        self, mock_resolve: MagicMock, mock_popen: MagicMock, doctor: MCPDoctor
-    ) -> None:
+    def test_test_server_timeout(self, mock_platform_info: PlatformInfo) -> None:
         """Test server testing with timeout."""
-        mock_resolve.return_value = "/usr/bin/test"
-        mock_popen.side_effect = subprocess.TimeoutExpired("test", 5)
+        doctor = MCPDoctor(mock_platform_info, timeout=0.5)
 
-        server = MCPServerConfig(
-            name="slow-server",
-            command="slow",
-            args=[],
-        )
-
-        diag = doctor.test_server(server)
+        diag = doctor.test_server(fake_server("hang"))
 
         assert diag.status == ServerStatus.UNREACHABLE
         error_lower = (diag.error or "").lower()
         assert "timeout" in error_lower or "not respond" in error_lower
 
-    @patch("subprocess.Popen")
-    @patch("py_mcp_installer.mcp_doctor.resolve_command_path")
-    def test_test_server_init_error(
-        self, mock_resolve: MagicMock, mock_popen: MagicMock, doctor: MCPDoctor
+    def test_test_server_partial_line_times_out(
+        self, mock_platform_info: PlatformInfo
     ) -> None:
+        """A partial line on stdout must not block past the deadline."""
+        doctor = MCPDoctor(mock_platform_info, timeout=0.5)
+
+        start = time.monotonic()
+        diag = doctor.test_server(fake_server("partial"))
+
+        assert diag.status == ServerStatus.UNREACHABLE
+        assert time.monotonic() - start < 5
+
+    def test_test_server_noisy_stderr(self, doctor: MCPDoctor) -> None:
+        """Heavy stderr output and stdout logging do not deadlock the test."""
+        diag = doctor.test_server(fake_server("noisy"))
+
+        assert diag.status == ServerStatus.HEALTHY
+        assert diag.tool_count == 2
+
+    def test_test_server_init_error(self, doctor: MCPDoctor) -> None:
         """Test server testing with initialization error."""
-        mock_resolve.return_value = "/usr/bin/test"
-
-        # Mock subprocess
-        mock_process = MagicMock()
-
-        # Mock error response
-        error_response = (
-            json.dumps(
-                {
-                    "jsonrpc": "2.0",
-                    "id": 1,
-                    "error": {"code": -32600, "message": "Invalid request"},
-                }
+        diag = doctor.test_server(fake_server("init-error"))
+
+        assert diag.status == ServerStatus.ERROR
+        assert diag.error == "Invalid request"
+
+    def test_test_server_null_capabilities(self, doctor: MCPDoctor) -> None:
+        """An explicit null capabilities object means no capabilities."""
+        init_result = '{"protocolVersion": "1", "capabilities": null}'
+        diag = doctor.test_server(fake_server("healthy", "--init-result", init_result))
+
+        assert diag.status == ServerStatus.HEALTHY
+        assert diag.capabilities == {"tools": False, "resources": False, "prompts": False}
+
+    @pytest.mark.parametrize(
+        ("init_result", "error"),
+        [
+            ('"ok"', "Invalid initialize result: 'ok'"),
+            ('{"capabilities": ["tools"]}', "Invalid capabilities in initialize result"),
+        ],
+    )
+    def test_test_server_malformed_initialize(
+        self, doctor: MCPDoctor, init_result: str, error: str
+    ) -> None:
+        """A malformed initialize answer is an ERROR, not a crashed probe."""
+        diag = doctor.test_server(fake_server("healthy", "--init-result", init_result))
+
+        assert diag.status == ServerStatus.ERROR
+        assert (diag.error or "").startswith(error)
+
+    def test_test_server_exit_reports_stderr(self, doctor: MCPDoctor) -> None:
+        """A server that exits early is reported with its stderr output."""
+        diag = doctor.test_server(fake_server("exit"))
+
+        assert diag.status == ServerStatus.ERROR
+        assert "exit code 3" in (diag.error or "")
+        assert "missing API key" in (diag.error or "")
+
+    def test_test_server_skips_unadvertised_capabilities(
+        self, doctor: MCPDoctor
+    ) -> None:
+        """List requests are only sent for capabilities the server advertised."""
+        diag = doctor.test_server(fake_server("healthy", "--capabilities", "tools"))
+
+        assert diag.status == ServerStatus.HEALTHY
+        assert diag.capabilities == {"tools": True, "resources": False, "prompts": False}
+        assert diag.tool_count == 2
+        # The fake server would list one resource if it were asked
+        assert diag.resource_count == 0
+        assert list(diag.method_times_ms) == ["tools/list"]
+
+    def test_test_server_latency_breakdown(self, doctor: MCPDoctor) -> None:
+        """Spawn-to-first-byte, initialize and per-method times are recorded."""
+        diag = doctor.test_server(fake_server("healthy", "--delay", "0.05"))
+
+        assert diag.status == ServerStatus.HEALTHY
+        assert diag.first_byte_ms is not None
+        assert diag.initialize_ms is not None
+        assert diag.initialize_ms >= 50
+        assert list(diag.method_times_ms) == [
+            "tools/list",
+            "resources/list",
+            "prompts/list",
+        ]
+        assert diag.response_time_ms is not None
+        assert diag.response_time_ms >= diag.first_byte_ms
+
+
+# ============================================================================
+# Concurrent Server Probing Tests
+# ============================================================================
+
+
+class TestConcurrentServerTests:
+    """Tests for concurrent server probing in full mode."""
+
+    @staticmethod
+    def _servers(count: int) -> list[MCPServerConfig]:
+        return [
+            MCPServerConfig(name=f"server-{i}", command="test", args=[])
+            for i in range(count)
+        ]
+
+    def test_results_keep_input_order(self, mock_platform_info: PlatformInfo) -> None:
+        """Results are ordered like the input even if later servers finish first."""
+        doctor = MCPDoctor(mock_platform_info, max_workers=4)
+        servers = self._servers(4)
+
+        def fake_test(server: MCPServerConfig) -> ServerDiagnostic:
+            # Earlier servers are slower, so completion order is reversed
+            time.sleep(0.05 * (4 - int(server.name.split("-")[1])))
+            return ServerDiagnostic(name=server.name, status=ServerStatus.HEALTHY)
+
+        with patch.object(doctor, "test_server", side_effect=fake_test):
+            start = time.monotonic()
+            results = doctor.test_servers(servers)
+            elapsed = time.monotonic() - start
+
+        assert list(results) == [s.name for s in servers]
+        assert all(d.status == ServerStatus.HEALTHY for d in results.values())
+        # Concurrent: bounded by slowest server (0.2s), not the sum (0.5s)
+        assert elapsed < 0.45
+
+    def test_budget_marks_slow_servers_unreachable(
+        self, mock_platform_info: PlatformInfo
+    ) -> None:
+        """Servers still running when the budget expires are unreachable."""
+        doctor = MCPDoctor(mock_platform_info, max_workers=2, total_timeout=0.2)
+        servers = self._servers(2)
+        release = threading.Event()
+
+        def fake_test(server: MCPServerConfig) -> ServerDiagnostic:
+            if server.name == "server-1":
+                release.wait(timeout=5)
+            return ServerDiagnostic(name=server.name, status=ServerStatus.HEALTHY)
+
+        try:
+            with patch.object(doctor, "test_server", side_effect=fake_test):
+                results = doctor.test_servers(servers)
+        finally:
+            release.set()
+
+        assert results["server-0"].status == ServerStatus.HEALTHY
+        assert results["server-1"].status == ServerStatus.UNREACHABLE
+        assert "budget" in (results["server-1"].error or "")
+
+    def test_no_server_outlives_budget(
+        self, mock_platform_info: PlatformInfo, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Every server process is dead soon after the budget runs out.
+
+        This includes servers whose probe only spawns them after the budget
+        expired (slow start below).
+        """
+        import asyncio
+
+        from py_mcp_installer.mcp_client import MCPStdioClient
+
+        doctor = MCPDoctor(mock_platform_info, timeout=30, max_workers=2, total_timeout=0.5)
+        servers = [
+            fake_server("hang"),
+            replace(fake_server("hang", "--capabilities", "tools"), name="fake-slow-start"),
+        ]
+        clients: list[MCPStdioClient] = []
+        original_start = MCPStdioClient.start
+
+        async def start(client: MCPStdioClient) -> None:
+            if "--capabilities" in client.args:
+                await asyncio.sleep(1.0)
+            await original_start(client)
+            clients.append(client)
+
+        monkeypatch.setattr(MCPStdioClient, "start", start)
+        results = doctor.test_servers(servers)
+
+        assert all(d.status == ServerStatus.UNREACHABLE for d in results.values())
+        deadline = time.monotonic() + 3.0
+        while time.monotonic() < deadline and (
+            len(clients) < 2
+            or any(c._process is None or c._process.returncode is None for c in clients)
+        ):
+            time.sleep(0.05)
+        assert len(clients) == 2
+        assert all(c._process is not None and c._process.returncode is not None for c in clients)
+
+    def test_worker_exception_becomes_error(
+        self, mock_platform_info: PlatformInfo
+    ) -> None:
+        """Unexpected exceptions in a worker are reported per server."""
+        doctor = MCPDoctor(mock_platform_info, max_workers=2)
+
+        with patch.object(doctor, "test_server", side_effect=RuntimeError("boom")):
+            results = doctor.test_servers(self._servers(2))
+
+        assert all(d.status == ServerStatus.ERROR for d in results.values())
+        assert results["server-0"].error == "boom"
+
+    def test_diagnose_full_issue_order_is_deterministic(
+        self, mock_platform_info: PlatformInfo, mock_config_content: dict[str, Any]
+    ) -> None:
+        """Server issues follow config order, not completion order."""
+        doctor = MCPDoctor(mock_platform_info, max_workers=2)
+        mock_manager = MagicMock()
+        mock_manager.snapshot_members.return_value = mock_config_content
+        doctor.config_manager = mock_manager
+
+        def fake_test(server: MCPServerConfig) -> ServerDiagnostic:
+            if server.name == "test-server":
+                time.sleep(0.1)
+            return ServerDiagnostic(
+                name=server.name, status=ServerStatus.UNREACHABLE, error="down"
             )
-            + "\n"
-        )
 
-        mock_process.stdout.readline.return_value = error_response
-        mock_process.stdin = MagicMock()
+        with (
+            patch.object(doctor, "test_server", side_effect=fake_test),
+            patch(
+                "py_mcp_installer.mcp_doctor.resolve_command_path",
+                return_value="/usr/bin/uv",
+            ),
+            patch.object(Path, "exists", return_value=True),
+        ):
+            report = doctor.diagnose(full=True)
 
-        mock_popen.return_value = mock_process
+        reachability = [
+            i.server_name for i in report.issues if i.check_name == "server_reachable"
+        ]
+        assert reachability == ["test-server", "github-mcp"]
+        assert list(report.server_reports) == ["test-server", "github-mcp"]
 
-        server = MCPServerConfig(
-            name="error-server",
-            command="test",
-            args=[],
+
+# ============================================================================
+# Benchmark Tests
+# ============================================================================
+
+
+class TestBenchmark:
+    """Tests for repeated-probe benchmark mode."""
+
+    def test_latency_stats(self) -> None:
+        """Percentiles interpolate between sorted samples."""
+        stats = LatencyStats.from_samples([40.0, 10.0, 30.0, 20.0, 50.0])
+
+        assert stats.samples == 5
+        assert stats.min_ms == 10.0
+        assert stats.p50_ms == 30.0
+        assert stats.p95_ms == pytest.approx(48.0)
+        assert stats.max_ms == 50.0
+        assert stats.mean_ms == 30.0
+        assert stats.variance_ms2 == 250.0
+
+    def test_latency_stats_single_sample(self) -> None:
+        """A single sample has zero variance."""
+        stats = LatencyStats.from_samples([12.5])
+
+        assert stats.p50_ms == stats.p95_ms == 12.5
+        assert stats.variance_ms2 == 0.0
+
+    def test_latency_stats_requires_samples(self) -> None:
+        """Empty sample lists are rejected."""
+        with pytest.raises(ValueError):
+            LatencyStats.from_samples([])
+
+    def test_server_benchmark_excludes_failures(self) -> None:
+        """Failed runs are counted but not included in the statistics."""
+        diags = [
+            ServerDiagnostic(
+                name="s",
+                status=ServerStatus.HEALTHY,
+                response_time_ms=ms,
+                initialize_ms=ms - 5,
+                method_times_ms={"tools/list": 2.0},
+            )
+            for ms in (100.0, 120.0)
+        ]
+        diags.append(
+            ServerDiagnostic(name="s", status=ServerStatus.UNREACHABLE, error="boom")
         )
 
-        diag = doctor.test_server(server)
+        bench = ServerBenchmark.from_diagnostics("s", diags)
 
-        assert diag.status == ServerStatus.ERROR
-        assert diag.error is not None
+        assert bench.runs == 3
+        assert bench.failures == 1
+        assert bench.errors == ["boom"]
+        assert bench.total is not None and bench.total.samples == 2
+        assert bench.initialize is not None and bench.initialize.min_ms == 95.0
+        assert bench.first_byte is None
+        assert set(bench.methods) == {"tools/list"}
+
+    def test_benchmark_fake_server(self, doctor: MCPDoctor) -> None:
+        """Each server is probed once per iteration."""
+        servers = [fake_server("healthy"), fake_server("exit")]
+
+        with patch.object(doctor, "_get_servers", return_value=servers):
+            report = doctor.benchmark(3)
+
+        assert report.iterations == 3
+        assert list(report.servers) == ["fake-healthy", "fake-exit"]
+
+        healthy = report.servers["fake-healthy"]
+        assert healthy.runs == 3 and healthy.failures == 0
+        assert healthy.total is not None and healthy.total.samples == 3
+        assert set(healthy.methods) == {"tools/list", "resources/list", "prompts/list"}
+
+        failing = report.servers["fake-exit"]
+        assert failing.failures == 3
+        assert failing.total is None
+        assert "missing API key" in failing.errors[0]
+
+        d = report.to_dict()
+        assert d["servers"]["fake-healthy"]["total"]["samples"] == 3
+        assert d["servers"]["fake-exit"]["total"] is None
+
+    def test_benchmark_single_server(self, doctor: MCPDoctor) -> None:
+        """server_name restricts the benchmark to one server."""
+        servers = [fake_server("healthy"), fake_server("exit")]
+
+        with patch.object(doctor, "_get_servers", return_value=servers):
+            report = doctor.benchmark(1, server_name="fake-healthy")
+
+        assert list(report.servers) == ["fake-healthy"]
+
+    def test_benchmark_requires_iterations(self, doctor: MCPDoctor) -> None:
+        """At least one iteration is required."""
+        with pytest.raises(ValueError):
+            doctor.benchmark(0)
 
 
 # ============================================================================
@@ -832,6 +1045,30 @@ class TestServerProtocolTests:
 class TestCLI:
     """Tests for CLI command."""
 
+    def test_print_server_status_verbose_timings(
+        self, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        """Verbose output includes the per-phase latency breakdown."""
+        from py_mcp_installer.cli import _print_server_status
+
+        diag = ServerDiagnostic(
+            name="test-server",
+            status=ServerStatus.HEALTHY,
+            response_time_ms=1250.0,
+            first_byte_ms=1200.0,
+            initialize_ms=1190.0,
+            method_times_ms={"tools/list": 12.0},
+        )
+
+        _print_server_status(diag)
+        assert "first byte" not in capsys.readouterr().out
+
+        _print_server_status(diag, verbose=True)
+        out = capsys.readouterr().out
+        assert "first byte: 1200ms" in out
+        assert "initialize: 1190ms" in out
+        assert "tools/list: 12ms" in out
+
     def test_import_cli(self) -> None:
         """Test that CLI module can be imported."""
         from py_mcp_installer.cli import cmd_doctor, main
@@ -881,6 +1118,11 @@ class TestCLI:
             json=True,
             verbose=False,
             timeout=10.0,
+            parallel=8,
+            budget=None,
+            bench=None,
+            watch=None,
+            no_cache=False,
         )
 
         exit_code = cmd_doctor(args)
@@ -938,8 +1180,114 @@ class TestCLI:
             json=False,
             verbose=False,
             timeout=10.0,
+            parallel=8,
+            budget=None,
+            bench=None,
+            watch=None,
+            no_cache=False,
         )
 
         exit_code = cmd_doctor(args)
         # Exit code should be 1 when issues found
         assert exit_code in [0, 1]
+
+    @patch("py_mcp_installer.cli.PlatformDetector")
+    @patch("py_mcp_installer.cli.MCPDoctor")
+    def test_cmd_doctor_bench_json(
+        self,
+        mock_doctor_cls: MagicMock,
+        mock_detector_cls: MagicMock,
+        capsys: pytest.CaptureFixture[str],
+    ) -> None:
+        """Benchmark mode prints the benchmark report instead of diagnostics."""
+        import json
+        from argparse import Namespace
+
+        from py_mcp_installer.cli import cmd_doctor
+        from py_mcp_installer.mcp_doctor import BenchmarkReport
+
+        mock_doctor = MagicMock()
+        mock_doctor.benchmark.return_value = BenchmarkReport(
+            platform=Platform.CLAUDE_CODE,
+            timestamp=datetime.now(),
+            iterations=5,
+            servers={
+                "test-server": ServerBenchmark(
+                    name="test-server",
+                    runs=5,
+                    total=LatencyStats.from_samples([10.0, 20.0]),
+                )
+            },
+        )
+        mock_doctor_cls.return_value = mock_doctor
+
+        args = Namespace(
+            full=False,
+            server="test-server",
+            json=True,
+            verbose=False,
+            timeout=10.0,
+            parallel=1,
+            budget=None,
+            bench=5,
+            watch=None,
+            no_cache=False,
+        )
+
+        exit_code = cmd_doctor(args)
+
+        assert exit_code == 0
+        mock_doctor.benchmark.assert_called_once_with(5, server_name="test-server")
+        mock_doctor.diagnose.assert_not_called()
+        output = json.loads(capsys.readouterr().out)
+        assert output["iterations"] == 5
+        assert output["servers"]["test-server"]["total"]["p50_ms"] == 15.0
+
+    @pytest.mark.parametrize("value", ["0", "-3", "two"])
+    def test_bench_rejects_non_positive(
+        self, value: str, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        """--bench must be a positive integer."""
+        from py_mcp_installer.cli import main
+
+        monkeypatch.setattr(sys, "argv", ["py-mcp-installer", "doctor", "--bench", value])
+        with pytest.raises(SystemExit) as exc_info:
+            main()
+
+        assert exc_info.value.code == 2
+        assert "--bench" in capsys.readouterr().err
+
+    @pytest.mark.parametrize("value", ["0", "-1.5", "nan", "inf", "soon"])
+    def test_watch_rejects_non_positive(
+        self, value: str, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        """--watch must be a positive number of seconds."""
+        from py_mcp_installer.cli import main
+
+        monkeypatch.setattr(sys, "argv", ["py-mcp-installer", "doctor", "--watch", value])
+        with pytest.raises(SystemExit) as exc_info:
+            main()
+
+        assert exc_info.value.code == 2
+        assert "--watch" in capsys.readouterr().err
+
+    @pytest.mark.parametrize(
+        ("option", "value"),
+        [("--budget", "0"), ("--budget", "-5"), ("--budget", "nan"), ("--parallel", "0")],
+    )
+    def test_probe_limits_reject_non_positive(
+        self,
+        option: str,
+        value: str,
+        monkeypatch: pytest.MonkeyPatch,
+        capsys: pytest.CaptureFixture[str],
+    ) -> None:
+        """--budget and --parallel must be positive."""
+        from py_mcp_installer.cli import main
+
+        monkeypatch.setattr(sys, "argv", ["py-mcp-installer", "doctor", option, value])
+        with pytest.raises(SystemExit) as exc_info:
+            main()
+
+        assert exc_info.value.code == 2
+        assert option in capsys.readouterr().err
@@ -0,0 +1,95 @@
+"""Tests for MCPInspector."""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from py_mcp_installer import mcp_inspector, utils
+from py_mcp_installer.json_extract import JsonDocumentScan
+from py_mcp_installer.mcp_inspector import MCPInspector
+from py_mcp_installer.types import ConfigLayout, Platform, PlatformInfo, Scope
+
+
+def _inspector(config_path: Path) -> MCPInspector:
+    return MCPInspector(
+        PlatformInfo(
+            platform=Platform.CLAUDE_CODE,
+            confidence=1.0,
+            config_path=config_path,
+            cli_available=False,
+            scope_support=Scope.BOTH,
+        )
+    )
+
+
+@pytest.mark.parametrize(
+    ("content", "legacy"),
+    [
+        ('{"name": "a", "command": "uvx"}\n\n  {"name": "b", "command": "npx"}\r\n', True),
+        ('{"name": "a", "command": "uvx"}\n', False),
+        ('{"name": "a"}\n{"name": \n', False),
+        (json.dumps({"mcpServers": {}}, indent=2), False),
+    ],
+)
+def test_check_legacy_format(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, content: str, legacy: bool
+) -> None:
+    monkeypatch.setattr(utils, "MMAP_MIN_BYTES", 1)
+    path = tmp_path / ".claude.json"
+    path.write_text(content)
+
+    assert _inspector(path).check_legacy_format() is legacy
+
+
+def test_inspect_reads_config_once(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    path = tmp_path / ".claude.json"
+    path.write_text(json.dumps({"mcpServers": {"a": {"command": "uvx"}}}, indent=2))
+    scans = []
+    real_classify = mcp_inspector.classify_json_config
+
+    def counting_classify(*args: object) -> JsonDocumentScan:
+        scans.append(args)
+        return real_classify(*args)  # type: ignore[arg-type]
+
+    monkeypatch.setattr(mcp_inspector, "classify_json_config", counting_classify)
+    inspector = _inspector(path)
+
+    report = inspector.inspect()
+
+    assert report.total_servers == 1
+    assert len(scans) == 1
+
+
+def test_legacy_config_reported_and_migrated(tmp_path: Path) -> None:
+    path = tmp_path / ".claude.json"
+    path.write_text('{"name": "a", "command": "uvx"}\n{"name": "b", "command": "npx"}\n')
+    inspector = _inspector(path)
+
+    report = inspector.inspect()
+    legacy = [issue for issue in report.issues if issue.auto_fixable]
+
+    assert inspector.classify_config().layout == ConfigLayout.LEGACY
+    assert report.has_errors() and len(legacy) == 1
+    assert inspector.auto_fix(legacy[0])
+    assert sorted(json.loads(path.read_text())["mcpServers"]) == ["a", "b"]
+    assert inspector.classify_config().layout == ConfigLayout.MODERN
+    assert inspector.inspect().total_servers == 2
+
+
+def test_inspect_reports_near_duplicates(tmp_path: Path) -> None:
+    path = tmp_path / ".claude.json"
+    servers = {
+        "a": {"command": "uvx", "args": ["srv"]},
+        "b": {"command": "/usr/bin/uvx", "args": ["srv"]},
+        "c": {"command": "uvx", "args": ["other"]},
+    }
+    path.write_text(json.dumps({"mcpServers": servers}))
+    inspector = _inspector(path)
+
+    report = inspector.inspect()
+
+    assert [issue.message for issue in report.issues if "same command" in issue.message] == [
+        "Servers run the same command: a, b"
+    ]
+    assert inspector.find_duplicates({"mcpServers": servers}) == [("a", "b")]
@@ -77,3 +77,95 @@ def test_individual_detection_returns_tuple():
     confidence, path = result
     assert isinstance(confidence, float)
     assert path is None or isinstance(path, Path)
+
+
+@pytest.fixture
+def isolated_home(tmp_path, monkeypatch):
+    """Run detection against an empty home directory, cwd and PATH."""
+    from py_mcp_installer.utils import clear_command_cache
+
+    home = tmp_path / "home"
+    work = tmp_path / "work"
+    bin_dir = tmp_path / "bin"
+    for directory in (home, work, bin_dir):
+        directory.mkdir()
+    monkeypatch.setenv("HOME", str(home))
+    monkeypatch.setenv("USERPROFILE", str(home))
+    monkeypatch.setenv("PATH", str(bin_dir))
+    monkeypatch.delenv("CLAUDE_CODE_ENV", raising=False)
+    monkeypatch.delenv("AUGGIE_HOME", raising=False)
+    monkeypatch.chdir(work)
+    clear_command_cache()
+    yield home
+    clear_command_cache()
+
+
+def test_detect_all_returns_every_platform(isolated_home):
+    """detect_all reports every supported platform, detected or not."""
+    cursor_dir = isolated_home / ".cursor"
+    cursor_dir.mkdir()
+    (cursor_dir / "mcp.json").write_text('{"mcpServers": {}}')
+
+    results = PlatformDetector().detect_all()
+
+    assert set(results) == {p for p in Platform if p != Platform.UNKNOWN}
+    assert results[Platform.CURSOR].confidence == pytest.approx(0.8)
+    assert results[Platform.CURSOR].config_path == cursor_dir / "mcp.json"
+    assert results[Platform.CODEX].confidence == 0.0
+
+
+def test_detect_picks_highest_confidence_from_detect_all(isolated_home):
+    """detect returns the detect_all entry with the highest confidence."""
+    (isolated_home / ".codex").mkdir()
+    cursor_dir = isolated_home / ".cursor"
+    cursor_dir.mkdir()
+    (cursor_dir / "mcp.json").write_text('{"mcpServers": {}}')
+
+    info = PlatformDetector().detect()
+
+    assert info.platform == Platform.CURSOR
+    assert info.confidence == pytest.approx(0.8)
+
+
+def test_detect_raises_when_nothing_installed(isolated_home):
+    """detect raises when no detector finds anything."""
+    with pytest.raises(PlatformDetectionError):
+        PlatformDetector().detect()
+
+
+def test_detect_all_shares_probes(isolated_home, monkeypatch):
+    """Commands and config files are probed once per detection pass."""
+    from py_mcp_installer import platform_detector
+
+    (isolated_home / ".claude.json").write_text('{"mcpServers": {}}')
+    lookups = []
+    parses = []
+    real_check = platform_detector.json_config_looks_valid
+
+    def counting_resolve(command):
+        lookups.append(command)
+        return None
+
+    def counting_check(path):
+        parses.append(path)
+        return real_check(path)
+
+    monkeypatch.setattr(platform_detector, "resolve_command_path", counting_resolve)
+    monkeypatch.setattr(platform_detector, "json_config_looks_valid", counting_check)
+
+    results = PlatformDetector().detect_all()
+
+    assert results[Platform.CLAUDE_CODE].confidence == pytest.approx(0.7)
+    assert lookups.count("claude") == 1
+    assert parses.count(isolated_home / ".claude.json") == 1
+
+
+def test_detect_for_platform_uses_detector(isolated_home):
+    """detect_for_platform reports the requested platform only."""
+    (isolated_home / ".augment").mkdir()
+
+    info = PlatformDetector().detect_for_platform(Platform.AUGGIE)
+
+    assert info.platform == Platform.AUGGIE
+    assert info.confidence == pytest.approx(0.2)
+    assert info.config_path is None
@@ -0,0 +1,130 @@
+"""Tests for the indexed servers view."""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from py_mcp_installer.config_manager import ConfigManager, clear_config_cache
+from py_mcp_installer.server_index import ServerIndex, normalize_argv
+from py_mcp_installer.types import ConfigFormat, MCPServerConfig, coerce_server_args
+
+SECTION = {
+    "ticketer": {"command": "uvx", "args": ["mcp-ticketer"]},
+    "memory": {"command": "uvx", "args": ["kuzu-memory"]},
+    "ticketer-2": {"command": "/usr/local/bin/uvx", "args": ["mcp-ticketer "]},
+    "github": {"command": "npx.cmd", "args": ["-y", "server-github"]},
+    "github-copy": {"command": "C:\\nodejs\\npx.exe", "args": ["-y", "server-github"]},
+    "broken": "not an object",
+}
+
+
+def test_lookups() -> None:
+    index = ServerIndex.from_section(SECTION)
+
+    assert len(index) == 5
+    assert index.names == ("ticketer", "memory", "ticketer-2", "github", "github-copy")
+    assert "broken" not in index
+    assert index.get("memory").args == ["kuzu-memory"]  # type: ignore[union-attr]
+    assert index.get("absent") is None
+    assert index.with_command("/opt/bin/uvx") == ("ticketer", "memory", "ticketer-2")
+    assert index.with_argv("uvx", ["kuzu-memory"]) == ("memory",)
+
+
+def test_near_duplicates() -> None:
+    index = ServerIndex.from_section(SECTION)
+
+    assert index.near_duplicates() == [("ticketer", "ticketer-2"), ("github", "github-copy")]
+
+
+def test_duplicate_names_last_wins() -> None:
+    index = ServerIndex(
+        [
+            MCPServerConfig(name="a", command="uvx"),
+            MCPServerConfig(name="b", command="npx"),
+            MCPServerConfig(name="a", command="uv"),
+        ]
+    )
+
+    assert index.duplicate_names == ("a",)
+    assert index.names == ("b", "a")
+    assert index.get("a").command == "uv"  # type: ignore[union-attr]
+    assert index.with_command("uvx") == ()
+
+
+@pytest.mark.parametrize(
+    ("command", "args", "expected"),
+    [
+        ("uvx", [], ("uvx",)),
+        (" /usr/bin/python3 ", ["-m", " srv "], ("python3", "-m", "srv")),
+        ("C:\\Tools\\Server.EXE", ["--x"], ("Server", "--x")),
+        ("node.js", [], ("node.js",)),
+    ],
+)
+def test_normalize_argv(command: str, args: list[str], expected: tuple[str, ...]) -> None:
+    assert normalize_argv(command, args) == expected
+
+
+def test_config_manager_builds_index_once_per_version(tmp_path: Path) -> None:
+    clear_config_cache()
+    path = tmp_path / ".claude.json"
+    manager = ConfigManager(path, ConfigFormat.JSON)
+    manager.add_server(MCPServerConfig(name="a", command="uvx", args=["a"]))
+
+    index = manager.server_index()
+    assert ConfigManager(path, ConfigFormat.JSON).server_index() is index
+
+    with manager.transaction() as txn:
+        txn.add_server(MCPServerConfig(name="b", command="uvx", args=["a"]))
+        assert manager.server_index().near_duplicates() == [("a", "b")]
+
+    assert manager.server_index() is not index
+    assert manager.server_index().names == ("a", "b")
+
+
+def test_frozen_servers_shared(tmp_path: Path) -> None:
+    clear_config_cache()
+    path = tmp_path / ".claude.json"
+    manager = ConfigManager(path, ConfigFormat.JSON)
+    manager.add_server(MCPServerConfig(name="a", command="uvx", args=["a"]))
+
+    servers = manager.frozen_servers()
+
+    assert [server.to_config() for server in servers] == manager.list_servers()
+    assert manager.frozen_servers() is servers
+
+
+def test_malformed_entries(tmp_path: Path) -> None:
+    """Hand-edited entries with odd args are listed, not rejected."""
+    clear_config_cache()
+    path = tmp_path / ".claude.json"
+    path.write_text(
+        json.dumps(
+            {
+                "mcpServers": {
+                    "none": {"command": "uvx", "args": None},
+                    "string": {"command": "uvx", "args": "serve"},
+                    "numbers": {"command": "uvx", "args": ["--port", 8080]},
+                    "no-command": {"command": None},
+                }
+            }
+        )
+    )
+    manager = ConfigManager(path, ConfigFormat.JSON)
+
+    assert [server.args for server in manager.list_servers()] == [
+        [],
+        ["serve"],
+        ["--port", "8080"],
+        [],
+    ]
+    assert manager.get_server("none").args == []  # type: ignore[union-attr]
+    assert manager.server_index().with_argv("uvx", ["serve"]) == ("string",)
+
+
+@pytest.mark.parametrize(
+    ("args", "expected"),
+    [(None, []), ("serve", ["serve"]), (7, ["7"]), (["a", 1, True], ["a", "1", "True"])],
+)
+def test_coerce_server_args(args: object, expected: list[str]) -> None:
+    assert coerce_server_args(args) == expected
@@ -0,0 +1,214 @@
+"""Unit tests for the warm MCP server pool."""
+
+import asyncio
+import os
+import signal
+import sys
+from collections.abc import Callable
+from pathlib import Path
+
+import pytest
+
+from py_mcp_installer.mcp_client import MCPStdioClient
+from py_mcp_installer.mcp_doctor import MCPDoctor
+from py_mcp_installer.server_pool import ServerHealth, ServerPool
+from py_mcp_installer.types import (
+    MCPServerConfig,
+    Platform,
+    PlatformInfo,
+    Scope,
+    ServerStatus,
+)
+
+FAKE_SERVER = str(Path(__file__).parent / "fake_mcp_server.py")
+
+
+def fake_server(mode: str, *extra_args: str) -> MCPServerConfig:
+    """Build a server config that runs the fake stdio MCP server."""
+    return MCPServerConfig(
+        name=f"fake-{mode}",
+        command=sys.executable,
+        args=[FAKE_SERVER, mode, *extra_args],
+    )
+
+
+@pytest.fixture
+def doctor(tmp_path: Path) -> MCPDoctor:
+    """Create doctor with a short request timeout."""
+    info = PlatformInfo(
+        platform=Platform.CLAUDE_CODE,
+        confidence=1.0,
+        config_path=tmp_path / "config.json",
+        cli_available=False,
+        scope_support=Scope.BOTH,
+    )
+    return MCPDoctor(info, timeout=2.0)
+
+
+def run_checks(
+    pool: ServerPool,
+    count: int,
+    between: Callable[[dict[str, ServerHealth]], None] | None = None,
+) -> list[dict[str, ServerHealth]]:
+    """Run ``count`` pool checks on one event loop and close the pool."""
+
+    async def run() -> list[dict[str, ServerHealth]]:
+        results = []
+        async with pool:
+            for _ in range(count):
+                results.append(await pool.check())
+                if between is not None:
+                    between(results[-1])
+        return results
+
+    return asyncio.run(run())
+
+
+class TestServerPool:
+    """Tests for ServerPool."""
+
+    def test_warm_checks_reuse_process(self, doctor: MCPDoctor) -> None:
+        """Later checks ping the running process instead of respawning it."""
+        pool = ServerPool(doctor, [fake_server("healthy")])
+
+        first, second = run_checks(pool, 2)
+
+        cold = first["fake-healthy"]
+        warm = second["fake-healthy"]
+        assert cold.diagnostic.status == ServerStatus.HEALTHY
+        assert warm.diagnostic.status == ServerStatus.HEALTHY
+        assert warm.pid == cold.pid
+        assert warm.checks == 2
+        assert warm.restarts == 0
+        assert warm.diagnostic.tool_count == 2
+        assert list(warm.diagnostic.method_times_ms) == ["ping"]
+
+    @pytest.mark.skipif(sys.platform == "win32", reason="uses POSIX signals")
+    def test_dead_server_is_restarted(self, doctor: MCPDoctor) -> None:
+        """A server that exits is restarted on the next check."""
+        pool = ServerPool(doctor, [fake_server("healthy")])
+
+        def kill(health: dict[str, ServerHealth]) -> None:
+            pid = health["fake-healthy"].pid
+            if health["fake-healthy"].checks == 1 and pid is not None:
+                os.kill(pid, signal.SIGKILL)
+
+        first, second = run_checks(pool, 2, between=kill)
+
+        restarted = second["fake-healthy"]
+        assert restarted.diagnostic.status == ServerStatus.HEALTHY
+        assert restarted.restarts == 1
+        assert restarted.pid != first["fake-healthy"].pid
+
+    def test_ping_fallback(self, doctor: MCPDoctor) -> None:
+        """Servers that reject ping are checked with tools/list."""
+        pool = ServerPool(doctor, [fake_server("healthy", "--no-ping")])
+
+        _, second, third = run_checks(pool, 3)
+
+        assert second["fake-healthy"].diagnostic.status == ServerStatus.HEALTHY
+        assert list(third["fake-healthy"].diagnostic.method_times_ms) == ["tools/list"]
+        assert third["fake-healthy"].restarts == 0
+
+    def test_failing_server_reported(self, doctor: MCPDoctor) -> None:
+        """Servers that fail the handshake are reported and retried."""
+        pool = ServerPool(doctor, [fake_server("exit"), fake_server("healthy")])
+
+        first, second = run_checks(pool, 2)
+
+        assert list(first) == ["fake-exit", "fake-healthy"]
+        failing = second["fake-exit"]
+        assert failing.diagnostic.status == ServerStatus.ERROR
+        assert failing.pid is None
+        assert failing.restarts == 1
+        assert second["fake-healthy"].diagnostic.status == ServerStatus.HEALTHY
+
+    def test_watch_iterations(self, doctor: MCPDoctor) -> None:
+        """watch() yields once per check and stops after ``iterations``."""
+        pool = ServerPool(doctor, [fake_server("healthy")])
+
+        async def run() -> list[int]:
+            async with pool:
+                return [
+                    h["fake-healthy"].checks async for h in pool.watch(interval=0.01, iterations=3)
+                ]
+
+        assert asyncio.run(run()) == [1, 2, 3]
+
+    @pytest.mark.skipif(sys.platform == "win32", reason="uses POSIX signals")
+    def test_close_stops_processes(self, doctor: MCPDoctor) -> None:
+        """Closing the pool stops every server process."""
+        pool = ServerPool(doctor, [fake_server("healthy")])
+
+        (health,) = run_checks(pool, 1)
+
+        pid = health["fake-healthy"].pid
+        assert pid is not None
+        with pytest.raises(ProcessLookupError):
+            os.kill(pid, 0)
+
+
+def test_server_exiting_during_handshake(
+    doctor: MCPDoctor, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """A server that exits right after initialize fails alone, not the check."""
+
+    async def closed(self: MCPStdioClient, method: str, params: object = None) -> None:
+        raise ConnectionError("Server closed connection (exit code 1)")
+
+    monkeypatch.setattr(MCPStdioClient, "notify", closed)
+    pool = ServerPool(doctor, [fake_server("healthy")])
+
+    (health,) = run_checks(pool, 1)
+
+    diagnostic = health["fake-healthy"].diagnostic
+    assert diagnostic.status == ServerStatus.ERROR
+    assert diagnostic.error == "Server closed connection (exit code 1)"
+    assert health["fake-healthy"].pid is None
+
+
+def test_ping_fallback_error_reported(doctor: MCPDoctor) -> None:
+    """An error answer to the tools/list fallback is not a healthy check."""
+    # initialize + 3 list requests + the rejected ping, then errors only
+    pool = ServerPool(doctor, [fake_server("healthy", "--no-ping", "--fail-after", "5")])
+
+    _, second, third = run_checks(pool, 3)
+
+    assert second["fake-healthy"].diagnostic.status == ServerStatus.HEALTHY
+    diagnostic = third["fake-healthy"].diagnostic
+    assert diagnostic.status == ServerStatus.ERROR
+    assert diagnostic.error == "tools/list failed: Server overloaded"
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="uses POSIX executable permissions")
+def test_unstartable_server_reported(doctor: MCPDoctor, tmp_path: Path) -> None:
+    """A command that cannot be executed fails alone and is retried."""
+    command = tmp_path / "not-a-program"
+    command.write_bytes(b"\x00\x01\x02\x03")
+    command.chmod(0o755)
+    broken = MCPServerConfig(name="broken", command=str(command))
+    pool = ServerPool(doctor, [broken, fake_server("healthy")])
+
+    first, second = run_checks(pool, 2)
+
+    assert first["broken"].diagnostic.status == ServerStatus.ERROR
+    assert second["broken"].diagnostic.status == ServerStatus.ERROR
+    assert second["broken"].restarts == 1
+    assert second["fake-healthy"].diagnostic.status == ServerStatus.HEALTHY
+
+
+def test_non_object_rpc_error_reported(doctor: MCPDoctor, monkeypatch: pytest.MonkeyPatch) -> None:
+    """A ping answered with a malformed error object is reported as ERROR."""
+    pool = ServerPool(doctor, [fake_server("healthy")])
+
+    async def malformed(self: MCPStdioClient, method: str, params: object = None) -> object:
+        return {"jsonrpc": "2.0", "id": 1, "error": "overloaded"}
+
+    def patch_request(health: dict[str, ServerHealth]) -> None:
+        monkeypatch.setattr(MCPStdioClient, "request", malformed)
+
+    _, second = run_checks(pool, 2, between=patch_request)
+
+    diagnostic = second["fake-healthy"].diagnostic
+    assert diagnostic.status == ServerStatus.ERROR
+    assert diagnostic.error == "ping failed: overloaded"
@@ -0,0 +1,119 @@
+"""Tests for the immutable server configuration."""
+
+import copy
+import json
+import os
+import pickle
+import subprocess
+import sys
+from dataclasses import FrozenInstanceError
+from pathlib import Path
+
+import pytest
+
+from py_mcp_installer.config_manager import ConfigManager
+from py_mcp_installer.exceptions import ValidationError
+from py_mcp_installer.types import ConfigFormat, FrozenServerConfig, MCPServerConfig
+
+ENTRY = {
+    "command": "uv",
+    "args": ["run", "mcp-ticketer", "mcp"],
+    "env": {"LINEAR_API_KEY": "secret", "DEBUG": "1"},
+    "description": "Tickets",
+}
+
+
+def test_entry_round_trip() -> None:
+    server = FrozenServerConfig.from_entry("mcp-ticketer", ENTRY)
+
+    assert server.args == ("run", "mcp-ticketer", "mcp")
+    assert server.to_entry() == ENTRY
+    assert FrozenServerConfig.from_entry("a", {}).to_entry() == {"command": "", "args": []}
+
+
+def test_config_round_trip() -> None:
+    config = MCPServerConfig(name="a", command="uvx", args=["a"], env={"K": "v"})
+
+    frozen = FrozenServerConfig.from_config(config)
+
+    assert frozen.to_config() == config
+    assert frozen.to_entry() == ConfigManager._server_to_dict(config)
+    assert frozen.to_config().args is not frozen.to_config().args
+
+
+def test_immutable_and_hashable() -> None:
+    env = {"A": "1", "B": "2"}
+    server = FrozenServerConfig(name="a", command="uvx", args=("x",), env=env)
+    env["A"] = "changed"
+
+    assert server.env["A"] == "1"  # Copied
+    with pytest.raises(TypeError):
+        server.env["A"] = "2"  # type: ignore[index]
+    with pytest.raises(FrozenInstanceError):
+        server.command = "npx"  # type: ignore[misc]
+
+    reordered = FrozenServerConfig(name="a", command="uvx", args=("x",), env={"B": "2", "A": "1"})
+    assert server == reordered
+    assert {server: 1}[reordered] == 1
+    assert server.content_hash == reordered.content_hash
+    assert server != FrozenServerConfig(name="b", command="uvx", args=("x",), env=env)
+
+
+def test_strings_interned() -> None:
+    first = FrozenServerConfig.from_entry("a", {"command": "".join(["u", "vx"]), "args": ["x"]})
+    second = FrozenServerConfig.from_entry("b", {"command": "".join(["uv", "x"]), "args": ["x"]})
+
+    assert first.command is second.command
+
+
+def test_content_hash_stable_across_processes() -> None:
+    server = FrozenServerConfig.from_entry("mcp-ticketer", ENTRY)
+    code = (
+        "from py_mcp_installer.types import FrozenServerConfig;"
+        f"print(FrozenServerConfig.from_entry('mcp-ticketer', {ENTRY!r}).content_hash)"
+    )
+
+    env = {**os.environ, "PYTHONPATH": str(Path(__file__).parents[1] / "src")}
+
+    output = subprocess.run(
+        [sys.executable, "-c", code], env=env, capture_output=True, text=True, check=True
+    ).stdout
+
+    assert output.strip() == server.content_hash
+
+
+def test_pickle_and_copy() -> None:
+    server = FrozenServerConfig.from_entry("mcp-ticketer", ENTRY)
+
+    assert pickle.loads(pickle.dumps(server)) == server
+    assert copy.deepcopy(server) == server
+
+
+def test_malformed_entries() -> None:
+    """Entries the rest of the library accepts can be frozen and hashed."""
+    numbers = FrozenServerConfig.from_entry("a", {"command": "uvx", "args": [1, "y"]})
+    string = FrozenServerConfig.from_entry("a", {"command": "uvx", "args": "serve"})
+    empty = FrozenServerConfig.from_entry("a", {"command": None, "args": None, "env": None})
+    nested = FrozenServerConfig.from_entry("a", {"command": "uvx", "env": {"K": ["v", {"x": 1}]}})
+
+    assert numbers.args == ("1", "y")
+    assert string.args == ("serve",)
+    assert (empty.command, empty.args, dict(empty.env)) == ("", (), {})
+    assert hash(nested) == hash(FrozenServerConfig.from_entry("a", nested.to_entry()))
+    assert len({numbers, string, empty, nested}) == 4
+    assert nested.content_hash
+
+    with pytest.raises(ValidationError):
+        FrozenServerConfig.from_entry("a", {"command": "uvx", "env": ["K=v"]})
+
+
+def test_frozen_servers_of_malformed_config(tmp_path: Path) -> None:
+    path = tmp_path / ".claude.json"
+    path.write_text(
+        json.dumps({"mcpServers": {"a": {"command": "uvx", "args": [1, "y"], "env": {"K": [1]}}}})
+    )
+
+    (server,) = ConfigManager(path, ConfigFormat.JSON).frozen_servers()
+
+    assert server.args == ("1", "y")
+    assert server.env["K"] == [1]
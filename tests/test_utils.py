@@ -0,0 +1,313 @@
+"""Tests for utility functions."""
+
+import os
+import stat
+import sys
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+
+from py_mcp_installer import utils
+from py_mcp_installer.config_manager import ConfigManager
+from py_mcp_installer.exceptions import ConfigurationError
+from py_mcp_installer.json_backend import set_json_backend
+from py_mcp_installer.types import ConfigFormat, Durability
+from py_mcp_installer.utils import (
+    atomic_write,
+    clear_command_cache,
+    deferred_sync,
+    json_config_looks_valid,
+    parse_json_safe,
+    resolve_command_path,
+)
+
+pytestmark = pytest.mark.skipif(sys.platform == "win32", reason="uses POSIX executable permissions")
+
+
+def make_executable(directory: Path, name: str) -> Path:
+    """Create an executable script in ``directory``."""
+    path = directory / name
+    path.write_text("#!/bin/sh\n")
+    path.chmod(path.stat().st_mode | stat.S_IXUSR)
+    return path
+
+
+@pytest.fixture
+def path_dirs(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Iterator[tuple[Path, Path]]:
+    """Point PATH at two empty directories and reset the command cache."""
+    first = tmp_path / "first"
+    second = tmp_path / "second"
+    first.mkdir()
+    second.mkdir()
+    monkeypatch.setenv("PATH", os.pathsep.join([str(first), str(second)]))
+    clear_command_cache()
+    yield first, second
+    clear_command_cache()
+
+
+def test_resolve_command_path_uses_path_order(path_dirs: tuple[Path, Path]) -> None:
+    """The first executable match in PATH order wins."""
+    first, second = path_dirs
+    make_executable(second, "tool")
+    expected = make_executable(first, "tool")
+
+    assert resolve_command_path("tool") == expected
+
+
+def test_resolve_command_path_skips_non_executable(
+    path_dirs: tuple[Path, Path],
+) -> None:
+    """Files without execute permission and directories are ignored."""
+    first, second = path_dirs
+    (first / "tool").write_text("not executable")
+    (first / "subdir").mkdir()
+    expected = make_executable(second, "tool")
+
+    assert resolve_command_path("tool") == expected
+    assert resolve_command_path("subdir") is None
+
+
+def test_resolve_command_path_missing(path_dirs: tuple[Path, Path]) -> None:
+    """Unknown commands resolve to None."""
+    assert resolve_command_path("definitely-not-installed") is None
+    assert resolve_command_path("") is None
+
+
+def test_resolve_command_path_rebuilds_on_path_change(
+    path_dirs: tuple[Path, Path], tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Changing PATH takes effect immediately."""
+    third = tmp_path / "third"
+    third.mkdir()
+    expected = make_executable(third, "tool")
+    assert resolve_command_path("tool") is None
+
+    monkeypatch.setenv("PATH", str(third))
+
+    assert resolve_command_path("tool") == expected
+
+
+def test_resolve_command_path_sees_new_install(
+    path_dirs: tuple[Path, Path], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """A command installed into a PATH directory is found after revalidation."""
+    first, _ = path_dirs
+    monkeypatch.setattr(utils._PathIndex, "REVALIDATE_SECONDS", 0.0)
+    assert resolve_command_path("tool") is None
+
+    expected = make_executable(first, "tool")
+    # Make sure the directory mtime differs even on coarse-grained filesystems
+    os.utime(first, ns=(0, 0))
+
+    assert resolve_command_path("tool") == expected
+
+
+def test_resolve_command_path_does_not_rescan_within_ttl(
+    path_dirs: tuple[Path, Path], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Repeated lookups reuse the index instead of listing PATH directories."""
+    first, _ = path_dirs
+    make_executable(first, "tool")
+    resolve_command_path("tool")
+
+    def fail_scandir(path: str) -> None:
+        raise AssertionError(f"PATH rescanned: {path}")
+
+    monkeypatch.setattr(utils.os, "scandir", fail_scandir)
+    for _ in range(3):
+        assert resolve_command_path("tool") is not None
+        assert resolve_command_path("missing") is None
+
+
+def test_resolve_command_path_removed_command(path_dirs: tuple[Path, Path]) -> None:
+    """A removed command is not returned even before the index is rebuilt."""
+    first, _ = path_dirs
+    tool = make_executable(first, "tool")
+    assert resolve_command_path("tool") == tool
+
+    tool.unlink()
+
+    assert resolve_command_path("tool") is None
+
+
+def test_resolve_command_path_with_directory(path_dirs: tuple[Path, Path]) -> None:
+    """Commands with a directory component bypass the PATH index."""
+    first, _ = path_dirs
+    tool = make_executable(first, "tool")
+
+    assert resolve_command_path(str(tool)) == tool
+
+
+def test_json_config_looks_valid_small_file(tmp_path: Path) -> None:
+    """Small files are fully parsed."""
+    good = tmp_path / "good.json"
+    good.write_text('{"mcpServers": {}}')
+    bad = tmp_path / "bad.json"
+    bad.write_text('{"mcpServers": {')
+    empty = tmp_path / "empty.json"
+    empty.write_text("")
+
+    assert json_config_looks_valid(good)
+    assert not json_config_looks_valid(bad)
+    assert json_config_looks_valid(empty)
+    assert not json_config_looks_valid(tmp_path / "missing.json")
+
+
+@pytest.fixture
+def stdlib_json() -> Iterator[None]:
+    """Parse with the stdlib backend, so that json.loads can be spied on."""
+    set_json_backend("json")
+    yield
+    set_json_backend(None)
+
+
+@pytest.mark.usefixtures("stdlib_json")
+def test_json_config_looks_valid_large_file_not_parsed(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Large files are only checked for a JSON object frame."""
+    monkeypatch.setattr(utils, "JSON_PROBE_PARSE_LIMIT", 100)
+    history = ", ".join(f'"project-{i}": {{"history": []}}' for i in range(100))
+    large = tmp_path / "large.json"
+    large.write_text(f'{{"projects": {{{history}}}, "mcpServers": {{}}}}\n')
+    truncated = tmp_path / "truncated.json"
+    truncated.write_text(large.read_text()[:-10])
+
+    def fail_loads(*args: object, **kwargs: object) -> None:
+        raise AssertionError("large file was parsed")
+
+    monkeypatch.setattr(utils.json, "loads", fail_loads)
+
+    assert json_config_looks_valid(large)
+    assert not json_config_looks_valid(truncated)
+
+
+@pytest.mark.usefixtures("stdlib_json")
+def test_json_config_looks_valid_cached_by_signature(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """An unchanged file is checked once; a modified file is re-checked."""
+    config = tmp_path / "config.json"
+    config.write_text('{"mcpServers": {}}')
+    calls = []
+    real_loads = utils.json.loads
+
+    def counting_loads(content: bytes) -> object:
+        calls.append(content)
+        return real_loads(content)
+
+    monkeypatch.setattr(utils.json, "loads", counting_loads)
+
+    assert json_config_looks_valid(config)
+    assert json_config_looks_valid(config)
+    assert len(calls) == 1
+
+    config.write_text('{"mcpServers": ')
+    os.utime(config, ns=(0, 0))
+
+    assert not json_config_looks_valid(config)
+    assert len(calls) == 2
+
+
+def test_parse_json_safe_fills_validity_cache(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """A parse result is reused by the validity check."""
+    config = tmp_path / "config.json"
+    config.write_text("{not json")
+
+    with pytest.raises(ConfigurationError):
+        parse_json_safe(config)
+
+    monkeypatch.setattr(utils, "parse_json_safe", None)
+    assert not json_config_looks_valid(config)
+
+
+@pytest.fixture
+def fsyncs(monkeypatch: pytest.MonkeyPatch) -> list[str]:
+    """Record the kind ("file" or "dir") of every fsync."""
+    calls: list[str] = []
+    real_fsync = os.fsync
+
+    def record(fd: int) -> None:
+        calls.append("dir" if stat.S_ISDIR(os.fstat(fd).st_mode) else "file")
+        real_fsync(fd)
+
+    monkeypatch.setattr(utils.os, "fsync", record)
+    return calls
+
+
+@pytest.mark.parametrize(
+    ("durability", "expected"),
+    [
+        (Durability.NONE, []),
+        (Durability.FILE, ["file"]),
+        (Durability.FILE_AND_DIR, ["file", "dir"]),
+        ("file+dir", ["file", "dir"]),
+    ],
+)
+def test_atomic_write_durability(
+    tmp_path: Path, fsyncs: list[str], durability: Durability, expected: list[str]
+) -> None:
+    """Each durability level syncs exactly what it promises."""
+    atomic_write(tmp_path / "config.json", "{}", durability=durability)
+
+    assert fsyncs == expected
+    assert (tmp_path / "config.json").read_text() == "{}"
+
+
+def test_deferred_sync_batches_fsyncs(tmp_path: Path, fsyncs: list[str]) -> None:
+    """Writes inside deferred_sync() are synced once each, at the end."""
+    with deferred_sync():
+        for name in ("a.json", "b.json", "a.json"):
+            atomic_write(tmp_path / name, name, durability=Durability.FILE_AND_DIR)
+        with deferred_sync():  # joins the outer batch
+            atomic_write(tmp_path / "c.json", "c", durability=Durability.NONE)
+        assert fsyncs == []
+
+    assert sorted(fsyncs) == ["dir", "file", "file"]
+    assert (tmp_path / "a.json").read_text() == "a.json"
+
+
+def test_config_manager_passes_durability(tmp_path: Path, fsyncs: list[str]) -> None:
+    """ConfigManager writes use its durability setting."""
+    manager = ConfigManager(
+        tmp_path / "mcp.json", ConfigFormat.JSON, durability=Durability.FILE_AND_DIR
+    )
+    manager.write({"mcpServers": {}})
+    assert fsyncs == ["file", "dir"]
+
+    fsyncs.clear()
+    manager.durability = Durability.NONE
+    manager.write({"mcpServers": {"a": {"command": "uvx"}}})
+    assert fsyncs == []
+
+
+@pytest.mark.parametrize("size", [0, 10, utils.MMAP_MIN_BYTES + 1])
+def test_mapped_file_views_content(tmp_path: Path, size: int) -> None:
+    path = tmp_path / "config.json"
+    path.write_bytes(b"x" * size)
+
+    with utils.mapped_file(path) as data:
+        assert data.readonly
+        assert data == b"x" * size
+
+
+def test_large_files_parsed_from_mapping(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(utils, "MMAP_MIN_BYTES", 1)
+    config = tmp_path / "config.json"
+    config.write_text('\ufeff  {"mcpServers": {"a": {"args": ["café"]}}}\n')
+    blank = tmp_path / "blank.json"
+    blank.write_text(" \n\t")
+    toml = tmp_path / "config.toml"
+    toml.write_text('[mcp_servers.a]\ncommand = "uvx"\n')
+
+    assert parse_json_safe(config) == {"mcpServers": {"a": {"args": ["café"]}}}
+    assert utils.parse_json_members_safe(config, ["mcpServers"]) == parse_json_safe(config)
+    assert parse_json_safe(blank) == {}
+    assert utils.parse_toml_safe(toml) == {"mcp_servers": {"a": {"command": "uvx"}}}
+
+    config.write_text('{"mcpServers": ')
+    with pytest.raises(ConfigurationError):
+        parse_json_safe(config)